@@ -0,0 +1,446 @@
+"""Benchmark suite of the Toucan tournament MVP calculator.
+
+Example
+-------
+Run the benchmarks on a synthetic tournament, store the results and compare
+them against a previous run:
+
+.. code:: bash
+
+   python benchmarks/bench.py --matches 2000 --output after.json --compare before.json
+"""
+
+import argparse
+import gc
+import json
+from pathlib import Path
+import platform
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from generate import generate_tournament
+
+import toucan.mvp.calculator
+from toucan.mvp.calculator import ToucanTournament
+from toucan.mvp.calculator.leaderboard import ToucanLeaderboard
+from toucan.mvp.calculator.parser import parse_match
+from toucan.mvp.calculator.players import ToucanPlayer
+
+
+def best_of(repeat: int, func: Callable[[], None]) -> float:
+    """Time a function several times and return the best time.
+
+    Parameters
+    ----------
+    repeat : int
+        Number of times the function is run.
+    func : Callable[[], None]
+        The function to be timed.
+
+    Returns
+    -------
+    float
+        The best time, in seconds.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def peak_memory(func: Callable[[], None]) -> int:
+    """Measure the peak memory allocated by a function.
+
+    Parameters
+    ----------
+    func : Callable[[], None]
+        The function to be measured.
+
+    Returns
+    -------
+    int
+        The peak of memory allocated while running the function, in bytes.
+    """
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def retained_memory(func: Callable[[], object]) -> int:
+    """Measure the memory retained by the object built by a function.
+
+    Parameters
+    ----------
+    func : Callable[[], object]
+        The function building the object.
+
+    Returns
+    -------
+    int
+        The memory still allocated once the object is built (and kept alive), in bytes.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        built = func()  # noqa : F841
+        gc.collect()
+        return tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def measure_memory(directory: Path, engine: str) -> Dict[str, float]:
+    """Measure the memory held by a processed tournament, per player and per row.
+
+    Notes
+    -----
+    The memory per player is measured on a tournament holding the players
+    only (i.e. with no matches). The memory per row (i.e. player record) is
+    the marginal one: the difference between the tournaments processed from
+    all the match files and from the first half of them, once the players
+    only seen in the second half are discounted, over the difference of
+    rows. Hence, fixed costs (e.g. precompiled parsers) are not attributed
+    to the rows. Both tournaments are retained with their MVP selected.
+
+    Parameters
+    ----------
+    directory : Path
+        Directory where the match files are located.
+    engine : str
+        The scoring engine of the tournament.
+
+    Returns
+    -------
+    Dict[str, float]
+        The memory retained by the tournament and per player and row, in bytes.
+    """
+    tournament = ToucanTournament("Benchmark", engine)
+    tournament.process_tournament(directory)
+    names = [(player.name, player.nickname) for player in tournament.players]
+    del tournament
+
+    def measure_tournament(match_directory: Path) -> Tuple[int, int, int]:
+        tournaments = []
+
+        def process_tournament():
+            tournament = ToucanTournament("Benchmark", engine)
+            tournament.process_tournament(match_directory)
+            tournament.mvp
+            tournaments.append(tournament)
+            return tournament
+
+        retained_bytes = retained_memory(process_tournament)
+        tournament = tournaments.pop()
+        return retained_bytes, len(list(tournament.players)), tournament._store.n_rows
+
+    def create_players():
+        tournament = ToucanTournament("Benchmark", engine)
+        for name, nickname in names:
+            # Copies, as if the names were parsed from the match files
+            tournament._get_or_create_player(name.encode().decode(), nickname.encode().decode())
+        return tournament
+
+    bytes_per_player = retained_memory(create_players) / len(names)
+    # (a sibling temporary directory, so that the sources of the matches are as long)
+    with tempfile.TemporaryDirectory(dir=directory.parent) as half_directory:
+        half_directory = Path(half_directory)
+        match_files = sorted(path for path in directory.iterdir() if path.is_file())
+        for match_file in match_files[: len(match_files) // 2]:
+            shutil.copy(match_file, half_directory / match_file.name)
+        half_bytes, half_players, half_rows = measure_tournament(half_directory)
+    retained_bytes, n_players, n_rows = measure_tournament(directory)
+    rows_bytes = retained_bytes - half_bytes - bytes_per_player * (n_players - half_players)
+    return {
+        "retained_bytes": retained_bytes,
+        "bytes_per_player": bytes_per_player,
+        "bytes_per_row": rows_bytes / (n_rows - half_rows),
+    }
+
+
+def run_benchmarks(
+    directory: Path, n_rows: int, repeat: int, engine: str, workers: int
+) -> Dict[str, Dict[str, float]]:
+    """Run every benchmark on a tournament directory.
+
+    Parameters
+    ----------
+    directory : Path
+        Directory where the match files are located.
+    n_rows : int
+        Total number of player records in the match files.
+    repeat : int
+        Number of times each benchmark is run (the best time is kept).
+    engine : str
+        The scoring engine of the tournament.
+    workers : int
+        Number of worker processes used for processing the tournament.
+
+    Returns
+    -------
+    Dict[str, Dict[str, float]]
+        The measurements of each benchmark.
+    """
+    match_files = sorted(path for path in directory.iterdir() if path.is_file())
+    n_files = len(match_files)
+    results = {}
+
+    # Whole tournament
+    def process_tournament():
+        ToucanTournament("Benchmark", engine).process_tournament(directory, workers=workers)
+
+    seconds = best_of(repeat, process_tournament)
+    results["process_tournament"] = {
+        "seconds": seconds,
+        "rows_per_s": n_rows / seconds,
+        "files_per_s": n_files / seconds,
+        "peak_memory_bytes": peak_memory(process_tournament),
+    }
+
+    # Whole tournament with the default options (i.e. how most callers use the library),
+    # up to its MVP
+    def process_default_tournament():
+        tournament = ToucanTournament("Benchmark")
+        tournament.process_tournament(directory)
+        tournament.mvp
+
+    seconds = best_of(repeat, process_default_tournament)
+    results["process_tournament[default]"] = {
+        "seconds": seconds,
+        "rows_per_s": n_rows / seconds,
+        "files_per_s": n_files / seconds,
+        "peak_memory_bytes": peak_memory(process_default_tournament),
+    }
+
+    # Match files one by one (i.e. no directory listing nor worker processes)
+    def process_matches():
+        tournament = ToucanTournament("Benchmark", engine)
+        for match_file in match_files:
+            tournament._process_match(match_file)
+
+    seconds = best_of(repeat, process_matches)
+    results["_process_match"] = {
+        "seconds": seconds,
+        "rows_per_s": n_rows / seconds,
+        "files_per_s": n_files / seconds,
+        "peak_memory_bytes": peak_memory(process_matches),
+    }
+
+    # Match files one by one, memory-mapped and parsed without decoding
+    def process_mapped_matches():
+        tournament = ToucanTournament("Benchmark", engine, parser="mmap")
+        for match_file in match_files:
+            tournament._process_match(match_file)
+
+    seconds = best_of(repeat, process_mapped_matches)
+    results["_process_match[mmap]"] = {
+        "seconds": seconds,
+        "rows_per_s": n_rows / seconds,
+        "files_per_s": n_files / seconds,
+        "peak_memory_bytes": peak_memory(process_mapped_matches),
+    }
+
+    # Scoring only, on records parsed beforehand
+    records = []
+    for match_file in match_files:
+        with open(match_file, "r") as file:
+            discipline, rows = parse_match(file, match_file)
+            records.extend((discipline, position, marks) for *_, position, marks in rows)
+
+    def add_match_points():
+        player = ToucanPlayer("Benchmark", "benchmark")
+        for discipline, position, marks in records:
+            player.add_match_points(marks, discipline, position)
+
+    seconds = best_of(repeat, add_match_points)
+    results["ToucanPlayer.add_match_points"] = {
+        "seconds": seconds,
+        "rows_per_s": n_rows / seconds,
+        "peak_memory_bytes": peak_memory(add_match_points),
+    }
+
+    # MVP selection, ranking all the players from scratch
+    tournament = ToucanTournament("Benchmark", engine)
+    tournament.process_tournament(directory, workers=workers)
+    players = list(tournament.players)
+
+    def select_mvp():
+        leaderboard = ToucanLeaderboard()
+        for player in players:
+            leaderboard.update(player.id, player.total_points)
+        assert players[leaderboard.mvp] is tournament.mvp
+
+    seconds = best_of(repeat, select_mvp)
+    results["mvp_selection"] = {
+        "seconds": seconds,
+        "players_per_s": len(players) / seconds,
+        "peak_memory_bytes": peak_memory(select_mvp),
+    }
+
+    # Watch mode: latency from a match file landing, changing or being removed
+    # to the updated MVP
+    with tempfile.TemporaryDirectory() as live_directory:
+        live_directory = Path(live_directory)
+        for match_file in match_files:
+            (live_directory / match_file.name).write_bytes(match_file.read_bytes())
+        live_tournament = ToucanTournament("Benchmark", engine)
+        manifest = live_tournament._manifest
+        watcher = live_tournament.watch(live_directory, workers=workers)
+        watcher.poll()
+        content, new_content = match_files[0].read_bytes(), match_files[-1].read_bytes()
+        latencies: Dict[str, List[float]] = {"add": [], "modify": [], "remove": []}
+        for idx in range(repeat):
+            live_file = live_directory / f"live{idx}.txt"
+            start = time.perf_counter()
+            live_file.write_bytes(content)
+            while live_file not in manifest:
+                watcher.poll(1.0)
+            latencies["add"].append(time.perf_counter() - start)
+
+            digest = manifest[live_file].digest
+            start = time.perf_counter()
+            live_file.write_bytes(new_content)
+            while live_file not in manifest or manifest[live_file].digest == digest:
+                watcher.poll(1.0)
+            latencies["modify"].append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            live_file.unlink()
+            while live_file in manifest:
+                watcher.poll(1.0)
+            latencies["remove"].append(time.perf_counter() - start)
+        watcher.stop()
+    results["watch_latency"] = {"seconds": min(latencies["add"]), "backend": watcher.backend}
+    for change in ("modify", "remove"):
+        results[f"watch_latency[{change}]"] = {
+            "seconds": min(latencies[change]),
+            "backend": watcher.backend,
+        }
+
+    # Memory held by the processed tournament
+    results["memory"] = measure_memory(directory, engine)
+
+    return results
+
+
+def compare(results: Dict, previous: Dict, tolerance: float) -> List[str]:
+    """Compare the results of two benchmark runs.
+
+    Parameters
+    ----------
+    results : Dict
+        The results of the current run.
+    previous : Dict
+        The results of the previous run.
+    tolerance : float
+        Relative slowdown tolerated before considering it a regression.
+
+    Returns
+    -------
+    List[str]
+        The benchmarks that regressed.
+    """
+    if results["parameters"] != previous["parameters"]:
+        print("WARNING: runs were done with different parameters, they are not comparable.")
+
+    regressions = []
+    print(f"\n{'benchmark':<32}{'previous':>14}{'current':>14}{'ratio':>8}")
+    for name, measurements in results["benchmarks"].items():
+        if name not in previous["benchmarks"]:
+            continue
+        # Timings are compared in seconds, memory in bytes per player and row
+        metrics = (
+            ["seconds"] if "seconds" in measurements else ["bytes_per_player", "bytes_per_row"]
+        )
+        for metric in metrics:
+            if metric not in previous["benchmarks"][name]:
+                continue
+            before, after = previous["benchmarks"][name][metric], measurements[metric]
+            ratio = after / before
+            flag = ""
+            if ratio > 1 + tolerance:
+                regressions.append(f"{name}.{metric}")
+                flag = "  <-- REGRESSION"
+            label = name if metric == "seconds" else f"{name}.{metric}"
+            print(f"{label:<32}{before:>14.4f}{after:>14.4f}{ratio:>8.2f}{flag}")
+    return regressions
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the benchmark suite from the command line.
+
+    Parameters
+    ----------
+    argv : Sequence[str], optional
+        The command line arguments, by default ``sys.argv[1:]``.
+
+    Returns
+    -------
+    int
+        The exit code: 1 if a regression was found when comparing, 0 otherwise.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--matches", type=int, default=1000, help="number of match files")
+    parser.add_argument("--rows-per-match", type=int, default=10, help="players per match")
+    parser.add_argument("--players", type=int, default=1000, help="number of players")
+    parser.add_argument("--teams", type=int, default=20, help="number of teams")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per benchmark")
+    parser.add_argument("--engine", default="python", help="scoring engine")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes")
+    parser.add_argument("--output", type=Path, help="JSON file where results are stored")
+    parser.add_argument("--compare", type=Path, help="JSON file of a previous run")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="relative slowdown tolerated")
+    args = parser.parse_args(argv)
+
+    parameters = {
+        "matches": args.matches,
+        "rows_per_match": args.rows_per_match,
+        "players": args.players,
+        "teams": args.teams,
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "engine": args.engine,
+        "workers": args.workers,
+    }
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        n_rows = generate_tournament(
+            Path(tmp_dir),
+            n_matches=args.matches,
+            rows_per_match=args.rows_per_match,
+            n_players=args.players,
+            n_teams=args.teams,
+            seed=args.seed,
+        )
+        benchmarks = run_benchmarks(Path(tmp_dir), n_rows, args.repeat, args.engine, args.workers)
+
+    results = {
+        "metadata": {
+            "version": toucan.mvp.calculator.__version__,
+            "python": sys.version,
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            "date": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "parameters": parameters,
+        "benchmarks": benchmarks,
+    }
+    print(json.dumps(results, indent=2))
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+    if args.compare:
+        return 1 if compare(results, json.loads(args.compare.read_text()), args.tolerance) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,163 @@
+"""Synthetic Toucan tournament generator used by the benchmark suite.
+
+Example
+-------
+Generate a tournament with 1000 matches of 20 players each:
+
+.. code:: bash
+
+   python benchmarks/generate.py /tmp/tournament --matches 1000 --rows-per-match 20
+"""
+
+import argparse
+from pathlib import Path
+import random
+from typing import List, Optional, Sequence
+
+from toucan.mvp.calculator.discipline import ToucanDiscipline
+
+MARKS_RANGE = (0, 30)
+"""Range (both ends included) of the random marks of each player."""
+
+
+def generate_match(
+    discipline: ToucanDiscipline,
+    nicknames: Sequence[str],
+    teams: Sequence[str],
+    rng: random.Random,
+) -> List[str]:
+    """Generate the lines of a valid match (i.e. two teams and no draw).
+
+    Parameters
+    ----------
+    discipline : ToucanDiscipline
+        The discipline of the match.
+    nicknames : Sequence[str]
+        The nicknames of the players of the match. The first half plays in the
+        first team and the second half in the second team.
+    teams : Sequence[str]
+        The names of the two teams of the match.
+    rng : random.Random
+        The random number generator.
+
+    Returns
+    -------
+    List[str]
+        The lines of the match, the discipline header included.
+    """
+    parser = discipline.get_parser()
+    positions = list(parser.coefficients)
+    n_marks = len(parser.coefficients[positions[0]][0])
+
+    rows = []
+    scores = [0, 0]
+    for idx, nickname in enumerate(nicknames):
+        team_idx = int(idx >= len(nicknames) / 2)
+        marks = [rng.randint(*MARKS_RANGE) for _ in range(n_marks)]
+        scores[team_idx] += parser.team_score_contribution(marks)
+        rows.append([nickname, team_idx, rng.choice(positions), marks])
+
+    # Matches cannot end in a draw... give an extra mark to the first team
+    if scores[0] == scores[1]:
+        score_idx = next(score_idx for score_idx, sign in parser.score_signs if sign > 0)
+        rows[0][3][score_idx] += 1
+
+    lines = [discipline.name]
+    for number, (nickname, team_idx, position, marks) in enumerate(rows, start=1):
+        fields = [f"player {nickname}", nickname, str(number), teams[team_idx], position]
+        lines.append(";".join(fields + [str(mark) for mark in marks]))
+    return lines
+
+
+def generate_tournament(
+    directory: Path,
+    n_matches: int = 100,
+    rows_per_match: int = 10,
+    n_players: int = 1000,
+    n_teams: int = 20,
+    disciplines: Optional[Sequence[ToucanDiscipline]] = None,
+    seed: int = 0,
+) -> int:
+    """Generate a synthetic tournament with valid match files.
+
+    Parameters
+    ----------
+    directory : Path
+        Directory where the match files are written. It is created if needed.
+    n_matches : int, optional
+        Number of match files, by default 100.
+    rows_per_match : int, optional
+        Number of players in each match, by default 10.
+    n_players : int, optional
+        Number of different players in the tournament, by default 1000.
+    n_teams : int, optional
+        Number of different teams in the tournament, by default 20.
+    disciplines : Sequence[ToucanDiscipline], optional
+        Disciplines of the matches, by default all of them.
+    seed : int, optional
+        Seed of the random number generator, by default 0.
+
+    Returns
+    -------
+    int
+        The total number of player records written.
+    """
+    if rows_per_match < 2 or rows_per_match > n_players or n_teams < 2:
+        raise ValueError("Matches need at least two players and two teams.")
+
+    rng = random.Random(seed)
+    disciplines = list(ToucanDiscipline) if disciplines is None else list(disciplines)
+    nicknames = [f"nick{idx}" for idx in range(n_players)]
+    teams = [f"Team {idx}" for idx in range(n_teams)]
+    width = len(str(n_matches - 1))
+
+    directory.mkdir(parents=True, exist_ok=True)
+    for match_idx in range(n_matches):
+        lines = generate_match(
+            rng.choice(disciplines),
+            rng.sample(nicknames, rows_per_match),
+            rng.sample(teams, 2),
+            rng,
+        )
+        Path(directory, f"match{match_idx:0{width}d}.txt").write_text("\n".join(lines) + "\n")
+
+    return n_matches * rows_per_match
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Generate a synthetic tournament from the command line.
+
+    Parameters
+    ----------
+    argv : Sequence[str], optional
+        The command line arguments, by default ``sys.argv[1:]``.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("directory", type=Path, help="directory where match files are written")
+    parser.add_argument("--matches", type=int, default=100, help="number of match files")
+    parser.add_argument("--rows-per-match", type=int, default=10, help="players per match")
+    parser.add_argument("--players", type=int, default=1000, help="number of players")
+    parser.add_argument("--teams", type=int, default=20, help="number of teams")
+    parser.add_argument(
+        "--discipline",
+        action="append",
+        choices=[discipline.name for discipline in ToucanDiscipline],
+        help="discipline of the matches (can be repeated), by default all of them",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    args = parser.parse_args(argv)
+
+    n_rows = generate_tournament(
+        args.directory,
+        n_matches=args.matches,
+        rows_per_match=args.rows_per_match,
+        n_players=args.players,
+        n_teams=args.teams,
+        disciplines=args.discipline and [ToucanDiscipline[name] for name in args.discipline],
+        seed=args.seed,
+    )
+    print(f"Generated {args.matches} match files ({n_rows} player records) in {args.directory}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,60 @@
 """Pythonic library used for computing the Most Valuable Player (MVP) of the Toucan Tournament."""
 
+from typing import TYPE_CHECKING, Any
+
+# Note: both the version and the classes exposed here are resolved lazily
+# (i.e. on first access), so that importing the package (e.g. from the
+# command line interface) stays fast.
+
 # Version
 # ------------------------------------------------------------------------------
 
-try:
-    import importlib.metadata as importlib_metadata
-except ModuleNotFoundError:  # pragma: no cover
-    import importlib_metadata  # type: ignore
 
-__version__ = importlib_metadata.version(__name__.replace(".", "-"))
-"""Toucan MVP calculator library version."""
+def _get_version() -> str:
+    """Retrieve the Toucan MVP calculator library version.
+
+    Returns
+    -------
+    str
+        The library version.
+    """
+    try:
+        import importlib.metadata as importlib_metadata
+    except ModuleNotFoundError:  # pragma: no cover
+        import importlib_metadata  # type: ignore
+
+    return importlib_metadata.version(__name__.replace(".", "-"))
+
 
 # Ease import statements
 # ------------------------------------------------------------------------------
 
-from toucan.mvp.calculator.tournament import ToucanTournament
+if TYPE_CHECKING:  # pragma: no cover
+    from toucan.mvp.calculator.league import ToucanLeague  # noqa : F401
+    from toucan.mvp.calculator.tournament import ToucanTournament  # noqa : F401
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the lazy attributes of the package.
+
+    Parameters
+    ----------
+    name : str
+        The name of the attribute.
+
+    Returns
+    -------
+    Any
+        The value of the attribute.
+    """
+    if name == "__version__":
+        value = _get_version()
+    elif name == "ToucanTournament":
+        from toucan.mvp.calculator.tournament import ToucanTournament as value
+    elif name == "ToucanLeague":
+        from toucan.mvp.calculator.league import ToucanLeague as value
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
@@ -0,0 +1,7 @@
+"""Allow running the ``toucan-mvp`` command line interface with ``python -m``."""
+
+import sys
+
+from toucan.mvp.calculator.cli import main
+
+sys.exit(main())
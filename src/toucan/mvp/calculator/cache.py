@@ -0,0 +1,304 @@
+"""Module containing the cache of the results of scored match files.
+
+Notes
+-----
+Results are keyed by the content hash of the match file and the version of the
+discipline definitions (see ``get_disciplines_version``), so a match file is
+only scored again when either its content or the way it is scored changes,
+regardless of its path or of the tournament it belongs to.
+
+Results are kept in memory and, optionally, in a directory (one JSON file per
+match file), so that they survive across processes. Both levels evict the
+least recently used results when they grow beyond their size bound.
+"""
+
+from collections import OrderedDict
+import hashlib
+import json
+import os
+from pathlib import Path
+import tempfile
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union
+
+from toucan.mvp.calculator.errors import ToucanException
+from toucan.mvp.calculator.manifest import compute_file_digest
+
+if TYPE_CHECKING:  # pragma: no cover
+    from toucan.mvp.calculator.tournament import MatchResult
+
+CACHE_MAX_ENTRIES = 4096
+"""Default maximum number of results kept in memory."""
+
+CACHE_MAX_BYTES = 256 << 20
+"""Default maximum size (in bytes) of the results kept on disk."""
+
+
+class ToucanMatchCache:
+    """Class caching the results of scored match files by content hash.
+
+    Parameters
+    ----------
+    path : Path or str, optional
+        Directory where the results are kept on disk, by default ``None`` (i.e.
+        they are only kept in memory).
+    max_entries : int, optional
+        Maximum number of results kept in memory, by default ``CACHE_MAX_ENTRIES``.
+    max_bytes : int, optional
+        Maximum size (in bytes) of the results kept on disk, by default
+        ``CACHE_MAX_BYTES``.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[Path, str]] = None,
+        max_entries: int = CACHE_MAX_ENTRIES,
+        max_bytes: int = CACHE_MAX_BYTES,
+    ) -> None:
+        """Instantiate ``ToucanMatchCache`` object."""
+        if max_entries < 0 or max_bytes < 0:
+            raise ToucanException("The size bounds of the cache cannot be negative.")
+        self._max_entries: int = max_entries
+        self._max_bytes: int = max_bytes
+        self._entries: "OrderedDict[str, MatchResult]" = OrderedDict()
+        self._hits: int = 0
+        self._misses: int = 0
+
+        # Results kept on disk (and their size), least recently used first
+        self._path: Optional[Path] = None if path is None else Path(path)
+        self._files: "OrderedDict[str, int]" = OrderedDict()
+        self._size: int = 0
+        if self._path is not None:
+            self._path.mkdir(parents=True, exist_ok=True)
+            files = sorted(
+                (file.stat().st_mtime_ns, file.stem, file.stat().st_size)
+                for file in self._path.glob("*.json")
+            )
+            for _, key, size in files:
+                self._files[key] = size
+                self._size += size
+            while self._files and self._size > self._max_bytes:
+                self._discard_file(next(iter(self._files)))
+
+    def __len__(self) -> int:
+        """Count the results kept in memory.
+
+        Returns
+        -------
+        int
+            Number of results.
+        """
+        return len(self._entries)
+
+    @property
+    def hits(self) -> int:
+        """Access property for retrieving the amount of results found in the cache.
+
+        Returns
+        -------
+        int
+            Number of hits.
+        """
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Access property for retrieving the amount of results not found in the cache.
+
+        Returns
+        -------
+        int
+            Number of misses.
+        """
+        return self._misses
+
+    def get_key(self, filepath: Union[Path, bytes], version: str) -> str:
+        """Compute the key of the result of a match file.
+
+        Parameters
+        ----------
+        filepath : Path or bytes
+            The path to the match's file or its contents (e.g. those of an
+            archive member).
+        version : str
+            The version of the discipline definitions.
+
+        Returns
+        -------
+        str
+            The key of the result.
+        """
+        if isinstance(filepath, bytes):
+            digest = hashlib.sha256(filepath).hexdigest()
+        else:
+            digest = compute_file_digest(filepath)
+        return f"{digest}-{version[:16]}"
+
+    def get(self, key: str) -> Optional["MatchResult"]:
+        """Retrieve a result from the cache.
+
+        Parameters
+        ----------
+        key : str
+            The key of the result.
+
+        Returns
+        -------
+        MatchResult or None
+            The result, or ``None`` if it is not in the cache.
+        """
+        result = self._entries.get(key)
+        if result is not None:
+            self._entries.move_to_end(key)
+        elif key in self._files:
+            result = self._read(key)
+            if result is not None:
+                self._remember(key, result)
+
+        if result is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+        return result
+
+    def put(self, key: str, result: "MatchResult") -> None:
+        """Add a result to the cache.
+
+        Parameters
+        ----------
+        key : str
+            The key of the result.
+        result : MatchResult
+            The result.
+        """
+        self._remember(key, result)
+        if self._path is not None and key not in self._files:
+            self._write(key, result)
+
+    def clear(self) -> None:
+        """Remove every result from the cache (also from disk)."""
+        self._entries.clear()
+        while self._files:
+            self._discard_file(next(iter(self._files)))
+
+    def _remember(self, key: str, result: "MatchResult") -> None:
+        """Keep a result in memory, evicting the least recently used ones if needed.
+
+        Parameters
+        ----------
+        key : str
+            The key of the result.
+        result : MatchResult
+            The result.
+        """
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def _read(self, key: str) -> Optional["MatchResult"]:
+        """Read a result from disk, discarding it if it cannot be read.
+
+        Parameters
+        ----------
+        key : str
+            The key of the result.
+
+        Returns
+        -------
+        MatchResult or None
+            The result, or ``None`` if it cannot be read.
+        """
+        filepath = self._path / f"{key}.json"
+        try:
+            with open(filepath, "r") as file:
+                result = _decode_result(json.load(file))
+        except (OSError, ValueError, TypeError, KeyError):
+            self._discard_file(key)
+            return None
+
+        # Touch the file, so that it is the most recently used one
+        os.utime(filepath)
+        self._files.move_to_end(key)
+        return result
+
+    def _write(self, key: str, result: "MatchResult") -> None:
+        """Write a result to disk, evicting the least recently used ones if needed.
+
+        Parameters
+        ----------
+        key : str
+            The key of the result.
+        result : MatchResult
+            The result.
+        """
+        encoded = json.dumps(_encode_result(result), separators=(",", ":")).encode("utf-8")
+        if len(encoded) > self._max_bytes:
+            return
+        while self._files and self._size + len(encoded) > self._max_bytes:
+            self._discard_file(next(iter(self._files)))
+
+        # Each writer has a temporary file of its own, since several processes
+        # may share the cache directory (and write the same result at once)
+        with tempfile.NamedTemporaryFile(
+            dir=self._path, prefix=f"{key}.", suffix=".tmp", delete=False
+        ) as tmp_file:
+            tmp_file.write(encoded)
+        try:
+            os.replace(tmp_file.name, self._path / f"{key}.json")
+        except OSError:
+            os.remove(tmp_file.name)
+            raise
+        self._files[key] = len(encoded)
+        self._size += len(encoded)
+
+    def _discard_file(self, key: str) -> None:
+        """Remove a result from disk.
+
+        Parameters
+        ----------
+        key : str
+            The key of the result.
+        """
+        self._size -= self._files.pop(key)
+        try:
+            os.remove(self._path / f"{key}.json")
+        except FileNotFoundError:
+            pass
+
+
+def _encode_result(result: "MatchResult") -> Dict[str, Any]:
+    """Encode the result of a match as JSON compatible data.
+
+    Parameters
+    ----------
+    result : MatchResult
+        The result.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The encoded result.
+    """
+    discipline, teams, scores, rows = result
+    return {"discipline": discipline, "teams": teams, "scores": scores, "rows": rows}
+
+
+def _decode_result(data: Dict[str, Any]) -> "MatchResult":
+    """Decode the result of a match encoded with ``_encode_result``.
+
+    Parameters
+    ----------
+    data : Dict[str, Any]
+        The encoded result.
+
+    Returns
+    -------
+    MatchResult
+        The result.
+    """
+    return (
+        data["discipline"],
+        tuple(data["teams"]),
+        tuple(data["scores"]),
+        [tuple(row) for row in data["rows"]],
+    )
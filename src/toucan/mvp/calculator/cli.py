@@ -0,0 +1,469 @@
+"""Module containing the ``toucan-mvp`` command line interface.
+
+Example
+-------
+Process two tournaments at once, two worker processes each, and print their
+leaderboards as JSON together with the time spent in each phase:
+
+.. code:: bash
+
+   toucan-mvp season1/ season2/ --workers 2 --format json --profile
+
+Process a tournament in two shards (e.g. on two hosts sharing a file system)
+and merge their partial results:
+
+.. code:: bash
+
+   toucan-mvp season1/ --shard 0/2 --partial-output shard0.json
+   toucan-mvp season1/ --shard 1/2 --partial-output shard1.json
+   toucan-mvp shard0.json shard1.json --merge --name season1
+"""
+
+import argparse
+import csv
+import hashlib
+import io
+import json
+import os
+from pathlib import Path
+import sys
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+FORMATS = ("text", "json", "csv")
+"""Output formats of the leaderboards."""
+
+LEADERBOARD_FIELDS = ("tournament", "rank", "nickname", "name", "points")
+"""Fields of each entry of the leaderboards."""
+
+
+def get_default_state_dir() -> Path:
+    """Retrieve the default directory where incremental runs keep their state.
+
+    Returns
+    -------
+    Path
+        ``$XDG_CACHE_HOME/toucan-mvp``, or ``~/.cache/toucan-mvp`` if not defined.
+    """
+    cache_dir = os.environ.get("XDG_CACHE_HOME") or Path(Path.home(), ".cache")
+    return Path(cache_dir, "toucan-mvp")
+
+
+def run_tournament(
+    directory: Path,
+    workers: int,
+    engine: str,
+    top: Optional[int],
+    state_dir: Optional[Path],
+    cache_dir: Optional[Path] = None,
+) -> Tuple[Dict[str, Any], Dict[str, float]]:
+    """Process a tournament directory (or archive) and compute its leaderboard.
+
+    Parameters
+    ----------
+    directory : Path
+        Directory (or zip/tar archive) where the match files are located.
+    workers : int
+        Number of worker processes used for processing the match files.
+    engine : str
+        The scoring engine of the tournament.
+    top : int or None
+        Number of players in the leaderboard. ``None`` for all of them.
+    state_dir : Path or None
+        Directory where the state of incremental runs is kept. ``None`` for
+        a non incremental run. Archives are never processed incrementally.
+    cache_dir : Path or None, optional
+        Directory where the results of the match files are cached, by default
+        ``None`` (i.e. no cache).
+
+    Returns
+    -------
+    Tuple[Dict[str, Any], Dict[str, float]]
+        The leaderboard of the tournament and the time (in seconds) spent in
+        each phase.
+    """
+    timings: Dict[str, float] = {}
+    start = time.perf_counter()
+
+    def lap(phase: str) -> None:
+        nonlocal start
+        now = time.perf_counter()
+        timings[phase] = timings.get(phase, 0.0) + now - start
+        start = now
+
+    from toucan.mvp.calculator.tournament import ToucanTournament
+
+    lap("import")
+
+    # Incremental runs resume from the snapshot of the previous run (if any),
+    # archives are always processed from scratch
+    directory = directory.resolve()
+    snapshot = None
+    tournament = None
+    if state_dir is not None and directory.is_dir():
+        key = hashlib.sha1(str(directory).encode("utf-8")).hexdigest()
+        snapshot = Path(state_dir, f"{key}.snapshot")
+        if snapshot.is_file():
+            tournament = ToucanTournament.load(snapshot)
+    if tournament is None:
+        tournament = ToucanTournament(directory.name, engine)
+    if cache_dir is not None:
+        from toucan.mvp.calculator.cache import ToucanMatchCache
+
+        tournament.cache = ToucanMatchCache(cache_dir)
+    lap("load_state")
+
+    tournament.process_tournament(directory, workers=workers, incremental=snapshot is not None)
+    lap("process")
+
+    leaderboard = _build_leaderboard(tournament, top)
+    lap("ranking")
+
+    if snapshot is not None:
+        snapshot.parent.mkdir(parents=True, exist_ok=True)
+        tournament.save(snapshot)
+        lap("save_state")
+
+    return leaderboard, timings
+
+
+def merge_partial_results(
+    paths: Sequence[Path], name: str, top: Optional[int]
+) -> Tuple[Dict[str, Any], Dict[str, float]]:
+    """Merge the partial results of the shards of a tournament and compute its leaderboard.
+
+    Parameters
+    ----------
+    paths : Sequence[Path]
+        The files of the partial results.
+    name : str
+        The name of the tournament.
+    top : int or None
+        Number of players in the leaderboard. ``None`` for all of them.
+
+    Returns
+    -------
+    Tuple[Dict[str, Any], Dict[str, float]]
+        The leaderboard of the tournament and the time (in seconds) spent in
+        each phase.
+    """
+    start = time.perf_counter()
+    from toucan.mvp.calculator.partial import ToucanPartialResult
+    from toucan.mvp.calculator.tournament import ToucanTournament
+
+    partials = [ToucanPartialResult.load(path) for path in paths]
+    load = time.perf_counter()
+    tournament = ToucanTournament.from_partials(name, partials)
+    merge = time.perf_counter()
+    leaderboard = _build_leaderboard(tournament, top)
+    timings = {
+        "load_partials": load - start,
+        "merge": merge - load,
+        "ranking": time.perf_counter() - merge,
+    }
+    return leaderboard, timings
+
+
+def _build_leaderboard(tournament: Any, top: Optional[int]) -> Dict[str, Any]:
+    """Build the leaderboard of a processed tournament.
+
+    Parameters
+    ----------
+    tournament : ToucanTournament
+        The tournament.
+    top : int or None
+        Number of players in the leaderboard. ``None`` for all of them.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The leaderboard of the tournament.
+    """
+    players = tournament.top(len(tournament._players) if top is None else top)
+    return {
+        "tournament": tournament.name,
+        "mvp": None if tournament.mvp is None else tournament.mvp.nickname,
+        "leaderboard": [
+            {
+                "tournament": tournament.name,
+                "rank": rank,
+                "nickname": player.nickname,
+                "name": player.name,
+                "points": player.total_points,
+            }
+            for rank, player in enumerate(players, start=1)
+        ],
+    }
+
+
+def format_leaderboards(leaderboards: List[Dict[str, Any]], format: str) -> str:
+    """Format the leaderboards of several tournaments.
+
+    Parameters
+    ----------
+    leaderboards : List[Dict[str, Any]]
+        The leaderboards of the tournaments.
+    format : str
+        The output format, one of ``FORMATS``.
+
+    Returns
+    -------
+    str
+        The formatted leaderboards.
+    """
+    if format == "json":
+        return json.dumps(leaderboards, indent=2)
+
+    if format == "csv":
+        output = io.StringIO()
+        writer = csv.DictWriter(output, fieldnames=LEADERBOARD_FIELDS, lineterminator="\n")
+        writer.writeheader()
+        for leaderboard in leaderboards:
+            writer.writerows(leaderboard["leaderboard"])
+        return output.getvalue().rstrip("\n")
+
+    lines = []
+    for leaderboard in leaderboards:
+        lines.append(f"Tournament: {leaderboard['tournament']}")
+        lines.append(f"MVP:        {leaderboard['mvp']}")
+        for entry in leaderboard["leaderboard"]:
+            lines.append(f"{entry['rank']:>6}. {entry['nickname']:<24}{entry['points']:>10}")
+    return "\n".join(lines)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the parser of the command line arguments.
+
+    Returns
+    -------
+    argparse.ArgumentParser
+        The parser of the command line arguments.
+    """
+    parser = argparse.ArgumentParser(
+        prog="toucan-mvp",
+        description="Compute the Most Valuable Player (MVP) of Toucan tournaments.",
+    )
+    parser.add_argument(
+        "directories",
+        nargs="+",
+        type=Path,
+        help="directories (or zip/tar archives) where match files are located",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="worker processes (shared among directories when several are given)",
+    )
+    parser.add_argument(
+        "--engine", choices=("python", "numpy"), default="python", help="scoring engine"
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="only process the match files changed since the previous incremental run",
+    )
+    parser.add_argument(
+        "--state-dir",
+        type=Path,
+        default=None,
+        help="directory where incremental runs keep their state "
+        "(by default $XDG_CACHE_HOME/toucan-mvp)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="directory where the results of the match files are cached across runs",
+    )
+    parser.add_argument(
+        "--disciplines",
+        type=Path,
+        action="append",
+        default=[],
+        help="JSON or TOML file defining additional disciplines (can be repeated)",
+    )
+    parser.add_argument(
+        "--shard",
+        type=_parse_shard,
+        default=None,
+        metavar="I/N",
+        help="only process shard I out of N and deliver its partial result "
+        "(see --partial-output and --coordinator)",
+    )
+    parser.add_argument(
+        "--partial-output",
+        type=Path,
+        default=None,
+        help="file where the partial result of the shard is saved",
+    )
+    parser.add_argument(
+        "--coordinator",
+        type=_parse_address,
+        default=None,
+        metavar="HOST:PORT",
+        help="coordinator to which the partial result of the shard is sent",
+    )
+    parser.add_argument(
+        "--merge",
+        action="store_true",
+        help="merge the partial results given instead of directories into a single tournament",
+    )
+    parser.add_argument(
+        "--name", default="tournament", help="name of the tournament merged with --merge"
+    )
+    parser.add_argument("--top", type=int, default=None, help="players in each leaderboard")
+    parser.add_argument("--format", choices=FORMATS, default="text", help="output format")
+    parser.add_argument(
+        "--profile", action="store_true", help="print the time spent in each phase to stderr"
+    )
+    parser.add_argument("--version", action="store_true", help="print the version and exit")
+    return parser
+
+
+def _parse_shard(value: str) -> Tuple[int, int]:
+    """Parse a shard given as ``I/N`` in the command line.
+
+    Parameters
+    ----------
+    value : str
+        The shard.
+
+    Returns
+    -------
+    Tuple[int, int]
+        The shard and the amount of shards.
+    """
+    try:
+        shard, shards = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid shard '{value}', expected I/N") from None
+    if shards < 1 or not 0 <= shard < shards:
+        raise argparse.ArgumentTypeError(f"invalid shard '{value}', expected 0 <= I < N")
+    return shard, shards
+
+
+def _parse_address(value: str) -> Tuple[str, int]:
+    """Parse an address given as ``HOST:PORT`` in the command line.
+
+    Parameters
+    ----------
+    value : str
+        The address.
+
+    Returns
+    -------
+    Tuple[str, int]
+        The host and port.
+    """
+    host, _, port = value.rpartition(":")
+    if not host or not port.isdigit():
+        raise argparse.ArgumentTypeError(f"invalid address '{value}', expected HOST:PORT")
+    return host, int(port)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the ``toucan-mvp`` command line interface.
+
+    Parameters
+    ----------
+    argv : Sequence[str], optional
+        The command line arguments, by default ``sys.argv[1:]``.
+
+    Returns
+    -------
+    int
+        The exit code.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if "--version" in argv:
+        import toucan.mvp.calculator
+
+        print(f"toucan-mvp {toucan.mvp.calculator.__version__}")
+        return 0
+
+    args = build_parser().parse_args(argv)
+    if args.workers < 1:
+        print("toucan-mvp: error: the number of workers must be at least 1", file=sys.stderr)
+        return 2
+    if args.shard is not None and (
+        len(args.directories) > 1 or (args.partial_output is None) == (args.coordinator is None)
+    ):
+        print(
+            "toucan-mvp: error: --shard requires a single directory and either "
+            "--partial-output or --coordinator",
+            file=sys.stderr,
+        )
+        return 2
+    state_dir = None
+    if args.incremental:
+        state_dir = get_default_state_dir() if args.state_dir is None else args.state_dir
+
+    from toucan.mvp.calculator.discipline import (
+        _restore_disciplines,
+        get_custom_disciplines,
+        load_disciplines,
+    )
+    from toucan.mvp.calculator.errors import ToucanException
+
+    start = time.perf_counter()
+    try:
+        for disciplines_file in args.disciplines:
+            load_disciplines(disciplines_file)
+
+        if args.shard is not None:
+            # Worker of a sharded run... only deliver the partial result
+            from toucan.mvp.calculator.shard import run_shard
+
+            output = args.coordinator if args.coordinator is not None else args.partial_output
+            run_shard(
+                args.directories[0], *args.shard, output, workers=args.workers, engine=args.engine
+            )
+            return 0
+        elif args.merge:
+            results = [merge_partial_results(args.directories, args.name, args.top)]
+        elif len(args.directories) > 1 and args.workers > 1:
+            # Several tournaments at once... one per worker process
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(
+                max_workers=args.workers,
+                initializer=_restore_disciplines,
+                initargs=(get_custom_disciplines(),),
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        run_tournament,
+                        directory,
+                        1,
+                        args.engine,
+                        args.top,
+                        state_dir,
+                        args.cache_dir,
+                    )
+                    for directory in args.directories
+                ]
+                results = [future.result() for future in futures]
+        else:
+            results = [
+                run_tournament(
+                    directory, args.workers, args.engine, args.top, state_dir, args.cache_dir
+                )
+                for directory in args.directories
+            ]
+    except ToucanException as err:
+        print(f"toucan-mvp: error: {err}", file=sys.stderr)
+        return 1
+    elapsed = time.perf_counter() - start
+
+    output_start = time.perf_counter()
+    print(format_leaderboards([leaderboard for leaderboard, _ in results], args.format))
+    output_time = time.perf_counter() - output_start
+
+    if args.profile:
+        for directory, (_, timings) in zip(args.directories, results):
+            phases = ", ".join(f"{phase}={seconds:.4f}s" for phase, seconds in timings.items())
+            print(f"[profile] {directory}: {phases}", file=sys.stderr)
+        print(f"[profile] total: run={elapsed:.4f}s, output={output_time:.4f}s", file=sys.stderr)
+
+    return 0
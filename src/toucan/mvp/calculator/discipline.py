@@ -1,10 +1,18 @@
 """Module defining the disciplines ran in the Toucan Tournament and auxiliary methods."""
 
 from enum import Enum
-from typing import Dict, Tuple
+from functools import lru_cache
+import hashlib
+import json
+from pathlib import Path
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 from toucan.mvp.calculator.errors import ToucanException
 
+BONUS_POINTS = 10
+"""Default bonus points given to each player of the winner team of a match."""
+
 
 class ToucanDiscipline(Enum):
     """Provides an enum holding the different disciplines available.
@@ -35,14 +43,14 @@ class ToucanDiscipline(Enum):
     # TODO: force regex to be numbers or letters
     BASKETBALL = (
         0,
-        r"^(.*);(.*);([0-9]*);(.*);([a-zA-Z]*);([0-9]*);([0-9]*);([0-9]*)$",
+        r"^(.*);(.*);([0-9]*);(.*);([a-zA-Z]*);([0-9]+);([0-9]+);([0-9]+)$",
         {"G": (2, 3, 1), "F": (2, 2, 2), "C": (2, 1, 3)},
         ((0, True),),
         {"G": 0, "F": 0, "C": 0},
     )
     HANDBALL = (
         1,
-        r"^(.*);(.*);([0-9]*);(.*);([a-zA-Z]*);([0-9]*);([0-9]*)$",
+        r"^(.*);(.*);([0-9]*);(.*);([a-zA-Z]*);([0-9]+);([0-9]+)$",
         {"G": (5, -2), "F": (1, -1)},
         (
             (0, True),
@@ -95,10 +103,626 @@ class ToucanDiscipline(Enum):
         """
         return self.value[4]
 
+    def get_bonus_points(self) -> int:
+        """Accessor method to the bonus points given to each player of the winner team.
+
+        Returns
+        -------
+        int
+            The bonus points.
+        """
+        return BONUS_POINTS
+
+    def get_parser(self) -> "ToucanDisciplineParser":
+        """Accessor method to the precompiled parser of the discipline's match lines.
+
+        Notes
+        -----
+        The parser is built only once per discipline and cached afterwards.
+
+        Returns
+        -------
+        ToucanDisciplineParser
+            The parser of the discipline.
+        """
+        return _get_discipline_parser(self)
+
+
+class ToucanDisciplineParser:
+    """Class holding everything needed to parse and score the match lines of a discipline.
+
+    Notes
+    -----
+    The parser is built from the ``ToucanDiscipline`` enum values (or from a
+    ``ToucanCustomDiscipline`` definition) and contains:
+
+    * The compiled regex of the match lines (both for ``str`` and ``bytes``
+      lines). Lines are first split on ``;``, which is much faster, and the
+      regex is only used as a fallback for the lines that do not look like a
+      well-formed line.
+    * A table with the evaluation parameters per position and the extra
+      rating points of the position already folded in.
+    * The sign with which each mark contributes to the team's score.
+    * The bonus points given to each player of the winner team.
+
+    Parameters
+    ----------
+    discipline : ToucanDiscipline or ToucanCustomDiscipline
+        The discipline to be parsed.
+    """
+
+    def __init__(self, discipline: Union[ToucanDiscipline, "ToucanCustomDiscipline"]) -> None:
+        """Instantiate ``ToucanDisciplineParser`` object."""
+        self._discipline: Union[ToucanDiscipline, ToucanCustomDiscipline] = discipline
+        self._pattern: re.Pattern = re.compile(discipline.get_pattern())
+        self._raw_pattern: re.Pattern = re.compile(discipline.get_pattern().encode())
+        self._n_fields: int = self._pattern.groups
+
+        extra_points = discipline.get_extra_points()
+        self._coefficients: Dict[str, Tuple[Tuple[int, ...], int]] = {
+            position: (tuple(eval_params), extra_points.get(position, 0))
+            for position, eval_params in discipline.get_eval_params().items()
+        }
+        self._raw_positions: Dict[bytes, str] = {
+            position.encode(): position for position in self._coefficients
+        }
+        self._score_signs: Tuple[Tuple[int, int], ...] = tuple(
+            (score_idx, 1 if is_addition else -1)
+            for score_idx, is_addition in discipline.get_points_in_eval_params()
+        )
+        self._bonus_points: int = discipline.get_bonus_points()
+
+    @property
+    def discipline(self) -> Union[ToucanDiscipline, "ToucanCustomDiscipline"]:
+        """Access property for retrieving the discipline parsed.
+
+        Returns
+        -------
+        ToucanDiscipline or ToucanCustomDiscipline
+            The discipline parsed.
+        """
+        return self._discipline
+
+    @property
+    def pattern(self) -> re.Pattern:
+        """Access property for retrieving the compiled regex of a match line.
+
+        Returns
+        -------
+        re.Pattern
+            The compiled regex of a match line.
+        """
+        return self._pattern
+
+    @property
+    def coefficients(self) -> Dict[str, Tuple[Tuple[int, ...], int]]:
+        """Access property for retrieving the scoring coefficients per position.
+
+        Returns
+        -------
+        Dict[str, Tuple[Tuple[int, ...], int]]
+            The evaluation parameters and extra rating points of each position.
+        """
+        return self._coefficients
+
+    @property
+    def score_signs(self) -> Tuple[Tuple[int, int], ...]:
+        """Access property for retrieving the contribution of the marks to the team's score.
+
+        Returns
+        -------
+        Tuple[Tuple[int, int], ...]
+            Index of each mark contributing to the team's score and its sign
+            (i.e. 1 for an addition, -1 for a subtraction).
+        """
+        return self._score_signs
+
+    @property
+    def bonus_points(self) -> int:
+        """Access property for retrieving the bonus points of the winner team's players.
+
+        Returns
+        -------
+        int
+            The bonus points given to each player of the winner team.
+        """
+        return self._bonus_points
+
+    def parse_line(self, line: str) -> Optional[Tuple[str, str, str, str, str, List[int]]]:
+        """Parse a match line.
+
+        Parameters
+        ----------
+        line : str
+            The match line, without its line break.
+
+        Returns
+        -------
+        Tuple[str, str, str, str, str, List[int]] or None
+            The name, nickname, number, team, position and marks of the player.
+            ``None`` if the line does not match the discipline's pattern.
+        """
+        fields = line.split(";")
+        digits = "".join(fields[5:])
+        if (
+            len(fields) != self._n_fields
+            or "\n" in line
+            or not fields[4].isascii()
+            or not fields[4].isalpha()
+            or not all(fields[5:])
+            or not (digits.isascii() and digits.isdigit())
+            or not (fields[2].isascii() and fields[2].isdigit() or fields[2] == "")
+        ):
+            # Not a well-formed line... let the regex decide
+            entries = self._pattern.match(line)
+            if entries is None:
+                return None
+            fields = entries.groups()
+
+        name, nickname, number, team, position, *marks = fields
+        return name, nickname, number, team, position, list(map(int, marks))
+
+    def parse_raw_line(
+        self, line: bytes
+    ) -> Optional[Tuple[bytes, bytes, bytes, bytes, str, List[int]]]:
+        """Parse a match line without decoding it.
+
+        Notes
+        -----
+        The marks are converted straight from their bytes and the position is
+        looked up among the ones of the discipline, so that no intermediate
+        strings are created. The name, nickname, number and team are left
+        undecoded.
+
+        Parameters
+        ----------
+        line : bytes
+            The match line, without its line break.
+
+        Returns
+        -------
+        Tuple[bytes, bytes, bytes, bytes, str, List[int]] or None
+            The name, nickname, number, team, position and marks of the player.
+            ``None`` if the line does not match the discipline's pattern.
+        """
+        # Note: contrary to ``str`` ones, ``bytes`` methods only consider ASCII
+        # letters and digits... and all the marks are checked at once
+        fields = line.split(b";")
+        if (
+            len(fields) != self._n_fields
+            or not fields[4].isalpha()
+            or not b"".join(fields[5:]).isdigit()
+            or not all(fields[5:])
+            or not (fields[2].isdigit() or fields[2] == b"")
+        ):
+            # Not a well-formed line... let the regex decide
+            entries = self._raw_pattern.match(line)
+            if entries is None:
+                return None
+            fields = entries.groups()
+
+        name, nickname, number, team, position, *marks = fields
+        position = self._raw_positions.get(position) or position.decode()
+        return name, nickname, number, team, position, [int(mark) for mark in marks]
+
+    def score(self, marks: List[int], position: str) -> Optional[int]:
+        """Compute the rating points of a player in a match.
+
+        Parameters
+        ----------
+        marks : List[int]
+            Marks obtained during the match.
+        position : str
+            Player's position in the match.
+
+        Returns
+        -------
+        int or None
+            The rating points (extra points included). ``None`` if the position
+            does not exist in the discipline.
+        """
+        coefficients = self._coefficients.get(position, None)
+        if coefficients is None:
+            return None
+        eval_params, extra_points = coefficients
+        return sum([eval * mark for eval, mark in zip(eval_params, marks)]) + extra_points
+
+    def team_score_contribution(self, marks: List[int]) -> int:
+        """Compute the score contributed by a player to the team's result.
+
+        Parameters
+        ----------
+        marks : List[int]
+            Marks obtained during the match.
+
+        Returns
+        -------
+        int
+            Score contributed to the team's result.
+        """
+        score = 0
+        for score_idx, sign in self._score_signs:
+            score += sign * marks[score_idx]
+        return score
+
+
+class ToucanCustomDiscipline:
+    """Class defining a discipline at runtime (e.g. loaded from a configuration file).
+
+    Notes
+    -----
+    Custom disciplines provide the same accessors as the ``ToucanDiscipline``
+    enum, so they are parsed and scored by the very same (cached)
+    ``ToucanDisciplineParser``... hence as fast as the built-in ones. Their
+    match lines follow the same field layout: name, nickname, number, team,
+    position and one field per mark.
+
+    Parameters
+    ----------
+    name : str
+        The name of the discipline (i.e. the header of its match files).
+    marks : List[str]
+        The names of the marks of each player, in order of appearance.
+    positions : Dict[str, Tuple[List[int], int]]
+        The coefficient of each mark and the extra rating points per position.
+    team_score : Dict[str, int]
+        The sign (i.e. 1 or -1) with which some marks contribute to the team's
+        score.
+    bonus_points : int, optional
+        The bonus points given to each player of the winner team, by default
+        ``BONUS_POINTS``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        marks: List[str],
+        positions: Dict[str, Tuple[List[int], int]],
+        team_score: Dict[str, int],
+        bonus_points: int = BONUS_POINTS,
+    ) -> None:
+        """Instantiate ``ToucanCustomDiscipline`` object."""
+        if not re.fullmatch(r"[A-Za-z0-9_]+", name):
+            raise ToucanException(f"The discipline name '{name}' is not valid.")
+        self._name: str = name.upper()
+
+        # Check the field layout and the scoring of the discipline
+        if not marks or len(set(marks)) != len(marks):
+            raise ToucanException(f"The marks of '{self._name}' must be a list of unique names.")
+        self._marks: Tuple[str, ...] = tuple(marks)
+        self._eval_params: Dict[str, Tuple[int, ...]] = {}
+        self._extra_points: Dict[str, int] = {}
+        for position, (coefficients, extra_points) in positions.items():
+            if not re.fullmatch(r"[A-Za-z]+", position) or len(coefficients) != len(marks):
+                raise ToucanException(
+                    f"The position '{position}' of '{self._name}' must be a word with one coefficient per mark."  # noqa : E501
+                )
+            self._eval_params[position] = tuple(int(coefficient) for coefficient in coefficients)
+            self._extra_points[position] = int(extra_points)
+        if not self._eval_params:
+            raise ToucanException(f"The discipline '{self._name}' has no positions.")
+        for mark, sign in team_score.items():
+            if mark not in self._marks or sign not in (1, -1):
+                raise ToucanException(
+                    f"The team score of '{self._name}' must map marks to either 1 or -1."
+                )
+        self._points_in_eval_params: Tuple[Tuple[int, bool], ...] = tuple(
+            (self._marks.index(mark), sign == 1) for mark, sign in team_score.items()
+        )
+        self._bonus_points: int = int(bonus_points)
+
+    @classmethod
+    def from_dict(cls, definition: Dict[str, Any]) -> "ToucanCustomDiscipline":
+        """Build a discipline from its definition (e.g. a table of a configuration file).
+
+        Parameters
+        ----------
+        definition : Dict[str, Any]
+            The definition, with the ``name``, ``marks``, ``positions`` (each
+            of them with its ``coefficients`` and optional ``extra`` points),
+            ``team_score`` and optional ``bonus`` keys.
+
+        Returns
+        -------
+        ToucanCustomDiscipline
+            The discipline.
+        """
+        try:
+            return cls(
+                definition["name"],
+                list(definition["marks"]),
+                {
+                    position: (list(params["coefficients"]), params.get("extra", 0))
+                    for position, params in definition["positions"].items()
+                },
+                dict(definition["team_score"]),
+                definition.get("bonus", BONUS_POINTS),
+            )
+        except (KeyError, TypeError, ValueError, AttributeError) as error:
+            raise ToucanException(f"Invalid discipline definition: {error!r}") from None
+
+    @property
+    def name(self) -> str:
+        """Access property for retrieving the name of the discipline.
+
+        Returns
+        -------
+        str
+            The (upper case) name of the discipline.
+        """
+        return self._name
+
+    @property
+    def marks(self) -> Tuple[str, ...]:
+        """Access property for retrieving the names of the marks of the discipline.
+
+        Returns
+        -------
+        Tuple[str, ...]
+            The names of the marks, in order of appearance in the match lines.
+        """
+        return self._marks
+
+    def get_pattern(self) -> str:
+        """Accessor method to the line pattern in a match file.
+
+        Returns
+        -------
+        str
+            The regex expression for a match line.
+        """
+        return r"^(.*);(.*);([0-9]*);(.*);([a-zA-Z]*)" + r";([0-9]+)" * len(self._marks) + "$"
 
-def get_discipline_by_name(name: str) -> ToucanDiscipline:
+    def get_eval_params(self) -> Dict[str, Tuple[int, ...]]:
+        """Accessor method to the evaluation parameters for a player in a match file.
+
+        Returns
+        -------
+        Dict[str, Tuple[int, ...]]
+            Dictionary containing the evaluation parameters as a
+            function of the position.
+        """
+        return self._eval_params
+
+    def get_points_in_eval_params(self) -> Tuple[Tuple[int, bool], ...]:
+        """Accessor method to the positions in the evaluation parameters.
+
+        Returns
+        -------
+        Tuple[Tuple[int, bool], ...]
+            Tuple of tuples, where each subtuple indicates the location
+            where points are contributed and whether they should be considered
+            as an addition to the team's score or a subtraction.
+        """
+        return self._points_in_eval_params
+
+    def get_extra_points(self) -> Dict[str, int]:
+        """Accessor method to the extra rating points for a player in a match file.
+
+        Returns
+        -------
+        Dict[str, int]
+            Dictionary containing the extra rating points as a
+            function of the position.
+        """
+        return self._extra_points
+
+    def get_bonus_points(self) -> int:
+        """Accessor method to the bonus points given to each player of the winner team.
+
+        Returns
+        -------
+        int
+            The bonus points.
+        """
+        return self._bonus_points
+
+    def get_parser(self) -> ToucanDisciplineParser:
+        """Accessor method to the precompiled parser of the discipline's match lines.
+
+        Notes
+        -----
+        The parser is built only once per discipline and cached afterwards.
+
+        Returns
+        -------
+        ToucanDisciplineParser
+            The parser of the discipline.
+        """
+        return _get_discipline_parser(self)
+
+    def __repr__(self) -> str:
+        """Represent the discipline as string.
+
+        Returns
+        -------
+        str
+            String representation of the discipline.
+        """
+        return f"<ToucanCustomDiscipline.{self._name}>"
+
+
+@lru_cache(maxsize=None)
+def _get_discipline_parser(
+    discipline: Union[ToucanDiscipline, ToucanCustomDiscipline]
+) -> ToucanDisciplineParser:
+    """Build the parser of a discipline (only once, thanks to the cache).
+
+    Parameters
+    ----------
+    discipline : ToucanDiscipline or ToucanCustomDiscipline
+        The discipline to be parsed.
+
+    Returns
+    -------
+    ToucanDisciplineParser
+        The parser of the discipline.
+    """
+    return ToucanDisciplineParser(discipline)
+
+
+_DISCIPLINES_BY_NAME: Dict[str, Union[ToucanDiscipline, ToucanCustomDiscipline]] = {
+    discipline.name: discipline for discipline in ToucanDiscipline
+}
+"""Lookup table of the disciplines by (upper case) name."""
+
+
+def register_discipline(discipline: ToucanCustomDiscipline) -> None:
+    """Register a custom discipline, so that its match files can be processed.
+
+    Parameters
+    ----------
+    discipline : ToucanCustomDiscipline
+        The discipline to be registered.
+    """
+    if discipline.name in _DISCIPLINES_BY_NAME:
+        raise ToucanException(f"The discipline '{discipline.name}' is already registered.")
+    _DISCIPLINES_BY_NAME[discipline.name] = discipline
+
+
+def unregister_discipline(name: str) -> None:
+    """Unregister a custom discipline.
+
+    Parameters
+    ----------
+    name : str
+        The name of the discipline.
+    """
+    discipline = _DISCIPLINES_BY_NAME.get(name.upper(), None)
+    if not isinstance(discipline, ToucanCustomDiscipline):
+        raise ToucanException(f"The discipline '{name}' is not a registered custom discipline.")
+    del _DISCIPLINES_BY_NAME[discipline.name]
+
+
+def get_custom_disciplines() -> List[ToucanCustomDiscipline]:
+    """Retrieve the custom disciplines registered.
+
+    Returns
+    -------
+    List[ToucanCustomDiscipline]
+        The custom disciplines, in order of registration.
+    """
+    return [
+        discipline
+        for discipline in _DISCIPLINES_BY_NAME.values()
+        if isinstance(discipline, ToucanCustomDiscipline)
+    ]
+
+
+def load_disciplines(path: Union[Path, str]) -> List[ToucanCustomDiscipline]:
+    """Load custom disciplines from a configuration file and register them.
+
+    Notes
+    -----
+    The configuration file is either a JSON (``.json``) or a TOML (``.toml``)
+    file, holding a ``disciplines`` list with the definition of each of them
+    (see ``ToucanCustomDiscipline.from_dict``). For example, in TOML:
+
+    .. code:: toml
+
+       [[disciplines]]
+       name = "VOLLEYBALL"
+       marks = ["points", "blocks", "errors"]
+       team_score = {points = 1, errors = -1}
+       bonus = 5
+       positions.S = {coefficients = [1, 2, -1], extra = 10}
+       positions.L = {coefficients = [2, 1, -1]}
+
+    Either all the disciplines of the file are registered, or none of them.
+    Reading TOML files requires Python 3.11 or ``tomli`` to be installed.
+
+    Parameters
+    ----------
+    path : Path or str
+        The path to the configuration file.
+
+    Returns
+    -------
+    List[ToucanCustomDiscipline]
+        The disciplines registered.
+    """
+    path = Path(path)
+    if path.suffix == ".toml":
+        try:
+            import tomllib
+        except ModuleNotFoundError:  # pragma: no cover
+            try:
+                import tomli as tomllib  # type: ignore
+            except ModuleNotFoundError:
+                raise ToucanException("Reading TOML files requires 'tomli' to be installed.")
+        with open(path, "rb") as file:
+            config = tomllib.load(file)
+    elif path.suffix == ".json":
+        with open(path, "r") as file:
+            config = json.load(file)
+    else:
+        raise ToucanException(f"The disciplines file '{path}' is neither a JSON nor a TOML file.")
+
+    # Build every discipline before registering any of them
+    disciplines = [
+        ToucanCustomDiscipline.from_dict(definition) for definition in config.get("disciplines", [])
+    ]
+    names = [discipline.name for discipline in disciplines]
+    for name in names:
+        if name in _DISCIPLINES_BY_NAME or names.count(name) > 1:
+            raise ToucanException(f"The discipline '{name}' is already registered.")
+    for discipline in disciplines:
+        register_discipline(discipline)
+    return disciplines
+
+
+def get_disciplines_version() -> str:
+    """Compute the version of the definitions of the registered disciplines.
+
+    Notes
+    -----
+    The version changes whenever the way any match would be scored changes
+    (e.g. a custom discipline is registered or redefined), so it can be used
+    to invalidate the results scored with previous definitions.
+
+    Returns
+    -------
+    str
+        The SHA-256 hexadecimal digest of the definitions of the disciplines.
+    """
+    definitions = [
+        [
+            discipline.name,
+            discipline.get_pattern(),
+            discipline.get_eval_params(),
+            discipline.get_points_in_eval_params(),
+            discipline.get_extra_points(),
+            discipline.get_bonus_points(),
+        ]
+        for discipline in _DISCIPLINES_BY_NAME.values()
+    ]
+    return hashlib.sha256(json.dumps(definitions, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _restore_disciplines(disciplines: Iterable[ToucanCustomDiscipline]) -> None:
+    """Register the custom disciplines that are not registered yet.
+
+    Notes
+    -----
+    This function is used as initializer of the worker processes, so that
+    they know about the custom disciplines of the main process.
+
+    Parameters
+    ----------
+    disciplines : Iterable[ToucanCustomDiscipline]
+        The custom disciplines.
+    """
+    for discipline in disciplines:
+        _DISCIPLINES_BY_NAME.setdefault(discipline.name, discipline)
+
+
+def get_discipline_by_name(name: str) -> Union[ToucanDiscipline, ToucanCustomDiscipline]:
     """Return the ToucanDiscipline enum class corresponding to a given name.
 
+    Notes
+    -----
+    Custom disciplines registered at runtime are also looked up.
+
     Parameters
     ----------
     name : str
@@ -106,12 +730,12 @@ def get_discipline_by_name(name: str) -> ToucanDiscipline:
 
     Returns
     -------
-    ToucanDiscipline
-        The ToucanDiscipline enum.
+    ToucanDiscipline or ToucanCustomDiscipline
+        The ToucanDiscipline enum (or the custom discipline).
     """
-    for discipline in ToucanDiscipline:
-        if name.upper() == discipline.name:
-            return discipline
+    discipline = _DISCIPLINES_BY_NAME.get(name.upper(), None)
+    if discipline is not None:
+        return discipline
 
     raise ToucanException(
         f"The provided discipline name '{name}' is not implemented. Consider adding it to the ToucanDiscipline enum class."  # noqa : E501
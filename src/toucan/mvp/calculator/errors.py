@@ -1,5 +1,7 @@
 """Module containing errors to be raised by the Toucan Tournament MVP calculator library."""
 
+from typing import Optional
+
 
 class ToucanException(Exception):
     """Specific Toucan exception class."""
@@ -13,3 +15,49 @@ class ToucanException(Exception):
             The message to be raised, by default "".
         """
         Exception.__init__(self, msg)
+
+
+class ToucanMatchError(ToucanException):
+    """Toucan exception raised when a match file is invalid.
+
+    Attributes
+    ----------
+    source : object
+        The origin of the match (e.g. the path to the match's file).
+    line : int or None
+        The number of the offending line (starting at 1 for the discipline
+        header), or ``None`` if the match as a whole is invalid.
+    reason : str
+        The reason why the match is invalid.
+    """
+
+    def __init__(self, source: object, line: Optional[int], reason: str):
+        """Instantiate ``ToucanMatchError`` object.
+
+        Parameters
+        ----------
+        source : object
+            The origin of the match (e.g. the path to the match's file).
+        line : int or None
+            The number of the offending line, or ``None`` if the match as a
+            whole is invalid.
+        reason : str
+            The reason why the match is invalid.
+        """
+        location = f"'{source}'" if line is None else f"'{source}', line {line}"
+        ToucanException.__init__(
+            self, f"Failed to process tournament... error on match file {location}: {reason}"
+        )
+        self.source = source
+        self.line = line
+        self.reason = reason
+
+    def __reduce__(self):
+        """Reduce the exception for pickling (e.g. when raised in a worker process).
+
+        Returns
+        -------
+        tuple
+            The class of the exception and the arguments to rebuild it.
+        """
+        return self.__class__, (self.source, self.line, self.reason)
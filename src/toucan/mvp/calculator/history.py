@@ -0,0 +1,409 @@
+"""Module containing the ``ToucanMatchHistory`` class.
+
+Notes
+-----
+The history orders the matches of a tournament (by arrival, by the name of
+their match file or by its modification time) and answers point-in-time and
+windowed queries over them without processing the tournament again: e.g. the
+MVP as of round N or the top players over the last K matches.
+"""
+
+from array import array
+from bisect import bisect_right
+import heapq
+import os
+from pathlib import Path
+import re
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from toucan.mvp.calculator.errors import ToucanException
+from toucan.mvp.calculator.leaderboard import ToucanLeaderboard
+from toucan.mvp.calculator.store import DROPPED_PLAYER_ID
+
+if TYPE_CHECKING:  # pragma: no cover
+    from toucan.mvp.calculator.players import ToucanPlayer
+    from toucan.mvp.calculator.tournament import ToucanTournament
+
+HISTORY_ORDERS = ("arrival", "name", "mtime")
+"""Ways of ordering the matches of a tournament in its history."""
+
+
+def _natural_key(name: str) -> List[Any]:
+    """Compute the key sorting names naturally (e.g. ``round_2`` before ``round_10``).
+
+    Parameters
+    ----------
+    name : str
+        The name.
+
+    Returns
+    -------
+    List[Any]
+        The key of the name: its text and numeric parts, alternately.
+    """
+    return [int(part) if part.isdigit() else part for part in re.split(r"(\d+)", name)]
+
+
+class ToucanMatchHistory:
+    """Class answering point-in-time and windowed queries over the matches of a tournament.
+
+    Notes
+    -----
+    The matches are numbered in order, starting at 1 (i.e. "round" N is the
+    N-th match). For each player, the history keeps the rounds it played and
+    the running sum of its points (i.e. prefix sums), so its points over any
+    range of rounds are found with two binary searches. Besides, the MVP after
+    each round is recorded once by replaying the matches, so the MVP as of any
+    round is found in constant time. Windowed queries only rank the players of
+    the rounds in the window (when it is short).
+
+    The history follows the tournament: matches added after the last round are
+    appended to it, whereas retracted matches or matches added before the last
+    round rebuild it the next time it is queried.
+
+    Parameters
+    ----------
+    tournament : ToucanTournament
+        The tournament.
+    order : str, optional
+        How matches are ordered, by default ``"arrival"`` (i.e. in the order
+        they were processed, which is sorted path order for a directory).
+        ``"name"`` sorts them naturally by the name of their match file and
+        ``"mtime"`` by its modification time. Matches without a match file
+        (e.g. processed from a stream) come first, in order of arrival.
+    """
+
+    def __init__(self, tournament: "ToucanTournament", order: str = "arrival") -> None:
+        """Instantiate ``ToucanMatchHistory`` object."""
+        if order not in HISTORY_ORDERS:
+            raise ToucanException(f"The history order '{order}' is not one of {HISTORY_ORDERS}.")
+        self._tournament = tournament
+        self._order: str = order
+        self._reset()
+
+    def _reset(self) -> None:
+        """Forget every match of the history."""
+        self._keys: List[Tuple[Any, int]] = []
+        self._rounds: Dict[int, int] = {}
+        self._player_rounds: Dict[int, array] = {}
+        self._player_sums: Dict[int, array] = {}
+        self._replay: ToucanLeaderboard = ToucanLeaderboard()
+        self._leaders: array = array("i")
+        self._round_players: List[array] = []
+        self._n_matches: int = 0
+
+        # Players by order of first appearance, which breaks ties in the replay
+        self._ordinals: Dict[int, int] = {}
+        self._ordinal_players: array = array("i")
+
+    def __len__(self) -> int:
+        """Count the rounds (i.e. matches) of the history.
+
+        Returns
+        -------
+        int
+            Number of rounds.
+        """
+        self._sync()
+        return len(self._keys)
+
+    @property
+    def order(self) -> str:
+        """Access property for retrieving how the matches are ordered.
+
+        Returns
+        -------
+        str
+            The order of the matches.
+        """
+        return self._order
+
+    def invalidate(self) -> None:
+        """Rebuild the history the next time it is queried (e.g. after retracting matches)."""
+        self._reset()
+
+    def round_of(self, match_id: int) -> int:
+        """Retrieve the round of a match.
+
+        Parameters
+        ----------
+        match_id : int
+            The identifier of the match in the tournament's points store.
+
+        Returns
+        -------
+        int
+            The round of the match (starting at 1).
+        """
+        self._sync()
+        if match_id not in self._rounds:
+            raise ToucanException(f"The match '{match_id}' is not part of the tournament.")
+        return self._rounds[match_id]
+
+    def points(self, nickname: str, end: Optional[int] = None, window: Optional[int] = None) -> int:
+        """Compute the points obtained by a player up to a round.
+
+        Parameters
+        ----------
+        nickname : str
+            The nickname of the player.
+        end : int, optional
+            The last round taken into account, by default ``None`` (i.e. the
+            last round of the history).
+        window : int, optional
+            Amount of rounds taken into account (ending at ``end``), by default
+            ``None`` (i.e. every round since the first one).
+
+        Returns
+        -------
+        int
+            The points of the player.
+        """
+        player = self._tournament._players.get(nickname)
+        if player is None:
+            raise ToucanException(f"The player '{nickname}' does not take part in the tournament.")
+        start, end = self._get_range(end, window)
+        return self._range_points(player.id, start, end)
+
+    def mvp(
+        self, end: Optional[int] = None, window: Optional[int] = None
+    ) -> Optional["ToucanPlayer"]:
+        """Retrieve the MVP as of a round.
+
+        Notes
+        -----
+        Ties are broken as in the tournament: the player that appeared first
+        in the rounds taken into account is the MVP.
+
+        Parameters
+        ----------
+        end : int, optional
+            The last round taken into account, by default ``None`` (i.e. the
+            last round of the history).
+        window : int, optional
+            Amount of rounds taken into account (ending at ``end``), by default
+            ``None`` (i.e. every round since the first one).
+
+        Returns
+        -------
+        ToucanPlayer or None
+            The MVP. ``None`` if no round is taken into account.
+        """
+        start, end = self._get_range(end, window)
+        if end == 0 or start == end:
+            return None
+        if start == 0:
+            return self._tournament._players_by_id[self._leaders[end - 1]]
+        top = self.top(1, end, window)
+        return top[0][0] if top else None
+
+    def top(
+        self, k: int, end: Optional[int] = None, window: Optional[int] = None
+    ) -> List[Tuple["ToucanPlayer", int]]:
+        """Retrieve the top players as of a round.
+
+        Notes
+        -----
+        Only the players who played in the rounds taken into account are ranked.
+
+        Parameters
+        ----------
+        k : int
+            The amount of players to retrieve.
+        end : int, optional
+            The last round taken into account, by default ``None`` (i.e. the
+            last round of the history).
+        window : int, optional
+            Amount of rounds taken into account (ending at ``end``), by default
+            ``None`` (i.e. every round since the first one).
+
+        Returns
+        -------
+        List[Tuple[ToucanPlayer, int]]
+            The (at most) ``k`` top players and their points, best first.
+        """
+        start, end = self._get_range(end, window)
+
+        # The candidates of short windows are the players of their rounds
+        if end - start < len(self._player_rounds) // 8:
+            candidates = {
+                player_id
+                for match_round in range(start, end)
+                for player_id in self._round_players[match_round]
+            }
+        else:
+            candidates = {
+                player_id
+                for player_id, rounds in self._player_rounds.items()
+                if bisect_right(rounds, end) > bisect_right(rounds, start)
+            }
+        ranked = heapq.nsmallest(
+            k, (self._get_rank_key(player_id, start, end) for player_id in candidates)
+        )
+        players_by_id = self._tournament._players_by_id
+        return [(players_by_id[player_id], -neg_points) for neg_points, _, _, player_id in ranked]
+
+    def _get_rank_key(self, player_id: int, start: int, end: int) -> Tuple[int, int, int, int]:
+        """Compute the key ranking a player over some rounds.
+
+        Notes
+        -----
+        Players are ranked by descending points. Ties are broken by their first
+        appearance in the rounds (i.e. as if only those rounds were processed).
+
+        Parameters
+        ----------
+        player_id : int
+            The identifier of the player.
+        start : int
+            The round after which points are taken into account.
+        end : int
+            The last round taken into account.
+
+        Returns
+        -------
+        Tuple[int, int, int, int]
+            The negated points, the first round, the first record in that round
+            and the identifier of the player.
+        """
+        rounds = self._player_rounds[player_id]
+        first_round = rounds[bisect_right(rounds, start)]
+        first_row = self._round_players[first_round - 1].index(player_id)
+        return -self._range_points(player_id, start, end), first_round, first_row, player_id
+
+    def _get_range(self, end: Optional[int], window: Optional[int]) -> Tuple[int, int]:
+        """Check the rounds taken into account by a query.
+
+        Parameters
+        ----------
+        end : int or None
+            The last round taken into account (``None`` for the last round).
+        window : int or None
+            Amount of rounds taken into account (``None`` for all of them).
+
+        Returns
+        -------
+        Tuple[int, int]
+            The rounds taken into account: after the first one, up to the
+            second one (included).
+        """
+        self._sync()
+        n_rounds = len(self._keys)
+        end = n_rounds if end is None else end
+        if not 0 <= end <= n_rounds:
+            raise ToucanException(f"The round {end} is not between 0 and {n_rounds}.")
+        if window is not None and window < 0:
+            raise ToucanException(f"The window cannot be negative, not {window}.")
+        return (0 if window is None else max(0, end - window)), end
+
+    def _range_points(self, player_id: int, start: int, end: int) -> int:
+        """Compute the points obtained by a player after a round and up to another one.
+
+        Parameters
+        ----------
+        player_id : int
+            The identifier of the player.
+        start : int
+            The round after which points are taken into account.
+        end : int
+            The last round taken into account.
+
+        Returns
+        -------
+        int
+            The points of the player.
+        """
+        rounds = self._player_rounds.get(player_id)
+        if rounds is None:
+            return 0
+        sums = self._player_sums[player_id]
+        end_idx, start_idx = bisect_right(rounds, end), bisect_right(rounds, start)
+        return (sums[end_idx - 1] if end_idx else 0) - (sums[start_idx - 1] if start_idx else 0)
+
+    def _get_key(self, match_id: int) -> Tuple[Any, int]:
+        """Compute the key ordering a match in the history.
+
+        Parameters
+        ----------
+        match_id : int
+            The identifier of the match in the tournament's points store.
+
+        Returns
+        -------
+        Tuple[Any, int]
+            The key of the match.
+        """
+        if self._order == "arrival":
+            return (), match_id
+        results = self._tournament._results
+        slot = results.get_slot(match_id)
+        source = None if slot is None else results.get_source(slot)
+        if source is None:
+            return (), match_id
+        if self._order == "name":
+            return (_natural_key(Path(source).name),), match_id
+        try:
+            return (os.stat(source).st_mtime_ns,), match_id
+        except OSError:
+            return (), match_id
+
+    def _sync(self) -> None:
+        """Bring the history up to date with the matches of the tournament."""
+        store = self._tournament._store
+        n_matches = store.n_matches
+        if n_matches == self._n_matches:
+            return
+
+        # Gather the rows of the new matches, in order of arrival
+        new_matches: Dict[int, List[Tuple[int, int]]] = {}
+        for match_id in range(self._n_matches, n_matches):
+            rows = [
+                (player_id, points)
+                for player_id, points in zip(*store.match_rows(match_id))
+                if player_id != DROPPED_PLAYER_ID
+            ]
+            if rows:
+                new_matches[match_id] = rows
+        keys = sorted((self._get_key(match_id), match_id) for match_id in new_matches)
+
+        # Matches which do not go after the last round require a rebuild
+        if self._keys and keys and keys[0][0] < self._keys[-1]:
+            self._reset()
+            self._sync()
+            return
+        for key, match_id in keys:
+            self._append(key, match_id, new_matches[match_id])
+        self._n_matches = n_matches
+
+    def _append(self, key: Tuple[Any, int], match_id: int, rows: List[Tuple[int, int]]) -> None:
+        """Append a match to the history as its last round.
+
+        Parameters
+        ----------
+        key : Tuple[Any, int]
+            The key of the match.
+        match_id : int
+            The identifier of the match in the tournament's points store.
+        rows : List[Tuple[int, int]]
+            The identifier of the player and the points of each record of the match.
+        """
+        self._keys.append(key)
+        match_round = self._rounds[match_id] = len(self._keys)
+        self._round_players.append(array("i", [player_id for player_id, _ in rows]))
+        for player_id, points in rows:
+            rounds = self._player_rounds.get(player_id)
+            if rounds is None:
+                rounds = self._player_rounds[player_id] = array("i")
+                self._player_sums[player_id] = array("q")
+            sums = self._player_sums[player_id]
+            if rounds and rounds[-1] == match_round:
+                sums[-1] += points
+            else:
+                rounds.append(match_round)
+                sums.append((sums[-1] if sums else 0) + points)
+            ordinal = self._ordinals.get(player_id)
+            if ordinal is None:
+                ordinal = self._ordinals[player_id] = len(self._ordinal_players)
+                self._ordinal_players.append(player_id)
+            self._replay.update(ordinal, sums[-1])
+        self._leaders.append(self._ordinal_players[self._replay.mvp])
@@ -0,0 +1,226 @@
+"""Module containing the ``ToucanLeaderboard`` class."""
+
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+BUCKET_LOAD = 512
+"""Target size of the sorted buckets in which the leaderboard is split."""
+
+
+class ToucanLeaderboard:
+    """Class keeping the players of a tournament ranked by their total points.
+
+    Notes
+    -----
+    The leaderboard is an order-statistics structure: a sorted list split in
+    buckets of about ``BUCKET_LOAD`` entries (plus the maximum of each bucket),
+    so that updating a player, finding the MVP, the top players or the rank
+    of a player does not require sorting all of them again.
+
+    Players are ranked by descending total points. Ties are broken by
+    ascending player identifier (i.e. the player that joined the tournament
+    first ranks higher), which matches how the MVP has always been selected.
+    """
+
+    def __init__(self) -> None:
+        """Instantiate ``ToucanLeaderboard`` object."""
+        self._buckets: List[List[Tuple[int, int]]] = []
+        self._maxes: List[Tuple[int, int]] = []
+        self._keys: Dict[int, Tuple[int, int]] = {}
+
+    @classmethod
+    def from_totals(cls, totals: Iterable[Tuple[int, int]]) -> "ToucanLeaderboard":
+        """Build a leaderboard at once from the total points of many players.
+
+        Parameters
+        ----------
+        totals : Iterable[Tuple[int, int]]
+            The identifier and total points of each player.
+
+        Returns
+        -------
+        ToucanLeaderboard
+            The leaderboard.
+        """
+        leaderboard = cls()
+        leaderboard._keys = {player_id: (-total, player_id) for player_id, total in totals}
+        keys = sorted(leaderboard._keys.values())
+        leaderboard._buckets = [
+            keys[idx : idx + BUCKET_LOAD] for idx in range(0, len(keys), BUCKET_LOAD)
+        ]
+        leaderboard._maxes = [bucket[-1] for bucket in leaderboard._buckets]
+        return leaderboard
+
+    def __len__(self) -> int:
+        """Count the players in the leaderboard.
+
+        Returns
+        -------
+        int
+            Number of players.
+        """
+        return len(self._keys)
+
+    def __contains__(self, player_id: int) -> bool:
+        """Check whether a player is in the leaderboard.
+
+        Parameters
+        ----------
+        player_id : int
+            The identifier of the player.
+
+        Returns
+        -------
+        bool
+            ``True`` if the player is in the leaderboard.
+        """
+        return player_id in self._keys
+
+    @property
+    def mvp(self) -> Optional[int]:
+        """Access property for retrieving the player leading the leaderboard.
+
+        Returns
+        -------
+        int or None
+            The identifier of the MVP. ``None`` if the leaderboard is empty.
+        """
+        return self._buckets[0][0][1] if self._buckets else None
+
+    def update(self, player_id: int, total: int) -> None:
+        """Insert a player in the leaderboard or update its total points.
+
+        Parameters
+        ----------
+        player_id : int
+            The identifier of the player.
+        total : int
+            The total points of the player.
+        """
+        key = (-total, player_id)
+        old_key = self._keys.get(player_id)
+        if old_key == key:
+            return
+        if old_key is not None:
+            self._remove(old_key)
+        self._insert(key)
+        self._keys[player_id] = key
+
+    def discard(self, player_id: int) -> None:
+        """Remove a player from the leaderboard, if present.
+
+        Parameters
+        ----------
+        player_id : int
+            The identifier of the player.
+        """
+        key = self._keys.pop(player_id, None)
+        if key is not None:
+            self._remove(key)
+
+    def top(self, k: int) -> List[Tuple[int, int]]:
+        """Retrieve the top players of the leaderboard.
+
+        Parameters
+        ----------
+        k : int
+            The amount of players to retrieve.
+
+        Returns
+        -------
+        List[Tuple[int, int]]
+            The identifier and total points of (at most) ``k`` players, best first.
+        """
+        top = []
+        for bucket in self._buckets:
+            for neg_total, player_id in bucket[: k - len(top)]:
+                top.append((player_id, -neg_total))
+            if len(top) >= k:
+                break
+        return top
+
+    def iter_after(self, key: Optional[Tuple[int, int]] = None) -> Iterator[Tuple[int, int]]:
+        """Iterate lazily over the players of the leaderboard, best first.
+
+        Notes
+        -----
+        Iteration can be resumed after any key (i.e. negated total points and
+        player identifier), even if that player's total points changed
+        meanwhile, which allows paginating over the leaderboard.
+
+        Parameters
+        ----------
+        key : Tuple[int, int], optional
+            The key after which the iteration starts, by default ``None`` (i.e.
+            from the MVP).
+
+        Yields
+        ------
+        Tuple[int, int]
+            The identifier and total points of each player.
+        """
+        bucket_idx, idx = 0, 0
+        if key is not None:
+            bucket_idx = bisect_right(self._maxes, key)
+            if bucket_idx < len(self._buckets):
+                idx = bisect_right(self._buckets[bucket_idx], key)
+        for bucket in self._buckets[bucket_idx:]:
+            for neg_total, player_id in bucket[idx:]:
+                yield player_id, -neg_total
+            idx = 0
+
+    def rank(self, player_id: int) -> int:
+        """Retrieve the rank of a player in the leaderboard.
+
+        Parameters
+        ----------
+        player_id : int
+            The identifier of the player.
+
+        Returns
+        -------
+        int
+            The rank of the player, starting at 1 for the MVP.
+        """
+        key = self._keys[player_id]
+        idx = bisect_left(self._maxes, key)
+        return sum(map(len, self._buckets[:idx])) + bisect_left(self._buckets[idx], key) + 1
+
+    def _insert(self, key: Tuple[int, int]) -> None:
+        """Insert a key in its bucket, splitting the bucket if it grows too large.
+
+        Parameters
+        ----------
+        key : Tuple[int, int]
+            The key (i.e. negated total points and player identifier).
+        """
+        if not self._buckets:
+            self._buckets.append([key])
+            self._maxes.append(key)
+            return
+
+        idx = min(bisect_left(self._maxes, key), len(self._maxes) - 1)
+        bucket = self._buckets[idx]
+        insort(bucket, key)
+        if len(bucket) > 2 * BUCKET_LOAD:
+            self._buckets.insert(idx + 1, bucket[BUCKET_LOAD:])
+            del bucket[BUCKET_LOAD:]
+            self._maxes.insert(idx + 1, self._buckets[idx + 1][-1])
+        self._maxes[idx] = bucket[-1]
+
+    def _remove(self, key: Tuple[int, int]) -> None:
+        """Remove a key from its bucket, dropping the bucket if it becomes empty.
+
+        Parameters
+        ----------
+        key : Tuple[int, int]
+            The key (i.e. negated total points and player identifier).
+        """
+        idx = bisect_left(self._maxes, key)
+        bucket = self._buckets[idx]
+        del bucket[bisect_left(bucket, key)]
+        if bucket:
+            self._maxes[idx] = bucket[-1]
+        else:
+            del self._buckets[idx]
+            del self._maxes[idx]
@@ -0,0 +1,361 @@
+"""Module containing the ``ToucanLeague`` class."""
+
+from array import array
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from toucan.mvp.calculator.discipline import get_discipline_by_name
+from toucan.mvp.calculator.errors import ToucanException
+from toucan.mvp.calculator.leaderboard import ToucanLeaderboard
+from toucan.mvp.calculator.players import ToucanPlayer
+from toucan.mvp.calculator.store import ToucanPointsStore, check_points
+from toucan.mvp.calculator.tournament import (
+    ENGINES,
+    _list_match_files,
+    _map_scoring,
+    _score_match_file,
+)
+
+Scope = Tuple[Optional[str], Optional[str]]
+"""Scope of a ranking: the tournament and the discipline (``None`` meaning all of them)."""
+
+
+class ToucanLeague:
+    """Class containing the logic of a league of Toucan tournaments.
+
+    Notes
+    -----
+    All the tournaments of the league share a single registry of players (i.e.
+    players are identified by their nickname across tournaments). Each match
+    file is only parsed once: its points are accumulated in the totals of
+    every scope it belongs to (the whole league, its tournament, its
+    discipline and the discipline within its tournament), whose rankings are
+    kept up to date. Hence, MVP and top-K queries never rescan the matches.
+    """
+
+    def __init__(self, name: str, engine: str = "python") -> None:
+        """Instantiate ``ToucanLeague`` object.
+
+        Parameters
+        ----------
+        name : str
+            The name of the league.
+        engine : str, optional
+            The scoring engine used for the tournaments, by default ``"python"``.
+        """
+        if engine not in ENGINES:
+            raise ToucanException(f"The scoring engine '{engine}' is not one of {ENGINES}.")
+        self._name: str = name
+        self._engine: str = engine
+
+        # Initialize the shared registry of players and the store of their points
+        self._players: Dict[str, ToucanPlayer] = {}
+        self._players_by_id: List[ToucanPlayer] = []
+        self._store: ToucanPointsStore = ToucanPointsStore()
+
+        # Initialize the tournaments, disciplines and the rankings of each scope
+        self._tournaments: List[str] = []
+        self._disciplines: List[str] = []
+        self._totals: Dict[Scope, Dict[int, int]] = {}
+        self._leaderboards: Dict[Scope, ToucanLeaderboard] = {}
+
+    @property
+    def name(self) -> str:
+        """Access property for retrieving the name of the league.
+
+        Returns
+        -------
+        str
+            The name of the league.
+        """
+        return self._name
+
+    @property
+    def tournaments(self) -> List[str]:
+        """Access property for retrieving the names of the league's tournaments.
+
+        Returns
+        -------
+        List[str]
+            The names of the tournaments, in order of processing.
+        """
+        return list(self._tournaments)
+
+    @property
+    def disciplines(self) -> List[str]:
+        """Access property for retrieving the disciplines played in the league.
+
+        Returns
+        -------
+        List[str]
+            The names of the disciplines, in order of appearance.
+        """
+        return list(self._disciplines)
+
+    @property
+    def players(self) -> List[ToucanPlayer]:
+        """Access property for retrieving the players of the league.
+
+        Notes
+        -----
+        The points of these players are their points over the whole league.
+
+        Returns
+        -------
+        List[ToucanPlayer]
+            The players, in order of appearance.
+        """
+        return list(self._players_by_id)
+
+    def add_tournament(self, name: str, dir: Union[Path, str], workers: int = 1) -> None:
+        """Process a Toucan tournament directory as a new tournament of the league.
+
+        Parameters
+        ----------
+        name : str
+            The name of the tournament.
+        dir : Path or str
+            The directory containing the tournament's match files.
+        workers : int, optional
+            Number of worker processes used for scoring the match files, by
+            default 1.
+        """
+        if name in self._tournaments:
+            raise ToucanException(f"The tournament '{name}' is already part of the league.")
+        if workers < 1:
+            raise ToucanException(f"The number of workers must be at least 1, not {workers}.")
+
+        # Score and validate every match file before modifying the league...
+        # so that an invalid tournament is not partially added. Only the
+        # player and points of each row are kept meanwhile, in typed arrays
+        new_players: Dict[str, Tuple[str, int]] = {}
+        running_totals: Dict[int, int] = {}
+        matches: List[Tuple[str, array, array]] = []
+        match_results = _map_scoring(
+            _score_match_file, _list_match_files(dir), workers, self._engine
+        )
+        for discipline, _, _, rows in match_results:
+            row_points = [row[4] for row in rows]
+            if rows:
+                check_points(min(row_points), max(row_points))
+            player_ids, points = array("i"), array("q", row_points)
+            for row_name, nickname, _, _, points_ in rows:
+                player = self._players.get(nickname)
+                if player is not None:
+                    player_id = player.id
+                else:
+                    player_id = new_players.setdefault(
+                        nickname, (row_name, len(self._players_by_id) + len(new_players))
+                    )[1]
+                player_ids.append(player_id)
+                running_totals[player_id] = running_totals.get(player_id, 0) + points_
+            check_points(
+                *[
+                    running_totals[player_id]
+                    + (self._store.total(player_id) if player_id < self._store.n_players else 0)
+                    for player_id in set(player_ids)
+                ]
+            )
+            matches.append((discipline, player_ids, points))
+
+        # Then, add the new players and the matches to the league
+        for nickname, (row_name, _) in new_players.items():
+            player = ToucanPlayer(row_name, nickname, self._store)
+            self._players[player.nickname] = player
+            self._players_by_id.append(player)
+        for discipline, player_ids, points in matches:
+            self._merge_match(name, discipline, player_ids, points)
+        self._tournaments.append(name)
+
+    def mvp(
+        self, tournament: Optional[str] = None, discipline: Optional[str] = None
+    ) -> Union[ToucanPlayer, None]:
+        """Retrieve the MVP of the league, of a tournament and/or of a discipline.
+
+        Notes
+        -----
+        In case of a tie, the player that joined the league first is the MVP.
+
+        Parameters
+        ----------
+        tournament : str, optional
+            The name of the tournament, by default ``None`` (i.e. all of them).
+        discipline : str, optional
+            The name of the discipline, by default ``None`` (i.e. all of them).
+
+        Returns
+        -------
+        ToucanPlayer or None
+            The MVP. ``None`` if no MVP is possible.
+        """
+        mvp_id = self._get_leaderboard(tournament, discipline).mvp
+        return None if mvp_id is None else self._players_by_id[mvp_id]
+
+    def top(
+        self, k: int, tournament: Optional[str] = None, discipline: Optional[str] = None
+    ) -> List[Tuple[ToucanPlayer, int]]:
+        """Retrieve the best players of the league, a tournament and/or a discipline.
+
+        Parameters
+        ----------
+        k : int
+            The amount of players to retrieve.
+        tournament : str, optional
+            The name of the tournament, by default ``None`` (i.e. all of them).
+        discipline : str, optional
+            The name of the discipline, by default ``None`` (i.e. all of them).
+
+        Returns
+        -------
+        List[Tuple[ToucanPlayer, int]]
+            The (at most) ``k`` best players and their points in the scope, the
+            MVP first.
+        """
+        return [
+            (self._players_by_id[player_id], total)
+            for player_id, total in self._get_leaderboard(tournament, discipline).top(k)
+        ]
+
+    def points(
+        self, nickname: str, tournament: Optional[str] = None, discipline: Optional[str] = None
+    ) -> int:
+        """Retrieve the points of a player in the league, a tournament and/or a discipline.
+
+        Parameters
+        ----------
+        nickname : str
+            The nickname of the player.
+        tournament : str, optional
+            The name of the tournament, by default ``None`` (i.e. all of them).
+        discipline : str, optional
+            The name of the discipline, by default ``None`` (i.e. all of them).
+
+        Returns
+        -------
+        int
+            The points of the player in the scope (0 if the player did not play in it).
+        """
+        scope = self._get_scope(tournament, discipline)
+        return self._totals.get(scope, {}).get(self._get_player(nickname).id, 0)
+
+    def rank(
+        self, nickname: str, tournament: Optional[str] = None, discipline: Optional[str] = None
+    ) -> int:
+        """Retrieve the rank of a player in the league, a tournament and/or a discipline.
+
+        Parameters
+        ----------
+        nickname : str
+            The nickname of the player.
+        tournament : str, optional
+            The name of the tournament, by default ``None`` (i.e. all of them).
+        discipline : str, optional
+            The name of the discipline, by default ``None`` (i.e. all of them).
+
+        Returns
+        -------
+        int
+            The rank of the player, starting at 1 for the MVP.
+        """
+        leaderboard = self._get_leaderboard(tournament, discipline)
+        player_id = self._get_player(nickname).id
+        if player_id not in leaderboard:
+            raise ToucanException(f"The player '{nickname}' did not play in the requested scope.")
+        return leaderboard.rank(player_id)
+
+    def _get_player(self, nickname: str) -> ToucanPlayer:
+        """Retrieve a player of the league.
+
+        Parameters
+        ----------
+        nickname : str
+            The nickname of the player.
+
+        Returns
+        -------
+        ToucanPlayer
+            The player of the league.
+        """
+        player = self._players.get(nickname)
+        if player is None:
+            raise ToucanException(f"The player '{nickname}' does not take part in the league.")
+        return player
+
+    def _get_scope(self, tournament: Optional[str], discipline: Optional[str]) -> Scope:
+        """Validate a scope of the league.
+
+        Parameters
+        ----------
+        tournament : str or None
+            The name of the tournament, or ``None`` for all of them.
+        discipline : str or None
+            The name of the discipline, or ``None`` for all of them.
+
+        Returns
+        -------
+        Scope
+            The scope, with the name of the discipline normalized.
+        """
+        if tournament is not None and tournament not in self._tournaments:
+            raise ToucanException(f"The tournament '{tournament}' is not part of the league.")
+        if discipline is not None:
+            discipline = get_discipline_by_name(discipline).name
+        return tournament, discipline
+
+    def _get_leaderboard(
+        self, tournament: Optional[str], discipline: Optional[str]
+    ) -> ToucanLeaderboard:
+        """Retrieve the leaderboard of a scope.
+
+        Parameters
+        ----------
+        tournament : str or None
+            The name of the tournament, or ``None`` for all of them.
+        discipline : str or None
+            The name of the discipline, or ``None`` for all of them.
+
+        Returns
+        -------
+        ToucanLeaderboard
+            The leaderboard of the scope (empty if no match was played in it).
+        """
+        return self._leaderboards.get(self._get_scope(tournament, discipline), ToucanLeaderboard())
+
+    def _merge_match(
+        self, tournament: str, discipline: str, player_ids: array, points: array
+    ) -> None:
+        """Merge a validated match into the league.
+
+        Parameters
+        ----------
+        tournament : str
+            The name of the tournament of the match.
+        discipline : str
+            The name of the discipline of the match.
+        player_ids : array
+            The identifier of the player of each row of the match.
+        points : array
+            The points obtained in the match by each row.
+        """
+        if discipline not in self._disciplines:
+            self._disciplines.append(discipline)
+
+        # Add the points to the shared store
+        match_points: Dict[int, int] = {}
+        for player_id, row_points in zip(player_ids, points):
+            match_points[player_id] = match_points.get(player_id, 0) + row_points
+        self._store.new_match()
+        self._store.extend(player_ids.tolist(), points.tolist())
+
+        # Accumulate the points in every scope of the match and update their rankings
+        for scope in [
+            (None, None),
+            (tournament, None),
+            (None, discipline),
+            (tournament, discipline),
+        ]:
+            totals = self._totals.setdefault(scope, {})
+            leaderboard = self._leaderboards.setdefault(scope, ToucanLeaderboard())
+            for player_id, points_ in match_points.items():
+                totals[player_id] = totals.get(player_id, 0) + points_
+                leaderboard.update(player_id, totals[player_id])
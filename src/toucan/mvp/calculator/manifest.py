@@ -0,0 +1,79 @@
+"""Module containing the manifest of match files processed in a Toucan tournament."""
+
+import hashlib
+import os
+from pathlib import Path
+
+DIGEST_CHUNK_SIZE = 1 << 20
+"""Size of the chunks (in bytes) read when computing the digest of a match file."""
+
+
+def compute_file_digest(filepath: Path) -> str:
+    """Compute the content hash of a match file.
+
+    Parameters
+    ----------
+    filepath : Path
+        The path to the match's file.
+
+    Returns
+    -------
+    str
+        The SHA-256 hexadecimal digest of the file's content.
+    """
+    digest = hashlib.sha256()
+    with open(filepath, "rb") as file:
+        for chunk in iter(lambda: file.read(DIGEST_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ToucanManifestEntry:
+    """Class representing the state of a match file already processed in a tournament.
+
+    Attributes
+    ----------
+    size : int
+        Size of the file (in bytes) when it was processed.
+    mtime_ns : int
+        Modification time of the file (in nanoseconds) when it was processed.
+    digest : str
+        Content hash of the file when it was processed.
+    match_id : int
+        Identifier of the match in the tournament's points store, which
+        allows to retract its contribution.
+    """
+
+    def __init__(self, size: int, mtime_ns: int, digest: str, match_id: int) -> None:
+        """Instantiate ``ToucanManifestEntry`` object.
+
+        Parameters
+        ----------
+        size : int
+            Size of the file (in bytes) when it was processed.
+        mtime_ns : int
+            Modification time of the file (in nanoseconds) when it was processed.
+        digest : str
+            Content hash of the file when it was processed.
+        match_id : int
+            Identifier of the match in the tournament's points store.
+        """
+        self.size: int = size
+        self.mtime_ns: int = mtime_ns
+        self.digest: str = digest
+        self.match_id: int = match_id
+
+    def is_stat_unchanged(self, stat: os.stat_result) -> bool:
+        """Check whether the file's size and modification time are the recorded ones.
+
+        Parameters
+        ----------
+        stat : os.stat_result
+            The current status of the file.
+
+        Returns
+        -------
+        bool
+            ``True`` if neither the size nor the modification time changed.
+        """
+        return self.size == stat.st_size and self.mtime_ns == stat.st_mtime_ns
@@ -0,0 +1,205 @@
+"""Module containing the instrumentation of the Toucan tournament processing.
+
+Notes
+-----
+Instrumentation is opt-in: a ``ToucanTournament`` only reports metrics when
+it is given a metrics sink. The following metrics are reported:
+
+Timings (in seconds):
+
+* ``match.parse``: time spent parsing the lines of each match.
+* ``match.scoring``: time spent scoring the player records of each match.
+* ``match.team_resolution``: time spent resolving the winner team of each match.
+* ``match.total``: total time spent processing each match.
+* ``leaderboard.ranking``: time spent bringing the leaderboard (i.e. MVP
+  selection) up to date with the matches processed since it was last accessed.
+* ``tournament.process``: total time spent in each ``process_tournament`` call.
+
+When the match files are processed in isolation (i.e. in parallel or
+collecting their errors), the parse, scoring and team resolution timings and
+the regex failures are measured where each match file is processed, and
+reported as it is merged into the tournament.
+
+Counters:
+
+* ``matches``: matches processed.
+* ``rows``: player records parsed.
+* ``regex_failures``: lines which did not match the discipline's pattern.
+* ``players_created``: players that joined the tournament.
+* ``bytes_read``: bytes of match files read.
+* ``cache_hits``: match files whose result was found in the cache.
+* ``cache_misses``: match files whose result was not found in the cache.
+"""
+
+import math
+from typing import Dict, List
+
+try:
+    from typing import Protocol
+except ImportError:  # pragma: no cover
+    from typing_extensions import Protocol  # type: ignore
+
+TIMINGS = (
+    "match.parse",
+    "match.scoring",
+    "match.team_resolution",
+    "match.total",
+    "leaderboard.ranking",
+    "tournament.process",
+)
+"""Names of the timings reported."""
+
+COUNTERS = (
+    "matches",
+    "rows",
+    "regex_failures",
+    "players_created",
+    "bytes_read",
+    "cache_hits",
+    "cache_misses",
+)
+"""Names of the counters reported."""
+
+
+class ToucanMetricsSink(Protocol):
+    """Protocol to be implemented by the receivers of the tournament metrics."""
+
+    def timing(self, name: str, seconds: float) -> None:
+        """Receive a timing measurement.
+
+        Parameters
+        ----------
+        name : str
+            The name of the timing, one of ``TIMINGS``.
+        seconds : float
+            The time measured, in seconds.
+        """
+
+    def count(self, name: str, value: int = 1) -> None:
+        """Receive an increment of a counter.
+
+        Parameters
+        ----------
+        name : str
+            The name of the counter, one of ``COUNTERS``.
+        value : int, optional
+            The increment, by default 1.
+        """
+
+
+class ToucanMetricsCollector:
+    """Class collecting the tournament metrics in memory.
+
+    Notes
+    -----
+    Every timing measurement is kept until the collector is reset, so that
+    exact percentiles can be computed.
+    """
+
+    def __init__(self) -> None:
+        """Instantiate ``ToucanMetricsCollector`` object."""
+        self._timings: Dict[str, List[float]] = {}
+        self._counters: Dict[str, int] = {}
+
+    def timing(self, name: str, seconds: float) -> None:
+        """Receive a timing measurement.
+
+        Parameters
+        ----------
+        name : str
+            The name of the timing.
+        seconds : float
+            The time measured, in seconds.
+        """
+        self._timings.setdefault(name, []).append(seconds)
+
+    def count(self, name: str, value: int = 1) -> None:
+        """Receive an increment of a counter.
+
+        Parameters
+        ----------
+        name : str
+            The name of the counter.
+        value : int, optional
+            The increment, by default 1.
+        """
+        self._counters[name] = self._counters.get(name, 0) + value
+
+    @property
+    def counters(self) -> Dict[str, int]:
+        """Access property for retrieving the value of the counters.
+
+        Returns
+        -------
+        Dict[str, int]
+            The value of each counter.
+        """
+        return dict(self._counters)
+
+    def timings(self, name: str) -> List[float]:
+        """Retrieve the measurements of a timing.
+
+        Parameters
+        ----------
+        name : str
+            The name of the timing.
+
+        Returns
+        -------
+        List[float]
+            The measurements, in seconds, in order of arrival.
+        """
+        return list(self._timings.get(name, []))
+
+    def percentile(self, name: str, q: float) -> float:
+        """Compute a percentile of the measurements of a timing.
+
+        Parameters
+        ----------
+        name : str
+            The name of the timing.
+        q : float
+            The percentile, between 0 and 100.
+
+        Returns
+        -------
+        float
+            The percentile (linearly interpolated), in seconds. ``nan`` if
+            there are no measurements.
+        """
+        samples = sorted(self._timings.get(name, []))
+        if not samples:
+            return math.nan
+
+        position = (len(samples) - 1) * q / 100
+        lower = math.floor(position)
+        upper = min(lower + 1, len(samples) - 1)
+        return samples[lower] + (samples[upper] - samples[lower]) * (position - lower)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Summarize the measurements of every timing.
+
+        Returns
+        -------
+        Dict[str, Dict[str, float]]
+            For each timing, the amount of measurements, their total, mean,
+            minimum, maximum and 50th, 90th and 99th percentiles (in seconds).
+        """
+        return {
+            name: {
+                "count": len(samples),
+                "total": sum(samples),
+                "mean": sum(samples) / len(samples),
+                "min": min(samples),
+                "max": max(samples),
+                "p50": self.percentile(name, 50),
+                "p90": self.percentile(name, 90),
+                "p99": self.percentile(name, 99),
+            }
+            for name, samples in self._timings.items()
+        }
+
+    def reset(self) -> None:
+        """Discard every measurement collected so far."""
+        self._timings.clear()
+        self._counters.clear()
@@ -0,0 +1,197 @@
+"""Module containing the streaming parser of Toucan tournament match files."""
+
+from contextlib import contextmanager
+import mmap
+import os
+from pathlib import Path
+from typing import Iterable, Iterator, List, Tuple, Union
+
+from toucan.mvp.calculator.discipline import ToucanDiscipline, get_discipline_by_name
+from toucan.mvp.calculator.errors import ToucanException, ToucanMatchError
+
+MatchRow = Tuple[str, str, str, str, str, List[int]]
+"""Record of a player in a match: name, nickname, number, team, position and marks."""
+
+RawMatchRow = Tuple[bytes, bytes, bytes, bytes, str, List[int]]
+"""Record of a player in a match whose name, nickname, number and team are not decoded."""
+
+BUFFER_CHUNK_SIZE = 1 << 20
+"""Size of the chunks (in bytes) in which the lines of a buffer are split at once."""
+
+
+def parse_match(
+    lines: Iterable[str], source: object
+) -> Tuple[ToucanDiscipline, Iterator[MatchRow]]:
+    """Parse the lines of a match lazily.
+
+    Notes
+    -----
+    Only the first line (i.e. the discipline header) is consumed eagerly. The
+    player records are parsed one at a time as the returned iterator is
+    consumed, so the whole match never needs to be held in memory.
+
+    Parameters
+    ----------
+    lines : Iterable[str]
+        The lines of the match (e.g. an open match file).
+    source : object
+        The origin of the lines (e.g. the path to the match's file), used in
+        error messages.
+
+    Returns
+    -------
+    Tuple[ToucanDiscipline, Iterator[MatchRow]]
+        The discipline of the match and an iterator over its player records.
+    """
+    lines = iter(lines)
+
+    # Read the first line to get the sport/discipline
+    try:
+        discipline = get_discipline_by_name(next(lines, "").rstrip("\n"))
+    except ToucanException as error:
+        raise ToucanMatchError(source, 1, str(error)) from None
+
+    return discipline, iter_match_rows(lines, discipline, source)
+
+
+def iter_match_rows(
+    lines: Iterable[str], discipline: ToucanDiscipline, source: object
+) -> Iterator[MatchRow]:
+    """Parse the player records of a match one line at a time.
+
+    Parameters
+    ----------
+    lines : Iterable[str]
+        The lines of the match following the discipline header.
+    discipline : ToucanDiscipline
+        The discipline of the match.
+    source : object
+        The origin of the lines (e.g. the path to the match's file), used in
+        error messages.
+
+    Yields
+    ------
+    MatchRow
+        The record of a player in the match.
+    """
+    parse_line = discipline.get_parser().parse_line
+    for line_number, line in enumerate(lines, 2):
+        # Check that line matches the expected pattern and raise error otherwise
+        row = parse_line(line.rstrip("\n"))
+        if row is None:
+            raise ToucanMatchError(
+                source, line_number, f"the record does not match the {discipline.name} format"
+            )
+        yield row
+
+
+@contextmanager
+def open_match_buffer(filepath: Union[Path, str]) -> Iterator[Union[mmap.mmap, bytes]]:
+    """Memory-map a match file for reading.
+
+    Parameters
+    ----------
+    filepath : Path or str
+        The path to the match's file.
+
+    Yields
+    ------
+    mmap.mmap or bytes
+        The read-only contents of the file (empty files cannot be mapped, so
+        their contents are an empty ``bytes`` object).
+    """
+    with open(filepath, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            yield buffer
+
+
+def parse_match_buffer(
+    buffer: Union[mmap.mmap, bytes], source: object
+) -> Tuple[ToucanDiscipline, Iterator[RawMatchRow]]:
+    """Parse the contents of a match lazily, without decoding them.
+
+    Notes
+    -----
+    The lines are found by scanning the buffer for line breaks, one chunk of
+    about ``BUFFER_CHUNK_SIZE`` bytes at a time, and each of them is parsed with
+    ``ToucanDisciplineParser.parse_raw_line``. Only the discipline header is
+    decoded.
+
+    Parameters
+    ----------
+    buffer : mmap.mmap or bytes
+        The contents of the match (e.g. a memory-mapped match file).
+    source : object
+        The origin of the contents (e.g. the path to the match's file), used in
+        error messages.
+
+    Returns
+    -------
+    Tuple[ToucanDiscipline, Iterator[RawMatchRow]]
+        The discipline of the match and an iterator over its player records.
+    """
+    # Read the first line to get the sport/discipline
+    header_end = buffer.find(b"\n")
+    if header_end < 0:
+        header_end = len(buffer)
+    try:
+        header = buffer[:header_end].rstrip(b"\r").decode()
+        discipline = get_discipline_by_name(header)
+    except (ToucanException, UnicodeDecodeError) as error:
+        raise ToucanMatchError(source, 1, str(error)) from None
+
+    return discipline, iter_match_buffer_rows(buffer, header_end + 1, discipline, source)
+
+
+def iter_match_buffer_rows(
+    buffer: Union[mmap.mmap, bytes], start: int, discipline: ToucanDiscipline, source: object
+) -> Iterator[RawMatchRow]:
+    """Parse the player records of a match one line at a time, without decoding them.
+
+    Parameters
+    ----------
+    buffer : mmap.mmap or bytes
+        The contents of the match.
+    start : int
+        The offset of the first line following the discipline header.
+    discipline : ToucanDiscipline
+        The discipline of the match.
+    source : object
+        The origin of the contents (e.g. the path to the match's file), used in
+        error messages.
+
+    Yields
+    ------
+    RawMatchRow
+        The record of a player in the match.
+    """
+    parse_raw_line = discipline.get_parser().parse_raw_line
+    size = len(buffer)
+    line_number = 2
+    while start < size:
+        # Take a chunk of the buffer ending at a line break and split its lines
+        end = size
+        if start + BUFFER_CHUNK_SIZE < size:
+            end = buffer.rfind(b"\n", start, start + BUFFER_CHUNK_SIZE)
+            if end < 0:
+                end = buffer.find(b"\n", start + BUFFER_CHUNK_SIZE)
+                end = size if end < 0 else end
+        chunk = buffer[start:end]
+        lines = chunk.split(b"\n")
+        if end == size and chunk.endswith(b"\n"):
+            lines.pop()
+        if b"\r" in chunk:
+            lines = [line[:-1] if line.endswith(b"\r") else line for line in lines]
+
+        for line_number, line in enumerate(lines, line_number):
+            # Check that line matches the expected pattern and raise error otherwise
+            row = parse_raw_line(line)
+            if row is None:
+                raise ToucanMatchError(
+                    source, line_number, f"the record does not match the {discipline.name} format"
+                )
+            yield row
+        start, line_number = end + 1, line_number + 1
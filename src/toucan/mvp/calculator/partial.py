@@ -0,0 +1,321 @@
+"""Module containing the ``ToucanPartialResult`` class.
+
+Notes
+-----
+A partial result holds the outcome of processing a subset (i.e. a shard) of the
+match files of a tournament: the points obtained by each player in each match,
+the attributes of the players and the record of each match. Each match is keyed
+by the name of its match file and carries the content hash of the file, so that
+overlapping partial results can be detected when they are merged.
+
+Merging partial results is associative, commutative and idempotent (merging a
+partial result with itself, e.g. after a retried shard, changes nothing), and
+the merged tournament processes the matches in sorted name order, exactly as a
+single-node run does.
+"""
+
+from functools import reduce
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Union
+import zlib
+
+from toucan.mvp.calculator.cache import _decode_result, _encode_result
+from toucan.mvp.calculator.errors import ToucanException
+
+if TYPE_CHECKING:  # pragma: no cover
+    from toucan.mvp.calculator.tournament import MatchResult, ToucanTournament
+
+PARTIAL_FORMAT_VERSION = 2
+"""Version of the serialization format of the partial results."""
+
+
+def get_shard(name: str, shards: int) -> int:
+    """Assign a match file to a shard of the tournament.
+
+    Notes
+    -----
+    The assignment only depends on the name of the match file, so it is stable
+    across hosts and when other match files are added or removed.
+
+    Parameters
+    ----------
+    name : str
+        The name of the match file.
+    shards : int
+        The amount of shards the match files are split into.
+
+    Returns
+    -------
+    int
+        The shard of the match file.
+    """
+    return zlib.crc32(name.encode("utf-8")) % shards
+
+
+def merge_partials(partials: Iterable["ToucanPartialResult"]) -> "ToucanPartialResult":
+    """Merge several partial results of the same tournament, in any order.
+
+    Parameters
+    ----------
+    partials : Iterable[ToucanPartialResult]
+        The partial results.
+
+    Returns
+    -------
+    ToucanPartialResult
+        The merged partial result.
+    """
+    partials = list(partials)
+    if not partials:
+        raise ToucanException("There are no partial results to merge.")
+    return reduce(ToucanPartialResult.merge, partials)
+
+
+class ToucanPartialResult:
+    """Class holding the result of processing a shard of the match files of a tournament.
+
+    Parameters
+    ----------
+    shards : int
+        The amount of shards the match files of the tournament are split into.
+    shard_ids : Iterable[int]
+        The shards covered by the partial result.
+    version : str
+        The version of the discipline definitions the matches were scored with.
+    matches : Dict[str, Tuple[str, MatchResult]], optional
+        The content hash and partial result of each match, by the name of its
+        match file, by default ``None`` (i.e. no matches).
+    """
+
+    def __init__(
+        self,
+        shards: int,
+        shard_ids: Iterable[int],
+        version: str,
+        matches: Optional[Dict[str, Tuple[str, "MatchResult"]]] = None,
+    ) -> None:
+        """Instantiate ``ToucanPartialResult`` object."""
+        self._shard_ids = frozenset(shard_ids)
+        if shards < 1 or any(shard_id not in range(shards) for shard_id in self._shard_ids):
+            raise ToucanException(
+                f"The shards {sorted(self._shard_ids)} are not valid shards out of {shards}."
+            )
+        self._shards: int = shards
+        self._version: str = version
+        self._matches: Dict[str, Tuple[str, "MatchResult"]] = {} if matches is None else matches
+
+    def __len__(self) -> int:
+        """Count the matches of the partial result.
+
+        Returns
+        -------
+        int
+            Number of matches.
+        """
+        return len(self._matches)
+
+    @property
+    def shards(self) -> int:
+        """Access property for retrieving the amount of shards of the tournament.
+
+        Returns
+        -------
+        int
+            The amount of shards.
+        """
+        return self._shards
+
+    @property
+    def shard_ids(self) -> frozenset:
+        """Access property for retrieving the shards covered by the partial result.
+
+        Returns
+        -------
+        frozenset
+            The identifiers of the shards.
+        """
+        return self._shard_ids
+
+    @property
+    def version(self) -> str:
+        """Access property for retrieving the version of the discipline definitions.
+
+        Returns
+        -------
+        str
+            The version of the discipline definitions.
+        """
+        return self._version
+
+    @property
+    def is_complete(self) -> bool:
+        """Access property for retrieving whether every shard of the tournament is covered.
+
+        Returns
+        -------
+        bool
+            ``True`` if the partial result covers every shard.
+        """
+        return len(self._shard_ids) == self._shards
+
+    @property
+    def sources(self) -> List[str]:
+        """Access property for retrieving the names of the match files, in sorted order.
+
+        Returns
+        -------
+        List[str]
+            The names of the match files.
+        """
+        return sorted(self._matches)
+
+    def merge(self, other: "ToucanPartialResult") -> "ToucanPartialResult":
+        """Merge two partial results of the same tournament.
+
+        Notes
+        -----
+        A match present in both partial results is only kept once, as long as
+        its match file has the same content in both of them.
+
+        Parameters
+        ----------
+        other : ToucanPartialResult
+            The other partial result.
+
+        Returns
+        -------
+        ToucanPartialResult
+            The merged partial result (neither of the merged ones is modified).
+        """
+        if other._shards != self._shards:
+            raise ToucanException(
+                f"Partial results of {self._shards} and {other._shards} shards cannot be merged."
+            )
+        if other._version != self._version:
+            raise ToucanException(
+                "Partial results scored with different discipline definitions cannot be merged."
+            )
+
+        matches = dict(self._matches)
+        for source, (digest, match_result) in other._matches.items():
+            existing = matches.setdefault(source, (digest, match_result))
+            if existing[0] != digest:
+                raise ToucanException(
+                    f"The match file '{source}' differs between the merged partial results."
+                )
+        return ToucanPartialResult(
+            self._shards, self._shard_ids | other._shard_ids, self._version, matches
+        )
+
+    def to_tournament(self, name: str, **kwargs: Any) -> "ToucanTournament":
+        """Build the tournament of the partial result (usually, once merged).
+
+        Notes
+        -----
+        The matches are added in sorted name order, so the points of each player
+        and the MVP are identical to processing the match files in a single run.
+
+        Parameters
+        ----------
+        name : str
+            The name of the tournament.
+        **kwargs : Any
+            Other arguments of ``ToucanTournament`` (e.g. its ``engine``).
+
+        Returns
+        -------
+        ToucanTournament
+            The tournament.
+        """
+        from toucan.mvp.calculator.tournament import ToucanTournament
+
+        if not self.is_complete:
+            missing = sorted(set(range(self._shards)) - self._shard_ids)
+            raise ToucanException(f"The partial result is missing the shards {missing}.")
+
+        tournament = ToucanTournament(name, **kwargs)
+        for source in self.sources:
+            tournament._merge_match_result(self._matches[source][1], source)
+        return tournament
+
+    def to_bytes(self) -> bytes:
+        """Serialize the partial result (e.g. for sending it to a coordinator).
+
+        Returns
+        -------
+        bytes
+            The partial result, as UTF-8 encoded JSON.
+        """
+        data = {
+            "format": PARTIAL_FORMAT_VERSION,
+            "shards": self._shards,
+            "shard_ids": sorted(self._shard_ids),
+            "version": self._version,
+            "matches": {
+                source: {"digest": digest, "result": _encode_result(match_result)}
+                for source, (digest, match_result) in sorted(self._matches.items())
+            },
+        }
+        return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "ToucanPartialResult":
+        """Deserialize a partial result serialized with ``to_bytes``.
+
+        Parameters
+        ----------
+        data : bytes
+            The serialized partial result.
+
+        Returns
+        -------
+        ToucanPartialResult
+            The partial result.
+        """
+        try:
+            decoded = json.loads(data)
+            if decoded["format"] != PARTIAL_FORMAT_VERSION:
+                raise ToucanException(
+                    f"Unsupported partial result format version {decoded['format']}."
+                )
+            return cls(
+                decoded["shards"],
+                decoded["shard_ids"],
+                decoded["version"],
+                {
+                    source: (match["digest"], _decode_result(match["result"]))
+                    for source, match in decoded["matches"].items()
+                },
+            )
+        except (ValueError, TypeError, KeyError) as error:
+            raise ToucanException(f"Invalid partial result: {error}") from None
+
+    def save(self, path: Union[Path, str]) -> None:
+        """Save the partial result to a file (atomically).
+
+        Parameters
+        ----------
+        path : Path or str
+            The path to the file.
+        """
+        path = Path(path)
+        tmp_path = Path(f"{path}.tmp")
+        tmp_path.write_bytes(self.to_bytes())
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: Union[Path, str]) -> "ToucanPartialResult":
+        """Load a partial result previously saved with ``save``.
+
+        Parameters
+        ----------
+        path : Path or str
+            The path to the file.
+
+        Returns
+        -------
+        ToucanPartialResult
+            The partial result.
+        """
+        return cls.from_bytes(Path(path).read_bytes())
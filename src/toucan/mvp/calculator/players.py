@@ -1,15 +1,34 @@
 """Module contaiming the ``Player`` class and auxiliary methods related to them."""
 
-from typing import List
+import sys
+from typing import List, Optional
 
-from toucan.mvp.calculator.discipline import ToucanDiscipline
+from toucan.mvp.calculator.discipline import BONUS_POINTS, ToucanDiscipline
 from toucan.mvp.calculator.errors import ToucanException
+from toucan.mvp.calculator.store import ToucanPointsStore
 
 
 class ToucanPlayer:
-    """Class representing a player of Toucan tournament sport."""
-
-    def __init__(self, name: str, nickname: str) -> None:
+    """Class representing a player of Toucan tournament sport.
+
+    Notes
+    -----
+    The points of the player are not held by the player itself, but by a
+    ``ToucanPointsStore`` (usually owned by the tournament). The player is
+    just a lightweight view over its rows in the store: it has no ``__dict__``
+    and its name and nickname are interned, so that the strings parsed from
+    the match files are shared with any other copy of them.
+    """
+
+    __slots__ = ("_name", "_nickname", "_store", "_id")
+
+    def __init__(
+        self,
+        name: str,
+        nickname: str,
+        store: Optional[ToucanPointsStore] = None,
+        player_id: Optional[int] = None,
+    ) -> None:
         """Instantiate ``ToucanPlayer`` object.
 
         Parameters
@@ -18,10 +37,17 @@ class ToucanPlayer:
             The name of the player.
         nickname : str
             The nickname of the player.
+        store : ToucanPointsStore, optional
+            The store holding the points of the player, by default ``None``,
+            in which case the player gets a store of its own.
+        player_id : int, optional
+            The identifier of the player in the store, by default ``None``,
+            in which case the player is registered as a new player of the store.
         """
-        self._name: str = name
-        self._nickname: str = nickname
-        self._points: List[int] = []
+        self._name: str = sys.intern(name)
+        self._nickname: str = sys.intern(nickname)
+        self._store: ToucanPointsStore = ToucanPointsStore() if store is None else store
+        self._id: int = self._store.new_player() if player_id is None else player_id
 
     @property
     def name(self) -> str:
@@ -45,6 +71,17 @@ class ToucanPlayer:
         """
         return self._nickname
 
+    @property
+    def id(self) -> int:
+        """Access property for retrieving the identifier of the player in its store.
+
+        Returns
+        -------
+        int
+            The identifier of the player.
+        """
+        return self._id
+
     @property
     def points(self) -> List[int]:
         """Access property for retrieving the points of the player.
@@ -54,7 +91,7 @@ class ToucanPlayer:
         List[int]
             The list of points acquired per match.
         """
-        return self._points
+        return self._store.points_of(self._id)
 
     @property
     def total_points(self) -> int:
@@ -65,7 +102,7 @@ class ToucanPlayer:
         int
             Total number of points.
         """
-        return sum(self._points)
+        return self._store.total(self._id)
 
     def add_match_points(
         self, marks: List[int], discipline: ToucanDiscipline, position: str
@@ -75,7 +112,7 @@ class ToucanPlayer:
         Notes
         -----
         Computes the number of points and stores them
-        inside the player's record track (i.e. self._points).
+        inside the player's record track (i.e. its store).
 
         Parameters
         ----------
@@ -86,26 +123,24 @@ class ToucanPlayer:
         position : str
             Player's position in the match.
         """
-        # Get the evaluation parameters for the given discipline and player's position
-        eval_params = discipline.get_eval_params().get(position, None)
-        if not eval_params:
+        # Get the precompiled evaluation parameters (extra rating points included)
+        # for the given discipline and player's position
+        coefficients = discipline.get_parser().coefficients.get(position, None)
+        if not coefficients:
             raise ToucanException(
                 f"Problems retrieving evaluation parameters for '{discipline.name}' in position '{position}'."  # noqa : E501
             )
 
         # Do a quick check to see if the sizes of eval_params and marks are the same
+        eval_params, extra_points = coefficients
         if len(eval_params) != len(marks):
             raise ToucanException(
                 f"Evaluation parameters for '{discipline.name}' in position '{position}' do not match the marks given."  # noqa : E501
             )
 
         # Compute the amount of points received and store them
-        self._points.append(sum([eval * mark for eval, mark in zip(eval_params, marks)]))
-
-        # Get extra rating points if any
-        extra_points = discipline.get_extra_points().get(position, None)
-        if extra_points:
-            self._points[-1] = self._points[-1] + extra_points
+        points = sum([eval * mark for eval, mark in zip(eval_params, marks)]) + extra_points
+        self._store.append(self._id, points)
 
     def get_team_score_contribution(self, marks: List[int], discipline: ToucanDiscipline) -> int:
         """Retrieve the score contribution of a player in a match.
@@ -122,24 +157,18 @@ class ToucanPlayer:
         int
             Score contributed to the team's result.
         """
-        # Get the score contribution for a given discipline
-        score_eval_params = discipline.get_points_in_eval_params()
-
-        # Compute the contribution to the team's score
-        contrib = 0
-        for elem in score_eval_params:
-            score_idx, is_addition = elem
-            if is_addition:
-                contrib += marks[score_idx]
-            else:
-                contrib -= marks[score_idx]
-
-        # Return the contribution
-        return contrib
-
-    def add_bonus_points(self) -> None:
-        """Add bonus points (i.e. 10) to the last match the player has played."""
-        self._points[-1] = self._points[-1] + 10
+        # Compute the contribution to the team's score for the given discipline
+        return discipline.get_parser().team_score_contribution(marks)
+
+    def add_bonus_points(self, bonus_points: int = BONUS_POINTS) -> None:
+        """Add bonus points to the last match the player has played.
+
+        Parameters
+        ----------
+        bonus_points : int, optional
+            The bonus points, by default ``BONUS_POINTS`` (i.e. 10).
+        """
+        self._store.add_to_last(self._id, bonus_points)
 
     def __str__(self) -> str:
         """Represent player information as string.
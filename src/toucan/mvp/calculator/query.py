@@ -0,0 +1,373 @@
+"""Module containing the lazy, paginated queries over the players of a Toucan tournament."""
+
+import base64
+from bisect import bisect_right
+import csv
+import json
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    TextIO,
+    Tuple,
+)
+
+from toucan.mvp.calculator.errors import ToucanException
+from toucan.mvp.calculator.players import ToucanPlayer
+
+if TYPE_CHECKING:  # pragma: no cover
+    from toucan.mvp.calculator.tournament import ToucanTournament
+
+ATTRIBUTES = ("team", "position", "discipline")
+"""Attributes of the players by which queries can be filtered."""
+
+ORDERS = ("points", "name", "nickname")
+"""Orders in which queries can iterate over the players."""
+
+EXPORT_FORMATS = ("csv", "jsonl")
+"""Formats in which the results of a query can be exported."""
+
+SCAN_RATIO = 16
+"""Players per filtered player above which the filtered players are sorted instead of scanned."""
+
+
+class ToucanPlayerIndex:
+    """Class indexing the players of a tournament for querying them.
+
+    Notes
+    -----
+    The index keeps, for each team, position and discipline, the players that
+    played in (or as) it. Tournaments only build it (from the results of their
+    matches) the first time they are queried by one of these attributes, and
+    then only add the matches ingested since. The players sorted by name and
+    nickname are only built the first time they are queried too (so
+    tournaments never queried by name or nickname do not pay for them), and
+    only sorted again when queried after new players joined the tournament.
+
+    Parameters
+    ----------
+    players : Sequence[Optional[ToucanPlayer]]
+        The players of the tournament by identifier (``None`` for the players
+        no longer in it), which the index reads as they join the tournament.
+    """
+
+    def __init__(self, players: Sequence[Optional[ToucanPlayer]]) -> None:
+        """Instantiate ``ToucanPlayerIndex`` object."""
+        self._attributes: Dict[str, Dict[str, Set[int]]] = {
+            attribute: {} for attribute in ATTRIBUTES
+        }
+        self._players: Sequence[Optional[ToucanPlayer]] = players
+        self._orders: Dict[str, List[Tuple[str, int]]] = {"name": [], "nickname": []}
+        self._n_ordered: Dict[str, int] = {"name": 0, "nickname": 0}
+
+    def add(self, attribute: str, value: str, player_ids: Iterable[int]) -> None:
+        """Record that some players have a given attribute value.
+
+        Parameters
+        ----------
+        attribute : str
+            The attribute, one of ``ATTRIBUTES``.
+        value : str
+            The value of the attribute (e.g. the name of the team).
+        player_ids : Iterable[int]
+            The identifiers of the players.
+        """
+        values = self._attributes[attribute]
+        player_set = values.get(value)
+        if player_set is None:
+            player_set = values[value] = set()
+        player_set.update(player_ids)
+
+    def get(self, attribute: str, value: str) -> Set[int]:
+        """Retrieve the players with a given attribute value.
+
+        Parameters
+        ----------
+        attribute : str
+            The attribute, one of ``ATTRIBUTES``.
+        value : str
+            The value of the attribute.
+
+        Returns
+        -------
+        Set[int]
+            The identifiers of the players (empty if there are none).
+        """
+        return self._attributes[attribute].get(value, set())
+
+    def items(self) -> Iterator[Tuple[str, str, Set[int]]]:
+        """Iterate over every attribute value of the index.
+
+        Yields
+        ------
+        Tuple[str, str, Set[int]]
+            The attribute, its value and the identifiers of its players.
+        """
+        for attribute, values in self._attributes.items():
+            for value, player_ids in values.items():
+                yield attribute, value, player_ids
+
+    def get_order(self, attribute: str) -> List[Tuple[str, int]]:
+        """Retrieve the players sorted by name or nickname.
+
+        Parameters
+        ----------
+        attribute : str
+            Either ``"name"`` or ``"nickname"``.
+
+        Returns
+        -------
+        List[Tuple[str, int]]
+            The name (or nickname) and identifier of each player, sorted. It
+            may include players no longer in the tournament.
+        """
+        order = self._orders[attribute]
+        n_ordered = self._n_ordered[attribute]
+        if n_ordered < len(self._players):
+            order.extend(
+                (getattr(player, attribute), player.id)
+                for player in self._players[n_ordered:]
+                if player is not None
+            )
+            order.sort()
+            self._n_ordered[attribute] = len(self._players)
+        return order
+
+
+class ToucanPlayerQuery:
+    """Class representing a lazy query over the players of a tournament.
+
+    Notes
+    -----
+    Players are never materialized all at once: they are retrieved lazily
+    from the leaderboard (when sorted by points) or from the index of the
+    tournament (when sorted by name or nickname). Pages are delimited by
+    cursors holding the sort key of the last player returned, so paginating
+    remains consistent while the tournament keeps ingesting matches.
+
+    Parameters
+    ----------
+    tournament : ToucanTournament
+        The tournament queried.
+    order_by : str, optional
+        The order of the players, by default ``"points"`` (i.e. best first).
+        ``"name"`` and ``"nickname"`` sort them alphabetically.
+    team : str, optional
+        Only the players that played in this team, by default ``None``.
+    position : str, optional
+        Only the players that played in this position, by default ``None``.
+    discipline : str, optional
+        Only the players that played this discipline, by default ``None``.
+    """
+
+    def __init__(
+        self,
+        tournament: "ToucanTournament",
+        order_by: str = "points",
+        team: Optional[str] = None,
+        position: Optional[str] = None,
+        discipline: Optional[str] = None,
+    ) -> None:
+        """Instantiate ``ToucanPlayerQuery`` object."""
+        if order_by not in ORDERS:
+            raise ToucanException(f"The order '{order_by}' is not one of {ORDERS}.")
+        self._tournament = tournament
+        self._order_by: str = order_by
+        self._filters: Dict[str, str] = {
+            attribute: value
+            for attribute, value in zip(ATTRIBUTES, (team, position, discipline))
+            if value is not None
+        }
+        if "discipline" in self._filters:
+            self._filters["discipline"] = self._filters["discipline"].upper()
+
+    def __iter__(self) -> Iterator[ToucanPlayer]:
+        """Iterate lazily over the players matching the query.
+
+        Yields
+        ------
+        ToucanPlayer
+            Each player, in order.
+        """
+        for _, player in self._iter_after(None):
+            yield player
+
+    def page(
+        self, size: int, cursor: Optional[str] = None
+    ) -> Tuple[List[ToucanPlayer], Optional[str]]:
+        """Retrieve a page of players matching the query.
+
+        Parameters
+        ----------
+        size : int
+            The maximum amount of players in the page.
+        cursor : str, optional
+            The cursor returned with the previous page, by default ``None``
+            (i.e. the first page).
+
+        Returns
+        -------
+        Tuple[List[ToucanPlayer], Optional[str]]
+            The players of the page and the cursor of the next page (``None``
+            if there are no more players).
+        """
+        if size < 1:
+            raise ToucanException(f"The size of a page must be at least 1, not {size}.")
+
+        players: List[ToucanPlayer] = []
+        last_key = None
+        for last_key, player in self._iter_after(self._decode_cursor(cursor)):
+            players.append(player)
+            if len(players) == size:
+                break
+        if len(players) < size:
+            return players, None
+        return players, self._encode_cursor(last_key)
+
+    def export(self, file: TextIO, format: str = "csv") -> int:
+        """Stream the players matching the query into a file.
+
+        Parameters
+        ----------
+        file : TextIO
+            The (text) file where the players are written.
+        format : str, optional
+            The format of the file, by default ``"csv"`` (with a header). ``"jsonl"``
+            writes one JSON object per line.
+
+        Returns
+        -------
+        int
+            The amount of players written.
+        """
+        if format not in EXPORT_FORMATS:
+            raise ToucanException(f"The export format '{format}' is not one of {EXPORT_FORMATS}.")
+
+        fields = ("nickname", "name", "points")
+        writer = csv.writer(file, lineterminator="\n") if format == "csv" else None
+        if writer is not None:
+            writer.writerow(fields)
+        count = 0
+        for count, player in enumerate(self, 1):
+            row = (player.nickname, player.name, player.total_points)
+            if writer is not None:
+                writer.writerow(row)
+            else:
+                file.write(json.dumps(dict(zip(fields, row))) + "\n")
+        return count
+
+    def _iter_after(self, key: Optional[tuple]) -> Iterator[Tuple[tuple, ToucanPlayer]]:
+        """Iterate lazily over the players matching the query, after a sort key.
+
+        Parameters
+        ----------
+        key : tuple or None
+            The sort key after which the iteration starts, or ``None`` to
+            start from the first player.
+
+        Yields
+        ------
+        Tuple[tuple, ToucanPlayer]
+            The sort key of each player and the player.
+        """
+        tournament = self._tournament
+        players_by_id = tournament._players_by_id
+
+        # Players must match every filter... the smallest set first. The
+        # attributes are only indexed when the query is filtered by them
+        filter_sets: List[Set[int]] = []
+        if self._filters:
+            index = tournament._index
+            filter_sets = sorted(
+                (index.get(attribute, value) for attribute, value in self._filters.items()),
+                key=len,
+            )
+        if filter_sets and len(filter_sets[0]) * SCAN_RATIO < len(players_by_id):
+            # Few players match the filters... sort them instead of scanning everyone
+            keys = sorted(
+                self._get_key(players_by_id[player_id])
+                for player_id in filter_sets[0]
+                if all(player_id in player_ids for player_ids in filter_sets[1:])
+                and players_by_id[player_id] is not None
+            )
+            start = 0 if key is None else bisect_right(keys, key)
+            for entry_key in keys[start:]:
+                yield entry_key, players_by_id[entry_key[1]]
+            return
+
+        if self._order_by == "points":
+            entries: Iterator[tuple] = (
+                (-total, player_id) for player_id, total in tournament._leaderboard.iter_after(key)
+            )
+        else:
+            order = tournament._order_index.get_order(self._order_by)
+            entries = iter(order[0 if key is None else bisect_right(order, key) :])
+
+        for entry_key in entries:
+            player_id = entry_key[1]
+            if filter_sets and not all(player_id in player_ids for player_ids in filter_sets):
+                continue
+            player = players_by_id[player_id]
+            if player is not None:
+                yield entry_key, player
+
+    def _get_key(self, player: ToucanPlayer) -> tuple:
+        """Compute the sort key of a player.
+
+        Parameters
+        ----------
+        player : ToucanPlayer
+            The player.
+
+        Returns
+        -------
+        tuple
+            The sort key of the player.
+        """
+        if self._order_by == "points":
+            return -player.total_points, player.id
+        return getattr(player, self._order_by), player.id
+
+    def _encode_cursor(self, key: tuple) -> str:
+        """Encode a sort key as an opaque cursor.
+
+        Parameters
+        ----------
+        key : tuple
+            The sort key of the last player of a page.
+
+        Returns
+        -------
+        str
+            The cursor.
+        """
+        payload = json.dumps([self._order_by, *key]).encode()
+        return base64.urlsafe_b64encode(payload).decode()
+
+    def _decode_cursor(self, cursor: Optional[str]) -> Optional[tuple]:
+        """Decode an opaque cursor into a sort key.
+
+        Parameters
+        ----------
+        cursor : str or None
+            The cursor.
+
+        Returns
+        -------
+        tuple or None
+            The sort key, or ``None`` if there is no cursor.
+        """
+        if cursor is None:
+            return None
+        try:
+            order_by, *key = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        except (ValueError, TypeError):
+            raise ToucanException(f"The cursor '{cursor}' is not valid.") from None
+        if order_by != self._order_by or len(key) != 2:
+            raise ToucanException(f"The cursor '{cursor}' does not belong to this query.")
+        return tuple(key)
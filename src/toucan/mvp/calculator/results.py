@@ -0,0 +1,651 @@
+"""Module containing the ``ToucanMatchResults`` class."""
+
+from array import array
+from bisect import bisect_left, bisect_right
+import os
+from pathlib import Path
+import sys
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
+
+from toucan.mvp.calculator.store import ToucanPointsStore, fit_column, get_typecode
+
+MATCH_COLUMNS = {
+    "match_ids": "b",
+    "disciplines": "b",
+    "team_as": "b",
+    "team_bs": "b",
+    "score_as": "b",
+    "score_bs": "b",
+    "row_starts": "b",
+    "directories": "b",
+    "source_ends": "b",
+}
+"""Columns of the results with one entry per match and their initial array typecodes."""
+
+ROW_COLUMNS = {"sides": "b", "positions": "b"}
+"""Columns of the results with one entry per player record and their initial array typecodes."""
+
+SOURCE_COLUMNS = {"sources": "B"}
+"""Column of the results with the (file system encoded) file names of the sources of the
+matches, back to back."""
+
+_COLUMNS = {**MATCH_COLUMNS, **ROW_COLUMNS, **SOURCE_COLUMNS}
+"""Every column of the results and their array typecodes."""
+
+_ATTRIBUTES = {"teams": "team", "positions": "position", "disciplines": "discipline"}
+"""Attribute of the ``ToucanPlayerIndex`` given by each kind of interned name."""
+
+_NAME_COLUMNS = {
+    "teams": ("team_as", "team_bs"),
+    "disciplines": ("disciplines",),
+    "positions": ("positions",),
+    "directories": ("directories",),
+}
+"""Columns of the results holding the identifiers of each kind of interned name."""
+
+
+class ToucanMatchRecord:
+    """Class representing the result of a match of a tournament.
+
+    Attributes
+    ----------
+    match_id : int
+        Identifier of the match in the tournament's points store.
+    source : str or None
+        The match file the match was read from (if any).
+    discipline : str
+        The name of the discipline of the match.
+    teams : Tuple[str, str]
+        The teams of the match, in order of appearance.
+    scores : Tuple[int, int]
+        The score of each team.
+    winner : str
+        The team which won the match.
+    rows : List[Tuple[str, str, int]]
+        The nickname, team and points (bonus included) of each player record,
+        in order of appearance.
+    """
+
+    def __init__(
+        self,
+        match_id: int,
+        source: Optional[str],
+        discipline: str,
+        teams: Tuple[str, str],
+        scores: Tuple[int, int],
+        rows: List[Tuple[str, str, int]],
+    ) -> None:
+        """Instantiate ``ToucanMatchRecord`` object.
+
+        Parameters
+        ----------
+        match_id : int
+            Identifier of the match in the tournament's points store.
+        source : str or None
+            The match file the match was read from (if any).
+        discipline : str
+            The name of the discipline of the match.
+        teams : Tuple[str, str]
+            The teams of the match, in order of appearance.
+        scores : Tuple[int, int]
+            The score of each team.
+        rows : List[Tuple[str, str, int]]
+            The nickname, team and points of each player record.
+        """
+        self.match_id = match_id
+        self.source = source
+        self.discipline = discipline
+        self.teams = teams
+        self.scores = scores
+        self.winner = teams[0] if scores[0] > scores[1] else teams[1]
+        self.rows = rows
+
+    def __repr__(self) -> str:
+        """Represent the match record.
+
+        Returns
+        -------
+        str
+            The representation of the match record.
+        """
+        return (
+            f"ToucanMatchRecord({self.match_id}, {self.discipline}, "
+            f"{self.teams[0]} {self.scores[0]} - {self.scores[1]} {self.teams[1]})"
+        )
+
+
+class ToucanMatchResults:
+    """Class holding the result of each match of a tournament in columnar form.
+
+    Parameters
+    ----------
+    store : ToucanPointsStore
+        The store holding the points of the matches.
+
+    Notes
+    -----
+    Each match is kept as a slot of typed arrays (match id, discipline, teams,
+    team scores and first player record), and each of its player records as
+    a row of two other arrays (team and position). Like the columns of the
+    points store, they start with the narrowest typecode and are only widened
+    (see ``fit_column``) when their data does not fit in it anymore. The
+    player and points of each record are not duplicated, but read from the
+    rows of the match in the points store. The file names of the sources of
+    the matches are kept back to back in a single byte array, while their
+    directories, as well as team, discipline and position names, are
+    interned. Slots are found by match id with a bisection, and indices of the
+    slots by source, team and player are only built when first queried, so
+    that neither they nor ``ToucanMatchRecord`` objects cost anything while
+    matches are merged.
+
+    Dropping a match only marks its slot as dropped (and removes it from the
+    indices if they are built). The slots (and rows) of the dropped matches
+    are compacted once they are the majority.
+
+    Like the points store, results can be backed by read-only buffers (e.g.
+    memory-mapped from a snapshot file), which are only copied into arrays
+    the first time a match is added.
+    """
+
+    def __init__(self, store: ToucanPointsStore) -> None:
+        """Instantiate ``ToucanMatchResults`` object."""
+        self._store = store
+        for column, typecode in _COLUMNS.items():
+            setattr(self, f"_{column}", array(typecode))
+
+        # Interned team, discipline, position and source directory names
+        self._names: Dict[str, List[str]] = {
+            "teams": [],
+            "disciplines": [],
+            "positions": [],
+            "directories": [],
+        }
+        self._name_ids: Dict[str, Dict[str, int]] = {name: {} for name in self._names}
+
+        # Lazy indices: slot of each source, slots of each team and player
+        self._indexed = False
+        self._source_slots: Dict[str, int] = {}
+        self._team_slots: Dict[int, array] = {}
+        self._player_slots: Dict[int, array] = {}
+
+        # Slots of the dropped matches, until they are compacted
+        self._dropped: Set[int] = set()
+
+        # Whether the columns are backed by read-only buffers
+        self._read_only: bool = False
+
+    @classmethod
+    def from_buffers(
+        cls, store: ToucanPointsStore, columns: Dict[str, memoryview], data: Dict[str, Any]
+    ) -> "ToucanMatchResults":
+        """Create results backed by read-only buffers, without copying them.
+
+        Parameters
+        ----------
+        store : ToucanPointsStore
+            The store holding the points of the matches.
+        columns : Dict[str, memoryview]
+            The buffer of each column in ``MATCH_COLUMNS``, ``ROW_COLUMNS`` and
+            ``SOURCE_COLUMNS``, already cast to its typecode.
+        data : Dict[str, Any]
+            The interned names of the results, as given by ``to_dict``.
+
+        Returns
+        -------
+        ToucanMatchResults
+            The results.
+        """
+        results = cls(store)
+        for column in _COLUMNS:
+            setattr(results, f"_{column}", columns[column])
+        results._read_only = True
+        for kind in results._names:
+            for name in data[kind]:
+                results._intern(kind, name)
+        return results
+
+    @property
+    def columns(self) -> Dict[str, Union[array, memoryview]]:
+        """Access property for retrieving the columns of the results.
+
+        Returns
+        -------
+        Dict[str, Union[array, memoryview]]
+            The buffer of each column in ``MATCH_COLUMNS``, ``ROW_COLUMNS`` and
+            ``SOURCE_COLUMNS``.
+        """
+        return {column: getattr(self, f"_{column}") for column in _COLUMNS}
+
+    @property
+    def n_rows(self) -> int:
+        """Number of player records in the results.
+
+        Returns
+        -------
+        int
+            Number of player records, the ones of dropped matches included.
+        """
+        return len(self._sides)
+
+    def _make_writable(self) -> None:
+        """Copy the read-only buffers backing the results into arrays."""
+        for column in _COLUMNS:
+            buffer = getattr(self, f"_{column}")
+            column_array = array(buffer.format)
+            column_array.frombytes(buffer.cast("B"))
+            setattr(self, f"_{column}", column_array)
+        self._read_only = False
+
+    def __len__(self) -> int:
+        """Count the matches of the results.
+
+        Returns
+        -------
+        int
+            Number of matches, the dropped ones excluded.
+        """
+        return len(self._match_ids) - len(self._dropped)
+
+    def _intern(self, kind: str, name: str) -> int:
+        """Retrieve the identifier of a team or discipline name, registering it if needed.
+
+        Parameters
+        ----------
+        kind : str
+            Either ``"teams"``, ``"disciplines"``, ``"positions"`` or ``"directories"``.
+        name : str
+            The name.
+
+        Returns
+        -------
+        int
+            The identifier of the name.
+        """
+        name_ids = self._name_ids[kind]
+        name_id = name_ids.get(name)
+        if name_id is None:
+            name = sys.intern(name)
+            name_id = name_ids[name] = len(self._names[kind])
+            self._names[kind].append(name)
+            if not self._read_only:
+                # (read-only columns already fit the names they were written with)
+                for column in _NAME_COLUMNS[kind]:
+                    setattr(self, f"_{column}", fit_column(getattr(self, f"_{column}"), 0, name_id))
+        return name_id
+
+    def add(
+        self,
+        match_id: int,
+        source: Optional[str],
+        discipline: str,
+        teams: Sequence[str],
+        scores: Sequence[int],
+        positions: Sequence[str],
+        sides: Sequence[int],
+    ) -> None:
+        """Record the result of a match, whose rows were already added to the points store.
+
+        Parameters
+        ----------
+        match_id : int
+            Identifier of the match in the tournament's points store.
+        source : str or None
+            The match file the match was read from (if any).
+        discipline : str
+            The name of the discipline of the match.
+        teams : Sequence[str]
+            The two teams of the match, in order of appearance.
+        scores : Sequence[int]
+            The score of each team.
+        positions : Sequence[str]
+            The position of each record, in the order of the rows of the match.
+        sides : Sequence[int]
+            The team of each record, as its index in ``teams``.
+        """
+        if self._read_only:
+            self._make_writable()
+        team_ids = [self._intern("teams", team) for team in teams]
+        discipline_id = self._intern("disciplines", discipline)
+        directory_id = -1
+        if source is not None:
+            name = os.path.basename(source)
+            directory_id = self._intern("directories", source[: len(source) - len(name)])
+            self._sources.frombytes(os.fsencode(name))
+        slot = len(self._match_ids)
+        self._match_ids = fit_column(self._match_ids, 0, match_id)
+        self._score_as = fit_column(self._score_as, scores[0], scores[0])
+        self._score_bs = fit_column(self._score_bs, scores[1], scores[1])
+        self._row_starts = fit_column(self._row_starts, 0, len(self._sides))
+        self._source_ends = fit_column(self._source_ends, 0, len(self._sources))
+        self._match_ids.append(match_id)
+        self._disciplines.append(discipline_id)
+        self._team_as.append(team_ids[0])
+        self._team_bs.append(team_ids[1])
+        self._score_as.append(scores[0])
+        self._score_bs.append(scores[1])
+        self._row_starts.append(len(self._sides))
+        self._directories.append(directory_id)
+        self._source_ends.append(len(self._sources))
+        self._sides.extend(sides)
+        position_ids = self._name_ids["positions"]
+        self._positions.extend(
+            [
+                position_ids[position]
+                if position in position_ids
+                else self._intern("positions", position)
+                for position in positions
+            ]
+        )
+        if self._indexed:
+            self._index_slot(slot)
+
+    def _index_slot(self, slot: int) -> None:
+        """Add a match slot to the indices of the results.
+
+        Parameters
+        ----------
+        slot : int
+            The slot of the match.
+        """
+        source = self.get_source(slot)
+        if source is not None:
+            self._source_slots[source] = slot
+        for team_id in (self._team_as[slot], self._team_bs[slot]):
+            self._team_slots.setdefault(team_id, array("i")).append(slot)
+        seen = set()
+        for player_id in self._store.match_rows(self._match_ids[slot])[0]:
+            if player_id not in seen:
+                seen.add(player_id)
+                self._player_slots.setdefault(player_id, array("i")).append(slot)
+
+    def _build_indices(self) -> None:
+        """Build the indices of the slots by source, team and player, if not built yet."""
+        if self._indexed:
+            return
+        self._indexed = True
+        for slot in self.iter_slots():
+            self._index_slot(slot)
+
+    def _row_end(self, slot: int) -> int:
+        """Compute the end of the player records of a match slot.
+
+        Parameters
+        ----------
+        slot : int
+            The slot of the match.
+
+        Returns
+        -------
+        int
+            The index following the last player record of the match.
+        """
+        if slot + 1 < len(self._row_starts):
+            return self._row_starts[slot + 1]
+        return len(self._sides)
+
+    def get_slot(self, match: Any) -> Optional[int]:
+        """Retrieve the slot of a match from its identifier or its match file.
+
+        Parameters
+        ----------
+        match : int, Path or str
+            The identifier of the match or the path to its match file.
+
+        Returns
+        -------
+        int or None
+            The slot of the match, or ``None`` if there is no such match.
+        """
+        if isinstance(match, int):
+            slot = bisect_left(self._match_ids, match)
+            if (
+                slot == len(self._match_ids)
+                or self._match_ids[slot] != match
+                or slot in self._dropped
+            ):
+                return None
+            return slot
+        self._build_indices()
+        return self._source_slots.get(str(Path(match)))
+
+    def get_source(self, slot: int) -> Optional[str]:
+        """Retrieve the match file a match slot was read from.
+
+        Parameters
+        ----------
+        slot : int
+            The slot of the match.
+
+        Returns
+        -------
+        str or None
+            The match file, or ``None`` if the match was not read from a file.
+        """
+        directory_id = self._directories[slot]
+        if directory_id < 0:
+            return None
+        name = self._sources[self._source_start(slot) : self._source_ends[slot]]
+        return self._names["directories"][directory_id] + os.fsdecode(bytes(name))
+
+    def _source_start(self, slot: int) -> int:
+        """Compute the start of the source of a match slot in the sources column.
+
+        Parameters
+        ----------
+        slot : int
+            The slot of the match.
+
+        Returns
+        -------
+        int
+            The index of the first byte of the source of the match.
+        """
+        return self._source_ends[slot - 1] if slot > 0 else 0
+
+    def team_slots(self, team: str) -> Sequence[int]:
+        """Retrieve the slots of the matches played by a team, in order of arrival.
+
+        Parameters
+        ----------
+        team : str
+            The name of the team.
+
+        Returns
+        -------
+        Sequence[int]
+            The slots of the matches.
+        """
+        self._build_indices()
+        team_id = self._name_ids["teams"].get(team)
+        return self._team_slots.get(team_id, ()) if team_id is not None else ()
+
+    def player_slots(self, player_id: int) -> Sequence[int]:
+        """Retrieve the slots of the matches played by a player, in order of arrival.
+
+        Parameters
+        ----------
+        player_id : int
+            The identifier of the player.
+
+        Returns
+        -------
+        Sequence[int]
+            The slots of the matches.
+        """
+        self._build_indices()
+        return self._player_slots.get(player_id, ())
+
+    def iter_slots(self, after: int = -1) -> Iterator[int]:
+        """Iterate over the slots of the matches following a given one, in order of arrival.
+
+        Parameters
+        ----------
+        after : int, optional
+            The identifier of the match after which the iteration starts, by
+            default -1 (i.e. every match).
+
+        Yields
+        ------
+        int
+            The slot of each match, the dropped ones excluded.
+        """
+        for slot in range(bisect_right(self._match_ids, after), len(self._match_ids)):
+            if slot not in self._dropped:
+                yield slot
+
+    def get_match_id(self, slot: int) -> int:
+        """Retrieve the identifier of the match of a slot.
+
+        Parameters
+        ----------
+        slot : int
+            The slot of the match.
+
+        Returns
+        -------
+        int
+            The identifier of the match in the tournament's points store.
+        """
+        return self._match_ids[slot]
+
+    def get_attributes(self, slot: int) -> List[Tuple[str, str, Sequence[int]]]:
+        """Retrieve the team, position and discipline of the players of a match slot.
+
+        Parameters
+        ----------
+        slot : int
+            The slot of the match.
+
+        Returns
+        -------
+        List[Tuple[str, str, Sequence[int]]]
+            Each attribute (see ``ToucanPlayerIndex``), its value and the
+            identifiers of the players of the match having it.
+        """
+        rows = slice(self._row_starts[slot], self._row_end(slot))
+        player_ids, _ = self._store.match_rows(self._match_ids[slot])
+        team_ids = (self._team_as[slot], self._team_bs[slot])
+        values: Dict[Tuple[str, int], List[int]] = {}
+        for player_id, side, position_id in zip(
+            player_ids, self._sides[rows], self._positions[rows]
+        ):
+            values.setdefault(("teams", team_ids[side]), []).append(player_id)
+            values.setdefault(("positions", position_id), []).append(player_id)
+        values[("disciplines", self._disciplines[slot])] = player_ids
+        return [
+            (_ATTRIBUTES[kind], self._names[kind][name_id], ids)
+            for (kind, name_id), ids in values.items()
+        ]
+
+    def get_record(self, slot: int, nicknames: Sequence[Any]) -> ToucanMatchRecord:
+        """Build the record of a match slot.
+
+        Parameters
+        ----------
+        slot : int
+            The slot of the match.
+        nicknames : Sequence[Any]
+            The players of the tournament by identifier, whose ``nickname`` is
+            used in the rows of the record.
+
+        Returns
+        -------
+        ToucanMatchRecord
+            The record of the match.
+        """
+        teams = (
+            self._names["teams"][self._team_as[slot]],
+            self._names["teams"][self._team_bs[slot]],
+        )
+        rows = slice(self._row_starts[slot], self._row_end(slot))
+        player_ids, points = self._store.match_rows(self._match_ids[slot])
+        return ToucanMatchRecord(
+            self._match_ids[slot],
+            self.get_source(slot),
+            self._names["disciplines"][self._disciplines[slot]],
+            teams,
+            (self._score_as[slot], self._score_bs[slot]),
+            [
+                (nicknames[player_id].nickname, teams[side], points)
+                for player_id, side, points in zip(player_ids, self._sides[rows], points)
+            ],
+        )
+
+    def drop_matches(self, match_ids: Iterable[int]) -> None:
+        """Remove the results of the given matches.
+
+        Notes
+        -----
+        The matches must be removed before their rows are dropped from the
+        points store, which still tells the players of each match.
+
+        Parameters
+        ----------
+        match_ids : Iterable[int]
+            The identifiers of the matches to be removed.
+        """
+        for match_id in match_ids:
+            slot = self.get_slot(match_id)
+            if slot is None:
+                continue
+
+            # Remove the slot from the indices, if they are built
+            self._dropped.add(slot)
+            if not self._indexed:
+                continue
+            source = self.get_source(slot)
+            if source is not None and self._source_slots.get(source) == slot:
+                del self._source_slots[source]
+            for team_id in (self._team_as[slot], self._team_bs[slot]):
+                self._team_slots[team_id].remove(slot)
+            for player_id in set(self._store.match_rows(match_id)[0]):
+                self._player_slots[player_id].remove(slot)
+
+        # Reclaim the space of the dropped slots once they are the majority
+        if 2 * len(self._dropped) > len(self._match_ids):
+            self.compact()
+
+    def compact(self) -> None:
+        """Remove the slots and rows of the dropped matches for good."""
+        if not self._dropped:
+            return
+
+        # Compact the remaining matches and their rows, then rebuild the indices
+        kept = [slot for slot in range(len(self._match_ids)) if slot not in self._dropped]
+        columns = {
+            column: array(get_typecode(getattr(self, f"_{column}"))) for column in MATCH_COLUMNS
+        }
+        rows = {column: array(get_typecode(getattr(self, f"_{column}"))) for column in ROW_COLUMNS}
+        sources = array(SOURCE_COLUMNS["sources"])
+        for slot in kept:
+            for column in MATCH_COLUMNS:
+                columns[column].append(getattr(self, f"_{column}")[slot])
+            columns["row_starts"][-1] = len(rows["sides"])
+            for column in ROW_COLUMNS:
+                rows[column].extend(
+                    getattr(self, f"_{column}")[self._row_starts[slot] : self._row_end(slot)]
+                )
+            sources.extend(self._sources[self._source_start(slot) : self._source_ends[slot]])
+            columns["source_ends"][-1] = len(sources)
+        for column, column_array in {**columns, **rows, "sources": sources}.items():
+            setattr(self, f"_{column}", column_array)
+        self._read_only = False
+        self._dropped = set()
+        self._indexed = False
+        self._source_slots, self._team_slots, self._player_slots = {}, {}, {}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the interned names of the results as JSON compatible data.
+
+        Notes
+        -----
+        The columns are not included (see ``columns``), as they are better
+        kept as raw buffers. The dropped matches are compacted beforehand.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The interned names of the results.
+        """
+        self.compact()
+        return dict(self._names)
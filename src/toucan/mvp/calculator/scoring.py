@@ -0,0 +1,135 @@
+"""Module containing the pure Python scoring pipeline of the Toucan tournament.
+
+Notes
+-----
+Matches are scored in two phases. First, each player record is scored on its
+own and gathered into a ``ToucanMatchBuffer`` (rating points, team and team
+score contribution). Then, once the whole match is known, the team totals are
+finalized and the bonus of the winner team is applied to the buffered records
+at once. Only then are the results committed to the players of the tournament,
+so a match which turns out to be invalid leaves no partial points behind.
+"""
+
+from operator import mul
+from typing import Any, Dict, List, Tuple
+
+from toucan.mvp.calculator.discipline import ToucanDiscipline
+from toucan.mvp.calculator.errors import ToucanException
+
+
+class ToucanMatchBuffer:
+    """Class gathering the scored player records of a match before committing them.
+
+    Parameters
+    ----------
+    discipline : ToucanDiscipline
+        The discipline of the match.
+    """
+
+    __slots__ = (
+        "_discipline",
+        "_parser",
+        "_coefficients",
+        "_teams",
+        "_team_scores",
+        "_sides",
+        "_points",
+    )
+
+    def __init__(self, discipline: ToucanDiscipline) -> None:
+        """Instantiate ``ToucanMatchBuffer`` object."""
+        self._discipline = discipline
+        self._parser = discipline.get_parser()
+        self._coefficients = self._parser.coefficients
+        self._teams: Dict[Any, int] = {}
+        self._team_scores: List[int] = []
+        self._sides: List[int] = []
+        self._points: List[int] = []
+
+    def __len__(self) -> int:
+        """Count the player records of the buffer.
+
+        Returns
+        -------
+        int
+            Number of player records.
+        """
+        return len(self._points)
+
+    @property
+    def teams(self) -> List[Any]:
+        """Access property for retrieving the teams of the match, in order of appearance.
+
+        Returns
+        -------
+        List[Any]
+            The teams of the match.
+        """
+        return list(self._teams)
+
+    @property
+    def sides(self) -> List[int]:
+        """Access property for retrieving the team of each record, as its index in ``teams``.
+
+        Returns
+        -------
+        List[int]
+            The team of each record.
+        """
+        return self._sides
+
+    def add(self, team: Any, position: str, marks: List[int]) -> None:
+        """Score a player record and add it to the buffer (first phase).
+
+        Parameters
+        ----------
+        team : Any
+            The team of the player (either decoded or undecoded).
+        position : str
+            Player's position in the match.
+        marks : List[int]
+            Marks obtained during the match.
+        """
+        coefficients = self._coefficients.get(position, None)
+        if not coefficients:
+            raise ToucanException(
+                f"Problems retrieving evaluation parameters for '{self._discipline.name}' in position '{position}'."  # noqa : E501
+            )
+        eval_params, extra_points = coefficients
+        if len(eval_params) != len(marks):
+            raise ToucanException(
+                f"Evaluation parameters for '{self._discipline.name}' in position '{position}' do not match the marks given."  # noqa : E501
+            )
+
+        side = self._teams.get(team)
+        if side is None:
+            side = self._teams[team] = len(self._teams)
+            self._team_scores.append(0)
+        self._sides.append(side)
+        self._points.append(sum(map(mul, eval_params, marks)) + extra_points)
+        self._team_scores[side] += self._parser.team_score_contribution(marks)
+
+    def finalize(self) -> Tuple[List[int], Tuple[int, int]]:
+        """Resolve the winner of the match and apply its bonus (second phase).
+
+        Returns
+        -------
+        List[int]
+            The points obtained by each player record (bonus included).
+        Tuple[int, int]
+            The score of each team, in order of appearance.
+        """
+        if len(self._teams) != 2:
+            raise ToucanException(f"Matches must be played by two teams, not {len(self._teams)}.")
+        team_a_score, team_b_score = self._team_scores
+        if team_a_score == team_b_score:  # pragma: no cover
+            raise ToucanException("Matches cannot end in a draw. Invalid tournament.")
+
+        # Apply the bonus to every record of the winner team at once
+        winner = 0 if team_a_score > team_b_score else 1
+        bonus_points = self._parser.bonus_points
+        points = [
+            points + bonus_points if side == winner else points
+            for points, side in zip(self._points, self._sides)
+        ]
+        return points, (team_a_score, team_b_score)
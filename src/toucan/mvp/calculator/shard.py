@@ -0,0 +1,394 @@
+"""Module containing the coordination of tournaments processed in shards.
+
+Notes
+-----
+The match files of a tournament directory are split into shards (see
+``get_shard``), each of them processed by a worker into a ``ToucanPartialResult``
+(see ``ToucanTournament.process_partial``). The ``ToucanShardCoordinator``
+gathers the partial results of every shard and merges them into the tournament.
+Workers can be:
+
+* Local processes, spawned by the coordinator itself (``run``).
+* Processes on any host sharing a file system with the coordinator, which save
+  their partial result to a file (``run_shard``) that the coordinator waits for
+  (``collect_files``).
+* Processes on any host reaching the coordinator over TCP, which send their
+  partial result (``send_partial``) to the coordinator listening for them
+  (``listen`` and ``collect_socket``). Each partial result is sent as an 8-byte
+  big-endian length followed by the serialized partial result, which may not
+  exceed ``MAX_FRAME_BYTES``. Connections which do not deliver a valid partial
+  result of the tournament (e.g. stray connections, oversized frames or
+  partial results of another amount of shards) are rejected without
+  interrupting the collection.
+"""
+
+import os
+from pathlib import Path
+import socket
+import struct
+import time
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Union
+
+from toucan.mvp.calculator.errors import ToucanException
+from toucan.mvp.calculator.partial import ToucanPartialResult
+from toucan.mvp.calculator.tournament import ToucanTournament
+
+FRAME_HEADER = struct.Struct("!Q")
+"""Header of the partial results sent over a socket: their length in bytes."""
+
+RECEIVE_TIMEOUT = 60.0
+"""Maximum time (in seconds) a connection may take to deliver its partial result."""
+
+MAX_FRAME_BYTES = 1 << 30
+"""Maximum size (in bytes) of the partial results sent over a socket."""
+
+
+def run_shard(
+    dir: Union[Path, str],
+    shard: int,
+    shards: int,
+    output: Optional[Union[Path, str, Tuple[str, int]]] = None,
+    workers: Optional[int] = 1,
+    **kwargs: Any,
+) -> ToucanPartialResult:
+    """Process a shard of a tournament directory, as a worker of a coordinator.
+
+    Parameters
+    ----------
+    dir : Path or str
+        Directory where the match files are located.
+    shard : int
+        The shard to be processed.
+    shards : int
+        The amount of shards the match files are split into.
+    output : Path, str or Tuple[str, int], optional
+        Where the partial result is delivered: the path to a file, or the host
+        and port of a coordinator listening for it, by default ``None`` (i.e.
+        it is only returned).
+    workers : int or None, optional
+        Number of worker processes used for processing the match files, by
+        default 1.
+    **kwargs : Any
+        Other arguments of ``ToucanTournament`` (e.g. its ``engine``).
+
+    Returns
+    -------
+    ToucanPartialResult
+        The partial result of the shard.
+    """
+    tournament = ToucanTournament(Path(dir).name, **kwargs)
+    partial = tournament.process_partial(dir, shard, shards, workers)
+    if isinstance(output, tuple):
+        send_partial(partial, output)
+    elif output is not None:
+        partial.save(output)
+    return partial
+
+
+def send_partial(partial: ToucanPartialResult, address: Tuple[str, int]) -> None:
+    """Send a partial result to a coordinator listening for it.
+
+    Parameters
+    ----------
+    partial : ToucanPartialResult
+        The partial result.
+    address : Tuple[str, int]
+        The host and port of the coordinator.
+    """
+    data = partial.to_bytes()
+    _check_frame_size(len(data))
+    with socket.create_connection(address) as connection:
+        connection.sendall(FRAME_HEADER.pack(len(data)) + data)
+
+
+def _receive_exactly(connection: socket.socket, size: int) -> bytes:
+    """Receive an exact amount of bytes from a socket.
+
+    Parameters
+    ----------
+    connection : socket.socket
+        The connected socket.
+    size : int
+        The amount of bytes.
+
+    Returns
+    -------
+    bytes
+        The bytes received.
+    """
+    _check_frame_size(size)
+    chunks = []
+    while size > 0:
+        chunk = connection.recv(min(size, 1 << 20))
+        if not chunk:
+            raise ToucanException("The connection was closed before the partial result was sent.")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def _check_frame_size(size: int) -> None:
+    """Check that a frame sent over a socket does not exceed ``MAX_FRAME_BYTES``.
+
+    Parameters
+    ----------
+    size : int
+        The size of the frame, in bytes.
+    """
+    if size > MAX_FRAME_BYTES:
+        raise ToucanException(
+            f"The partial result of {size} bytes exceeds the limit of {MAX_FRAME_BYTES} bytes."
+        )
+
+
+class ToucanShardCoordinator:
+    """Class gathering the partial results of the shards of a tournament and merging them.
+
+    Parameters
+    ----------
+    name : str
+        The name of the tournament.
+    shards : int
+        The amount of shards the match files are split into.
+    **kwargs : Any
+        Other arguments of ``ToucanTournament`` (e.g. its ``engine``), used by
+        the local workers and by the merged tournament.
+    """
+
+    def __init__(self, name: str, shards: int, **kwargs: Any) -> None:
+        """Instantiate ``ToucanShardCoordinator`` object."""
+        if shards < 1:
+            raise ToucanException(f"The number of shards must be at least 1, not {shards}.")
+        self._name: str = name
+        self._shards: int = shards
+        self._kwargs: Dict[str, Any] = kwargs
+        self._server: Optional[socket.socket] = None
+        self._rejected: List[str] = []
+
+    @property
+    def shards(self) -> int:
+        """Access property for retrieving the amount of shards of the tournament.
+
+        Returns
+        -------
+        int
+            The amount of shards.
+        """
+        return self._shards
+
+    @property
+    def rejected(self) -> List[str]:
+        """Access property for retrieving the connections rejected while collecting from a socket.
+
+        Returns
+        -------
+        List[str]
+            The address of each rejected connection and the reason why it was rejected.
+        """
+        return self._rejected
+
+    def merge(self, partials: Sequence[ToucanPartialResult]) -> ToucanTournament:
+        """Merge the partial results of every shard into the tournament.
+
+        Parameters
+        ----------
+        partials : Sequence[ToucanPartialResult]
+            The partial results, in any order.
+
+        Returns
+        -------
+        ToucanTournament
+            The tournament.
+        """
+        for partial in partials:
+            if partial.shards != self._shards:
+                raise ToucanException(
+                    f"The partial result of {partial.shards} shards does not belong to a "
+                    f"tournament of {self._shards} shards."
+                )
+        return ToucanTournament.from_partials(self._name, partials, **self._kwargs)
+
+    def run(self, dir: Union[Path, str], workers: Optional[int] = None) -> ToucanTournament:
+        """Process every shard of a tournament directory in local worker processes.
+
+        Parameters
+        ----------
+        dir : Path or str
+            Directory where the match files are located.
+        workers : int or None, optional
+            Number of worker processes, by default ``None`` (i.e. one per
+            shard, at most as many as CPUs are available).
+
+        Returns
+        -------
+        ToucanTournament
+            The tournament.
+        """
+        if workers is None:
+            workers = min(self._shards, os.cpu_count() or 1)
+        elif workers < 1:
+            raise ToucanException(f"The number of workers must be at least 1, not {workers}.")
+
+        if workers == 1:
+            partials = [
+                run_shard(dir, shard, self._shards, **self._kwargs) for shard in range(self._shards)
+            ]
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+
+            from toucan.mvp.calculator.discipline import (
+                _restore_disciplines,
+                get_custom_disciplines,
+            )
+
+            # The worker processes have to know about the custom disciplines too
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_restore_disciplines,
+                initargs=(get_custom_disciplines(),),
+            ) as executor:
+                futures = [
+                    executor.submit(run_shard, dir, shard, self._shards, **self._kwargs)
+                    for shard in range(self._shards)
+                ]
+                partials = [future.result() for future in futures]
+        return self.merge(partials)
+
+    def collect_files(
+        self,
+        paths: Sequence[Union[Path, str]],
+        timeout: Optional[float] = None,
+        interval: float = 0.1,
+    ) -> ToucanTournament:
+        """Wait for the partial results saved to files by the workers and merge them.
+
+        Parameters
+        ----------
+        paths : Sequence[Path or str]
+            The files where the workers save their partial results.
+        timeout : float, optional
+            Maximum time (in seconds) waiting for the files, by default ``None``
+            (i.e. wait forever).
+        interval : float, optional
+            Time (in seconds) between checks for the files, by default 0.1.
+
+        Returns
+        -------
+        ToucanTournament
+            The tournament.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        pending = [Path(path) for path in paths]
+        partials: List[ToucanPartialResult] = []
+        while True:
+            for path in [path for path in pending if path.is_file()]:
+                partials.append(ToucanPartialResult.load(path))
+                pending.remove(path)
+            if not pending:
+                return self.merge(partials)
+            if deadline is not None and time.monotonic() >= deadline:
+                raise ToucanException(
+                    f"Timed out waiting for the partial results {[str(path) for path in pending]}."
+                )
+            time.sleep(interval)
+
+    def listen(self, address: Tuple[str, int] = ("127.0.0.1", 0)) -> Tuple[str, int]:
+        """Start listening for the partial results sent by the workers.
+
+        Parameters
+        ----------
+        address : Tuple[str, int], optional
+            The host and port to listen on, by default ``("127.0.0.1", 0)``
+            (i.e. any free port of the local host).
+
+        Returns
+        -------
+        Tuple[str, int]
+            The host and port actually listened on, to be given to the workers.
+        """
+        if self._server is None:
+            self._server = socket.create_server(address)
+        return self._server.getsockname()[:2]
+
+    def collect_socket(self, timeout: Optional[float] = None) -> ToucanTournament:
+        """Receive the partial results sent by the workers until every shard is covered.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum time (in seconds) waiting for the partial results, by
+            default ``None`` (i.e. wait forever).
+
+        Returns
+        -------
+        ToucanTournament
+            The tournament.
+        """
+        self.listen()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        merged: Optional[ToucanPartialResult] = None
+        covered: Set[int] = set()
+        try:
+            while len(covered) < self._shards:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise socket.timeout
+                self._server.settimeout(remaining)
+                connection, address = self._server.accept()
+                with connection:
+                    connection.settimeout(
+                        RECEIVE_TIMEOUT if remaining is None else min(remaining, RECEIVE_TIMEOUT)
+                    )
+                    try:
+                        merged = self._receive_partial(connection, merged)
+                    except (OSError, ToucanException) as error:
+                        self._rejected.append(f"{address[0]}:{address[1]}: {error or 'timed out'}")
+                        continue
+                covered = set(merged.shard_ids)
+        except socket.timeout:
+            missing = sorted(set(range(self._shards)) - covered)
+            rejected = f" ({len(self._rejected)} rejected connections)" if self._rejected else ""
+            raise ToucanException(
+                f"Timed out waiting for the partial results of the shards {missing}{rejected}."
+            ) from None
+        finally:
+            self.close()
+        return self.merge([merged])
+
+    def _receive_partial(
+        self, connection: socket.socket, merged: Optional[ToucanPartialResult]
+    ) -> ToucanPartialResult:
+        """Receive a partial result from a worker and merge it with those received before.
+
+        Notes
+        -----
+        The partial result is validated as soon as it arrives: it must belong
+        to a tournament of as many shards as the coordinator's and be mergeable
+        with the partial results received before.
+
+        Parameters
+        ----------
+        connection : socket.socket
+            The connection of the worker.
+        merged : ToucanPartialResult or None
+            The partial results received before, merged (``None`` if none).
+
+        Returns
+        -------
+        ToucanPartialResult
+            The partial results received so far, merged.
+        """
+        (size,) = FRAME_HEADER.unpack(_receive_exactly(connection, FRAME_HEADER.size))
+        partial = ToucanPartialResult.from_bytes(_receive_exactly(connection, size))
+        if partial.shards != self._shards:
+            raise ToucanException(
+                f"The partial result of {partial.shards} shards does not belong to a "
+                f"tournament of {self._shards} shards."
+            )
+        return partial if merged is None else merged.merge(partial)
+
+    def close(self) -> None:
+        """Stop listening for partial results."""
+        if self._server is not None:
+            self._server.close()
+            self._server = None
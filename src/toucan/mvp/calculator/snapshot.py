@@ -0,0 +1,267 @@
+"""Module containing the binary snapshot format of processed Toucan tournaments.
+
+Notes
+-----
+A snapshot file is laid out as follows (all sections aligned to 8 bytes):
+
+1. A fixed size header: magic bytes, format version, byte order, number of
+   players, rows and matches, number of matches and player records of the
+   results, size of the metadata and array typecode of each column (as
+   columns are widened to fit their data).
+2. The columns of the ``ToucanPointsStore`` (see ``COLUMNS``), as raw
+   native-endian arrays, in order.
+3. The columns of the ``ToucanMatchResults`` (see ``MATCH_COLUMNS``,
+   ``ROW_COLUMNS`` and ``SOURCE_COLUMNS``), as raw native-endian arrays, in
+   order.
+4. The metadata of the tournament (name, players, manifest, interned names
+   of the results...) as UTF-8 JSON.
+
+Snapshots are loaded by memory-mapping the file: the columns are exposed as
+``memoryview`` objects over the mapping, so neither the point arrays nor the
+results are copied (nor even read from disk) until they are actually used.
+"""
+
+from array import array
+import json
+import mmap
+import os
+from pathlib import Path
+import struct
+import sys
+from typing import Any, Dict, Tuple, Union
+
+from toucan.mvp.calculator.errors import ToucanException
+from toucan.mvp.calculator.results import (
+    MATCH_COLUMNS,
+    ROW_COLUMNS,
+    SOURCE_COLUMNS,
+    ToucanMatchResults,
+)
+from toucan.mvp.calculator.store import COLUMNS, INTEGER_TYPECODES, ToucanPointsStore, get_typecode
+
+SNAPSHOT_MAGIC = b"TOUCANSN"
+"""Magic bytes at the beginning of every snapshot file."""
+
+SNAPSHOT_VERSION = 6
+"""Version of the snapshot format."""
+
+_HEADER = struct.Struct("<8sIIQQQQQQ32s")
+"""Header: magic, version, byte order, players, rows, matches, result matches and rows,
+metadata size and column typecodes."""
+
+_ALIGNMENT = 8
+"""Alignment (in bytes) of every section of the snapshot file."""
+
+_ROW_COLUMNS = ("player_ids", "points")
+"""Columns of the store with one entry per row."""
+
+_MATCH_COLUMNS = ("match_starts",)
+"""Columns of the store with one entry per match (the rest have one entry per player)."""
+
+_TYPECODES = (*INTEGER_TYPECODES, "B")
+"""Array typecodes the columns of a snapshot can be written with."""
+
+
+def _padding(size: int) -> int:
+    """Compute the padding needed after a section to keep the next one aligned.
+
+    Parameters
+    ----------
+    size : int
+        Size (in bytes) of the section.
+
+    Returns
+    -------
+    int
+        Number of padding bytes.
+    """
+    return -size % _ALIGNMENT
+
+
+def _map_columns(
+    buffer: memoryview, offset: int, columns: Dict[str, str], sizes: Dict[str, int]
+) -> Tuple[Dict[str, memoryview], int]:
+    """Expose consecutive columns of a snapshot as views over its mapping.
+
+    Parameters
+    ----------
+    buffer : memoryview
+        The whole snapshot.
+    offset : int
+        The offset of the first column.
+    columns : Dict[str, str]
+        The columns and their array typecodes, in order.
+    sizes : Dict[str, int]
+        The number of entries of each column.
+
+    Returns
+    -------
+    Tuple[Dict[str, memoryview], int]
+        The view over each column and the offset following the last one.
+
+    Raises
+    ------
+    ValueError
+        If a typecode is unknown or a column does not fit in the snapshot
+        (e.g. truncated file).
+    """
+    views = {}
+    for column, typecode in columns.items():
+        if typecode not in _TYPECODES:
+            raise ValueError(f"Unknown typecode '{typecode}' for column '{column}'.")
+        size = sizes[column] * array(typecode).itemsize
+        if size < 0 or offset + size > len(buffer):
+            raise ValueError(f"The column '{column}' does not fit in the snapshot.")
+        views[column] = buffer[offset : offset + size].cast(typecode)
+        offset += size + _padding(size)
+    return views, offset
+
+
+def write_snapshot(
+    path: Union[Path, str],
+    store: ToucanPointsStore,
+    results: ToucanMatchResults,
+    metadata: Dict[str, Any],
+) -> None:
+    """Write a points store, match results and their metadata to a snapshot file.
+
+    Notes
+    -----
+    The snapshot is first written to a temporary file which then replaces
+    the target one. Hence, a snapshot can be safely overwritten while it is
+    memory-mapped (e.g. by the tournament being saved). The rows of the
+    dropped matches are compacted beforehand.
+
+    Parameters
+    ----------
+    path : Path or str
+        The path to the snapshot file.
+    store : ToucanPointsStore
+        The store holding the points of the tournament.
+    results : ToucanMatchResults
+        The results of the matches of the tournament.
+    metadata : Dict[str, Any]
+        JSON serializable metadata of the tournament.
+    """
+    store.compact()
+    metadata = {**metadata, "results": results.to_dict()}
+    encoded_metadata = json.dumps(metadata, separators=(",", ":")).encode("utf-8")
+    byte_order = 0 if sys.byteorder == "little" else 1
+    columns = [*store.columns.values(), *results.columns.values()]
+    typecodes = "".join(get_typecode(column) for column in columns)
+
+    tmp_path = Path(f"{path}.tmp")
+    with open(tmp_path, "wb") as file:
+        file.write(
+            _HEADER.pack(
+                SNAPSHOT_MAGIC,
+                SNAPSHOT_VERSION,
+                byte_order,
+                store.n_players,
+                store.n_rows,
+                store.n_matches,
+                len(results),
+                results.n_rows,
+                len(encoded_metadata),
+                typecodes.encode("ascii"),
+            )
+        )
+        for column in columns:
+            data = memoryview(column).cast("B")
+            file.write(data)
+            file.write(b"\0" * _padding(len(data)))
+        file.write(encoded_metadata)
+    os.replace(tmp_path, path)
+
+
+def read_snapshot(
+    path: Union[Path, str]
+) -> Tuple[ToucanPointsStore, ToucanMatchResults, Dict[str, Any]]:
+    """Memory-map a snapshot file and expose its points store and results without copying them.
+
+    Parameters
+    ----------
+    path : Path or str
+        The path to the snapshot file.
+
+    Returns
+    -------
+    Tuple[ToucanPointsStore, ToucanMatchResults, Dict[str, Any]]
+        The store and the results (both backed by the memory-mapped file) and
+        the metadata of the tournament.
+    """
+    with open(path, "rb") as file:
+        try:
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            raise ToucanException(f"The file '{path}' is not a valid tournament snapshot.")
+
+    if len(mapping) < _HEADER.size:
+        raise ToucanException(f"The file '{path}' is not a valid tournament snapshot.")
+    (
+        magic,
+        version,
+        byte_order,
+        n_players,
+        n_rows,
+        n_matches,
+        n_result_matches,
+        n_result_rows,
+        metadata_size,
+        typecodes,
+    ) = _HEADER.unpack_from(mapping)
+    if magic != SNAPSHOT_MAGIC:
+        raise ToucanException(f"The file '{path}' is not a valid tournament snapshot.")
+    if version != SNAPSHOT_VERSION:
+        raise ToucanException(f"The snapshot version {version} is not supported.")
+    if byte_order != (0 if sys.byteorder == "little" else 1):
+        raise ToucanException("The snapshot was written on a machine with another byte order.")
+
+    # Expose each column as a view over the mapping, with the typecode it was written with
+    typecodes = typecodes.rstrip(b"\0").decode("ascii", "replace")
+    result_names = [*MATCH_COLUMNS, *ROW_COLUMNS, *SOURCE_COLUMNS]
+    if len(typecodes) != len(COLUMNS) + len(result_names):
+        raise ToucanException(f"The file '{path}' is not a valid tournament snapshot.")
+    result_typecodes = dict(zip(result_names, typecodes[len(COLUMNS) :]))
+    buffer = memoryview(mapping)
+    try:
+        store_columns, offset = _map_columns(
+            buffer,
+            _HEADER.size,
+            dict(zip(COLUMNS, typecodes)),
+            {
+                **dict.fromkeys(COLUMNS, n_players),
+                **dict.fromkeys(_ROW_COLUMNS, n_rows),
+                **dict.fromkeys(_MATCH_COLUMNS, n_matches),
+            },
+        )
+        result_columns, offset = _map_columns(
+            buffer,
+            offset,
+            {column: result_typecodes[column] for column in [*MATCH_COLUMNS, *ROW_COLUMNS]},
+            {
+                **{column: n_result_matches for column in MATCH_COLUMNS},
+                **{column: n_result_rows for column in ROW_COLUMNS},
+            },
+        )
+        source_ends = result_columns["source_ends"]
+        source_columns, offset = _map_columns(
+            buffer,
+            offset,
+            {"sources": result_typecodes["sources"]},
+            {"sources": source_ends[-1] if source_ends else 0},
+        )
+        if offset + metadata_size > len(buffer):
+            raise ValueError("The metadata does not fit in the snapshot.")
+        metadata = json.loads(bytes(buffer[offset : offset + metadata_size]).decode("utf-8"))
+    except ValueError:
+        raise ToucanException(f"The file '{path}' is not a valid tournament snapshot.")
+
+    store = ToucanPointsStore.from_buffers(store_columns)
+    return (
+        store,
+        ToucanMatchResults.from_buffers(
+            store, {**result_columns, **source_columns}, metadata.pop("results")
+        ),
+        metadata,
+    )
@@ -0,0 +1,180 @@
+"""Module containing the adapters of match data which does not come from a tournament directory.
+
+Notes
+-----
+Matches can also be read from archives (zip and tar files, optionally
+compressed with gzip, bzip2 or xz), from file-like objects (binary or text),
+from ``bytes`` and from iterables of lines (``str`` or ``bytes``). Archive
+members are decompressed in a streaming fashion and fed to the parser
+directly, without extracting them to disk.
+"""
+
+import io
+from pathlib import Path
+import tarfile
+from typing import IO, Iterable, Iterator, Tuple, Union
+import zipfile
+
+from toucan.mvp.calculator.errors import ToucanException
+
+MatchSource = Union[bytes, bytearray, memoryview, IO[bytes], IO[str], Iterable[Union[str, bytes]]]
+"""Match data other than a match file: contents, file-like objects or iterables of lines."""
+
+
+def read_match_bytes(stream: MatchSource) -> bytes:
+    """Read the whole contents of a match as bytes.
+
+    Parameters
+    ----------
+    stream : MatchSource
+        The contents, file-like object or lines of the match.
+
+    Returns
+    -------
+    bytes
+        The contents of the match.
+    """
+    if isinstance(stream, (bytes, bytearray, memoryview)):
+        return bytes(stream)
+    if hasattr(stream, "read"):
+        data = stream.read()
+        return data if isinstance(data, bytes) else data.encode()
+    lines = (line if isinstance(line, bytes) else line.encode() for line in stream)
+    return b"".join(line if line.endswith(b"\n") else line + b"\n" for line in lines)
+
+
+def iter_match_lines(stream: MatchSource) -> Iterable[str]:
+    """Iterate over the lines of a match as text.
+
+    Notes
+    -----
+    File-like objects are decoded in a streaming fashion, one line at a time.
+    Lines are yielded without their line breaks, whatever their style.
+
+    Parameters
+    ----------
+    stream : MatchSource
+        The contents, file-like object or lines of the match.
+
+    Returns
+    -------
+    Iterable[str]
+        The lines of the match.
+    """
+    if isinstance(stream, (bytes, bytearray, memoryview)):
+        stream = io.BytesIO(stream)
+    return _decode_lines(stream)
+
+
+def _decode_lines(lines: Iterable[Union[str, bytes]]) -> Iterator[str]:
+    """Decode the lines of a match which may be ``bytes``, removing their line breaks.
+
+    Parameters
+    ----------
+    lines : Iterable[Union[str, bytes]]
+        The lines of the match.
+
+    Yields
+    ------
+    str
+        Each line of the match.
+    """
+    for line in lines:
+        yield (line.decode() if isinstance(line, bytes) else line).rstrip("\r\n")
+
+
+def is_archive(filepath: Union[Path, str]) -> bool:
+    """Check whether a file is an archive (zip or tar file) of match files.
+
+    Parameters
+    ----------
+    filepath : Path or str
+        The path to the file.
+
+    Returns
+    -------
+    bool
+        ``True`` if the file is a zip or tar file (optionally compressed).
+    """
+    return Path(filepath).is_file() and (
+        zipfile.is_zipfile(filepath) or tarfile.is_tarfile(filepath)
+    )
+
+
+def iter_archive_members(archive: Union[Path, str, IO[bytes]]) -> Iterator[Tuple[str, IO[bytes]]]:
+    """Iterate over the match files of an archive, decompressing them in a streaming fashion.
+
+    Notes
+    -----
+    The members of zip archives are iterated in sorted name order. The members
+    of tar archives are iterated in the order they are stored in, which allows
+    reading them from non-seekable streams (e.g. a socket). Directories, other
+    special members and hidden files (i.e. those with a path component starting
+    with a dot, such as ``.gitignore``) are skipped. Each member must be
+    consumed before moving on to the next one.
+
+    Parameters
+    ----------
+    archive : Path, str or IO[bytes]
+        The path to the archive or a binary file-like object with its contents.
+
+    Yields
+    ------
+    Tuple[str, IO[bytes]]
+        The name of each match file and a binary file-like object with its contents.
+    """
+    is_zip = False
+    if isinstance(archive, (Path, str)):
+        is_zip = zipfile.is_zipfile(archive)
+    elif archive.seekable():
+        position = archive.tell()
+        is_zip = zipfile.is_zipfile(archive)
+        archive.seek(position)
+    if is_zip:
+        with zipfile.ZipFile(archive) as zip_file:
+            members = sorted(
+                (
+                    member
+                    for member in zip_file.infolist()
+                    if not member.is_dir() and not is_hidden(member.filename)
+                ),
+                key=lambda member: member.filename,
+            )
+            for member in members:
+                with zip_file.open(member) as member_file:
+                    yield member.filename, member_file
+        return
+
+    try:
+        if isinstance(archive, (Path, str)):
+            tar_file = tarfile.open(archive, mode="r|*")
+        else:
+            tar_file = tarfile.open(fileobj=archive, mode="r|*")
+    except tarfile.TarError:
+        raise ToucanException(f"The archive {archive} is neither a zip nor a tar file.") from None
+    with tar_file:
+        for member in tar_file:
+            if member.isfile() and not is_hidden(member.name):
+                yield member.name, tar_file.extractfile(member)
+
+
+def is_hidden(name: str) -> bool:
+    """Check whether a match file is a hidden file, which is never processed.
+
+    Notes
+    -----
+    The same rule applies to the files of tournament directories and to the
+    members of archives.
+
+    Parameters
+    ----------
+    name : str
+        The name of the file (relative to the directory or archive, with
+        ``/`` separators).
+
+    Returns
+    -------
+    bool
+        ``True`` if any component of the name starts with a dot.
+    """
+    return any(part.startswith(".") and part not in (".", "..") for part in name.split("/"))
@@ -0,0 +1,518 @@
+"""Module containing the ``ToucanPointsStore`` class."""
+
+from array import array
+from itertools import compress
+from typing import Dict, Iterable, List, Sequence, Set, Tuple, Union
+
+from toucan.mvp.calculator.errors import ToucanException
+
+INTEGER_TYPECODES = ("b", "h", "i", "q")
+"""Array typecodes of the integer columns, from the narrowest (8-bit) to the widest (64-bit)."""
+
+TYPECODE_RANGES = {
+    typecode: (
+        -(1 << (8 * array(typecode).itemsize - 1)),
+        (1 << (8 * array(typecode).itemsize - 1)) - 1,
+    )
+    for typecode in INTEGER_TYPECODES
+}
+"""Smallest and largest value held by each integer array typecode."""
+
+PLAYER_ID_TYPECODE = "b"
+"""Initial array typecode of the player of each row, widened as players join."""
+
+ROW_TYPECODE = "b"
+"""Initial array typecode of the first row of each match, widened as rows are added."""
+
+POINTS_TYPECODE = "b"
+"""Initial array typecode of the points of each row, widened as larger points are recorded."""
+
+TOTALS_TYPECODE = "q"
+"""Array typecode of the per player information (i.e. 64-bit signed integers)."""
+
+POINTS_RANGE = TYPECODE_RANGES["q"]
+"""Smallest and largest amount of points (per row and in total) held by the store."""
+
+DROPPED_PLAYER_ID = -1
+"""Player identifier of the rows of dropped matches, until the store is compacted."""
+
+STALE_ROW = -2
+"""Last row of the players whose last row was dropped, until it is looked up again."""
+
+COLUMNS = {
+    "player_ids": PLAYER_ID_TYPECODE,
+    "points": POINTS_TYPECODE,
+    "match_starts": ROW_TYPECODE,
+    "totals": TOTALS_TYPECODE,
+    "row_counts": TOTALS_TYPECODE,
+    "last_rows": TOTALS_TYPECODE,
+}
+"""Columns of the store and their initial array typecodes."""
+
+
+class ToucanPointsStore:
+    """Class holding the points obtained by the players of a tournament in columnar form.
+
+    Notes
+    -----
+    Each row of the store holds the points obtained by a player in a match.
+    Rows are kept in two contiguous typed arrays (player id and points), in
+    order of arrival. The rows of each match are contiguous, so the store
+    only keeps the first row of each match instead of the match of each row.
+    On top of them, the store keeps, for each player, the running total of
+    points, the amount of rows and the index of its last row.
+
+    A store can also be backed by read-only buffers (e.g. memory-mapped
+    from a snapshot file). In that case the buffers are only copied into
+    arrays the first time the store is modified.
+
+    Points (per row and in total) must fit in ``POINTS_RANGE``. Rows that
+    would not fit are rejected before modifying any column. The store keeps
+    the sum of the absolute points ever recorded, which bounds every row and
+    total, so the totals only need to be checked once that bound gets out of
+    the range. The columns of the player and the points of each row start
+    with the narrowest typecode and are only widened (see ``fit_column``)
+    when the players or points recorded do not fit in it anymore, so that
+    each row only takes the bytes its data needs.
+
+    The rows of a player are not indexed: the few queries needing them (e.g.
+    the points of a single player) scan the player of each row instead.
+
+    Dropping a match only marks its rows (see ``DROPPED_PLAYER_ID``). The
+    rows are compacted once most of them are dropped, so the cost of
+    dropping a match depends on its own rows (amortized).
+    """
+
+    def __init__(self) -> None:
+        """Instantiate ``ToucanPointsStore`` object."""
+        # Rows: player id and points... and the first row of each match
+        self._player_ids: array = array(PLAYER_ID_TYPECODE)
+        self._points: array = array(POINTS_TYPECODE)
+        self._match_starts: array = array(ROW_TYPECODE)
+
+        # Per player information: total points, amount of rows and last row
+        self._totals: array = array(TOTALS_TYPECODE)
+        self._row_counts: array = array(TOTALS_TYPECODE)
+        self._last_rows: array = array(TOTALS_TYPECODE)
+
+        # Rows of dropped matches, until they are compacted
+        self._n_dropped: int = 0
+
+        # Bound of the absolute points of every row and total
+        self._points_bound: int = 0
+
+        # Whether the columns are backed by read-only buffers
+        self._read_only: bool = False
+
+    @classmethod
+    def from_buffers(cls, columns: Dict[str, memoryview]) -> "ToucanPointsStore":
+        """Create a store backed by read-only buffers, without copying them.
+
+        Parameters
+        ----------
+        columns : Dict[str, memoryview]
+            The buffer of each column in ``COLUMNS``, already cast to its
+            typecode (which may be wider than the initial one).
+
+        Returns
+        -------
+        ToucanPointsStore
+            The store.
+        """
+        store = cls()
+        for column in COLUMNS:
+            setattr(store, f"_{column}", columns[column])
+        store._read_only = True
+        return store
+
+    @property
+    def columns(self) -> Dict[str, Union[array, memoryview]]:
+        """Access property for retrieving the columns of the store.
+
+        Returns
+        -------
+        Dict[str, Union[array, memoryview]]
+            The buffer of each column in ``COLUMNS``.
+        """
+        return {column: getattr(self, f"_{column}") for column in COLUMNS}
+
+    @property
+    def n_matches(self) -> int:
+        """Number of matches registered in the store.
+
+        Returns
+        -------
+        int
+            Number of matches.
+        """
+        return len(self._match_starts)
+
+    @property
+    def n_players(self) -> int:
+        """Number of players registered in the store.
+
+        Returns
+        -------
+        int
+            Number of players.
+        """
+        return len(self._totals)
+
+    @property
+    def n_rows(self) -> int:
+        """Number of rows (i.e. points obtained by a player in a match) in the store.
+
+        Returns
+        -------
+        int
+            Number of rows, the ones of dropped matches excluded.
+        """
+        return len(self._points) - self._n_dropped
+
+    def _make_writable(self) -> None:
+        """Copy the read-only buffers backing the store into arrays."""
+        for column in COLUMNS:
+            buffer = getattr(self, f"_{column}")
+            column_array = array(buffer.format)
+            column_array.frombytes(buffer.cast("B"))
+            setattr(self, f"_{column}", column_array)
+        self._points_bound = sum(map(abs, self._points))
+        self._read_only = False
+
+    def new_player(self) -> int:
+        """Register a new player in the store.
+
+        Returns
+        -------
+        int
+            The identifier of the new player.
+        """
+        if self._read_only:
+            self._make_writable()
+        player_id = len(self._totals)
+        self._player_ids = fit_column(self._player_ids, DROPPED_PLAYER_ID, player_id)
+        self._totals.append(0)
+        self._row_counts.append(0)
+        self._last_rows.append(-1)
+        return player_id
+
+    def new_match(self) -> int:
+        """Register a new match in the store, which becomes the one being recorded.
+
+        Returns
+        -------
+        int
+            The identifier of the new match.
+        """
+        if self._read_only:
+            self._make_writable()
+        first_row = len(self._points)
+        self._match_starts = fit_column(self._match_starts, 0, first_row)
+        self._match_starts.append(first_row)
+        return len(self._match_starts) - 1
+
+    def append(self, player_id: int, points: int) -> None:
+        """Add the points obtained by a player in the match being recorded.
+
+        Parameters
+        ----------
+        player_id : int
+            The identifier of the player.
+        points : int
+            The points obtained in the match.
+        """
+        check_points(points, self._totals[player_id] + points)
+        if self._read_only:
+            self._make_writable()
+        self._points = fit_column(self._points, points, points)
+        self._last_rows[player_id] = len(self._points)
+        self._player_ids.append(player_id)
+        self._points.append(points)
+        self._totals[player_id] += points
+        self._row_counts[player_id] += 1
+        self._points_bound += abs(points)
+
+    def extend(self, player_ids: Sequence[int], points: Sequence[int]) -> None:
+        """Add the points obtained by several players in the match being recorded.
+
+        Parameters
+        ----------
+        player_ids : Sequence[int]
+            The identifier of the player of each row.
+        points : Sequence[int]
+            The points obtained in the match by each row.
+        """
+        if self._read_only:
+            self._make_writable()
+        totals = self._totals
+        points_bound = self._points_bound + sum(map(abs, points))
+        if points_bound > POINTS_RANGE[1]:
+            # Check the new totals upfront, so that nothing is modified if they do not fit
+            new_totals: Dict[int, int] = {}
+            for player_id, row_points in zip(player_ids, points):
+                new_totals[player_id] = new_totals.get(player_id, totals[player_id]) + row_points
+            if points:
+                check_points(min(points), max(points), *new_totals.values())
+        self._points_bound = points_bound
+        if points:
+            self._points = fit_column(self._points, min(points), max(points))
+
+        first_row = len(self._points)
+        self._player_ids.extend(player_ids)
+        self._points.extend(points)
+        row_counts, last_rows = self._row_counts, self._last_rows
+        for row, (player_id, row_points) in enumerate(zip(player_ids, points), start=first_row):
+            totals[player_id] += row_points
+            row_counts[player_id] += 1
+            last_rows[player_id] = row
+
+    def add_to_last(self, player_id: int, points: int) -> None:
+        """Add points to the last row of a player.
+
+        Parameters
+        ----------
+        player_id : int
+            The identifier of the player.
+        points : int
+            The points to be added.
+        """
+        last_row = self._last_rows[player_id]
+        if last_row == STALE_ROW:
+            last_row = self._get_rows(player_id)[-1]
+        row_points = self._points[last_row] + points
+        check_points(row_points, self._totals[player_id] + points)
+        if self._read_only:
+            self._make_writable()
+        self._points = fit_column(self._points, row_points, row_points)
+        self._points[last_row] = row_points
+        self._totals[player_id] += points
+        self._last_rows[player_id] = last_row
+        self._points_bound += abs(points)
+
+    def total(self, player_id: int) -> int:
+        """Total number of points obtained by a player.
+
+        Parameters
+        ----------
+        player_id : int
+            The identifier of the player.
+
+        Returns
+        -------
+        int
+            Total number of points.
+        """
+        return self._totals[player_id]
+
+    def row_count(self, player_id: int) -> int:
+        """Count the rows (i.e. matches played) of a player.
+
+        Parameters
+        ----------
+        player_id : int
+            The identifier of the player.
+
+        Returns
+        -------
+        int
+            Number of rows.
+        """
+        return self._row_counts[player_id]
+
+    def points_of(self, player_id: int) -> List[int]:
+        """Points obtained by a player in each of its rows, in order of arrival.
+
+        Notes
+        -----
+        The rows of the player are found by scanning the player of each row,
+        so that no index of the rows of every player has to be kept.
+
+        Parameters
+        ----------
+        player_id : int
+            The identifier of the player.
+
+        Returns
+        -------
+        List[int]
+            The points obtained by the player per match.
+        """
+        if self._row_counts[player_id] == 0:
+            return []
+        return list(compress(self._points, map(player_id.__eq__, self._player_ids)))
+
+    def match_rows(self, match_id: int) -> Tuple[Sequence[int], Sequence[int]]:
+        """Retrieve the rows of a match.
+
+        Parameters
+        ----------
+        match_id : int
+            The identifier of the match.
+
+        Returns
+        -------
+        Sequence[int]
+            The identifier of the player of each row, in order of arrival.
+        Sequence[int]
+            The points obtained in the match by each row.
+        """
+        rows = self._match_range(match_id)
+        return self._player_ids[rows.start : rows.stop], self._points[rows.start : rows.stop]
+
+    def _match_range(self, match_id: int) -> range:
+        """Compute the rows of a match.
+
+        Parameters
+        ----------
+        match_id : int
+            The identifier of the match.
+
+        Returns
+        -------
+        range
+            The rows of the match (none if there is no such match).
+        """
+        match_starts = self._match_starts
+        if not 0 <= match_id < len(match_starts):
+            return range(0)
+        if match_id + 1 < len(match_starts):
+            return range(match_starts[match_id], match_starts[match_id + 1])
+        return range(match_starts[match_id], len(self._points))
+
+    def _get_rows(self, player_id: int) -> List[int]:
+        """Find the rows of a player, scanning the player of each row.
+
+        Parameters
+        ----------
+        player_id : int
+            The identifier of the player.
+
+        Returns
+        -------
+        List[int]
+            The rows of the player, in order of arrival.
+        """
+        player_ids = self._player_ids
+        return list(compress(range(len(player_ids)), map(player_id.__eq__, player_ids)))
+
+    def drop_matches(self, match_ids: Iterable[int]) -> Set[int]:
+        """Remove all the rows belonging to the given matches.
+
+        Parameters
+        ----------
+        match_ids : Iterable[int]
+            The identifiers of the matches to be removed.
+
+        Returns
+        -------
+        Set[int]
+            The identifiers of the players whose rows were removed.
+        """
+        affected_players: Set[int] = set()
+        match_ids = set(match_ids)
+        if not match_ids:
+            return affected_players
+        if self._read_only:
+            self._make_writable()
+
+        # Mark the rows of each match as dropped
+        player_ids, points = self._player_ids, self._points
+        for match_id in match_ids:
+            for row in self._match_range(match_id):
+                player_id = player_ids[row]
+                if player_id == DROPPED_PLAYER_ID:
+                    continue
+                player_ids[row] = DROPPED_PLAYER_ID
+                self._n_dropped += 1
+                affected_players.add(player_id)
+                self._totals[player_id] -= points[row]
+                self._row_counts[player_id] -= 1
+                if self._row_counts[player_id] == 0:
+                    self._last_rows[player_id] = -1
+                elif self._last_rows[player_id] == row:
+                    self._last_rows[player_id] = STALE_ROW
+
+        # Reclaim the space of the dropped rows once they are the majority
+        if 2 * self._n_dropped > len(points):
+            self.compact()
+        return affected_players
+
+    def compact(self) -> None:
+        """Remove the rows of the dropped matches for good."""
+        if not self._n_dropped:
+            return
+        player_ids = array(self._player_ids.typecode)
+        points = array(self._points.typecode)
+        match_starts = array(self._match_starts.typecode)
+        for match_id in range(len(self._match_starts)):
+            match_starts.append(len(points))
+            for row in self._match_range(match_id):
+                row_player_id = self._player_ids[row]
+                if row_player_id != DROPPED_PLAYER_ID:
+                    self._last_rows[row_player_id] = len(points)
+                    player_ids.append(row_player_id)
+                    points.append(self._points[row])
+
+        self._player_ids, self._points, self._match_starts = player_ids, points, match_starts
+        self._n_dropped = 0
+
+
+def get_typecode(column: Union[array, memoryview]) -> str:
+    """Retrieve the typecode of a column, either an array or a view cast to its typecode.
+
+    Parameters
+    ----------
+    column : array or memoryview
+        The column.
+
+    Returns
+    -------
+    str
+        The array typecode of the column.
+    """
+    return column.typecode if isinstance(column, array) else column.format
+
+
+def fit_column(column: array, low: int, high: int) -> array:
+    """Widen an integer column, if needed, so that it can hold some values.
+
+    Parameters
+    ----------
+    column : array
+        The column, whose typecode is one of ``INTEGER_TYPECODES``.
+    low : int
+        The smallest value to be held.
+    high : int
+        The largest value to be held.
+
+    Returns
+    -------
+    array
+        The column itself if the values fit in its typecode, otherwise a copy
+        of it with the narrowest typecode they fit in.
+    """
+    column_low, column_high = TYPECODE_RANGES[column.typecode]
+    if column_low <= low and high <= column_high:
+        return column
+    for typecode in INTEGER_TYPECODES:
+        typecode_low, typecode_high = TYPECODE_RANGES[typecode]
+        if typecode_low <= low and high <= typecode_high:
+            return array(typecode, column)
+    raise ToucanException(f"The values between {low} and {high} do not fit in a column.")
+
+
+def check_points(*values: int) -> None:
+    """Check that some amounts of points fit in the store.
+
+    Parameters
+    ----------
+    *values : int
+        The amounts of points.
+    """
+    low, high = POINTS_RANGE
+    for value in values:
+        if not low <= value <= high:
+            raise ToucanException(
+                f"The amount of points {value} does not fit in the store, which only holds "
+                f"amounts between {low} and {high}."
+            )
@@ -1,29 +1,334 @@
 """Module containing the ``ToucanTournament`` class."""
+from collections import deque
+from contextlib import nullcontext
+from functools import partial
+import io
+import os
 from pathlib import Path
-import re
-from typing import List, Union
+import sys
+from time import perf_counter
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    AsyncIterable,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
-from toucan.mvp.calculator.discipline import get_discipline_by_name
-from toucan.mvp.calculator.errors import ToucanException
+from toucan.mvp.calculator.cache import ToucanMatchCache
+from toucan.mvp.calculator.discipline import (
+    ToucanDiscipline,
+    _restore_disciplines,
+    get_custom_disciplines,
+    get_disciplines_version,
+)
+from toucan.mvp.calculator.errors import ToucanException, ToucanMatchError
+from toucan.mvp.calculator.history import ToucanMatchHistory
+from toucan.mvp.calculator.leaderboard import ToucanLeaderboard
+from toucan.mvp.calculator.manifest import ToucanManifestEntry, compute_file_digest
+from toucan.mvp.calculator.metrics import TIMINGS, ToucanMetricsSink
+from toucan.mvp.calculator.parser import (
+    MatchRow,
+    RawMatchRow,
+    open_match_buffer,
+    parse_match,
+    parse_match_buffer,
+)
+from toucan.mvp.calculator.partial import ToucanPartialResult, get_shard, merge_partials
 from toucan.mvp.calculator.players import ToucanPlayer
+from toucan.mvp.calculator.query import ToucanPlayerIndex, ToucanPlayerQuery
+from toucan.mvp.calculator.results import ToucanMatchRecord, ToucanMatchResults
+from toucan.mvp.calculator.scoring import ToucanMatchBuffer
+from toucan.mvp.calculator.snapshot import read_snapshot, write_snapshot
+from toucan.mvp.calculator.sources import (
+    MatchSource,
+    is_archive,
+    is_hidden,
+    iter_archive_members,
+    iter_match_lines,
+    read_match_bytes,
+)
+from toucan.mvp.calculator.store import ToucanPointsStore, check_points
+
+if TYPE_CHECKING:  # pragma: no cover
+    from toucan.mvp.calculator.watch import ToucanWatcher
+
+ENGINES = ("python", "numpy")
+"""Scoring engines available for processing a tournament."""
+
+NUMPY_BATCH_ROWS = 1 << 16
+"""Minimum amount of player records scored at once by the ``"numpy"`` engine."""
+
+PARSERS = ("text", "mmap")
+"""Parsers available for reading the match files of a tournament."""
+
+MatchResult = Tuple[str, Tuple[str, str], Tuple[int, int], List[Tuple[str, str, str, int, int]]]
+"""Partial result of a match processed in isolation: the name of its discipline, its two
+teams and their scores (in order of appearance) and the name, nickname, position, team (as
+its index in the teams) and points (bonus included) of each player record."""
+
+MatchFile = Union[Path, Tuple[str, bytes]]
+"""Unit of work when scoring matches in isolation: the path to a match file, or the source
+(e.g. the name of an archive member) and contents of a match."""
+
+ERROR_MODES = ("raise", "collect")
+"""Ways of handling invalid match files when processing a tournament."""
+
+ARCHIVE_BATCH_FILES = 4096
+"""Maximum amount of archive members read into memory before scoring them."""
+
+RERANK_RATIO = 4
+"""Players per player left unranked above which the leaderboard is updated one by one
+instead of rebuilt from the totals."""
 
 
 class ToucanTournament:
     """Class containing the Toucan tournament logic."""
 
-    def __init__(self, name: str) -> None:
+    def __init__(
+        self,
+        name: str,
+        engine: str = "python",
+        metrics: Optional[ToucanMetricsSink] = None,
+        parser: str = "text",
+        cache: Optional[ToucanMatchCache] = None,
+    ) -> None:
         """Instantiate ``ToucanTournament`` onject.
 
         Parameters
         ----------
         name : str
             The name of the tournament.
+        engine : str, optional
+            The scoring engine, by default ``"python"``. The ``"numpy"`` engine
+            scores batches of player records at once with NumPy, which has to
+            be installed.
+        metrics : ToucanMetricsSink, optional
+            The sink receiving the processing metrics, by default ``None`` (i.e.
+            the processing is not instrumented).
+        parser : str, optional
+            The parser of the match files, by default ``"text"``. The ``"mmap"``
+            parser memory-maps each match file and parses its bytes directly,
+            only decoding the name and nickname of the players the first time
+            they are seen.
+        cache : ToucanMatchCache, optional
+            The cache of the results of the match files, by default ``None``
+            (i.e. every match file is parsed and scored).
         """
         self._name: str = name
+        self._metrics: Optional[ToucanMetricsSink] = metrics
+        self._cache: Optional[ToucanMatchCache] = cache
+
+        # Check the scoring engine requested
+        if engine not in ENGINES:
+            raise ToucanException(f"The scoring engine '{engine}' is not one of {ENGINES}.")
+        elif engine == "numpy":
+            try:
+                import toucan.mvp.calculator.vectorized  # noqa : F401
+            except ImportError:  # pragma: no cover
+                raise ToucanException("The 'numpy' scoring engine requires NumPy to be installed.")
+        self._engine: str = engine
+
+        # Check the parser requested
+        if parser not in PARSERS:
+            raise ToucanException(f"The parser '{parser}' is not one of {PARSERS}.")
+        self._parser: str = parser
 
-        # Initialize the participants and potential MVP
+        # Initialize the participants, the store of their points and their ranking
         self._players: dict[str, ToucanPlayer] = {}
-        self._mvp: Union[ToucanPlayer, None] = None
+        self._players_by_id: List[Optional[ToucanPlayer]] = []
+        self._raw_players: dict[bytes, ToucanPlayer] = {}
+        self._store: ToucanPointsStore = ToucanPointsStore()
+        self._leaderboard_index: Optional[ToucanLeaderboard] = ToucanLeaderboard()
+        self._unranked: Set[int] = set()
+
+        # Initialize the results of the matches (teams, scores, winner...) and
+        # the index of the players built from them (when first queried)
+        self._results: ToucanMatchResults = ToucanMatchResults(self._store)
+        self._player_index: Optional[ToucanPlayerIndex] = None
+        self._indexed_match: int = -1
+
+        # Initialize the manifest of match files processed incrementally
+        self._manifest: dict[Path, ToucanManifestEntry] = {}
+
+        # Nickname and rank (before the changes) of the players whose points
+        # change, only when tracked (e.g. by a watcher)
+        self._rank_changes: Optional[Dict[int, Tuple[str, Optional[int]]]] = None
+
+        # Histories of the matches, by order (built when first requested)
+        self._histories: Dict[str, ToucanMatchHistory] = {}
+
+    @classmethod
+    def from_partials(
+        cls, name: str, partials: Iterable[ToucanPartialResult], **kwargs: Any
+    ) -> "ToucanTournament":
+        """Build a tournament by merging the partial results of all its shards.
+
+        Parameters
+        ----------
+        name : str
+            The name of the tournament.
+        partials : Iterable[ToucanPartialResult]
+            The partial results (e.g. computed by ``process_partial`` on
+            several hosts), in any order.
+        **kwargs : Any
+            Other arguments of ``ToucanTournament`` (e.g. its ``engine``).
+
+        Returns
+        -------
+        ToucanTournament
+            The tournament, identical to processing all its match files at once.
+        """
+        return merge_partials(partials).to_tournament(name, **kwargs)
+
+    @classmethod
+    def load(cls, path: Union[Path, str]) -> "ToucanTournament":
+        """Load a tournament previously saved as a binary snapshot.
+
+        Notes
+        -----
+        The snapshot is memory-mapped: the points of the players and the match
+        results are not copied until the tournament is modified, and the
+        leaderboard and the indices of the results are only rebuilt when they
+        are first needed.
+
+        Parameters
+        ----------
+        path : Path or str
+            The path to the snapshot file.
+
+        Returns
+        -------
+        ToucanTournament
+            The tournament, as it was when it was saved.
+        """
+        store, results, metadata = read_snapshot(path)
+        tournament = cls(
+            metadata["name"], metadata["engine"], parser=metadata.get("parser", "text")
+        )
+        tournament._store = store
+        tournament._results = results
+        tournament._leaderboard_index = None
+        for player_id, player_names in enumerate(metadata["players"]):
+            player = None
+            if player_names is not None:
+                name, nickname = player_names
+                player = ToucanPlayer(name, nickname, store, player_id)
+                tournament._players[player.nickname] = player
+            tournament._players_by_id.append(player)
+        for match_file, (size, mtime_ns, digest, match_id) in metadata["manifest"].items():
+            tournament._manifest[Path(match_file)] = ToucanManifestEntry(
+                size, mtime_ns, digest, match_id
+            )
+        return tournament
+
+    def save(self, path: Union[Path, str]) -> None:
+        """Save the tournament as a compact binary snapshot.
+
+        Parameters
+        ----------
+        path : Path or str
+            The path to the snapshot file.
+        """
+        metadata = {
+            "name": self._name,
+            "engine": self._engine,
+            "parser": self._parser,
+            "players": [
+                None if player is None else [player.name, player.nickname]
+                for player in self._players_by_id
+            ],
+            "manifest": {
+                str(match_file): [entry.size, entry.mtime_ns, entry.digest, entry.match_id]
+                for match_file, entry in self._manifest.items()
+            },
+        }
+        write_snapshot(path, self._store, self._results, metadata)
+
+    @property
+    def _index(self) -> ToucanPlayerIndex:
+        """Access property for retrieving the index of the players, bringing it up to date.
+
+        Notes
+        -----
+        The index is built from the results of the matches the first time it
+        is needed. Afterwards, only the matches ingested since are added to it.
+
+        Returns
+        -------
+        ToucanPlayerIndex
+            The index of the players of the tournament.
+        """
+        index = self._order_index
+        for slot in self._results.iter_slots(self._indexed_match):
+            for attribute, value, player_ids in self._results.get_attributes(slot):
+                index.add(attribute, value, player_ids)
+            self._indexed_match = self._results.get_match_id(slot)
+        return index
+
+    @property
+    def _order_index(self) -> ToucanPlayerIndex:
+        """Access property for retrieving the index of the players, only to sort them.
+
+        Notes
+        -----
+        Unlike ``_index``, the attributes of the players are not brought up
+        to date, so sorting the players by name or nickname does not pay for
+        indexing the results of every match.
+
+        Returns
+        -------
+        ToucanPlayerIndex
+            The index of the players of the tournament.
+        """
+        if self._player_index is None:
+            self._player_index = ToucanPlayerIndex(self._players_by_id)
+            self._indexed_match = -1
+        return self._player_index
+
+    @property
+    def _leaderboard(self) -> ToucanLeaderboard:
+        """Access property for retrieving the leaderboard, building it if needed.
+
+        Notes
+        -----
+        The players whose total points changed since the leaderboard was last
+        accessed are ranked again at once. If they are many, the leaderboard
+        is rebuilt from the totals of all the players instead.
+
+        Returns
+        -------
+        ToucanLeaderboard
+            The leaderboard of the tournament.
+        """
+        if self._leaderboard_index is not None and not self._unranked:
+            return self._leaderboard_index
+
+        start = perf_counter()
+        if len(self._unranked) * RERANK_RATIO > len(self._players):
+            self._leaderboard_index = None
+        if self._leaderboard_index is None:
+            self._leaderboard_index = ToucanLeaderboard.from_totals(
+                (player.id, player.total_points) for player in self._players.values()
+            )
+        else:
+            total = self._store.total
+            for player_id in self._unranked:
+                self._leaderboard_index.update(player_id, total(player_id))
+        self._unranked.clear()
+        if self._metrics is not None:
+            self._metrics.timing("leaderboard.ranking", perf_counter() - start)
+        return self._leaderboard_index
 
     @property
     def name(self) -> str:
@@ -36,16 +341,90 @@ class ToucanTournament:
         """
         return self._name
 
+    @property
+    def engine(self) -> str:
+        """Access property for retrieving the scoring engine of the tournament.
+
+        Returns
+        -------
+        str
+            The scoring engine of the tournament.
+        """
+        return self._engine
+
+    @property
+    def parser(self) -> str:
+        """Access property for retrieving the parser of the tournament's match files.
+
+        Returns
+        -------
+        str
+            The parser of the tournament's match files.
+        """
+        return self._parser
+
+    @property
+    def metrics(self) -> Optional[ToucanMetricsSink]:
+        """Access property for retrieving the sink of the processing metrics.
+
+        Returns
+        -------
+        ToucanMetricsSink or None
+            The sink receiving the processing metrics, if any.
+        """
+        return self._metrics
+
+    @metrics.setter
+    def metrics(self, metrics: Optional[ToucanMetricsSink]) -> None:
+        """Set the sink of the processing metrics.
+
+        Parameters
+        ----------
+        metrics : ToucanMetricsSink or None
+            The sink receiving the processing metrics, or ``None`` to stop
+            instrumenting the processing.
+        """
+        self._metrics = metrics
+
+    @property
+    def cache(self) -> Optional[ToucanMatchCache]:
+        """Access property for retrieving the cache of the results of the match files.
+
+        Returns
+        -------
+        ToucanMatchCache or None
+            The cache, or ``None`` if match files are not cached.
+        """
+        return self._cache
+
+    @cache.setter
+    def cache(self, cache: Optional[ToucanMatchCache]) -> None:
+        """Set the cache of the results of the match files.
+
+        Parameters
+        ----------
+        cache : ToucanMatchCache or None
+            The cache, or ``None`` to stop caching match files.
+        """
+        self._cache = cache
+
     @property
     def mvp(self) -> Union[ToucanPlayer, None]:
         """Access property for retrieving the name of the tournament's MVP.
 
+        Notes
+        -----
+        The MVP is kept up to date while matches are processed, so it can be
+        retrieved at any moment (even in the middle of processing a tournament).
+        In case of a tie, the player that joined the tournament first is the MVP.
+
         Returns
         -------
         ToucanPlayer or None
             The MVP of the tournament. ``None`` if no MVP is possible.
         """
-        return self._mvp
+        mvp_id = self._leaderboard.mvp
+        return None if mvp_id is None else self._players_by_id[mvp_id]
 
     @property
     def players(self) -> List[ToucanPlayer]:
@@ -58,43 +437,1155 @@ class ToucanTournament:
         """
         return self._players.values()
 
-    def process_tournament(self, dir: Union[Path, str]) -> None:
+    def top(self, k: int) -> List[ToucanPlayer]:
+        """Retrieve the players with the most points in the tournament.
+
+        Parameters
+        ----------
+        k : int
+            The amount of players to retrieve.
+
+        Returns
+        -------
+        List[ToucanPlayer]
+            The (at most) ``k`` best players of the tournament, the MVP first.
+        """
+        return [self._players_by_id[player_id] for player_id, _ in self._leaderboard.top(k)]
+
+    def query(
+        self,
+        order_by: str = "points",
+        team: Optional[str] = None,
+        position: Optional[str] = None,
+        discipline: Optional[str] = None,
+    ) -> ToucanPlayerQuery:
+        """Query the players of the tournament lazily (e.g. to paginate or export them).
+
+        Parameters
+        ----------
+        order_by : str, optional
+            The order of the players, by default ``"points"`` (i.e. best first).
+            ``"name"`` and ``"nickname"`` sort them alphabetically.
+        team : str, optional
+            Only the players that played in this team, by default ``None``.
+        position : str, optional
+            Only the players that played in this position, by default ``None``.
+        discipline : str, optional
+            Only the players that played this discipline, by default ``None``.
+
+        Returns
+        -------
+        ToucanPlayerQuery
+            The query, which can be iterated, paginated or exported.
+        """
+        return ToucanPlayerQuery(self, order_by, team, position, discipline)
+
+    def match_result(self, match: Union[int, Path, str]) -> ToucanMatchRecord:
+        """Retrieve the result of a match of the tournament.
+
+        Parameters
+        ----------
+        match : int, Path or str
+            The identifier of the match or the path to its match file.
+
+        Returns
+        -------
+        ToucanMatchRecord
+            The result of the match: teams, scores, winner and points of each
+            player record.
+        """
+        slot = self._results.get_slot(match)
+        if slot is None:
+            raise ToucanException(f"The match '{match}' is not part of the tournament.")
+        return self._results.get_record(slot, self._players_by_id)
+
+    def team_results(self, team: str) -> List[ToucanMatchRecord]:
+        """Retrieve the results of the matches played by a team, in order of arrival.
+
+        Parameters
+        ----------
+        team : str
+            The name of the team.
+
+        Returns
+        -------
+        List[ToucanMatchRecord]
+            The results of the matches.
+        """
+        slots = self._results.team_slots(team)
+        if not slots:
+            raise ToucanException(f"The team '{team}' does not take part in the tournament.")
+        return [self._results.get_record(slot, self._players_by_id) for slot in slots]
+
+    def player_results(self, nickname: str) -> List[ToucanMatchRecord]:
+        """Retrieve the results of the matches played by a player, in order of arrival.
+
+        Parameters
+        ----------
+        nickname : str
+            The nickname of the player.
+
+        Returns
+        -------
+        List[ToucanMatchRecord]
+            The results of the matches.
+        """
+        player = self._players.get(nickname)
+        if player is None:
+            raise ToucanException(f"The player '{nickname}' does not take part in the tournament.")
+        return [
+            self._results.get_record(slot, self._players_by_id)
+            for slot in self._results.player_slots(player.id)
+        ]
+
+    def history(self, order: str = "arrival") -> ToucanMatchHistory:
+        """Retrieve the history of the matches of the tournament.
+
+        Notes
+        -----
+        The history answers point-in-time and windowed queries (e.g. the MVP
+        as of round N or over the last K matches) without processing the
+        tournament again. It is kept up to date as matches are processed.
+
+        Parameters
+        ----------
+        order : str, optional
+            How matches are ordered, by default ``"arrival"``. See
+            ``ToucanMatchHistory`` for the other orders.
+
+        Returns
+        -------
+        ToucanMatchHistory
+            The history of the matches.
+        """
+        history = self._histories.get(order)
+        if history is None:
+            history = self._histories[order] = ToucanMatchHistory(self, order)
+        return history
+
+    def watch(self, dir: Union[Path, str], **kwargs: Any) -> "ToucanWatcher":
+        """Watch a directory and ingest its match files as they are added, changed or removed.
+
+        Parameters
+        ----------
+        dir : Path or str
+            Directory where the match files are located.
+        **kwargs : Any
+            Further options of the ``ToucanWatcher`` (e.g. ``backend``).
+
+        Returns
+        -------
+        ToucanWatcher
+            The watcher, which still has to be started (or polled).
+        """
+        from toucan.mvp.calculator.watch import ToucanWatcher
+
+        return ToucanWatcher(self, dir, **kwargs)
+
+    def rank(self, nickname: str) -> int:
+        """Retrieve the rank of a player in the tournament.
+
+        Parameters
+        ----------
+        nickname : str
+            The nickname of the player.
+
+        Returns
+        -------
+        int
+            The rank of the player, starting at 1 for the MVP.
+        """
+        player = self._players.get(nickname)
+        if player is None:
+            raise ToucanException(f"The player '{nickname}' does not take part in the tournament.")
+        return self._leaderboard.rank(player.id)
+
+    def process_tournament(
+        self,
+        dir: Union[Path, str],
+        workers: Optional[int] = 1,
+        incremental: bool = False,
+        errors: str = "raise",
+        max_errors: Optional[int] = None,
+    ) -> List[ToucanMatchError]:
         """Process a tournament given a directory where the match files are located.
 
+        Notes
+        -----
+        Match files are always processed in sorted path order, so that the
+        outcome of the tournament does not depend on the order in which the
+        file system lists them. When ``workers`` is greater than one, the
+        match files are parsed and scored in a pool of processes and their
+        partial results are merged back in that same order, which makes the
+        parallel outcome identical to the serial one. Subdirectories and hidden
+        files (e.g. ``.DS_Store``) are skipped, as in archives.
+
+        In incremental mode, the tournament keeps a manifest of the processed
+        match files (size, modification time, content hash and contribution of
+        each player). Subsequent incremental runs only process the files that
+        were added or changed, and retract the contributions of the files that
+        were changed or removed. Incremental and non-incremental runs should not
+        be mixed on the same tournament.
+
+        When the tournament has a cache, the results of the match files whose
+        content was already scored are taken from it, skipping their parsing.
+
+        Instead of a directory, the path to an archive (zip or tar file) with
+        the match files can be given, which is processed with
+        ``process_archive`` (only in non incremental mode).
+
+        When ``errors`` is ``"collect"``, each match file is validated in
+        isolation before its points are added to the tournament: invalid match
+        files are skipped (leaving no partial points behind) and reported,
+        instead of aborting the processing. In incremental mode, invalid match
+        files are not recorded in the manifest, so they are retried in the next
+        run.
+
+        Parameters
+        ----------
+        dir : Path or str
+            Directory (or archive) where the match files are located.
+        workers : int or None, optional
+            Number of worker processes used for processing the match files,
+            by default 1 (i.e. serial processing). ``None`` uses as many
+            workers as CPUs are available.
+        incremental : bool, optional
+            Whether to only process the changes since the previous incremental
+            run, by default ``False``.
+        errors : str, optional
+            How to handle invalid match files, by default ``"raise"`` (i.e. the
+            processing is aborted). ``"collect"`` skips and reports them.
+        max_errors : int, optional
+            Maximum amount of invalid match files tolerated in ``"collect"``
+            mode before giving up, by default ``None`` (i.e. no limit).
+
+        Returns
+        -------
+        List[ToucanMatchError]
+            The errors found in the invalid match files, in sorted path order
+            (always empty in ``"raise"`` mode).
+        """
+        # Archives are processed without extracting them (but not incrementally)
+        if is_archive(dir):
+            if incremental:
+                raise ToucanException(f"The archive {dir} cannot be processed incrementally.")
+            return self.process_archive(dir, workers, errors, max_errors)
+
+        # First of all, collect the match files of the directory
+        match_files = _list_match_files(dir)
+        workers, match_errors = _check_processing_options(workers, errors, max_errors)
+
+        # Process the match files
+        start = perf_counter()
+        if incremental:
+            self._process_changed_matches(match_files, workers, match_errors, max_errors)
+        elif workers == 1 and match_errors is None and self._cache is None:
+            self._process_match_files(match_files)
+        else:
+            self._merge_match_results(match_files, workers, match_errors, max_errors)
+        if self._metrics is not None:
+            self._metrics.timing("tournament.process", perf_counter() - start)
+        return match_errors or []
+
+    def process_partial(
+        self,
+        dir: Union[Path, str],
+        shard: int = 0,
+        shards: int = 1,
+        workers: Optional[int] = 1,
+    ) -> ToucanPartialResult:
+        """Process a shard of the match files of a tournament directory into a partial result.
+
+        Notes
+        -----
+        The match files are assigned to shards by name (see ``get_shard``) and
+        only those of the requested shard are parsed and scored, with the
+        engine, parser and cache of the tournament. The tournament itself is
+        left untouched: the partial results of all the shards are meant to be
+        merged (e.g. with ``from_partials``) wherever they are gathered.
+
+        Parameters
+        ----------
+        dir : Path or str
+            Directory where the match files are located.
+        shard : int, optional
+            The shard to be processed, by default 0.
+        shards : int, optional
+            The amount of shards the match files are split into, by default 1.
+        workers : int or None, optional
+            Number of worker processes used for processing the match files,
+            by default 1 (i.e. serial processing). ``None`` uses as many
+            workers as CPUs are available.
+
+        Returns
+        -------
+        ToucanPartialResult
+            The partial result of the shard.
+        """
+        if shards < 1 or not 0 <= shard < shards:
+            raise ToucanException(f"The shard {shard} is not a valid shard out of {shards}.")
+        match_files = [
+            match_file
+            for match_file in _list_match_files(dir)
+            if get_shard(match_file.name, shards) == shard
+        ]
+        workers, _ = _check_processing_options(workers, "raise", None)
+
+        start = perf_counter()
+        matches = {
+            match_file.name: (compute_file_digest(match_file), match_result)
+            for match_file, match_result in zip(
+                match_files, self._iter_match_results(match_files, workers)
+            )
+        }
+        if self._metrics is not None:
+            self._metrics.timing("tournament.process", perf_counter() - start)
+        return ToucanPartialResult(shards, [shard], get_disciplines_version(), matches)
+
+    def process_archive(
+        self,
+        archive: Union[Path, str, IO[bytes]],
+        workers: Optional[int] = 1,
+        errors: str = "raise",
+        max_errors: Optional[int] = None,
+    ) -> List[ToucanMatchError]:
+        """Process a tournament given an archive (zip or tar file) with its match files.
+
+        Notes
+        -----
+        The members of the archive are decompressed in a streaming fashion and
+        fed to the parser directly, without extracting them to disk. Zip
+        archives are processed in sorted name order and tar archives in the
+        order their members are stored in (see ``iter_archive_members``). Each
+        match is identified by the path of the archive joined with the name of
+        its member (e.g. ``"matches.tar.gz/match_1.txt"``).
+
+        When several workers are requested, the tournament has a cache or
+        ``errors`` is ``"collect"``, the members are read into memory in
+        batches of at most ``ARCHIVE_BATCH_FILES`` and each of them is scored
+        in isolation, as in ``process_tournament``.
+
+        Parameters
+        ----------
+        archive : Path, str or IO[bytes]
+            The path to the archive or a binary file-like object with its
+            contents (which may not be seekable for tar archives).
+        workers : int or None, optional
+            Number of worker processes used for processing the match files,
+            by default 1 (i.e. serial processing). ``None`` uses as many
+            workers as CPUs are available.
+        errors : str, optional
+            How to handle invalid match files, by default ``"raise"`` (i.e. the
+            processing is aborted). ``"collect"`` skips and reports them.
+        max_errors : int, optional
+            Maximum amount of invalid match files tolerated in ``"collect"``
+            mode before giving up, by default ``None`` (i.e. no limit).
+
+        Returns
+        -------
+        List[ToucanMatchError]
+            The errors found in the invalid match files, in processing order
+            (always empty in ``"raise"`` mode).
+        """
+        workers, match_errors = _check_processing_options(workers, errors, max_errors)
+        prefix = Path(archive) if isinstance(archive, (Path, str)) else Path()
+        members = (
+            (str(Path(prefix, name)), member) for name, member in iter_archive_members(archive)
+        )
+
+        start = perf_counter()
+        if workers == 1 and match_errors is None and self._cache is None:
+            for source, member in members:
+                self.process_match(member, source)
+        else:
+            batch: List[Tuple[str, bytes]] = []
+            for source, member in members:
+                batch.append((source, member.read()))
+                if len(batch) == ARCHIVE_BATCH_FILES:
+                    self._merge_match_results(batch, workers, match_errors, max_errors)
+                    batch = []
+            self._merge_match_results(batch, workers, match_errors, max_errors)
+        if self._metrics is not None:
+            self._metrics.timing("tournament.process", perf_counter() - start)
+        return match_errors or []
+
+    def process_match(
+        self, stream: Union[Path, str, MatchSource], source: Optional[object] = None
+    ) -> None:
+        """Process a Toucan tournament match given its file or its contents.
+
+        Notes
+        -----
+        Besides the path to a match file, the match can be given as ``bytes``,
+        as a file-like object (binary or text, e.g. an archive member or a
+        message read from a queue) or as an iterable of lines (``str`` or
+        ``bytes``), so that it does not have to be written to disk first. With
+        the ``"mmap"`` parser, the contents are read at once and parsed without
+        decoding them. Otherwise, they are decoded and parsed one line at a time.
+
+        Parameters
+        ----------
+        stream : Path, str or MatchSource
+            The path to the match's file or the contents of the match.
+        source : object, optional
+            The origin of the contents, used in error messages and in the
+            record of the match, by default the path to the match's file or
+            the stream itself.
+        """
+        if isinstance(stream, (Path, str)):
+            self._process_match(Path(stream))
+            return
+
+        source = stream if source is None else source
+        if self._parser == "mmap":
+            data = read_match_bytes(stream)
+            start = perf_counter()
+            discipline, rows = parse_match_buffer(data, source)
+            self._process_match_rows(
+                discipline, rows, source, start, self._get_or_create_raw_player
+            )
+            if self._metrics is not None:
+                self._metrics.count("bytes_read", len(data))
+        else:
+            self._process_match_lines(iter_match_lines(stream), source)
+
+    async def aprocess_tournament(self, dir: Union[Path, str], concurrency: int = 8) -> None:
+        """Process a tournament asynchronously given a directory where the match files are located.
+
+        Notes
+        -----
+        This is the asynchronous counterpart of ``process_tournament``. Listing
+        the directory and reading the match files is offloaded to the default
+        executor of the event loop, with at most ``concurrency`` files being
+        read at the same time. Matches are then processed in sorted path order,
+        so the outcome is identical to the synchronous one.
+
         Parameters
         ----------
         dir : Path or str
             Directory where the match files are located.
+        concurrency : int, optional
+            Maximum number of match files read at the same time, by default 8.
+        """
+        import asyncio
+
+        if concurrency < 1:
+            raise ToucanException(f"The concurrency must be at least 1, not {concurrency}.")
+
+        loop = asyncio.get_running_loop()
+        match_files = await loop.run_in_executor(None, _list_match_files, dir)
+
+        # Keep a window of (at most) ``concurrency`` files being read and
+        # process them in order as soon as they are available
+        pending_files = iter(match_files)
+        reads: Deque[Tuple[Path, asyncio.Future]] = deque()
+        for match_file in pending_files:
+            reads.append((match_file, loop.run_in_executor(None, _read_match_file, match_file)))
+            if len(reads) == concurrency:
+                break
+
+        while reads:
+            match_file, read = reads.popleft()
+            next_file = next(pending_files, None)
+            if next_file is not None:
+                reads.append((next_file, loop.run_in_executor(None, _read_match_file, next_file)))
+            self._process_match_lines(io.StringIO(await read), match_file)
+
+    async def aprocess_match(
+        self,
+        stream: Union[Path, str, AsyncIterable[str], Iterable[str]],
+        source: Optional[object] = None,
+    ) -> None:
+        """Process a Toucan tournament match asynchronously.
+
+        Notes
+        -----
+        The lines of the match are gathered without blocking the event loop
+        and the match is scored at once, when it has been completely received.
+        Hence, several matches can be received concurrently on the same
+        tournament without their records getting mixed up.
+
+        Parameters
+        ----------
+        stream : Path, str, AsyncIterable[str] or Iterable[str]
+            The path to the match's file (read in the default executor of the
+            event loop) or the lines of the match.
+        source : object, optional
+            The origin of the lines, used in error messages, by default the
+            path to the match's file or the stream itself.
+        """
+        if isinstance(stream, (Path, str)):
+            import asyncio
+
+            loop = asyncio.get_running_loop()
+            lines = io.StringIO(await loop.run_in_executor(None, _read_match_file, stream))
+        elif hasattr(stream, "__aiter__"):
+            lines = [line async for line in stream]
+        else:
+            lines = stream
+
+        self._process_match_lines(lines, stream if source is None else source)
+
+    def _process_changed_matches(
+        self,
+        match_files: List[Path],
+        workers: int,
+        match_errors: Optional[List[ToucanMatchError]] = None,
+        max_errors: Optional[int] = None,
+    ) -> None:
+        """Process only the match files that changed since the previous incremental run.
+
+        Parameters
+        ----------
+        match_files : List[Path]
+            Sorted list of the match files currently in the tournament.
+        workers : int
+            Number of worker processes used for processing the match files.
+        match_errors : List[ToucanMatchError], optional
+            The list collecting the errors of the invalid match files, which
+            are skipped, by default ``None`` (i.e. invalid match files raise).
+        max_errors : int, optional
+            Maximum amount of invalid match files tolerated, by default ``None``.
+        """
+        self._apply_match_changes(
+            self._find_changed_files(match_files),
+            set(self._manifest).difference(match_files),
+            workers,
+            match_errors,
+            max_errors,
+        )
+
+    def _update_match_files(
+        self,
+        match_files: Iterable[Path],
+        workers: int = 1,
+        match_errors: Optional[List[ToucanMatchError]] = None,
+        max_errors: Optional[int] = None,
+    ) -> None:
+        """Process incrementally the changes of some match files (e.g. reported by a watcher).
+
+        Parameters
+        ----------
+        match_files : Iterable[Path]
+            The match files which may have been added, changed or removed.
+        workers : int, optional
+            Number of worker processes used for processing the match files, by default 1.
+        match_errors : List[ToucanMatchError], optional
+            The list collecting the errors of the invalid match files, which
+            are skipped, by default ``None`` (i.e. invalid match files raise).
+        max_errors : int, optional
+            Maximum amount of invalid match files tolerated, by default ``None``.
+        """
+        existing_files, removed_files = [], []
+        for match_file in sorted(set(match_files)):
+            if match_file.is_file():
+                existing_files.append(match_file)
+            elif match_file in self._manifest:
+                removed_files.append(match_file)
+        self._apply_match_changes(
+            self._find_changed_files(existing_files),
+            removed_files,
+            workers,
+            match_errors,
+            max_errors,
+        )
+
+    def _find_changed_files(
+        self, match_files: List[Path]
+    ) -> List[Tuple[Path, os.stat_result, str]]:
+        """Find out which match files were added or changed since they were processed.
+
+        Notes
+        -----
+        Only the files whose size or modification time differ from the recorded
+        ones are hashed.
+
+        Parameters
+        ----------
+        match_files : List[Path]
+            Sorted list of match files.
+
+        Returns
+        -------
+        List[Tuple[Path, os.stat_result, str]]
+            The path, status and content hash of each added or changed match file.
         """
-        # First of all, check that the provided argument is actually
-        # a directory. Otherwise raise an error.
-        dir_as_path = dir if isinstance(dir, Path) else Path(dir)
-        if not dir_as_path.is_dir():
-            raise ToucanException(f"The provided directory path {dir} is not a directory.")
-
-        # Now that we have ensured that it is a directory, let's start
-        # processing the matches
-        for match_file in dir_as_path.iterdir():
-            # Skip subdirectories (if any)... we will only process files
-            if not match_file.is_file():
+        changed_files: List[Tuple[Path, os.stat_result, str]] = []
+        for match_file in match_files:
+            stat = match_file.stat()
+            entry = self._manifest.get(match_file)
+            if entry is not None and entry.is_stat_unchanged(stat):
                 continue
 
-            # Process the match file
-            self._process_match(match_file)
+            digest = compute_file_digest(match_file)
+            if entry is not None and entry.digest == digest:
+                entry.size, entry.mtime_ns = stat.st_size, stat.st_mtime_ns
+                continue
+
+            changed_files.append((match_file, stat, digest))
+        return changed_files
+
+    def _apply_match_changes(
+        self,
+        changed_files: List[Tuple[Path, os.stat_result, str]],
+        removed_files: Iterable[Path],
+        workers: int,
+        match_errors: Optional[List[ToucanMatchError]] = None,
+        max_errors: Optional[int] = None,
+    ) -> None:
+        """Retract the removed and changed match files and process the new contents.
+
+        Parameters
+        ----------
+        changed_files : List[Tuple[Path, os.stat_result, str]]
+            The path, status and content hash of each added or changed match file.
+        removed_files : Iterable[Path]
+            The match files which were removed.
+        workers : int
+            Number of worker processes used for processing the match files.
+        match_errors : List[ToucanMatchError], optional
+            The list collecting the errors of the invalid match files, which
+            are skipped, by default ``None`` (i.e. invalid match files raise).
+        max_errors : int, optional
+            Maximum amount of invalid match files tolerated, by default ``None``.
+        """
+        # Retract the contributions of the files that were removed or changed
+        removed_files = set(removed_files)
+        self._retract_matches(
+            self._manifest.pop(match_file).match_id
+            for match_file in removed_files.union(path for path, *_ in changed_files)
+            if match_file in self._manifest
+        )
+
+        # Process the new contents and record them in the manifest
+        match_results = self._iter_match_results(
+            [path for path, *_ in changed_files], workers, match_errors, max_errors
+        )
+        for (match_file, stat, digest), match_result in zip(changed_files, match_results):
+            if match_result is None:
+                continue
+            try:
+                match_id = self._merge_match_result(match_result, str(match_file))
+            except ToucanMatchError as error:
+                if match_errors is None:
+                    raise
+                _collect_match_error(error, match_errors, max_errors)
+                continue
+            self._manifest[match_file] = ToucanManifestEntry(
+                stat.st_size, stat.st_mtime_ns, digest, match_id
+            )
+
+    def _merge_match_results(
+        self,
+        match_files: Sequence[MatchFile],
+        workers: int,
+        match_errors: Optional[List[ToucanMatchError]] = None,
+        max_errors: Optional[int] = None,
+    ) -> None:
+        """Score each match file in isolation and merge their partial results in order.
+
+        Parameters
+        ----------
+        match_files : Sequence[MatchFile]
+            The match files to be scored.
+        workers : int
+            Number of worker processes used for scoring the match files.
+        match_errors : List[ToucanMatchError], optional
+            The list collecting the errors of the invalid match files, by
+            default ``None`` (i.e. invalid match files raise).
+        max_errors : int, optional
+            Maximum amount of invalid match files tolerated, by default ``None``.
+        """
+        match_results = self._iter_match_results(match_files, workers, match_errors, max_errors)
+        for match_file, match_result in zip(match_files, match_results):
+            if match_result is None:
+                continue
+            try:
+                self._merge_match_result(match_result, _split_match_file(match_file)[0])
+            except ToucanMatchError as error:
+                if match_errors is None:
+                    raise
+                _collect_match_error(error, match_errors, max_errors)
+
+    def _iter_match_results(
+        self,
+        match_files: Sequence[MatchFile],
+        workers: int,
+        match_errors: Optional[List[ToucanMatchError]] = None,
+        max_errors: Optional[int] = None,
+    ) -> Iterator[Optional[MatchResult]]:
+        """Score each match file in isolation and yield their partial results in order.
+
+        Parameters
+        ----------
+        match_files : Sequence[MatchFile]
+            The match files to be scored.
+        workers : int
+            Number of worker processes used for scoring the match files.
+        match_errors : List[ToucanMatchError], optional
+            The list collecting the errors of the invalid match files, whose
+            partial result is ``None``, by default ``None`` (i.e. invalid
+            match files raise).
+        max_errors : int, optional
+            Maximum amount of invalid match files tolerated, by default ``None``.
+
+        Yields
+        ------
+        MatchResult or None
+            The partial result of each match.
+        """
+        if match_errors is None:
+            yield from self._score_match_files(match_files, workers, _score_match_file)
+            return
+
+        for match_result in self._score_match_files(match_files, workers, _try_score_match_file):
+            if not isinstance(match_result, ToucanMatchError):
+                yield match_result
+                continue
+
+            _collect_match_error(match_result, match_errors, max_errors)
+            yield None
+
+    def _score_match_files(
+        self, match_files: Sequence[MatchFile], workers: int, score_match_file: Callable
+    ) -> Iterator[Any]:
+        """Apply a scoring function to each match file and yield their outcome in order.
+
+        Notes
+        -----
+        When the tournament has a cache, the scoring function is only applied
+        to the match files whose result is not cached, and their results
+        (unless they are errors) are added to the cache.
+
+        Parameters
+        ----------
+        match_files : Sequence[MatchFile]
+            The match files to be scored.
+        workers : int
+            Number of worker processes used for scoring the match files.
+        score_match_file : Callable
+            The module-level function scoring a single match file.
+
+        Yields
+        ------
+        Any
+            The outcome of the scoring function for each match file.
+        """
+        if self._cache is None:
+            yield from self._map_match_files(match_files, workers, score_match_file)
+            return
+
+        version = get_disciplines_version()
+        keys = [
+            self._cache.get_key(_split_match_file(match_file)[1], version)
+            for match_file in match_files
+        ]
+        match_results = [self._cache.get(key) for key in keys]
+        missing_files = [
+            match_file
+            for match_file, match_result in zip(match_files, match_results)
+            if match_result is None
+        ]
+        if self._metrics is not None:
+            self._metrics.count("cache_hits", len(match_files) - len(missing_files))
+            self._metrics.count("cache_misses", len(missing_files))
+
+        scored_files = self._map_match_files(missing_files, workers, score_match_file)
+        try:
+            for key, match_result in zip(keys, match_results):
+                if match_result is None:
+                    match_result = next(scored_files)
+                    if not isinstance(match_result, ToucanMatchError):
+                        self._cache.put(key, match_result)
+                yield match_result
+        finally:
+            scored_files.close()
+
+    def _map_match_files(
+        self, match_files: Sequence[MatchFile], workers: int, score_match_file: Callable
+    ) -> Iterator[Any]:
+        """Apply a scoring function to each match file, possibly in parallel, in order.
+
+        Parameters
+        ----------
+        match_files : Sequence[MatchFile]
+            The match files to be scored.
+        workers : int
+            Number of worker processes used for scoring the match files.
+        score_match_file : Callable
+            The module-level function scoring a single match file.
+
+        Yields
+        ------
+        Any
+            The outcome of the scoring function for each match file.
+        """
+        metrics = self._metrics
+        if metrics is None:
+            yield from _map_scoring(
+                score_match_file, match_files, workers, self._engine, self._parser
+            )
+            return
+
+        # The match files are measured in isolation and reported from here
+        measured_files = _map_scoring(
+            partial(_measure_match_file, score_match_file),
+            match_files,
+            workers,
+            self._engine,
+            self._parser,
+        )
+        for outcome, measures, error in measured_files:
+            for name, value in measures.items():
+                if name in TIMINGS:
+                    metrics.timing(name, value)
+                else:
+                    metrics.count(name, int(value))
+            if error is not None:
+                raise error
+            yield outcome
+
+    def _rank_players(self, player_ids: Iterable[int]) -> None:
+        """Mark some players to be ranked again the next time the leaderboard is accessed.
+
+        Parameters
+        ----------
+        player_ids : Iterable[int]
+            The identifiers of the players whose total points changed.
+        """
+        if self._rank_changes is not None:
+            player_ids = list(player_ids)
+            self._track_rank_changes(player_ids)
+        self._unranked.update(player_ids)
+
+    def _track_rank_changes(self, player_ids: Iterable[int]) -> None:
+        """Record the nickname and rank of some players before their points change.
+
+        Notes
+        -----
+        Players whose rank was already recorded are skipped.
+
+        Parameters
+        ----------
+        player_ids : Iterable[int]
+            The identifiers of the players whose points are about to change.
+        """
+        leaderboard = self._leaderboard
+        for player_id in player_ids:
+            if player_id not in self._rank_changes:
+                self._rank_changes[player_id] = (
+                    self._players_by_id[player_id].nickname,
+                    leaderboard.rank(player_id) if player_id in leaderboard else None,
+                )
+
+    def _get_or_create_player(self, name: str, nickname: str) -> ToucanPlayer:
+        """Retrieve a player of the tournament, creating it if it does not exist yet.
+
+        Parameters
+        ----------
+        name : str
+            The name of the player.
+        nickname : str
+            The nickname of the player.
+
+        Returns
+        -------
+        ToucanPlayer
+            The player of the tournament.
+        """
+        player = self._players.get(nickname)
+        if player is None:
+            player = ToucanPlayer(name, nickname, self._store)
+            self._players[player.nickname] = player
+            self._players_by_id.append(player)
+            if self._metrics is not None:
+                self._metrics.count("players_created")
+        return player
+
+    def _get_or_create_raw_player(self, name: bytes, nickname: bytes) -> ToucanPlayer:
+        """Retrieve a player of the tournament from its undecoded name and nickname.
+
+        Notes
+        -----
+        The name and nickname are only decoded the first time they are seen.
+
+        Parameters
+        ----------
+        name : bytes
+            The name of the player.
+        nickname : bytes
+            The nickname of the player.
+
+        Returns
+        -------
+        ToucanPlayer
+            The player of the tournament.
+        """
+        player = self._raw_players.get(nickname)
+        if player is None:
+            player = self._get_or_create_player(name.decode(), nickname.decode())
+            self._raw_players[nickname] = player
+        return player
+
+    def _merge_match_result(self, match_result: MatchResult, source: object = None) -> int:
+        """Merge the partial result of a match processed elsewhere into the tournament.
+
+        Parameters
+        ----------
+        match_result : MatchResult
+            The partial result of the match.
+        source : object, optional
+            The origin of the match (e.g. the path to the match's file), by
+            default ``None`` (i.e. unknown).
+
+        Returns
+        -------
+        int
+            The identifier of the match in the points store.
+        """
+        discipline, teams, scores, rows = match_result
+        _check_match_points([row[4] for row in rows], scores, source)
+        get_player = self._get_or_create_player
+        match_id = self._commit_match(
+            discipline,
+            teams,
+            scores,
+            [get_player(name, nickname).id for name, nickname, _, _, _ in rows],
+            [row[2] for row in rows],
+            [row[3] for row in rows],
+            [row[4] for row in rows],
+            source,
+        )
+        if self._metrics is not None:
+            self._metrics.count("matches")
+            self._metrics.count("rows", len(rows))
+        return match_id
+
+    def _retract_matches(self, match_ids: Iterable[int]) -> None:
+        """Retract the points of matches previously processed in the tournament.
+
+        Notes
+        -----
+        Players left without any points are removed from the tournament.
+
+        Parameters
+        ----------
+        match_ids : Iterable[int]
+            The identifiers of the matches in the points store.
+        """
+        match_ids = list(match_ids)
+        if not match_ids:
+            return
+        for history in self._histories.values():
+            history.invalidate()
+
+        # The index is rebuilt from the remaining matches when queried again
+        self._player_index = None
 
-        # Once all matches in the tournament have been processed
-        # determine who is the MVP!
-        for player in self.players:
-            # In case no MVP is yet available... the first one in line
-            # will be the MVP
-            if self._mvp is None:
-                self._mvp = player
+        # The results go first, as they read the players of each match from the store
+        self._results.drop_matches(match_ids)
+        for player_id in sorted(self._store.drop_matches(match_ids)):
+            if self._store.row_count(player_id) > 0:
+                self._rank_players([player_id])
                 continue
 
-            # Now, check if the current player has more points than
-            # the "current" MVP
-            if player.total_points > self._mvp.total_points:
-                self._mvp = player
+            if self._rank_changes is not None:
+                self._track_rank_changes([player_id])
+            player = self._players_by_id[player_id]
+            self._players_by_id[player_id] = None
+            del self._players[player.nickname]
+            self._raw_players.pop(player.nickname.encode(), None)
+            self._leaderboard.discard(player_id)
+
+    def _process_match_files(self, match_files: List[Path]) -> None:
+        """Process Toucan tournament match files in order.
+
+        Notes
+        -----
+        The ``"numpy"`` engine parses consecutive match files until at least
+        ``NUMPY_BATCH_ROWS`` player records are gathered and scores them at once.
+
+        Parameters
+        ----------
+        match_files : List[Path]
+            The paths to the match files.
+        """
+        if self._engine == "python":
+            for match_file in match_files:
+                self._process_match(match_file)
+            return
+
+        get_player = self._get_or_create_player
+        if self._parser == "mmap":
+            get_player = self._get_or_create_raw_player
+        batch: List[Tuple[ToucanDiscipline, List[Union[MatchRow, RawMatchRow]]]] = []
+        batch_sources: List[object] = []
+        batch_rows = 0
+        for match_file in match_files:
+            batch_sources.append(match_file)
+            if self._parser == "mmap":
+                with open_match_buffer(match_file) as buffer:
+                    start = perf_counter()
+                    discipline, rows = parse_match_buffer(buffer, match_file)
+                    batch.append((discipline, self._read_rows(rows)))
+                    size = len(buffer)
+            else:
+                with open(match_file, "r") as file:
+                    start = perf_counter()
+                    discipline, rows = parse_match(file, match_file)
+                    batch.append((discipline, self._read_rows(rows)))
+                    size = os.fstat(file.fileno()).st_size
+            if self._metrics is not None:
+                self._metrics.timing("match.parse", perf_counter() - start)
+                self._metrics.count("bytes_read", size)
+            batch_rows += len(batch[-1][1])
+            if batch_rows >= NUMPY_BATCH_ROWS:
+                self._commit_scored_matches(batch, get_player, batch_sources)
+                batch, batch_sources, batch_rows = [], [], 0
+        self._commit_scored_matches(batch, get_player, batch_sources)
+
+    def _commit_scored_matches(
+        self,
+        matches: List[Tuple[ToucanDiscipline, List[Union[MatchRow, RawMatchRow]]]],
+        get_player: Optional[Callable[[Any, Any], ToucanPlayer]] = None,
+        sources: Optional[List[object]] = None,
+    ) -> None:
+        """Score a batch of matches with the ``"numpy"`` engine and add the points to the players.
+
+        Parameters
+        ----------
+        matches : List[Tuple[ToucanDiscipline, List[Union[MatchRow, RawMatchRow]]]]
+            The discipline and player records of each match, either decoded or
+            undecoded.
+        get_player : Callable[[Any, Any], ToucanPlayer], optional
+            The method retrieving a player from the name and nickname of the
+            records, by default ``_get_or_create_player`` (i.e. decoded records).
+        sources : List[object], optional
+            The origin of each match (e.g. the path to the match's file), by
+            default ``None`` (i.e. unknown).
+        """
+        get_player = self._get_or_create_player if get_player is None else get_player
+        from toucan.mvp.calculator.vectorized import score_matches
+
+        start = perf_counter()
+        scored_matches, team_scores = score_matches(matches, return_team_scores=True)
+        if self._metrics is not None:
+            self._metrics.timing("match.scoring", perf_counter() - start)
+            self._metrics.count("matches", len(matches))
+            self._metrics.count("rows", sum(len(rows) for _, rows in matches))
+
+        sources = [None] * len(matches) if sources is None else sources
+        for (discipline, rows), points, scores, source in zip(
+            matches, scored_matches, team_scores, sources
+        ):
+            self._commit_match_rows(discipline, rows, points, scores, None, source, get_player)
+
+    def _commit_match_rows(
+        self,
+        discipline: ToucanDiscipline,
+        rows: List[Union[MatchRow, RawMatchRow]],
+        points: List[int],
+        scores: Tuple[int, int],
+        sides: Optional[List[int]],
+        source: object,
+        get_player: Callable[[Any, Any], ToucanPlayer],
+    ) -> None:
+        """Commit the scored player records of a match to the tournament.
+
+        Parameters
+        ----------
+        discipline : ToucanDiscipline
+            The discipline of the match.
+        rows : List[Union[MatchRow, RawMatchRow]]
+            The player records of the match, either decoded or undecoded.
+        points : List[int]
+            The points obtained by each player record (bonus included).
+        scores : Tuple[int, int]
+            The score of each team, in order of appearance.
+        sides : List[int] or None
+            The team of each record, as its index in the teams of the match
+            (in order of appearance). ``None`` if not known yet.
+        source : object
+            The origin of the match (e.g. the path to the match's file).
+        get_player : Callable[[Any, Any], ToucanPlayer]
+            The method retrieving a player from the name and nickname of the records.
+        """
+        _check_match_points(points, scores, source)
+        team_sides: Dict[Any, int] = {}
+        player_ids: List[int] = []
+        for name, nickname, _, team, _, _ in rows:
+            player_ids.append(get_player(name, nickname).id)
+            team_sides.setdefault(team, len(team_sides))
+        if sides is None:
+            sides = [team_sides[row[3]] for row in rows]
+        self._commit_match(
+            discipline.name,
+            [_decode_name(team) for team in team_sides],
+            scores,
+            player_ids,
+            [row[4] for row in rows],
+            sides,
+            points,
+            source,
+        )
+
+    def _commit_match(
+        self,
+        discipline: str,
+        teams: Sequence[str],
+        scores: Sequence[int],
+        player_ids: List[int],
+        positions: Sequence[str],
+        sides: Sequence[int],
+        points: Sequence[int],
+        source: object,
+    ) -> int:
+        """Commit a scored match to the players, leaderboard, index and results of the tournament.
+
+        Parameters
+        ----------
+        discipline : str
+            The name of the discipline of the match.
+        teams : Sequence[str]
+            The two teams of the match, in order of appearance.
+        scores : Sequence[int]
+            The score of each team.
+        player_ids : List[int]
+            The identifier of the player of each record.
+        positions : Sequence[str]
+            The position of each record.
+        sides : Sequence[int]
+            The team of each record, as its index in ``teams``.
+        points : Sequence[int]
+            The points (bonus included) of each record.
+        source : object
+            The origin of the match (e.g. the path to the match's file).
+
+        Returns
+        -------
+        int
+            The identifier of the match in the points store.
+        """
+        teams = [sys.intern(team) for team in teams]
+
+        # All the records of the match are added to the store at once... the
+        # store rejects them (leaving the match empty) if a total overflows
+        match_id = self._store.new_match()
+        try:
+            self._store.extend(player_ids, points)
+        except ToucanException as error:
+            raise ToucanMatchError(source, None, str(error)) from None
+        self._rank_players(player_ids)
+        self._results.add(
+            match_id,
+            str(source) if isinstance(source, (Path, str)) else None,
+            discipline,
+            teams,
+            scores,
+            positions,
+            sides,
+        )
+        return match_id
 
     def _process_match(self, filepath: Path):
         """Process Toucan tournament match file.
@@ -104,54 +1595,502 @@ class ToucanTournament:
         filepath : Path
             The path to the match's file.
         """
-        with open(filepath, "r") as file:
-            # Read the file
-            lines = file.read().splitlines()
-
-            # Read the first line to get the sport/discipline
-            discipline = get_discipline_by_name(lines[0])
-
-            # Initialize the scores for each team
-            teams: dict[str, int] = {}
-            player_teams: dict[str, list[ToucanPlayer]] = {}
-
-            # Now, proceed to reading each line
-            line_pattern = re.compile(discipline.get_pattern())
-            for line in lines[1:]:
-                # Check that line matches the expected pattern and raise error otherwise
-                entries = line_pattern.match(line)
-                if entries is None:
-                    raise ToucanException(
-                        f"Failed to process tournament... error on match file '{filepath}'"
-                    )
-                else:
-                    name, nickname, _, team, position, *marks = entries.groups()
-                    marks = [int(mark) for mark in marks]  # Reassign to integers
-
-                # Check if player exists, otherwise create it
-                player = self._players.get(nickname)
-                if player is None:
-                    player = self._players[nickname] = ToucanPlayer(name, nickname)
-
-                # Check if the team has already been processed or not... if not, initialize it
-                if not team in teams.keys():
-                    teams[team] = 0
-                    player_teams[team] = []
-
-                # Add the player to the team
-                player_teams[team].append(player)
-
-                # Add the player's points and its contribution to the team
-                player.add_match_points(marks, discipline, position)
-                teams[team] += player.get_team_score_contribution(marks, discipline)
-
-            # Once all player evaluations have been processed... Let's see which team won
-            # and provide the bonus points to the winner players
-            team_a, team_b = teams.keys()
-            team_a_score, team_b_score = teams.values()
-            if team_a_score > team_b_score:
-                [winner_player.add_bonus_points() for winner_player in player_teams[team_a]]
-            elif team_a_score < team_b_score:
-                [winner_player.add_bonus_points() for winner_player in player_teams[team_b]]
-            else:  # pragma: no cover
-                raise Exception("Matches cannot end in a draw. Invalid tournament.")
+        if self._parser == "mmap":
+            with open_match_buffer(filepath) as buffer:
+                start = perf_counter()
+                discipline, rows = parse_match_buffer(buffer, filepath)
+                self._process_match_rows(
+                    discipline, rows, filepath, start, self._get_or_create_raw_player
+                )
+                size = len(buffer)
+        else:
+            with open(filepath, "r") as file:
+                self._process_match_lines(file, filepath)
+                size = os.fstat(file.fileno()).st_size
+        if self._metrics is not None:
+            self._metrics.count("bytes_read", size)
+
+    def _read_rows(self, rows: Iterator[MatchRow]) -> List[MatchRow]:
+        """Read all the player records of a match, counting the lines which failed to parse.
+
+        Parameters
+        ----------
+        rows : Iterator[MatchRow]
+            The player records of the match, parsed lazily.
+
+        Returns
+        -------
+        List[MatchRow]
+            The player records of the match.
+        """
+        try:
+            return list(rows)
+        except ToucanException:
+            if self._metrics is not None:
+                self._metrics.count("regex_failures")
+            raise
+
+    def _process_match_lines(self, lines: Iterable[str], source: object):
+        """Process the lines of a Toucan tournament match.
+
+        Parameters
+        ----------
+        lines : Iterable[str]
+            The lines of the match (e.g. an open match file).
+        source : object
+            The origin of the lines (e.g. the path to the match's file).
+        """
+        # Read the first line to get the sport/discipline... the player
+        # records are parsed lazily, one line at a time
+        start = perf_counter()
+        discipline, rows = parse_match(lines, source)
+        self._process_match_rows(discipline, rows, source, start)
+
+    def _process_match_rows(
+        self,
+        discipline: ToucanDiscipline,
+        rows: Union[Iterator[MatchRow], Iterator[RawMatchRow]],
+        source: object,
+        start: float,
+        get_player: Optional[Callable[[Any, Any], ToucanPlayer]] = None,
+    ):
+        """Process the player records of a Toucan tournament match.
+
+        Parameters
+        ----------
+        discipline : ToucanDiscipline
+            The discipline of the match.
+        rows : Iterator[MatchRow] or Iterator[RawMatchRow]
+            The player records of the match, either decoded or undecoded.
+        source : object
+            The origin of the match (e.g. the path to the match's file).
+        start : float
+            The moment the processing of the match started, as given by
+            ``time.perf_counter``.
+        get_player : Callable[[Any, Any], ToucanPlayer], optional
+            The method retrieving a player from the name and nickname of the
+            records, by default ``_get_or_create_player`` (i.e. decoded records).
+        """
+        get_player = self._get_or_create_player if get_player is None else get_player
+
+        # The player records are parsed upfront when the processing is
+        # instrumented, so that each phase can be timed
+        if self._engine == "numpy" or self._metrics is not None:
+            rows = self._read_rows(rows)
+            parsed = perf_counter()
+            if self._metrics is not None:
+                self._metrics.timing("match.parse", parsed - start)
+            if self._engine == "numpy":
+                self._commit_scored_matches([(discipline, rows)], get_player, [source])
+                return
+
+        # First phase: score each player record on its own and buffer it
+        match_buffer = ToucanMatchBuffer(discipline)
+        buffered_rows = []
+        for row in rows:
+            match_buffer.add(row[3], row[4], row[5])
+            buffered_rows.append(row)
+
+        # Second phase: resolve the winner and apply the bonus to the buffered records
+        if self._metrics is not None:
+            scored = perf_counter()
+            self._metrics.timing("match.scoring", scored - parsed)
+            self._metrics.count("matches")
+            self._metrics.count("rows", len(buffered_rows))
+        try:
+            points, scores = match_buffer.finalize()
+        except ToucanException as error:
+            raise ToucanMatchError(source, None, str(error)) from None
+        if self._metrics is not None:
+            self._metrics.timing("match.team_resolution", perf_counter() - scored)
+
+        # Finally, commit the match to the players of the tournament
+        self._commit_match_rows(
+            discipline, buffered_rows, points, scores, match_buffer.sides, source, get_player
+        )
+        if self._metrics is not None:
+            self._metrics.timing("match.total", perf_counter() - start)
+
+
+def _list_match_files(dir: Union[Path, str]) -> List[Path]:
+    """List the match files of a tournament directory in sorted path order.
+
+    Parameters
+    ----------
+    dir : Path or str
+        Directory where the match files are located.
+
+    Returns
+    -------
+    List[Path]
+        The paths to the match files.
+    """
+    # First of all, check that the provided argument is actually
+    # a directory. Otherwise raise an error.
+    dir_as_path = dir if isinstance(dir, Path) else Path(dir)
+    if not dir_as_path.is_dir():
+        raise ToucanException(f"The provided directory path {dir} is not a directory.")
+
+    # Now that we have ensured that it is a directory, let's collect
+    # the match files... skip subdirectories and hidden files (if any), like
+    # archives do (all of them share the same parent, so sorting by name is
+    # sorting by path)
+    paths = [path for path in dir_as_path.iterdir() if path.is_file() and not is_hidden(path.name)]
+    return sorted(paths, key=lambda path: os.path.normcase(path.name))
+
+
+def _read_match_file(filepath: Union[Path, str]) -> str:
+    """Read the whole content of a match file.
+
+    Parameters
+    ----------
+    filepath : Path or str
+        The path to the match's file.
+
+    Returns
+    -------
+    str
+        The content of the match file.
+    """
+    with open(filepath, "r") as file:
+        return file.read()
+
+
+def _check_processing_options(
+    workers: Optional[int], errors: str, max_errors: Optional[int]
+) -> Tuple[int, Optional[List[ToucanMatchError]]]:
+    """Check the options for processing the match files of a tournament.
+
+    Parameters
+    ----------
+    workers : int or None
+        Number of worker processes requested. ``None`` for as many as CPUs.
+    errors : str
+        How to handle invalid match files.
+    max_errors : int or None
+        Maximum amount of invalid match files tolerated.
+
+    Returns
+    -------
+    Tuple[int, Optional[List[ToucanMatchError]]]
+        The number of worker processes and the list collecting the errors of
+        the invalid match files (``None`` in ``"raise"`` mode).
+    """
+    # Check the amount of workers requested
+    if workers is None:
+        workers = os.cpu_count() or 1
+    elif workers < 1:
+        raise ToucanException(f"The number of workers must be at least 1, not {workers}.")
+
+    # Check how invalid match files should be handled
+    if errors not in ERROR_MODES:
+        raise ToucanException(f"The error mode '{errors}' is not one of {ERROR_MODES}.")
+    elif max_errors is not None and max_errors < 0:
+        raise ToucanException(f"The maximum number of errors cannot be negative, not {max_errors}.")
+    return workers, [] if errors == "collect" else None
+
+
+def _split_match_file(match_file: MatchFile) -> Tuple[str, Union[Path, bytes]]:
+    """Split a match file into its source and the way its contents are accessed.
+
+    Parameters
+    ----------
+    match_file : MatchFile
+        The path to the match's file, or the source and contents of a match.
+
+    Returns
+    -------
+    Tuple[str, Union[Path, bytes]]
+        The source of the match and either the path to its file or its contents.
+    """
+    if isinstance(match_file, tuple):
+        return match_file
+    return str(match_file), match_file
+
+
+def _score_match_file(
+    filepath: MatchFile,
+    engine: str = "python",
+    parser: str = "text",
+    measures: Optional[Dict[str, float]] = None,
+) -> MatchResult:
+    """Process a single match file in isolation and return its partial result.
+
+    Notes
+    -----
+    This function is the unit of work of the parallel mode. It is defined at
+    module level so that it can be sent to worker processes.
+
+    Parameters
+    ----------
+    filepath : MatchFile
+        The path to the match's file, or the source and contents of a match.
+    engine : str, optional
+        The scoring engine, by default ``"python"``.
+    parser : str, optional
+        The parser of the match file, by default ``"text"``.
+    measures : Dict[str, float], optional
+        The dictionary where the timings and counters of the processing are
+        recorded, by default ``None`` (i.e. not instrumented).
+
+    Returns
+    -------
+    MatchResult
+        The partial result of the match.
+    """
+    source, contents = _split_match_file(filepath)
+    error_source = contents if isinstance(contents, Path) else source
+    rows: List[Union[MatchRow, RawMatchRow]]
+    start = perf_counter()
+    if parser == "mmap":
+        opened = (
+            open_match_buffer(contents) if isinstance(contents, Path) else nullcontext(contents)
+        )
+        with opened as buffer:
+            discipline, match_rows = parse_match_buffer(buffer, error_source)
+            rows = _read_match_rows(match_rows, measures)
+    elif isinstance(contents, Path):
+        with open(contents, "r") as file:
+            discipline, match_rows = parse_match(file, error_source)
+            rows = _read_match_rows(match_rows, measures)
+    else:
+        discipline, match_rows = parse_match(iter_match_lines(contents), error_source)
+        rows = _read_match_rows(match_rows, measures)
+    parsed = perf_counter()
+
+    # Score the player records on their own, only their outcome is sent back
+    if engine == "numpy":
+        from toucan.mvp.calculator.vectorized import score_matches
+
+        (points,), (scores,) = score_matches([(discipline, rows)], return_team_scores=True)
+        team_sides: Dict[Any, int] = {}
+        sides = [team_sides.setdefault(row[3], len(team_sides)) for row in rows]
+        teams: Sequence[Any] = list(team_sides)
+        if measures is not None:
+            measures["match.parse"] = parsed - start
+            measures["match.scoring"] = perf_counter() - parsed
+    else:
+        match_buffer = ToucanMatchBuffer(discipline)
+        for row in rows:
+            match_buffer.add(row[3], row[4], row[5])
+        scored = perf_counter()
+        try:
+            points, scores = match_buffer.finalize()
+        except ToucanException as error:
+            raise ToucanMatchError(error_source, None, str(error)) from None
+        teams, sides = match_buffer.teams, match_buffer.sides
+        if measures is not None:
+            measures["match.parse"] = parsed - start
+            measures["match.scoring"] = scored - parsed
+            measures["match.team_resolution"] = perf_counter() - scored
+    return (
+        discipline.name,
+        tuple(_decode_name(team) for team in teams),
+        tuple(scores),
+        [
+            (_decode_name(row[0]), _decode_name(row[1]), row[4], side, row_points)
+            for row, side, row_points in zip(rows, sides, points)
+        ],
+    )
+
+
+def _map_scoring(
+    score_match_file: Callable,
+    match_files: Sequence[MatchFile],
+    workers: int,
+    engine: str = "python",
+    parser: str = "text",
+) -> Iterator[Any]:
+    """Apply a scoring function to each match file, possibly in parallel, in order.
+
+    Parameters
+    ----------
+    score_match_file : Callable
+        The module-level function scoring a single match file.
+    match_files : Sequence[MatchFile]
+        The match files to be scored.
+    workers : int
+        Number of worker processes used for scoring the match files.
+    engine : str, optional
+        The scoring engine, by default ``"python"``.
+    parser : str, optional
+        The parser of the match files, by default ``"text"``.
+
+    Yields
+    ------
+    Any
+        The outcome of the scoring function for each match file.
+    """
+    score_match_file = partial(score_match_file, engine=engine, parser=parser)
+    if workers == 1 or len(match_files) <= 1:
+        yield from map(score_match_file, match_files)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    # The worker processes have to know about the custom disciplines too
+    chunksize = max(1, len(match_files) // (workers * 4))
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_restore_disciplines,
+        initargs=(get_custom_disciplines(),),
+    ) as executor:
+        yield from executor.map(score_match_file, match_files, chunksize=chunksize)
+
+
+def _read_match_rows(
+    rows: Union[Iterator[MatchRow], Iterator[RawMatchRow]],
+    measures: Optional[Dict[str, float]],
+) -> List[Union[MatchRow, RawMatchRow]]:
+    """Read all the player records of a match, counting the lines which failed to parse.
+
+    Parameters
+    ----------
+    rows : Iterator[MatchRow] or Iterator[RawMatchRow]
+        The player records of the match, parsed lazily.
+    measures : Dict[str, float] or None
+        The dictionary where the counters of the processing are recorded.
+
+    Returns
+    -------
+    List[MatchRow] or List[RawMatchRow]
+        The player records of the match.
+    """
+    try:
+        return list(rows)
+    except ToucanException:
+        if measures is not None:
+            measures["regex_failures"] = 1
+        raise
+
+
+def _measure_match_file(
+    score_match_file: Callable,
+    filepath: MatchFile,
+    engine: str = "python",
+    parser: str = "text",
+) -> Tuple[Any, Dict[str, float], Optional[Exception]]:
+    """Apply a scoring function to a single match file, recording its measures.
+
+    Notes
+    -----
+    The error raised by the scoring function is returned along with the
+    measures taken until then, so that they are reported before it is raised
+    again.
+
+    Parameters
+    ----------
+    score_match_file : Callable
+        The module-level function scoring a single match file.
+    filepath : MatchFile
+        The path to the match's file, or the source and contents of a match.
+    engine : str, optional
+        The scoring engine, by default ``"python"``.
+    parser : str, optional
+        The parser of the match file, by default ``"text"``.
+
+    Returns
+    -------
+    Tuple[Any, Dict[str, float], Optional[Exception]]
+        The outcome of the scoring function, the measures taken and the error
+        raised, if any.
+    """
+    measures: Dict[str, float] = {}
+    try:
+        return score_match_file(filepath, engine, parser, measures), measures, None
+    except (ToucanException, UnicodeDecodeError) as error:
+        return None, measures, error
+
+
+def _check_match_points(points: Sequence[int], scores: Sequence[int], source: object) -> None:
+    """Check that the points of the records and the team scores of a match fit in the store.
+
+    Parameters
+    ----------
+    points : Sequence[int]
+        The points obtained by each record of the match.
+    scores : Sequence[int]
+        The score of each team.
+    source : object
+        The origin of the match (e.g. the path to the match's file).
+    """
+    try:
+        check_points(*scores)
+        if points:
+            check_points(min(points), max(points))
+    except ToucanException as error:
+        raise ToucanMatchError(source, None, str(error)) from None
+
+
+def _collect_match_error(
+    error: ToucanMatchError, match_errors: List[ToucanMatchError], max_errors: Optional[int]
+) -> None:
+    """Collect the error of an invalid match file, unless too many of them were found.
+
+    Parameters
+    ----------
+    error : ToucanMatchError
+        The error of the invalid match file.
+    match_errors : List[ToucanMatchError]
+        The list collecting the errors of the invalid match files.
+    max_errors : int or None
+        Maximum amount of invalid match files tolerated.
+    """
+    match_errors.append(error)
+    if max_errors is not None and len(match_errors) > max_errors:
+        raise ToucanException(
+            f"Too many invalid match files ({len(match_errors)}), the last one being... {error}"
+        )
+
+
+def _decode_name(name: Union[str, bytes]) -> str:
+    """Decode a name read by the ``"mmap"`` parser, if needed.
+
+    Parameters
+    ----------
+    name : str or bytes
+        The name, either decoded or undecoded.
+
+    Returns
+    -------
+    str
+        The decoded name.
+    """
+    return name.decode() if isinstance(name, bytes) else name
+
+
+def _try_score_match_file(
+    filepath: MatchFile,
+    engine: str = "python",
+    parser: str = "text",
+    measures: Optional[Dict[str, float]] = None,
+) -> Union[MatchResult, ToucanMatchError]:
+    """Process a single match file in isolation, returning its error if it is invalid.
+
+    Parameters
+    ----------
+    filepath : MatchFile
+        The path to the match's file, or the source and contents of a match.
+    engine : str, optional
+        The scoring engine, by default ``"python"``.
+    parser : str, optional
+        The parser of the match file, by default ``"text"``.
+    measures : Dict[str, float], optional
+        The dictionary where the timings and counters of the processing are
+        recorded, by default ``None`` (i.e. not instrumented).
+
+    Returns
+    -------
+    MatchResult or ToucanMatchError
+        The partial result of the match. The error found if the match file is
+        invalid.
+    """
+    try:
+        return _score_match_file(filepath, engine, parser, measures)
+    except ToucanMatchError as error:
+        return error
+    except (ToucanException, UnicodeDecodeError) as error:
+        source, contents = _split_match_file(filepath)
+        return ToucanMatchError(
+            contents if isinstance(contents, Path) else source, None, str(error)
+        )
@@ -0,0 +1,224 @@
+"""Module containing the vectorized (NumPy based) scoring engine of the Toucan tournament.
+
+Notes
+-----
+This module requires NumPy, which is an optional dependency of the library.
+It can be installed by running ``pip install toucan-mvp-calculator[numpy]``.
+"""
+
+from functools import lru_cache
+from typing import Dict, List, Sequence, Tuple, Union
+
+import numpy as np
+
+from toucan.mvp.calculator.discipline import ToucanDiscipline
+from toucan.mvp.calculator.errors import ToucanException
+from toucan.mvp.calculator.parser import MatchRow
+
+
+@lru_cache(maxsize=None)
+def get_coefficient_tables(
+    discipline: ToucanDiscipline,
+) -> Tuple[Dict[str, int], np.ndarray, np.ndarray, np.ndarray]:
+    """Build the coefficient tables used for scoring the matches of a discipline.
+
+    Parameters
+    ----------
+    discipline : ToucanDiscipline
+        Sports discipline for which the tables are built.
+
+    Returns
+    -------
+    Tuple[Dict[str, int], np.ndarray, np.ndarray, np.ndarray]
+        The index of each position in the tables, the evaluation parameters
+        matrix (positions x marks), the extra rating points vector (positions)
+        and the team score contribution vector (marks).
+    """
+    parser = discipline.get_parser()
+    positions = {position: idx for idx, position in enumerate(parser.coefficients)}
+    coefficients = np.array(
+        [eval_params for eval_params, _ in parser.coefficients.values()], dtype=np.int64
+    )
+    extra_points = np.array(
+        [extra_points for _, extra_points in parser.coefficients.values()], dtype=np.int64
+    )
+    score_vector = np.zeros(coefficients.shape[1], dtype=np.int64)
+    for score_idx, sign in parser.score_signs:
+        score_vector[score_idx] += sign
+
+    return positions, coefficients, extra_points, score_vector
+
+
+def score_matches(
+    matches: Sequence[Tuple[ToucanDiscipline, List[MatchRow]]], return_team_scores: bool = False
+) -> Union[List[List[int]], Tuple[List[List[int]], List[Tuple[int, int]]]]:
+    """Compute the points obtained by each player in a batch of matches.
+
+    Notes
+    -----
+    The matches are grouped by discipline and all their records are scored at
+    once: marks are packed into integer arrays and multiplied against the
+    coefficient tables of the discipline. The results are exactly the ones
+    obtained with the pure Python ``ToucanMatchBuffer``.
+
+    Parameters
+    ----------
+    matches : Sequence[Tuple[ToucanDiscipline, List[MatchRow]]]
+        The discipline and player records of each match.
+    return_team_scores : bool, optional
+        Whether to also return the score of each team, by default ``False``.
+
+    Returns
+    -------
+    List[List[int]]
+        The points obtained by each player record (bonus included) of each match.
+    List[Tuple[int, int]]
+        The score of each team of each match, in order of appearance. Only
+        returned when ``return_team_scores`` is ``True``.
+    """
+    # Group the matches by discipline
+    matches_per_discipline: Dict[ToucanDiscipline, List[int]] = {}
+    for match_idx, (discipline, _) in enumerate(matches):
+        matches_per_discipline.setdefault(discipline, []).append(match_idx)
+
+    # Score each group of matches at once
+    results: List[List[int]] = [[] for _ in matches]
+    team_scores: List[Tuple[int, int]] = [(0, 0) for _ in matches]
+    for discipline, match_idxs in matches_per_discipline.items():
+        rows_per_match = [matches[match_idx][1] for match_idx in match_idxs]
+        points_per_match, scores_per_match = _score_discipline(discipline, rows_per_match)
+        for match_idx, points, scores in zip(match_idxs, points_per_match, scores_per_match):
+            results[match_idx], team_scores[match_idx] = points, scores
+
+    if return_team_scores:
+        return results, team_scores
+    return results
+
+
+def _score_discipline(
+    discipline: ToucanDiscipline, rows_per_match: List[List[MatchRow]]
+) -> Tuple[List[List[int]], List[Tuple[int, int]]]:
+    """Compute the points obtained by each player in a batch of matches of a discipline.
+
+    Parameters
+    ----------
+    discipline : ToucanDiscipline
+        Sports discipline in which the matches were played.
+    rows_per_match : List[List[MatchRow]]
+        The player records of each match.
+
+    Returns
+    -------
+    List[List[int]]
+        The points obtained by each player record (bonus included) of each match.
+    List[Tuple[int, int]]
+        The score of each team of each match, in order of appearance.
+    """
+    positions, coefficients, extra_points, score_vector = get_coefficient_tables(discipline)
+
+    # Pack the records into arrays... teams are identified by consecutive
+    # indices, two per match, in order of appearance
+    marks, position_idxs, team_idxs, match_sizes = [], [], [], []
+    for rows in rows_per_match:
+        teams: Dict[str, int] = {}
+        for _, _, _, team, position, row_marks in rows:
+            position_idx = positions.get(position, None)
+            if position_idx is None:
+                raise ToucanException(
+                    f"Problems retrieving evaluation parameters for '{discipline.name}' in position '{position}'."  # noqa : E501
+                )
+            if len(row_marks) != coefficients.shape[1]:
+                raise ToucanException(
+                    f"Evaluation parameters for '{discipline.name}' in position '{position}' do not match the marks given."  # noqa : E501
+                )
+            marks.append(row_marks)
+            position_idxs.append(position_idx)
+            team_idxs.append(teams.setdefault(team, 2 * len(match_sizes) + len(teams)))
+
+        # Matches are played by exactly two teams
+        if len(teams) != 2:
+            raise ToucanException(f"Matches must be played by two teams, not {len(teams)}.")
+        match_sizes.append(len(rows))
+
+    marks = _pack_marks(marks, coefficients, extra_points, score_vector, discipline, match_sizes)
+    if marks.dtype == object:
+        coefficients, extra_points, score_vector = (
+            coefficients.astype(object),
+            extra_points.astype(object),
+            score_vector.astype(object),
+        )
+    position_idxs = np.array(position_idxs, dtype=np.intp)
+    team_idxs = np.array(team_idxs, dtype=np.intp)
+
+    # Rating points: evaluate every record against every position and keep its own
+    points = (marks @ coefficients.T)[np.arange(len(marks)), position_idxs]
+    points += extra_points[position_idxs]
+
+    # Team scores and winner bonus
+    team_scores = np.zeros(2 * len(match_sizes), dtype=marks.dtype)
+    np.add.at(team_scores, team_idxs, marks @ score_vector)
+    team_a_scores, team_b_scores = team_scores[0::2], team_scores[1::2]
+    if np.any(team_a_scores == team_b_scores):  # pragma: no cover
+        raise ToucanException("Matches cannot end in a draw. Invalid tournament.")
+    winner_teams = 2 * np.arange(len(match_sizes)) + (team_b_scores > team_a_scores)
+    points += discipline.get_parser().bonus_points * (
+        team_idxs == np.repeat(winner_teams, match_sizes)
+    )
+
+    # Split the points per match
+    return [
+        match_points.tolist() for match_points in np.split(points, np.cumsum(match_sizes)[:-1])
+    ], list(zip(team_a_scores.tolist(), team_b_scores.tolist()))
+
+
+def _pack_marks(
+    marks: List[List[int]],
+    coefficients: np.ndarray,
+    extra_points: np.ndarray,
+    score_vector: np.ndarray,
+    discipline: ToucanDiscipline,
+    match_sizes: List[int],
+) -> np.ndarray:
+    """Pack the marks of a batch of records into an array (records x marks).
+
+    Notes
+    -----
+    Marks are packed into 64-bit integers, unless the points or team scores
+    computed from them could overflow. In that case they are packed as
+    (exact, but slower) Python integers.
+
+    Parameters
+    ----------
+    marks : List[List[int]]
+        The marks of each record.
+    coefficients : np.ndarray
+        The evaluation parameters matrix (positions x marks) of the discipline.
+    extra_points : np.ndarray
+        The extra rating points vector (positions) of the discipline.
+    score_vector : np.ndarray
+        The team score contribution vector (marks) of the discipline.
+    discipline : ToucanDiscipline
+        Sports discipline in which the matches were played.
+    match_sizes : List[int]
+        The amount of records of each match.
+
+    Returns
+    -------
+    np.ndarray
+        The marks of each record.
+    """
+    n_marks = coefficients.shape[1]
+    try:
+        packed = np.array(marks, dtype=np.int64).reshape(-1, n_marks)
+    except OverflowError:
+        return np.array(marks, dtype=object).reshape(-1, n_marks)
+
+    # Bound the largest (absolute) points and team score of the batch
+    if len(packed) == 0 or n_marks == 0:
+        return packed
+    largest_mark = int(np.abs(packed).max())
+    weight = max(int(np.abs(coefficients).sum(axis=1).max()), int(np.abs(score_vector).sum()))
+    bound = largest_mark * weight * max(match_sizes) + int(np.abs(extra_points).max())
+    if bound + abs(discipline.get_parser().bonus_points) > np.iinfo(np.int64).max:
+        return packed.astype(object)
+    return packed
@@ -0,0 +1,464 @@
+"""Module containing the watch mode of live Toucan tournaments.
+
+Notes
+-----
+A ``ToucanWatcher`` monitors the directory of a tournament and ingests each
+match file as soon as it is added, changed or removed, updating the tournament
+incrementally (see ``ToucanTournament.process_tournament``). Changes are
+detected with ``inotify`` on Linux, and by polling the directory elsewhere.
+
+Subscribers are notified of the changes of each update as ``ToucanWatchEvent``
+objects: a new MVP, the rank changes of the players whose points changed and
+the invalid match files found.
+"""
+
+import ctypes
+import ctypes.util
+import os
+from pathlib import Path
+import select
+import struct
+import sys
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Set, Tuple, Union
+
+from toucan.mvp.calculator.errors import ToucanException, ToucanMatchError
+from toucan.mvp.calculator.sources import is_hidden
+from toucan.mvp.calculator.tournament import ToucanTournament
+
+BACKENDS = ("auto", "inotify", "poll")
+"""Backends detecting the changes of the watched directory."""
+
+EVENT_KINDS = ("mvp", "rank", "error")
+"""Kinds of the events notified to the subscribers of a watcher."""
+
+POLL_INTERVAL = 0.25
+"""Default time (in seconds) between two polls of the watched directory."""
+
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_DELETE = 0x00000200
+_IN_Q_OVERFLOW = 0x00004000
+_IN_EVENT = struct.Struct("iIII")
+"""Header of an ``inotify`` event: watch descriptor, mask, cookie and length of the name."""
+
+
+class ToucanWatchEvent:
+    """Class representing a change in a watched tournament.
+
+    Attributes
+    ----------
+    kind : str
+        The kind of event, one of ``EVENT_KINDS``.
+    nickname : str or None
+        The new MVP (``"mvp"``) or the player whose rank changed (``"rank"``).
+    previous : str, int or None
+        The previous MVP (``"mvp"``) or rank (``"rank"``), ``None`` if there
+        was none.
+    current : int or None
+        The new rank (``"rank"``), ``None`` if the player left the tournament.
+    error : ToucanMatchError or None
+        The error found in an invalid match file (``"error"``).
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        nickname: Optional[str] = None,
+        previous: Optional[Union[str, int]] = None,
+        current: Optional[int] = None,
+        error: Optional[ToucanMatchError] = None,
+    ) -> None:
+        """Instantiate ``ToucanWatchEvent`` object.
+
+        Parameters
+        ----------
+        kind : str
+            The kind of event, one of ``EVENT_KINDS``.
+        nickname : str, optional
+            The new MVP or the player whose rank changed, by default ``None``.
+        previous : str or int, optional
+            The previous MVP or rank, by default ``None``.
+        current : int, optional
+            The new rank, by default ``None``.
+        error : ToucanMatchError, optional
+            The error found in an invalid match file, by default ``None``.
+        """
+        self.kind = kind
+        self.nickname = nickname
+        self.previous = previous
+        self.current = current
+        self.error = error
+
+    def __repr__(self) -> str:
+        """Represent the event.
+
+        Returns
+        -------
+        str
+            The representation of the event.
+        """
+        if self.kind == "error":
+            return f"ToucanWatchEvent(error, {self.error})"
+        return f"ToucanWatchEvent({self.kind}, {self.nickname}, {self.previous} -> {self.current})"
+
+
+class ToucanWatcher:
+    """Class ingesting the match files of a live tournament as they appear.
+
+    Notes
+    -----
+    The watcher owns the updates of the tournament: ``lock`` is held while an
+    update is in progress, so other threads can hold it to query the
+    tournament consistently. Subscribers are called from the thread running
+    the update.
+
+    Parameters
+    ----------
+    tournament : ToucanTournament
+        The tournament updated (in incremental mode).
+    dir : Path or str
+        Directory where the match files are located.
+    backend : str, optional
+        How changes are detected, by default ``"auto"`` (i.e. ``"inotify"``
+        when available, ``"poll"`` otherwise).
+    interval : float, optional
+        Time (in seconds) between two polls of the directory, by default
+        ``POLL_INTERVAL``. It is also the longest time a ``run`` loop waits
+        before checking whether it was stopped.
+    workers : int, optional
+        Number of worker processes used for processing the match files, by default 1.
+    """
+
+    def __init__(
+        self,
+        tournament: ToucanTournament,
+        dir: Union[Path, str],
+        backend: str = "auto",
+        interval: float = POLL_INTERVAL,
+        workers: int = 1,
+    ) -> None:
+        """Instantiate ``ToucanWatcher`` object."""
+        if backend not in BACKENDS:
+            raise ToucanException(f"The watch backend '{backend}' is not one of {BACKENDS}.")
+        if interval <= 0:
+            raise ToucanException(f"The poll interval must be positive, not {interval}.")
+        self._dir = Path(dir)
+        if not self._dir.is_dir():
+            raise ToucanException(f"The provided directory path {dir} is not a directory.")
+
+        self._tournament = tournament
+        self._interval = interval
+        self._workers = workers
+        self._subscribers: List[Callable[[ToucanWatchEvent], None]] = []
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self.lock = threading.Lock()
+
+        self._backend: Union[_InotifyBackend, _PollingBackend]
+        if backend != "poll" and _InotifyBackend.is_available():
+            self._backend = _InotifyBackend(self._dir)
+        elif backend == "inotify":
+            raise ToucanException("The 'inotify' watch backend is not available.")
+        else:
+            self._backend = _PollingBackend(self._dir, interval)
+        self._caught_up: bool = False
+
+    @property
+    def backend(self) -> str:
+        """Access property for retrieving the backend detecting the changes.
+
+        Returns
+        -------
+        str
+            Either ``"inotify"`` or ``"poll"``.
+        """
+        return "inotify" if isinstance(self._backend, _InotifyBackend) else "poll"
+
+    def subscribe(self, callback: Callable[[ToucanWatchEvent], None]) -> None:
+        """Subscribe to the changes of the tournament.
+
+        Parameters
+        ----------
+        callback : Callable[[ToucanWatchEvent], None]
+            The function called with each event.
+        """
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[ToucanWatchEvent], None]) -> None:
+        """Unsubscribe from the changes of the tournament.
+
+        Parameters
+        ----------
+        callback : Callable[[ToucanWatchEvent], None]
+            The function previously subscribed.
+        """
+        self._subscribers.remove(callback)
+
+    def poll(self, timeout: float = 0) -> List[ToucanWatchEvent]:
+        """Wait for changes in the directory and ingest them.
+
+        Notes
+        -----
+        The first call processes the whole directory (i.e. only the changes
+        since the previous incremental run of the tournament, if any).
+
+        Parameters
+        ----------
+        timeout : float, optional
+            The maximum time (in seconds) waited for changes, by default 0.
+
+        Returns
+        -------
+        List[ToucanWatchEvent]
+            The events notified to the subscribers.
+        """
+        if not self._caught_up:
+            # First update... catch up with the whole directory
+            self._backend.changes(0)
+            self._caught_up = True
+            return self._update(None)
+
+        changes = self._backend.changes(timeout)
+        return self._update(changes) if changes is None or changes else []
+
+    def run(self) -> None:
+        """Ingest the changes of the directory until the watcher is stopped."""
+        while not self._stop.is_set():
+            self.poll(self._interval)
+
+    def start(self) -> None:
+        """Ingest the changes of the directory in a background thread."""
+        if self._thread is not None:
+            raise ToucanException("The watcher is already running.")
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run, name="toucan-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread (if any) and release the resources of the watcher."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._backend.close()
+
+    def __enter__(self) -> "ToucanWatcher":
+        """Start watching the directory in a background thread.
+
+        Returns
+        -------
+        ToucanWatcher
+            The watcher.
+        """
+        self.start()
+        return self
+
+    def __exit__(self, *_) -> None:
+        """Stop watching the directory."""
+        self.stop()
+
+    def _update(self, changes: Optional[Set[Path]]) -> List[ToucanWatchEvent]:
+        """Ingest the changes of the directory and notify the subscribers.
+
+        Parameters
+        ----------
+        changes : Set[Path] or None
+            The match files added, changed or removed. ``None`` to check the
+            whole directory.
+
+        Returns
+        -------
+        List[ToucanWatchEvent]
+            The events notified to the subscribers.
+        """
+        tournament = self._tournament
+        match_errors: List[ToucanMatchError] = []
+        with self.lock:
+            mvp = None if tournament.mvp is None else tournament.mvp.nickname
+            tournament._rank_changes = {}
+            try:
+                if changes is None:
+                    match_errors = tournament.process_tournament(
+                        self._dir, workers=self._workers, incremental=True, errors="collect"
+                    )
+                else:
+                    tournament._update_match_files(changes, self._workers, match_errors)
+                rank_changes = tournament._rank_changes
+            finally:
+                tournament._rank_changes = None
+
+            events = [ToucanWatchEvent("error", error=error) for error in match_errors]
+            new_mvp = None if tournament.mvp is None else tournament.mvp.nickname
+            if new_mvp != mvp:
+                events.append(ToucanWatchEvent("mvp", new_mvp, mvp))
+            # A player may have left and joined again (e.g. its only match file
+            # changed)... the first rank recorded is the one before the update
+            ranks: Dict[str, Optional[int]] = {}
+            for nickname, rank in rank_changes.values():
+                ranks.setdefault(nickname, rank)
+            for nickname, rank in ranks.items():
+                new_rank = tournament.rank(nickname) if nickname in tournament._players else None
+                if new_rank != rank:
+                    events.append(ToucanWatchEvent("rank", nickname, rank, new_rank))
+
+        for event in events:
+            for callback in list(self._subscribers):
+                callback(event)
+        return events
+
+
+class _PollingBackend:
+    """Class detecting the changes of a directory by polling it (portable)."""
+
+    def __init__(self, dir: Path, interval: float) -> None:
+        """Instantiate ``_PollingBackend`` object.
+
+        Parameters
+        ----------
+        dir : Path
+            The directory watched.
+        interval : float
+            Time (in seconds) between two polls of the directory.
+        """
+        self._dir = dir
+        self._interval = interval
+        self._files: Dict[str, Tuple[int, int]] = {}
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        """List the size and modification time of the files of the directory.
+
+        Returns
+        -------
+        Dict[str, Tuple[int, int]]
+            The size and modification time (in nanoseconds) of each file, by name.
+        """
+        files = {}
+        with os.scandir(self._dir) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_file() and not is_hidden(entry.name):
+                        stat = entry.stat()
+                        files[entry.name] = (stat.st_size, stat.st_mtime_ns)
+                except FileNotFoundError:  # pragma: no cover
+                    continue
+        return files
+
+    def changes(self, timeout: float) -> Optional[Set[Path]]:
+        """Wait for (at most) the timeout and collect the files added, changed or removed.
+
+        Notes
+        -----
+        The directory is polled right away and then every ``interval`` seconds,
+        until some changes are found or the timeout expires.
+
+        Parameters
+        ----------
+        timeout : float
+            The maximum time (in seconds) waited for changes.
+
+        Returns
+        -------
+        Set[Path] or None
+            The paths to the files added, changed or removed.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            files = self._scan()
+            changed = {name for name, state in files.items() if self._files.get(name) != state}
+            changed.update(name for name in self._files if name not in files)
+            self._files = files
+            remaining = deadline - time.monotonic()
+            if changed or remaining <= 0:
+                return {self._dir / name for name in changed}
+            time.sleep(min(self._interval, remaining))
+
+    def close(self) -> None:
+        """Release the resources of the backend."""
+
+
+class _InotifyBackend:
+    """Class detecting the changes of a directory with ``inotify`` (Linux only)."""
+
+    _libc: Optional[ctypes.CDLL] = None
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """Check whether ``inotify`` is available.
+
+        Returns
+        -------
+        bool
+            ``True`` if ``inotify`` can be used.
+        """
+        if not sys.platform.startswith("linux"):  # pragma: no cover
+            return False
+        if cls._libc is None:
+            try:
+                libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+                libc.inotify_init1, libc.inotify_add_watch
+            except (OSError, AttributeError):  # pragma: no cover
+                return False
+            cls._libc = libc
+        return True
+
+    def __init__(self, dir: Path) -> None:
+        """Instantiate ``_InotifyBackend`` object.
+
+        Parameters
+        ----------
+        dir : Path
+            The directory watched.
+        """
+        self._dir = dir
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:  # pragma: no cover
+            raise ToucanException(
+                f"Failed to initialize inotify: {os.strerror(ctypes.get_errno())}"
+            )
+        mask = _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_DELETE
+        if self._libc.inotify_add_watch(self._fd, os.fsencode(dir), mask) < 0:  # pragma: no cover
+            os.close(self._fd)
+            raise ToucanException(f"Failed to watch {dir}: {os.strerror(ctypes.get_errno())}")
+
+    def changes(self, timeout: float) -> Optional[Set[Path]]:
+        """Wait for (at most) the timeout and collect the files added, changed or removed.
+
+        Parameters
+        ----------
+        timeout : float
+            The maximum time (in seconds) waited for changes.
+
+        Returns
+        -------
+        Set[Path] or None
+            The paths to the files added, changed or removed. ``None`` if some
+            changes were lost (i.e. the whole directory has to be checked).
+        """
+        changed: Set[Path] = set()
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        while ready:
+            try:
+                data = os.read(self._fd, 1 << 16)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                _, mask, _, length = _IN_EVENT.unpack_from(data, offset)
+                offset += _IN_EVENT.size
+                if mask & _IN_Q_OVERFLOW:  # pragma: no cover
+                    changed = None
+                elif changed is not None:
+                    name = os.fsdecode(data[offset : offset + length].rstrip(b"\0"))
+                    if not is_hidden(name):
+                        changed.add(self._dir / name)
+                offset += length
+        return changed
+
+    def close(self) -> None:
+        """Release the resources of the backend."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
@@ -0,0 +1,143 @@
+from pathlib import Path
+import shutil
+
+import pytest
+
+from toucan.mvp.calculator import ToucanTournament
+from toucan.mvp.calculator.cache import ToucanMatchCache
+from toucan.mvp.calculator.discipline import (
+    ToucanCustomDiscipline,
+    get_disciplines_version,
+    register_discipline,
+    unregister_discipline,
+)
+from toucan.mvp.calculator.errors import ToucanException
+from toucan.mvp.calculator.metrics import ToucanMetricsCollector
+
+DATA_PATH = Path(Path(__file__).parent, "data", "tournament")
+
+
+@pytest.mark.parametrize("engine", ["python", "numpy"])
+@pytest.mark.parametrize("workers", [1, 2])
+def test_cached_tournament(tmp_path, engine, workers):
+    if engine == "numpy":
+        pytest.importorskip("numpy")
+
+    # Let's process the reference tournament without cache...
+    cold = ToucanTournament("Cached", engine)
+    cold.process_tournament(DATA_PATH)
+    cold.save(tmp_path / "cold.snapshot")
+
+    # ...and twice with it: results are the same whether they are cached or not
+    cache = ToucanMatchCache()
+    for run in ("first", "second"):
+        metrics = ToucanMetricsCollector()
+        tournament = ToucanTournament("Cached", engine, metrics=metrics, cache=cache)
+        assert tournament.cache is cache
+        tournament.process_tournament(DATA_PATH, workers=workers)
+        tournament.save(tmp_path / f"{run}.snapshot")
+        snapshot = (tmp_path / f"{run}.snapshot").read_bytes()
+        assert snapshot == (tmp_path / "cold.snapshot").read_bytes()
+
+    # The second run did not parse any match file
+    assert metrics.counters["cache_hits"] == 2
+    assert metrics.counters["cache_misses"] == 0
+    assert metrics.counters.get("bytes_read", 0) == 0
+    assert (cache.hits, cache.misses, len(cache)) == (2, 2, 2)
+
+
+def test_cache_on_disk(tmp_path):
+    tournament = ToucanTournament("Cached", cache=ToucanMatchCache(tmp_path / "cache"))
+    tournament.process_tournament(DATA_PATH)
+    assert len(list((tmp_path / "cache").glob("*.json"))) == 2
+
+    # The results survive the cache... even for the same content in another directory
+    shutil.copytree(DATA_PATH, tmp_path / "copy")
+    cache = ToucanMatchCache(tmp_path / "cache")
+    copy = ToucanTournament("Copy", cache=cache)
+    copy.process_tournament(tmp_path / "copy")
+    assert (cache.hits, cache.misses) == (2, 0)
+    assert [player.points for player in copy.players] == [
+        player.points for player in tournament.players
+    ]
+    assert copy.match_result(tmp_path / "copy" / "match1.txt").source == str(
+        tmp_path / "copy" / "match1.txt"
+    )
+
+    # Unreadable results are discarded
+    for cache_file in (tmp_path / "cache").glob("*.json"):
+        cache_file.write_text("{")
+    cache = ToucanMatchCache(tmp_path / "cache")
+    ToucanTournament("Corrupted", cache=cache).process_tournament(DATA_PATH)
+    assert (cache.hits, cache.misses) == (0, 2)
+
+    cache.clear()
+    assert len(cache) == 0
+    assert list((tmp_path / "cache").glob("*.json")) == []
+
+
+def test_cache_shared_directory(tmp_path):
+    # Writers sharing the cache directory do not clobber each other's temporary files
+    cache = ToucanMatchCache(tmp_path)
+    key = cache.get_key(DATA_PATH / "match1.txt", get_disciplines_version())
+    (tmp_path / f"{key}.json.tmp").write_text("another writer")
+    ToucanTournament("Cached", cache=cache).process_tournament(DATA_PATH)
+    assert (tmp_path / f"{key}.json.tmp").read_text() == "another writer"
+    assert len(list(tmp_path.glob("*.json"))) == 2
+    assert list(tmp_path.glob("*.tmp")) == [tmp_path / f"{key}.json.tmp"]
+
+
+def test_cache_eviction(tmp_path):
+    # Only the most recently used results are kept in memory...
+    cache = ToucanMatchCache(max_entries=1)
+    ToucanTournament("Cached", cache=cache).process_tournament(DATA_PATH)
+    assert len(cache) == 1
+    ToucanTournament("Cached", cache=cache).process_tournament(DATA_PATH)
+    assert (cache.hits, cache.misses) == (1, 3)
+
+    # ...and on disk
+    cache = ToucanMatchCache(tmp_path, max_entries=0, max_bytes=300)
+    ToucanTournament("Cached", cache=cache).process_tournament(DATA_PATH)
+    assert len(cache) == 0
+    assert len(list(tmp_path.glob("*.json"))) == 1
+    cache = ToucanMatchCache(tmp_path, max_bytes=0)
+    ToucanTournament("Cached", cache=cache).process_tournament(DATA_PATH)
+    assert cache.hits == 0
+    assert list(tmp_path.glob("*.json")) == []
+
+    with pytest.raises(ToucanException, match="cannot be negative"):
+        ToucanMatchCache(max_entries=-1)
+
+
+def test_cache_discipline_version(tmp_path):
+    # Changing the discipline definitions invalidates the cached results
+    cache = ToucanMatchCache()
+    ToucanTournament("Cached", cache=cache).process_tournament(DATA_PATH)
+    register_discipline(
+        ToucanCustomDiscipline.from_dict(
+            {
+                "name": "CACHEBALL",
+                "marks": ["goals"],
+                "team_score": {"goals": 1},
+                "positions": {"G": {"coefficients": [1]}},
+            }
+        )
+    )
+    try:
+        ToucanTournament("Cached", cache=cache).process_tournament(DATA_PATH)
+    finally:
+        unregister_discipline("CACHEBALL")
+    assert (cache.hits, cache.misses) == (0, 4)
+
+
+def test_cache_collect_errors(tmp_path):
+    # Invalid match files are not cached
+    shutil.copytree(DATA_PATH, tmp_path, dirs_exist_ok=True)
+    (tmp_path / "match3.txt").write_text("CURLING\n")
+    cache = ToucanMatchCache()
+    for _ in range(2):
+        tournament = ToucanTournament("Cached", cache=cache)
+        match_errors = tournament.process_tournament(tmp_path, errors="collect")
+        assert len(match_errors) == 1
+    assert (cache.hits, cache.misses, len(cache)) == (2, 4, 2)
+    assert tournament.mvp.nickname == "nick3"
@@ -0,0 +1,86 @@
+import json
+from pathlib import Path
+import shutil
+
+from toucan.mvp.calculator.cli import main
+
+DATA_PATH = Path(Path(__file__).parent, "data", "tournament")
+
+
+def test_cli_text(capsys):
+    # Let's process the reference tournament
+    assert main([str(DATA_PATH)]) == 0
+    out = capsys.readouterr().out
+    assert "Tournament: tournament" in out
+    assert "MVP:        nick3" in out
+
+
+def test_cli_json_many_directories(tmp_path, capsys):
+    # Let's process two tournaments at once in worker processes
+    for name in ("first", "second"):
+        shutil.copytree(DATA_PATH, Path(tmp_path, name))
+    directories = [str(Path(tmp_path, name)) for name in ("first", "second")]
+
+    assert main(directories + ["--workers", "2", "--format", "json", "--top", "2"]) == 0
+    leaderboards = json.loads(capsys.readouterr().out)
+    assert [leaderboard["tournament"] for leaderboard in leaderboards] == ["first", "second"]
+    for leaderboard in leaderboards:
+        assert leaderboard["mvp"] == "nick3"
+        assert [entry["nickname"] for entry in leaderboard["leaderboard"]] == ["nick3", "nick4"]
+        assert leaderboard["leaderboard"][0]["points"] == 72
+
+
+def test_cli_csv_incremental_profile(tmp_path, capsys):
+    # Let's process a tournament incrementally... twice
+    tournament = Path(tmp_path, "tournament")
+    shutil.copytree(DATA_PATH, tournament)
+    args = [str(tournament), "--incremental", "--state-dir", str(Path(tmp_path, "state"))]
+    assert main(args + ["--format", "csv", "--profile"]) == 0
+    first = capsys.readouterr()
+    assert main(args + ["--format", "csv"]) == 0
+    second = capsys.readouterr()
+
+    # Points should not be double counted
+    assert first.out == second.out
+    assert first.out.splitlines()[0] == "tournament,rank,nickname,name,points"
+    assert first.out.splitlines()[1] == "tournament,1,nick3,player 3,72"
+    assert len(list(Path(tmp_path, "state").iterdir())) == 1
+
+    # The profile is printed to stderr
+    assert "[profile]" in first.err
+    assert "process=" in first.err
+    assert "save_state=" in first.err
+
+
+def test_cli_errors(tmp_path, capsys):
+    # Invalid directories and amount of workers are reported
+    assert main([str(Path(tmp_path, "missing"))]) == 1
+    assert "is not a directory" in capsys.readouterr().err
+    assert main([str(DATA_PATH), "--workers", "0"]) == 2
+    assert "the number of workers must be at least 1" in capsys.readouterr().err
+
+
+def test_cli_archive(tmp_path, capsys):
+    # Archives are processed as their extracted directory (never incrementally)
+    archive = Path(shutil.make_archive(str(Path(tmp_path, "tournament")), "gztar", DATA_PATH))
+    args = ["--format", "csv", "--incremental", "--state-dir", str(Path(tmp_path, "state"))]
+    assert main([str(DATA_PATH), "--format", "csv"]) == 0
+    expected = capsys.readouterr().out.replace("\ntournament,", "\ntournament.tar.gz,")
+    assert main([str(archive)] + args) == 0
+    assert capsys.readouterr().out == expected
+    assert not Path(tmp_path, "state").exists()
+
+
+def test_cli_version(capsys):
+    assert main(["--version"]) == 0
+    assert capsys.readouterr().out.startswith("toucan-mvp ")
+
+
+def test_cli_cache_dir(tmp_path, capsys):
+    # Results cached by a run are reused by the next one
+    args = [str(DATA_PATH), "--cache-dir", str(Path(tmp_path, "cache"))]
+    assert main(args) == 0
+    first = capsys.readouterr().out
+    assert len(list(Path(tmp_path, "cache").glob("*.json"))) == 2
+    assert main(args) == 0
+    assert capsys.readouterr().out == first
@@ -1,6 +1,18 @@
+import json
+from pathlib import Path
+
 import pytest
 
-from toucan.mvp.calculator.discipline import ToucanDiscipline, get_discipline_by_name
+from toucan.mvp.calculator import ToucanTournament
+from toucan.mvp.calculator.discipline import (
+    ToucanCustomDiscipline,
+    ToucanDiscipline,
+    get_custom_disciplines,
+    get_discipline_by_name,
+    load_disciplines,
+    register_discipline,
+    unregister_discipline,
+)
 from toucan.mvp.calculator.errors import ToucanException
 
 
@@ -26,3 +38,198 @@ def test_get_discipline_by_name():
 
     with pytest.raises(ToucanException):
         get_discipline_by_name("mysport")
+
+
+def test_discipline_parser():
+    # Parsers are built only once per discipline
+    parser = ToucanDiscipline.HANDBALL.get_parser()
+    assert parser is ToucanDiscipline.HANDBALL.get_parser()
+    assert parser.discipline is ToucanDiscipline.HANDBALL
+    assert parser.pattern.pattern == ToucanDiscipline.HANDBALL.get_pattern()
+
+    # Extra rating points are folded in the coefficients
+    assert parser.coefficients == {"G": ((5, -2), 50), "F": ((1, -1), 20)}
+    assert parser.score_signs == ((0, 1), (1, -1))
+    assert parser.score([10, 2], "G") == 50 + 10 * 5 - 2 * 2
+    assert parser.score([10, 2], "C") is None
+    assert parser.team_score_contribution([10, 2]) == 8
+
+
+def test_discipline_parser_parse_line():
+    # The parser should behave exactly as the discipline's regex
+    parser = ToucanDiscipline.BASKETBALL.get_parser()
+    lines = [
+        "player 1;nick1;4;Team A;G;10;2;7",
+        "player;1;nick1;4;Team A;G;10;2;7",
+        "player 1;nick1;;Team A;G;10;2;7",
+        "player 1;nick1;4;Team A;;10;2;7",
+        "player 1;nick1;4;Team A;G;10;2",
+        "player 1;nick1;4;Team A;G;10;²;7",
+        "player 1;nick1;4;Team A;G1;10;2;7",
+        "player 1;nick1;4;Team A;Ñ;10;2;7",
+        "player\n1;nick1;4;Team A;G;10;2;7",
+    ]
+    for line in lines:
+        entries = parser.pattern.match(line)
+        if entries is None:
+            assert parser.parse_line(line) is None
+        else:
+            name, nickname, number, team, position, *marks = entries.groups()
+            assert parser.parse_line(line) == (
+                name,
+                nickname,
+                number,
+                team,
+                position,
+                [int(mark) for mark in marks],
+            )
+
+
+def test_discipline_parser_parse_raw_line():
+    # Parsing the bytes of a line should behave exactly as parsing the line
+    parser = ToucanDiscipline.BASKETBALL.get_parser()
+    lines = [
+        "player 1;nick1;4;Team A;G;10;2;7",
+        "pläyer 1;ñick1;;Team Ä;F;10;2;7",
+        "player;1;nick1;4;Team A;G;10;2;7",
+        "player 1;nick1;4;Team A;;10;2;7",
+        "player 1;nick1;4;Team A;X;10;2;7",
+        "player 1;nick1;4;Team A;G;10;2",
+        "player 1;nick1;4;Team A;G;10;²;7",
+        "player 1;nick1;4;Team A;Ñ;10;2;7",
+    ]
+    for line in lines:
+        row = parser.parse_raw_line(line.encode())
+        if row is None:
+            assert parser.parse_line(line) is None
+        else:
+            name, nickname, number, team, position, marks = row
+            decoded = (name.decode(), nickname.decode(), number.decode(), team.decode())
+            assert parser.parse_line(line) == (*decoded, position, marks)
+
+
+HOOPS_TOML = """
+[[disciplines]]
+name = "hoops"
+marks = ["points", "rebounds", "assists"]
+team_score = {points = 1}
+positions.G = {coefficients = [2, 3, 1]}
+positions.F = {coefficients = [2, 2, 2]}
+positions.C = {coefficients = [2, 1, 3], extra = 0}
+"""
+
+SHOOTOUT_JSON = {
+    "disciplines": [
+        {
+            "name": "SHOOTOUT",
+            "marks": ["goals", "saves", "misses"],
+            "team_score": {"goals": 1, "misses": -1},
+            "bonus": 5,
+            "positions": {"S": {"coefficients": [3, 0, -1], "extra": 7}},
+        }
+    ]
+}
+
+
+@pytest.fixture
+def custom_disciplines(tmp_path):
+    # Register the custom disciplines only for the duration of a test
+    toml_file = tmp_path / "hoops.toml"
+    toml_file.write_text(HOOPS_TOML)
+    json_file = tmp_path / "shootout.json"
+    json_file.write_text(json.dumps(SHOOTOUT_JSON))
+    disciplines = load_disciplines(toml_file) + load_disciplines(json_file)
+    yield disciplines
+    for discipline in disciplines:
+        unregister_discipline(discipline.name)
+
+
+def test_custom_disciplines(custom_disciplines):
+    hoops, shootout = custom_disciplines
+    assert get_custom_disciplines() == [hoops, shootout]
+    assert get_discipline_by_name("Hoops") is hoops
+    assert hoops.marks == ("points", "rebounds", "assists")
+    assert hoops.get_pattern() == ToucanDiscipline.BASKETBALL.get_pattern()
+
+    # Their compiled plans are cached and equivalent to the built-in ones
+    assert hoops.get_parser() is hoops.get_parser()
+    basketball = ToucanDiscipline.BASKETBALL.get_parser()
+    assert hoops.get_parser().coefficients == basketball.coefficients
+    assert hoops.get_parser().score_signs == basketball.score_signs
+    assert hoops.get_parser().bonus_points == basketball.bonus_points == 10
+
+    parser = shootout.get_parser()
+    assert parser.coefficients == {"S": ((3, 0, -1), 7)}
+    assert parser.score_signs == ((0, 1), (2, -1))
+    assert parser.bonus_points == 5
+    assert parser.parse_line("p;n;1;A;S;2;0;1") == ("p", "n", "1", "A", "S", [2, 0, 1])
+    assert parser.score([2, 0, 1], "S") == 12
+    assert parser.team_score_contribution([2, 0, 1]) == 1
+
+
+def test_custom_disciplines_errors(custom_disciplines, tmp_path):
+    hoops, _ = custom_disciplines
+    with pytest.raises(ToucanException, match="already registered"):
+        register_discipline(hoops)
+    with pytest.raises(ToucanException, match="already registered"):
+        register_discipline(ToucanCustomDiscipline("BASKETBALL", ["a"], {"G": ([1], 0)}, {}))
+    with pytest.raises(ToucanException, match="not a registered custom discipline"):
+        unregister_discipline("BASKETBALL")
+
+    # Invalid definitions
+    with pytest.raises(ToucanException, match="is not valid"):
+        ToucanCustomDiscipline("my sport", ["a"], {"G": ([1], 0)}, {})
+    with pytest.raises(ToucanException, match="unique names"):
+        ToucanCustomDiscipline("SPORT", ["a", "a"], {"G": ([1, 1], 0)}, {})
+    with pytest.raises(ToucanException, match="one coefficient per mark"):
+        ToucanCustomDiscipline("SPORT", ["a", "b"], {"G": ([1], 0)}, {})
+    with pytest.raises(ToucanException, match="has no positions"):
+        ToucanCustomDiscipline("SPORT", ["a"], {}, {})
+    with pytest.raises(ToucanException, match="either 1 or -1"):
+        ToucanCustomDiscipline("SPORT", ["a"], {"G": ([1], 0)}, {"b": 1})
+    with pytest.raises(ToucanException, match="Invalid discipline definition"):
+        ToucanCustomDiscipline.from_dict({"name": "SPORT"})
+
+    # Files are registered all at once... or not at all
+    json_file = tmp_path / "disciplines.json"
+    json_file.write_text(
+        json.dumps(
+            {
+                "disciplines": [
+                    {**SHOOTOUT_JSON["disciplines"][0], "name": "OTHER"},
+                    SHOOTOUT_JSON["disciplines"][0],
+                ]
+            }
+        )
+    )
+    with pytest.raises(ToucanException, match="'SHOOTOUT' is already registered"):
+        load_disciplines(json_file)
+    with pytest.raises(ToucanException):
+        get_discipline_by_name("OTHER")
+    with pytest.raises(ToucanException, match="neither a JSON nor a TOML file"):
+        load_disciplines(tmp_path / "disciplines.yaml")
+
+
+@pytest.mark.parametrize("engine", ["python", "numpy"])
+@pytest.mark.parametrize("workers", [1, 2])
+def test_custom_discipline_tournament(custom_disciplines, tmp_path, engine, workers):
+    if engine == "numpy":
+        pytest.importorskip("numpy")
+
+    # A custom discipline defined as basketball scores exactly as basketball
+    REF_PATH = Path(Path(__file__).parent, "data", "tournament")
+    tmp_path = tmp_path / "tournament"
+    tmp_path.mkdir()
+    for idx in range(2):
+        content = (REF_PATH / "match1.txt").read_text()
+        Path(tmp_path, f"basketball{idx}.txt").write_text(content)
+        Path(tmp_path, f"hoops{idx}.txt").write_text(content.replace("BASKETBALL", "HOOPS"))
+    Path(tmp_path, "shootout.txt").write_text("SHOOTOUT\np1;n1;1;A;S;2;0;1\np2;n2;2;B;S;0;3;4\n")
+
+    tournament = ToucanTournament("CustomTournament", engine)
+    tournament.process_tournament(tmp_path, workers=workers)
+    for player in tournament.players:
+        if player.nickname.startswith("nick"):
+            assert player.points[0:2] == player.points[2:4]
+    assert tournament._players["n1"].points == [12 + 5]
+    assert tournament._players["n2"].points == [3]
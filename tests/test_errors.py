@@ -1,4 +1,6 @@
-from toucan.mvp.calculator.errors import ToucanException
+import pickle
+
+from toucan.mvp.calculator.errors import ToucanException, ToucanMatchError
 
 
 def test_toucan_exception():
@@ -9,3 +11,18 @@ def test_toucan_exception():
     assert isinstance(err, Exception)
     assert isinstance(err, ToucanException)
     assert str(err) == "This is my exception"
+
+
+def test_toucan_match_error():
+    # Build ToucanMatchError... it carries where and why the match is invalid
+    err = ToucanMatchError("match.txt", 3, "bad record")
+    assert isinstance(err, ToucanException)
+    assert (err.source, err.line, err.reason) == ("match.txt", 3, "bad record")
+    assert str(err) == (
+        "Failed to process tournament... error on match file 'match.txt', line 3: bad record"
+    )
+
+    # It survives being sent back from a worker process
+    copy = pickle.loads(pickle.dumps(err))
+    assert (copy.source, copy.line, copy.reason) == ("match.txt", 3, "bad record")
+    assert str(ToucanMatchError("match.txt", None, "draw")).endswith("'match.txt': draw")
@@ -0,0 +1,128 @@
+import os
+from pathlib import Path
+import random
+
+import pytest
+
+from toucan.mvp.calculator import ToucanTournament
+from toucan.mvp.calculator.errors import ToucanException
+
+N_ROUNDS = 12
+
+
+@pytest.fixture
+def rounds(tmp_path):
+    # Let's build random basketball matches between a pool of players
+    rng = random.Random(7)
+    dir = Path(tmp_path, "rounds")
+    dir.mkdir()
+    paths = []
+    for match_round in range(1, N_ROUNDS + 1):
+        while True:
+            players = rng.sample(range(10), 6)
+            rows = [
+                (idx, "Team A" if row < 3 else "Team B", rng.choice("GFC"), rng.randint(0, 20))
+                for row, idx in enumerate(players)
+            ]
+            if sum(p for _, t, _, p in rows if t == "Team A") != sum(
+                p for _, t, _, p in rows if t == "Team B"
+            ):
+                break
+        path = Path(dir, f"round_{match_round}.txt")
+        path.write_text(
+            "\n".join(
+                ["BASKETBALL"]
+                + [
+                    f"player {idx};nick{idx};{idx};{team};{position};{scored};{idx};{idx % 3}"
+                    for idx, team, position, scored in rows
+                ]
+            )
+        )
+        os.utime(path, ns=(0, (N_ROUNDS - match_round) * 10**9))
+        paths.append(path)
+    return paths
+
+
+def brute_force(paths):
+    # Process the given match files from scratch
+    tournament = ToucanTournament("BruteForce")
+    for path in paths:
+        tournament.process_match(path)
+    return tournament
+
+
+@pytest.mark.parametrize("order", ["arrival", "name", "mtime"])
+def test_history(rounds, order):
+    tournament = ToucanTournament("History")
+    tournament.process_tournament(rounds[0].parent)
+    history = tournament.history(order)
+    assert tournament.history(order) is history
+    assert history.order == order
+    assert len(history) == N_ROUNDS
+
+    # Arrival order is sorted path order (round_10 before round_2), name order is
+    # natural and mtime order is reversed (the last round is the oldest file)
+    ordered = {
+        "arrival": sorted(rounds),
+        "name": rounds,
+        "mtime": rounds[::-1],
+    }[order]
+    assert history.round_of(tournament.match_result(ordered[0]).match_id) == 1
+
+    for end in range(N_ROUNDS + 1):
+        for window in (None, 1, 3):
+            start = 0 if window is None else max(0, end - window)
+            expected = brute_force(ordered[start:end])
+            if end == start:
+                assert history.mvp(end, window) is None
+                assert history.top(3, end, window) == []
+                continue
+
+            assert history.mvp(end, window).nickname == expected.mvp.nickname
+            assert [
+                (player.nickname, points) for player, points in history.top(4, end, window)
+            ] == [(player.nickname, player.total_points) for player in expected.top(4)]
+            for player in expected.players:
+                assert history.points(player.nickname, end, window) == player.total_points
+
+    # The whole history in arrival order is the tournament itself
+    if order == "arrival":
+        assert history.mvp() is tournament.mvp
+
+
+def test_history_follows_tournament(rounds):
+    # Matches processed after the history was built are appended to it...
+    tournament = ToucanTournament("History")
+    history = tournament.history("name")
+    assert len(history) == 0
+    assert history.mvp() is None
+    for path in rounds[:6]:
+        tournament.process_match(path)
+    assert history.mvp(6).nickname == brute_force(rounds[:6]).mvp.nickname
+
+    # ...or rebuild it when they go before its last round
+    for path in rounds[6:][::-1]:
+        tournament.process_match(path)
+        assert len(history) == tournament._store.n_matches
+    assert history.mvp(9, 2).nickname == brute_force(rounds[7:9]).mvp.nickname
+
+    # Retracted matches rebuild it too
+    tournament._retract_matches([tournament.match_result(rounds[0]).match_id])
+    assert len(history) == N_ROUNDS - 1
+    assert history.mvp().nickname == brute_force(rounds[1:]).mvp.nickname
+
+
+def test_history_errors(rounds):
+    tournament = ToucanTournament("History")
+    tournament.process_tournament(rounds[0].parent)
+    with pytest.raises(ToucanException, match="history order 'random' is not one of"):
+        tournament.history("random")
+    history = tournament.history()
+    with pytest.raises(ToucanException, match="round 13 is not between 0 and 12"):
+        history.mvp(13)
+    with pytest.raises(ToucanException, match="window cannot be negative"):
+        history.top(3, window=-1)
+    with pytest.raises(ToucanException, match="does not take part"):
+        history.points("nobody")
+    with pytest.raises(ToucanException, match="is not part of the tournament"):
+        history.round_of(99)
@@ -0,0 +1,92 @@
+import random
+
+from toucan.mvp.calculator.leaderboard import ToucanLeaderboard
+
+
+def test_empty_leaderboard():
+    leaderboard = ToucanLeaderboard()
+    assert len(leaderboard) == 0
+    assert leaderboard.mvp is None
+    assert leaderboard.top(3) == []
+    assert 0 not in leaderboard
+
+
+def test_leaderboard_ties():
+    # Ties are broken by the identifier of the player
+    leaderboard = ToucanLeaderboard()
+    leaderboard.update(2, 10)
+    leaderboard.update(1, 10)
+    leaderboard.update(0, 5)
+    assert leaderboard.mvp == 1
+    assert leaderboard.top(2) == [(1, 10), (2, 10)]
+    assert [leaderboard.rank(player_id) for player_id in range(3)] == [3, 1, 2]
+
+    # Updating a player with the same total does nothing
+    leaderboard.update(1, 10)
+    assert leaderboard.mvp == 1
+    assert len(leaderboard) == 3
+
+
+def test_leaderboard_against_sorting(monkeypatch):
+    # Let's use tiny buckets so that they are split and dropped often
+    monkeypatch.setattr("toucan.mvp.calculator.leaderboard.BUCKET_LOAD", 4)
+
+    rng = random.Random(0)
+    leaderboard = ToucanLeaderboard()
+    totals = {}
+    for _ in range(2000):
+        player_id = rng.randrange(100)
+        if rng.random() < 0.1:
+            leaderboard.discard(player_id)
+            totals.pop(player_id, None)
+        else:
+            totals[player_id] = rng.randint(-50, 50)
+            leaderboard.update(player_id, totals[player_id])
+
+        # Compare against a brute-force ranking
+        expected = sorted(totals.items(), key=lambda item: (-item[1], item[0]))
+        assert len(leaderboard) == len(totals)
+        assert leaderboard.mvp == (expected[0][0] if expected else None)
+        assert leaderboard.top(10) == expected[:10]
+
+    for rank, (player_id, _) in enumerate(expected, start=1):
+        assert player_id in leaderboard
+        assert leaderboard.rank(player_id) == rank
+
+
+def test_leaderboard_from_totals(monkeypatch):
+    # Building a leaderboard at once is the same as building it incrementally
+    monkeypatch.setattr("toucan.mvp.calculator.leaderboard.BUCKET_LOAD", 4)
+
+    rng = random.Random(1)
+    totals = [(player_id, rng.randint(-20, 20)) for player_id in range(50)]
+    leaderboard = ToucanLeaderboard()
+    for player_id, total in totals:
+        leaderboard.update(player_id, total)
+
+    built = ToucanLeaderboard.from_totals(totals)
+    assert len(built) == len(leaderboard)
+    assert built.mvp == leaderboard.mvp
+    assert built.top(50) == leaderboard.top(50)
+
+    # ...and it can keep on being updated
+    built.update(0, 100)
+    assert built.mvp == 0
+    assert built.rank(0) == 1
+
+
+def test_leaderboard_iter_after(monkeypatch):
+    # Iteration can be resumed after any key, even one no longer in the leaderboard
+    monkeypatch.setattr("toucan.mvp.calculator.leaderboard.BUCKET_LOAD", 4)
+
+    rng = random.Random(2)
+    totals = [(player_id, rng.randint(-20, 20)) for player_id in range(50)]
+    leaderboard = ToucanLeaderboard.from_totals(totals)
+    expected = sorted(totals, key=lambda item: (-item[1], item[0]))
+    assert list(leaderboard.iter_after()) == expected
+
+    for position in range(0, 50, 7):
+        player_id, total = expected[position]
+        assert list(leaderboard.iter_after((-total, player_id))) == expected[position + 1 :]
+    assert list(leaderboard.iter_after((-1000, -1))) == expected
+    assert list(leaderboard.iter_after((1000, 0))) == []
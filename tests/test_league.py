@@ -0,0 +1,113 @@
+from pathlib import Path
+import shutil
+
+import pytest
+
+from toucan.mvp.calculator import ToucanTournament
+from toucan.mvp.calculator.errors import ToucanException
+from toucan.mvp.calculator.league import ToucanLeague
+
+DATA_PATH = Path(Path(__file__).parent, "data", "tournament")
+
+
+@pytest.fixture
+def season(tmp_path):
+    # Two tournaments: the reference one, and a second one replaying its basketball match
+    second = tmp_path / "second"
+    second.mkdir()
+    shutil.copy(DATA_PATH / "match1.txt", second / "match1.txt")
+    return DATA_PATH, second
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_league_rankings(season, workers):
+    first, second = season
+    league = ToucanLeague("Season")
+    league.add_tournament("first", first, workers=workers)
+    league.add_tournament("second", second, workers=workers)
+
+    assert league.name == "Season"
+    assert league.tournaments == ["first", "second"]
+    assert league.disciplines == ["BASKETBALL", "HANDBALL"]
+    assert len(league.players) == 6
+
+    # Per tournament rankings match the ones of standalone tournaments
+    for name, path in [("first", first), ("second", second)]:
+        tournament = ToucanTournament(name)
+        tournament.process_tournament(path)
+        assert league.mvp(name).nickname == tournament.mvp.nickname
+        assert league.points(tournament.mvp.nickname, name) == tournament.mvp.total_points
+        assert [player.nickname for player, _ in league.top(6, name)] == [
+            player.nickname for player in tournament.top(6)
+        ]
+
+    # The aggregate ranking holds the points of the players over the whole league
+    top = league.top(6)
+    assert [total for _, total in top] == sorted((total for _, total in top), reverse=True)
+    for player, total in top:
+        assert player.total_points == total
+        assert league.points(player.nickname) == total
+        assert total == league.points(player.nickname, "first") + league.points(
+            player.nickname, "second"
+        )
+    assert league.rank(league.mvp().nickname) == 1
+
+    # Per discipline rankings
+    basketball = league.top(6, discipline="basketball")
+    assert all(
+        total
+        == league.points(player.nickname, "first", "basketball")
+        + league.points(player.nickname, "second", "basketball")
+        for player, total in basketball
+    )
+    assert league.top(6, "second", "handball") == []
+    assert league.mvp("second", "handball") is None
+
+
+def test_league_errors(season):
+    first, _ = season
+    league = ToucanLeague("Season")
+    league.add_tournament("first", first)
+
+    with pytest.raises(ToucanException, match="already part of the league"):
+        league.add_tournament("first", first)
+    with pytest.raises(ToucanException, match="not part of the league"):
+        league.mvp("unknown")
+    with pytest.raises(ToucanException, match="does not take part in the league"):
+        league.rank("unknown")
+    with pytest.raises(ToucanException, match="not implemented"):
+        league.top(3, discipline="chess")
+    with pytest.raises(ToucanException, match="scoring engine"):
+        ToucanLeague("Season", engine="unknown")
+
+    # An invalid tournament is not partially added
+    with pytest.raises(ToucanException):
+        league.add_tournament("invalid", Path(Path(__file__).parent, "data", "tournament_error1"))
+    assert league.tournaments == ["first"]
+    assert len(league.players) == 6
+
+
+def test_league_overflow(season, tmp_path):
+    # Totals which do not fit in the store are rejected before modifying the league,
+    # even if the points of each match do fit
+    first, _ = season
+    league = ToucanLeague("Season")
+    league.add_tournament("first", first)
+    overflow = tmp_path / "overflow"
+    overflow.mkdir()
+    for idx in range(4):
+        (overflow / f"match{idx}.txt").write_text(
+            f"HANDBALL\nplayer 1;nick1;1;Team A;F;{1 << 61};0\nplayer 9;nick9;9;Team B;F;1;0\n"
+        )
+    with pytest.raises(ToucanException, match="does not fit in the store"):
+        league.add_tournament("overflow", overflow)
+    assert league.tournaments == ["first"]
+    assert len(league.players) == 6
+    assert league.points("nick1") == league.points("nick1", "first")
+
+    # ...so the tournament can be added once fixed
+    (overflow / "match3.txt").unlink()
+    league.add_tournament("overflow", overflow)
+    assert league.tournaments == ["first", "overflow"]
+    assert league.mvp().nickname == "nick1"
+    assert len(league.players) == 7
@@ -0,0 +1,123 @@
+import math
+from pathlib import Path
+
+import pytest
+
+from toucan.mvp.calculator import ToucanTournament
+from toucan.mvp.calculator.errors import ToucanException
+from toucan.mvp.calculator.metrics import COUNTERS, TIMINGS, ToucanMetricsCollector
+
+DATA_PATH = Path(Path(__file__).parent, "data", "tournament")
+
+
+def test_collector_percentiles():
+    collector = ToucanMetricsCollector()
+    assert math.isnan(collector.percentile("match.parse", 50))
+    assert collector.summary() == {}
+
+    for seconds in [4.0, 1.0, 3.0, 2.0]:
+        collector.timing("match.parse", seconds)
+    collector.count("rows", 3)
+    collector.count("rows")
+
+    assert collector.timings("match.parse") == [4.0, 1.0, 3.0, 2.0]
+    assert collector.percentile("match.parse", 0) == 1.0
+    assert collector.percentile("match.parse", 50) == 2.5
+    assert collector.percentile("match.parse", 100) == 4.0
+    assert collector.counters == {"rows": 4}
+
+    summary = collector.summary()["match.parse"]
+    assert summary["count"] == 4
+    assert summary["total"] == 10.0
+    assert summary["mean"] == 2.5
+    assert (summary["min"], summary["max"]) == (1.0, 4.0)
+
+    collector.reset()
+    assert collector.counters == {}
+    assert collector.timings("match.parse") == []
+
+
+@pytest.mark.parametrize("engine", ["python", "numpy"])
+def test_tournament_metrics(engine):
+    if engine == "numpy":
+        pytest.importorskip("numpy")
+
+    collector = ToucanMetricsCollector()
+    tournament = ToucanTournament("MetricsTournament", engine, metrics=collector)
+    assert tournament.metrics is collector
+    tournament.process_tournament(DATA_PATH)
+
+    # The instrumentation does not change the results
+    assert tournament.mvp.nickname == "nick3"
+    assert tournament.mvp.total_points == 72
+
+    counters = collector.counters
+    assert set(counters) <= set(COUNTERS)
+    assert set(collector.summary()) <= set(TIMINGS)
+    assert counters["matches"] == 2
+    assert counters["rows"] == 12
+    assert counters["players_created"] == 6
+    assert counters["bytes_read"] == sum(
+        path.stat().st_size for path in DATA_PATH.iterdir() if path.is_file()
+    )
+    assert len(collector.timings("match.parse")) == 2
+    assert len(collector.timings("leaderboard.ranking")) == 1
+    assert len(collector.timings("tournament.process")) == 1
+    if engine == "python":
+        assert len(collector.timings("match.team_resolution")) == 2
+
+    # The leaderboard is only ranked again when the points changed
+    assert tournament.rank("nick3") == 1
+    assert len(collector.timings("leaderboard.ranking")) == 1
+
+
+@pytest.mark.parametrize("engine", ["python", "numpy"])
+@pytest.mark.parametrize("workers,errors", [(1, "collect"), (2, "raise"), (2, "collect")])
+def test_tournament_metrics_isolated(engine, workers, errors):
+    if engine == "numpy":
+        pytest.importorskip("numpy")
+
+    collector = ToucanMetricsCollector()
+    tournament = ToucanTournament("MetricsTournament", engine, metrics=collector)
+    tournament.process_tournament(DATA_PATH, workers=workers, errors=errors)
+    assert tournament.mvp.nickname == "nick3"
+
+    counters = collector.counters
+    assert counters["matches"] == 2
+    assert counters["rows"] == 12
+    assert len(collector.timings("match.parse")) == 2
+    assert len(collector.timings("match.scoring")) == 2
+    if engine == "python":
+        assert len(collector.timings("match.team_resolution")) == 2
+
+
+@pytest.mark.parametrize("workers,errors", [(1, "collect"), (2, "raise"), (2, "collect")])
+def test_tournament_metrics_isolated_regex_failure(tmp_path, workers, errors):
+    (tmp_path / "match0.txt").write_text("BASKETBALL\nplayer 1;nick1;4;Team A;G;10;2\n")
+    (tmp_path / "match1.txt").write_text("BASKETBALL\nplayer 2;nick2;4;Team A;G;10;2;1\n")
+
+    collector = ToucanMetricsCollector()
+    tournament = ToucanTournament("FailingTournament", metrics=collector)
+    if errors == "raise":
+        with pytest.raises(ToucanException):
+            tournament.process_tournament(tmp_path, workers=workers, errors=errors)
+    else:
+        match_errors = tournament.process_tournament(tmp_path, workers=workers, errors=errors)
+        assert len(match_errors) == 2
+    assert collector.counters["regex_failures"] == 1
+
+
+def test_tournament_metrics_regex_failure(tmp_path):
+    (tmp_path / "match.txt").write_text("BASKETBALL\nplayer 1;nick1;4;Team A;G;10;2\n")
+
+    collector = ToucanMetricsCollector()
+    tournament = ToucanTournament("FailingTournament", metrics=collector)
+    with pytest.raises(ToucanException):
+        tournament.process_tournament(tmp_path)
+    assert collector.counters["regex_failures"] == 1
+
+    # Once the sink is removed, nothing else is reported
+    tournament.metrics = None
+    with pytest.raises(ToucanException):
+        tournament.process_tournament(tmp_path)
+    assert collector.counters["regex_failures"] == 1
@@ -0,0 +1,103 @@
+import io
+
+import pytest
+
+from toucan.mvp.calculator import parser
+from toucan.mvp.calculator.discipline import ToucanDiscipline
+from toucan.mvp.calculator.errors import ToucanException
+from toucan.mvp.calculator.parser import open_match_buffer, parse_match, parse_match_buffer
+
+
+def test_parse_match():
+    # Let's parse a reference match from an in-memory file
+    match = io.StringIO(
+        "HANDBALL\nplayer 1;nick1;4;Team A;G;0;20\nplayer 4;nick4;16;Team B;G;1;25\n"
+    )
+    discipline, rows = parse_match(match, "match.txt")
+
+    # Check the discipline and the parsed records
+    assert discipline is ToucanDiscipline.HANDBALL
+    assert list(rows) == [
+        ("player 1", "nick1", "4", "Team A", "G", [0, 20]),
+        ("player 4", "nick4", "16", "Team B", "G", [1, 25]),
+    ]
+
+
+def test_parse_match_is_lazy():
+    # Let's check that lines are only consumed as records are requested
+    consumed = []
+
+    def lines():
+        for line in ["BASKETBALL\n", "player 1;nick1;4;Team A;G;10;2;7\n", "invalid line\n"]:
+            consumed.append(line)
+            yield line
+
+    discipline, rows = parse_match(lines(), "match.txt")
+    assert discipline is ToucanDiscipline.BASKETBALL
+    assert len(consumed) == 1
+
+    # The first record is fine...
+    assert next(rows) == ("player 1", "nick1", "4", "Team A", "G", [10, 2, 7])
+    assert len(consumed) == 2
+
+    # ...but the second one is not
+    with pytest.raises(ToucanException, match="error on match file 'match.txt'"):
+        next(rows)
+
+
+def test_parse_empty_match():
+    # An empty match does not even have a discipline
+    with pytest.raises(ToucanException, match="The provided discipline name '' is not implemented"):
+        parse_match([], "match.txt")
+
+
+def test_parse_match_buffer(tmp_path):
+    # Let's parse a memory-mapped match file, with Windows line breaks
+    match_file = tmp_path / "match.txt"
+    match_file.write_bytes(
+        b"HANDBALL\r\nplayer 1;nick1;4;Team A;G;0;20\r\nplayer 4;nick4;16;Team B;G;1;25"
+    )
+    with open_match_buffer(match_file) as buffer:
+        discipline, rows = parse_match_buffer(buffer, match_file)
+
+        # Check the discipline and the (undecoded) parsed records
+        assert discipline is ToucanDiscipline.HANDBALL
+        assert list(rows) == [
+            (b"player 1", b"nick1", b"4", b"Team A", "G", [0, 20]),
+            (b"player 4", b"nick4", b"16", b"Team B", "G", [1, 25]),
+        ]
+
+    # Invalid records are reported with their line number
+    discipline, rows = parse_match_buffer(b"HANDBALL\n\ninvalid\n", "match.txt")
+    with pytest.raises(ToucanException, match="error on match file 'match.txt', line 2"):
+        next(rows)
+
+
+def test_parse_empty_match_buffer(tmp_path):
+    # Empty files cannot be memory-mapped... but they are parsed as any other
+    match_file = tmp_path / "match.txt"
+    match_file.write_bytes(b"")
+    with open_match_buffer(match_file) as buffer:
+        with pytest.raises(ToucanException, match="The provided discipline name ''"):
+            parse_match_buffer(buffer, match_file)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 1 << 20])
+def test_parse_match_buffer_chunks(monkeypatch, chunk_size):
+    # The chunks in which the buffer is split should not change the records
+    monkeypatch.setattr(parser, "BUFFER_CHUNK_SIZE", chunk_size)
+    lines = [f"player {idx};nick{idx};{idx};Team {idx % 2};G;{idx};2;7" for idx in range(20)]
+    content = "\n".join(["BASKETBALL"] + lines) + "\n"
+
+    _, rows = parse_match(io.StringIO(content), "match.txt")
+    _, raw_rows = parse_match_buffer(content.encode(), "match.txt")
+    assert [
+        (name.decode(), nickname.decode(), number.decode(), team.decode(), position, marks)
+        for name, nickname, number, team, position, marks in raw_rows
+    ] == list(rows)
+
+    # ...nor the line number of an invalid record
+    content = content.replace(lines[12], "invalid")
+    _, raw_rows = parse_match_buffer(content.encode(), "match.txt")
+    with pytest.raises(ToucanException, match="'match.txt', line 14"):
+        list(raw_rows)
@@ -0,0 +1,93 @@
+from pathlib import Path
+
+import pytest
+
+from toucan.mvp.calculator import ToucanTournament
+from toucan.mvp.calculator.errors import ToucanException
+from toucan.mvp.calculator.partial import ToucanPartialResult, get_shard, merge_partials
+
+REF_PATH = Path(Path(__file__).parent, "data", "tournament")
+
+
+@pytest.fixture
+def tournament_dir(tmp_path):
+    # Let's build a bigger tournament by replicating the reference matches
+    dir = Path(tmp_path, "tournament")
+    dir.mkdir()
+    for idx in range(8):
+        for match_file in REF_PATH.glob("*.txt"):
+            Path(dir, f"{idx}_{match_file.name}").write_text(match_file.read_text())
+    return dir
+
+
+def get_standings(tournament):
+    return [
+        (player.nickname, player.name, player.points, tournament.rank(player.nickname))
+        for player in tournament.players
+    ]
+
+
+@pytest.mark.parametrize("shards", [1, 3])
+def test_merged_partials(tournament_dir, shards):
+    # Let's process each shard on its own...
+    partials = [
+        ToucanTournament("Shard").process_partial(tournament_dir, shard, shards)
+        for shard in range(shards)
+    ]
+    assert sum(len(partial) for partial in partials) == 16
+    assert all(partial.shards == shards for partial in partials)
+    for shard, partial in enumerate(partials):
+        assert all(get_shard(source, shards) == shard for source in partial.sources)
+
+    # ...and merge them in any order: it is the same as a single run
+    single = ToucanTournament("Single")
+    single.process_tournament(tournament_dir)
+    for order in (partials, partials[::-1]):
+        merged = ToucanTournament.from_partials("Merged", order)
+        assert get_standings(merged) == get_standings(single)
+        assert merged.mvp.nickname == single.mvp.nickname == "nick3"
+        assert (
+            merged.match_result("0_match1.txt").scores
+            == single.match_result(Path(tournament_dir, "0_match1.txt")).scores
+        )
+
+
+def test_merge_partials(tournament_dir):
+    # Merging is associative, commutative and idempotent...
+    a, b, c = [ToucanTournament("Shard").process_partial(tournament_dir, i, 3) for i in range(3)]
+    merged = merge_partials([a, b, c])
+    assert merged.is_complete
+    for other in (a.merge(b.merge(c)), merge_partials([c, a, b]), merged.merge(b)):
+        assert other.to_bytes() == merged.to_bytes()
+
+    # ...and survives a round trip through a file
+    merged.save(tournament_dir / "merged.json")
+    assert ToucanPartialResult.load(tournament_dir / "merged.json").to_bytes() == merged.to_bytes()
+
+
+def test_invalid_partials(tournament_dir):
+    partial = ToucanTournament("Shard").process_partial(tournament_dir, 0, 2)
+
+    # Incomplete, mismatched or overlapping partial results cannot be merged
+    with pytest.raises(ToucanException, match="missing the shards \\[1\\]"):
+        partial.to_tournament("Incomplete")
+    with pytest.raises(ToucanException, match="of 2 and 1 shards cannot be merged"):
+        partial.merge(ToucanTournament("Shard").process_partial(tournament_dir))
+    with pytest.raises(ToucanException, match="different discipline definitions"):
+        partial.merge(ToucanPartialResult(2, [1], "other"))
+    changed = Path(tournament_dir, partial.sources[0])
+    changed.write_text(changed.read_text().replace(";10;", ";11;", 1))
+    with pytest.raises(ToucanException, match="differs between the merged partial results"):
+        partial.merge(ToucanTournament("Shard").process_partial(tournament_dir, 0, 2))
+    with pytest.raises(ToucanException, match="There are no partial results"):
+        merge_partials([])
+
+    # Invalid shards and serialized data are rejected too
+    with pytest.raises(ToucanException, match="not a valid shard"):
+        ToucanTournament("Shard").process_partial(tournament_dir, 2, 2)
+    with pytest.raises(ToucanException, match="not valid shards"):
+        ToucanPartialResult(2, [2], "version")
+    with pytest.raises(ToucanException, match="Invalid partial result"):
+        ToucanPartialResult.from_bytes(b"{}")
+    with pytest.raises(ToucanException, match="Unsupported partial result format"):
+        ToucanPartialResult.from_bytes(b'{"format": 0}')
@@ -3,6 +3,7 @@ import pytest
 from toucan.mvp.calculator.discipline import ToucanDiscipline
 from toucan.mvp.calculator.errors import ToucanException
 from toucan.mvp.calculator.players import ToucanPlayer
+from toucan.mvp.calculator.store import ToucanPointsStore
 
 
 def test_toucan_player_basketball():
@@ -145,3 +146,23 @@ def test_error_unexpected_position():
     exp_error = f"Problems retrieving evaluation parameters for '{discipline.name}' in position '{position}'."  # noqa : E501
     with pytest.raises(ToucanException, match=exp_error):
         player.add_match_points(marks, discipline, position)
+
+
+def test_players_sharing_store():
+    # Players of a tournament share the same store of points
+    store = ToucanPointsStore()
+    player_a = ToucanPlayer("Roberto Pastor", "RobPasMue", store)
+    player_b = ToucanPlayer("Another Player", "another", store)
+    assert (player_a.id, player_b.id) == (0, 1)
+
+    store.new_match()
+    player_a.add_match_points((10, 2), ToucanDiscipline.HANDBALL, "F")
+    player_b.add_match_points((1, 1), ToucanDiscipline.HANDBALL, "F")
+    player_a.add_bonus_points()
+
+    assert player_a.points == [20 + 10 - 2 + 10]
+    assert player_b.points == [20]
+    assert store.n_rows == 2
+
+    # Players are lightweight views without an instance dictionary
+    assert not hasattr(player_a, "__dict__")
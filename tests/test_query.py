@@ -0,0 +1,191 @@
+import csv
+import io
+import json
+import random
+
+import pytest
+
+from toucan.mvp.calculator import ToucanTournament
+from toucan.mvp.calculator.errors import ToucanException
+
+
+@pytest.fixture
+def tournament_path(tmp_path):
+    # Let's generate some matches played by random players in random teams
+    rng = random.Random(0)
+    for match in range(30):
+        teams = rng.sample(["Team A", "Team B", "Team C", "Team D"], 2)
+        player_ids = rng.sample(range(60), 8)
+        lines = ["HANDBALL"]
+        for idx, player_id in enumerate(player_ids):
+            lines.append(
+                f"player {player_id};nick{player_id};{idx};{teams[idx % 2]};"
+                f"{rng.choice('GF')};{rng.randint(0, 20)};{rng.randint(0, 20)}"
+            )
+        match_path = tmp_path / f"match{match}.txt"
+        match_path.write_text("\n".join(lines) + "\n")
+    return tmp_path
+
+
+def _players(tournament, path, team=None, position=None):
+    # Filter the players by brute force
+    players = []
+    for player in tournament.players:
+        teams, positions = set(), set()
+        for match_file in path.iterdir():
+            for line in match_file.read_text().splitlines()[1:]:
+                _, nickname, _, player_team, player_position, *_ = line.split(";")
+                if nickname == player.nickname:
+                    teams.add(player_team)
+                    positions.add(player_position)
+        if (team is None or team in teams) and (position is None or position in positions):
+            players.append(player)
+    return players
+
+
+@pytest.mark.parametrize("order_by", ["points", "name", "nickname"])
+@pytest.mark.parametrize("filters", [{}, {"team": "Team A"}, {"team": "Team B", "position": "G"}])
+@pytest.mark.parametrize("scan_ratio", [16, 1])
+def test_query_pagination(monkeypatch, tournament_path, order_by, filters, scan_ratio):
+    # Filtered players are either scanned or sorted depending on how many there are
+    monkeypatch.setattr("toucan.mvp.calculator.query.SCAN_RATIO", scan_ratio)
+    tournament = ToucanTournament("Query")
+    tournament.process_tournament(tournament_path)
+
+    # The query iterates over the players in order...
+    expected = _players(tournament, tournament_path, **filters)
+    if order_by == "points":
+        expected.sort(key=lambda player: (-player.total_points, player.id))
+    else:
+        expected.sort(key=lambda player: (getattr(player, order_by), player.id))
+    query = tournament.query(order_by, **filters)
+    assert list(query) == expected
+
+    # ...and paginating over them is the same
+    players, cursor = query.page(7)
+    while cursor is not None:
+        page, cursor = query.page(7, cursor)
+        assert len(page) <= 7
+        players += page
+    assert players == expected
+
+
+def test_query_discipline(tournament_path):
+    tournament = ToucanTournament("Query")
+    tournament.process_tournament(tournament_path)
+    assert list(tournament.query(discipline="handball")) == list(tournament.query())
+    assert list(tournament.query(discipline="BASKETBALL")) == []
+    assert list(tournament.query(team="Team Z")) == []
+
+
+def test_query_consistent_pages(tournament_path, tmp_path_factory):
+    # Pages remain consistent while the tournament ingests new matches
+    tournament = ToucanTournament("Query")
+    tournament.process_tournament(tournament_path)
+    query = tournament.query("nickname")
+    first, cursor = query.page(10)
+
+    new_path = tmp_path_factory.mktemp("new")
+    (new_path / "match.txt").write_text(
+        "HANDBALL\nplayer 0;aaa;1;Team A;G;0;20\nplayer 1;zzz;2;Team B;G;1;25\n"
+    )
+    tournament.process_tournament(new_path)
+    rest = []
+    while cursor is not None:
+        page, cursor = query.page(10, cursor)
+        rest += page
+    assert first[-1].nickname < rest[0].nickname
+    assert [player.nickname for player in first + rest][-1] == "zzz"
+    assert "aaa" not in [player.nickname for player in first + rest]
+
+
+def test_query_incremental(tournament_path):
+    # The index is only built when first queried... and follows the new matches
+    tournament = ToucanTournament("Query")
+    tournament.process_tournament(tournament_path, incremental=True)
+    assert tournament._player_index is None
+    assert len(tournament.query().page(10)[0]) == 10
+    assert tournament._player_index is None
+    tournament.query("name").page(10)
+    assert tournament._player_index is not None
+    assert tournament._indexed_match == -1
+    expected = _players(tournament, tournament_path, team="Team C")
+    assert set(tournament.query(team="Team C")) == set(expected)
+    (tournament_path / "new.txt").write_text(
+        "HANDBALL\nplayer 0;aaa;1;Team E;G;0;20\nplayer 1;zzz;2;Team C;G;1;25\n"
+    )
+    tournament.process_tournament(tournament_path, incremental=True)
+    assert [player.nickname for player in tournament.query("nickname", team="Team E")] == ["aaa"]
+    assert "zzz" in [player.nickname for player in tournament.query(team="Team C")]
+
+    # Retracting matches retracts the attributes of their players too
+    (tournament_path / "new.txt").write_text(
+        "HANDBALL\nplayer 0;aaa;1;Team F;G;0;20\nplayer 1;zzz;2;Team C;G;1;25\n"
+    )
+    tournament.process_tournament(tournament_path, incremental=True)
+    assert list(tournament.query(team="Team E")) == []
+    assert [player.nickname for player in tournament.query("nickname", team="Team F")] == ["aaa"]
+
+
+@pytest.mark.parametrize("engine", ["python", "numpy"])
+@pytest.mark.parametrize("workers", [1, 2])
+def test_query_engines(tournament_path, engine, workers):
+    # Every way of processing a tournament indexes the same players
+    if engine == "numpy":
+        pytest.importorskip("numpy")
+    ref_tournament = ToucanTournament("Ref")
+    ref_tournament.process_tournament(tournament_path)
+    for parser in ("text", "mmap"):
+        tournament = ToucanTournament("Query", engine, parser=parser)
+        tournament.process_tournament(tournament_path, workers=workers)
+        for filters in ({"team": "Team C"}, {"position": "F"}, {"discipline": "HANDBALL"}):
+            players = [player.nickname for player in tournament.query(**filters)]
+            assert players == [player.nickname for player in ref_tournament.query(**filters)]
+
+
+def test_query_snapshot(tournament_path, tmp_path_factory):
+    tournament = ToucanTournament("Query")
+    tournament.process_tournament(tournament_path)
+    snapshot = tmp_path_factory.mktemp("snapshot") / "query.snapshot"
+    tournament.save(snapshot)
+
+    loaded = ToucanTournament.load(snapshot)
+    for order_by in ("points", "name"):
+        expected = [player.nickname for player in tournament.query(order_by, team="Team D")]
+        assert [player.nickname for player in loaded.query(order_by, team="Team D")] == expected
+
+
+def test_query_export(tournament_path):
+    tournament = ToucanTournament("Query")
+    tournament.process_tournament(tournament_path)
+    expected = [
+        (player.nickname, player.name, player.total_points)
+        for player in tournament.query(team="Team A")
+    ]
+
+    file = io.StringIO()
+    assert tournament.query(team="Team A").export(file) == len(expected)
+    rows = list(csv.reader(io.StringIO(file.getvalue())))
+    assert rows[0] == ["nickname", "name", "points"]
+    assert [(nickname, name, int(points)) for nickname, name, points in rows[1:]] == expected
+
+    file = io.StringIO()
+    assert tournament.query(team="Team A").export(file, format="jsonl") == len(expected)
+    objects = [json.loads(line) for line in file.getvalue().splitlines()]
+    assert [(obj["nickname"], obj["name"], obj["points"]) for obj in objects] == expected
+
+
+def test_invalid_query(tournament_path):
+    tournament = ToucanTournament("Query")
+    tournament.process_tournament(tournament_path)
+    with pytest.raises(ToucanException, match="The order 'points2' is not one of"):
+        tournament.query("points2")
+    with pytest.raises(ToucanException, match="The size of a page must be at least 1, not 0."):
+        tournament.query().page(0)
+    with pytest.raises(ToucanException, match="The export format 'xml' is not one of"):
+        tournament.query().export(io.StringIO(), format="xml")
+    with pytest.raises(ToucanException, match="The cursor 'abc' is not valid."):
+        tournament.query().page(5, "abc")
+    _, cursor = tournament.query("name").page(5)
+    with pytest.raises(ToucanException, match="does not belong to this query"):
+        tournament.query().page(5, cursor)
@@ -0,0 +1,182 @@
+import os
+from pathlib import Path
+import shutil
+from types import SimpleNamespace
+
+import pytest
+
+from toucan.mvp.calculator import ToucanTournament
+from toucan.mvp.calculator.errors import ToucanException
+from toucan.mvp.calculator.results import ToucanMatchResults
+from toucan.mvp.calculator.store import ToucanPointsStore
+
+DATA_PATH = Path(Path(__file__).parent, "data", "tournament")
+
+
+def _as_tuples(records):
+    return [
+        (record.discipline, record.teams, record.scores, record.winner, record.rows)
+        for record in records
+    ]
+
+
+def test_match_results():
+    tournament = ToucanTournament("Results")
+    tournament.process_tournament(DATA_PATH)
+
+    # Let's check the results of the reference matches
+    match = tournament.match_result(DATA_PATH / "match1.txt")
+    assert match.match_id == 0
+    assert match.source == str(DATA_PATH / "match1.txt")
+    assert match.discipline == "BASKETBALL"
+    assert match.teams == ("Team A", "Team B")
+    assert match.scores == (25, 32)
+    assert match.winner == "Team B"
+    assert match.rows[0] == ("nick1", "Team A", 33)
+    assert match.rows[3] == ("nick4", "Team B", 50)
+
+    # Matches can also be retrieved by identifier
+    match = tournament.match_result(1)
+    assert match.discipline == "HANDBALL"
+    assert match.winner == "Team A"
+    assert repr(match) == "ToucanMatchRecord(1, HANDBALL, Team A -35 - -54 Team B)"
+
+    # The points of each record add up to the total points of each player
+    for player in tournament.players:
+        records = tournament.player_results(player.nickname)
+        assert len(records) == 2
+        assert player.total_points == sum(
+            points
+            for record in records
+            for nickname, _, points in record.rows
+            if nickname == player.nickname
+        )
+    assert _as_tuples(tournament.team_results("Team A")) == _as_tuples(
+        [tournament.match_result(0), tournament.match_result(1)]
+    )
+
+
+@pytest.mark.parametrize("engine", ["python", "numpy"])
+@pytest.mark.parametrize("parser", ["text", "mmap"])
+@pytest.mark.parametrize("workers", [1, 2])
+def test_match_results_engines(engine, parser, workers):
+    # Every way of processing a tournament records the same results
+    if engine == "numpy":
+        pytest.importorskip("numpy")
+    ref_tournament = ToucanTournament("Ref")
+    ref_tournament.process_tournament(DATA_PATH)
+
+    tournament = ToucanTournament("Results", engine, parser=parser)
+    tournament.process_tournament(DATA_PATH, workers=workers)
+    for team in ("Team A", "Team B"):
+        records = tournament.team_results(team)
+        assert _as_tuples(records) == _as_tuples(ref_tournament.team_results(team))
+        assert [record.source for record in records] == [
+            str(DATA_PATH / "match1.txt"),
+            str(DATA_PATH / "match2.txt"),
+        ]
+
+
+def test_match_results_incremental(tmp_path):
+    shutil.copytree(DATA_PATH, tmp_path, dirs_exist_ok=True)
+    tournament = ToucanTournament("Results")
+    tournament.process_tournament(tmp_path, incremental=True)
+    assert len(tournament.team_results("Team A")) == 2
+
+    # Replace the second match by one played by other teams... the results follow
+    (tmp_path / "match2.txt").write_text(
+        "HANDBALL\nplayer 1;nick1;4;Team C;G;0;20\nplayer 7;nick7;4;Team D;G;1;25\n"
+    )
+    tournament.process_tournament(tmp_path, incremental=True)
+    assert _as_tuples(tournament.team_results("Team A")) == _as_tuples(
+        [tournament.match_result(tmp_path / "match1.txt")]
+    )
+    match = tournament.match_result(str(tmp_path / "match2.txt"))
+    assert match.teams == ("Team C", "Team D")
+    assert [record.teams for record in tournament.player_results("nick1")] == [
+        ("Team A", "Team B"),
+        ("Team C", "Team D"),
+    ]
+    assert tournament.team_results("Team D")[0].winner == "Team C"
+
+    # ...and removing a match removes its results
+    (tmp_path / "match2.txt").unlink()
+    tournament.process_tournament(tmp_path, incremental=True)
+    with pytest.raises(ToucanException, match="The team 'Team C' does not take part"):
+        tournament.team_results("Team C")
+    with pytest.raises(ToucanException, match="is not part of the tournament."):
+        tournament.match_result(tmp_path / "match2.txt")
+
+
+def test_match_results_retraction(tmp_path):
+    # Let's build a bigger tournament by replicating the reference matches
+    for idx in range(5):
+        for match_file in DATA_PATH.glob("*.txt"):
+            Path(tmp_path, f"{idx}_{match_file.name}").write_text(match_file.read_text())
+    tournament = ToucanTournament("Results")
+    tournament.process_tournament(tmp_path, incremental=True)
+
+    # Removing a few matches leaves their slots behind until they are compacted...
+    for name in ["1_match1.txt", "3_match2.txt"]:
+        (tmp_path / name).unlink()
+    tournament.process_tournament(tmp_path, incremental=True)
+    assert len(tournament._results) == 8
+    assert len(tournament.team_results("Team A")) == 8
+    assert [len(tournament.player_results(nickname)) for nickname in ["nick1", "nick4"]] == [8, 8]
+    with pytest.raises(ToucanException, match="is not part of the tournament."):
+        tournament.match_result(tmp_path / "1_match1.txt")
+
+    # ...which snapshots do before saving them
+    tournament.save(tmp_path / "results.snapshot")
+    loaded = ToucanTournament.load(tmp_path / "results.snapshot")
+    for nickname in ["nick1", "nick4"]:
+        assert _as_tuples(loaded.player_results(nickname)) == _as_tuples(
+            tournament.player_results(nickname)
+        )
+    assert loaded.mvp.total_points == tournament.mvp.total_points
+
+
+def test_match_results_snapshot(tmp_path):
+    tournament = ToucanTournament("Results")
+    tournament.process_tournament(DATA_PATH)
+    tournament.save(tmp_path / "results.snapshot")
+
+    loaded = ToucanTournament.load(tmp_path / "results.snapshot")
+    assert _as_tuples(loaded.player_results("nick3")) == _as_tuples(
+        tournament.player_results("nick3")
+    )
+    assert loaded.match_result(DATA_PATH / "match2.txt").winner == "Team A"
+
+
+def test_match_results_columns():
+    # The columns start narrow and are widened as needed... sources are kept as they were
+    store = ToucanPointsStore()
+    results = ToucanMatchResults(store)
+    player_ids = [store.new_player(), store.new_player()]
+    sources = [None, "match.txt", str(DATA_PATH / "match1.txt"), str(DATA_PATH) + os.sep]
+    for index, source in enumerate(sources):
+        match_id = store.new_match()
+        store.extend(player_ids, [1, 2])
+        scores = (index << 40, 300)
+        results.add(match_id, source, "HANDBALL", (f"T{index}", "U"), scores, ("G", "F"), (0, 1))
+    assert results.columns["score_as"].typecode == "q"
+    assert results.columns["score_bs"].typecode == "h"
+    assert results.columns["team_as"].typecode == "b"
+    for slot, source in enumerate(sources):
+        assert results.get_source(slot) == source
+        record = results.get_record(
+            slot, [SimpleNamespace(nickname="a"), SimpleNamespace(nickname="b")]
+        )
+        assert record.scores == (slot << 40, 300)
+        assert record.rows == [("a", f"T{slot}", 1), ("b", "U", 2)]
+
+
+def test_invalid_match_results():
+    tournament = ToucanTournament("Results")
+    tournament.process_tournament(DATA_PATH)
+    with pytest.raises(ToucanException, match="The match '5' is not part of the tournament."):
+        tournament.match_result(5)
+    with pytest.raises(ToucanException, match="The team 'Team Z' does not take part"):
+        tournament.team_results("Team Z")
+    with pytest.raises(ToucanException, match="The player 'nick9' does not take part"):
+        tournament.player_results("nick9")
@@ -0,0 +1,73 @@
+from pathlib import Path
+
+import pytest
+
+from toucan.mvp.calculator import ToucanTournament
+from toucan.mvp.calculator.discipline import ToucanDiscipline
+from toucan.mvp.calculator.errors import ToucanException, ToucanMatchError
+from toucan.mvp.calculator.players import ToucanPlayer
+from toucan.mvp.calculator.scoring import ToucanMatchBuffer
+
+DATA_PATH = Path(Path(__file__).parent, "data", "tournament")
+
+ROWS = [
+    ("Team A", "G", [10, 2]),
+    ("Team B", "F", [1, 1]),
+    ("Team A", "F", [4, 1]),
+    ("Team B", "G", [3, 5]),
+]
+
+
+def test_match_buffer():
+    # Let's buffer the records of a handball match...
+    match_buffer = ToucanMatchBuffer(ToucanDiscipline.HANDBALL)
+    for team, position, marks in ROWS:
+        match_buffer.add(team, position, marks)
+    assert len(match_buffer) == 4
+    assert match_buffer.teams == ["Team A", "Team B"]
+    assert match_buffer.sides == [0, 1, 0, 1]
+
+    # ...and compare them against the players' scoring once finalized
+    players, scores = [], [0, 0]
+    for team, position, marks in ROWS:
+        player = ToucanPlayer("", "")
+        player.add_match_points(marks, ToucanDiscipline.HANDBALL, position)
+        scores[match_buffer.teams.index(team)] += player.get_team_score_contribution(
+            marks, ToucanDiscipline.HANDBALL
+        )
+        players.append((team, player))
+    winner = match_buffer.teams[0 if scores[0] > scores[1] else 1]
+    for team, player in players:
+        if team == winner:
+            player.add_bonus_points()
+
+    points, team_scores = match_buffer.finalize()
+    assert points == [player.total_points for _, player in players]
+    assert team_scores == tuple(scores)
+
+
+def test_match_buffer_errors():
+    # Unknown positions and wrong amounts of marks are rejected when buffered...
+    match_buffer = ToucanMatchBuffer(ToucanDiscipline.HANDBALL)
+    with pytest.raises(ToucanException, match="Problems retrieving evaluation parameters"):
+        match_buffer.add("Team A", "X", [1, 2])
+    with pytest.raises(ToucanException, match="do not match the marks given"):
+        match_buffer.add("Team A", "G", [1, 2, 3])
+
+    # ...and matches not played by two teams when finalized
+    match_buffer.add("Team A", "G", [1, 2])
+    with pytest.raises(ToucanException, match="two teams, not 1"):
+        match_buffer.finalize()
+
+
+def test_invalid_match_leaves_no_points():
+    # A match which turns out to be invalid is not committed at all
+    tournament = ToucanTournament("Atomic")
+    tournament.process_tournament(DATA_PATH)
+    standings = [(player.nickname, player.points) for player in tournament.players]
+
+    lines = ["HANDBALL", "player 1;nick1;4;Team A;G;0;20", "player 7;nick7;1;Team A;F;1;1"]
+    with pytest.raises(ToucanMatchError, match="two teams, not 1"):
+        tournament.process_match(lines, "one_team.txt")
+    assert [(player.nickname, player.points) for player in tournament.players] == standings
+    assert tournament._store.n_matches == 2
@@ -0,0 +1,152 @@
+from pathlib import Path
+import socket
+import threading
+
+import pytest
+
+from toucan.mvp.calculator import ToucanTournament
+from toucan.mvp.calculator.cli import main
+from toucan.mvp.calculator.errors import ToucanException
+from toucan.mvp.calculator.shard import (
+    FRAME_HEADER,
+    MAX_FRAME_BYTES,
+    ToucanShardCoordinator,
+    run_shard,
+    send_partial,
+)
+
+REF_PATH = Path(Path(__file__).parent, "data", "tournament")
+
+
+@pytest.fixture
+def tournament_dir(tmp_path):
+    # Let's build a bigger tournament by replicating the reference matches
+    dir = Path(tmp_path, "tournament")
+    dir.mkdir()
+    for idx in range(8):
+        for match_file in REF_PATH.glob("*.txt"):
+            Path(dir, f"{idx}_{match_file.name}").write_text(match_file.read_text())
+    return dir
+
+
+def get_standings(tournament):
+    return [(player.nickname, player.points) for player in tournament.players]
+
+
+@pytest.fixture
+def single(tournament_dir):
+    tournament = ToucanTournament("Single")
+    tournament.process_tournament(tournament_dir)
+    return get_standings(tournament)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_coordinator_local(tournament_dir, single, workers):
+    # Shards processed in local worker processes
+    coordinator = ToucanShardCoordinator("Sharded", 3)
+    assert coordinator.shards == 3
+    tournament = coordinator.run(tournament_dir, workers=workers)
+    assert tournament.name == "Sharded"
+    assert get_standings(tournament) == single
+    with pytest.raises(ToucanException, match="at least 1"):
+        coordinator.run(tournament_dir, workers=0)
+
+
+def test_coordinator_files(tournament_dir, single, tmp_path):
+    # Shards saved to files by their workers (e.g. on a shared file system)
+    paths = [Path(tmp_path, f"shard{shard}.json") for shard in range(2)]
+    coordinator = ToucanShardCoordinator("Sharded", 2)
+    with pytest.raises(ToucanException, match="Timed out"):
+        coordinator.collect_files(paths, timeout=0.05, interval=0.01)
+    for shard, path in enumerate(paths):
+        run_shard(tournament_dir, shard, 2, path)
+    assert get_standings(coordinator.collect_files(paths, timeout=5)) == single
+
+    # Partial results of another amount of shards are rejected
+    with pytest.raises(ToucanException, match="does not belong to a tournament of 3 shards"):
+        ToucanShardCoordinator("Sharded", 3).collect_files(paths)
+    with pytest.raises(ToucanException, match="at least 1"):
+        ToucanShardCoordinator("Sharded", 0)
+
+
+def test_coordinator_socket(tournament_dir, single):
+    # Shards sent over TCP by their workers (e.g. on other hosts)
+    coordinator = ToucanShardCoordinator("Sharded", 3)
+    address = coordinator.listen()
+    workers = [
+        threading.Thread(target=run_shard, args=(tournament_dir, shard, 3, address))
+        for shard in range(3)
+    ]
+    for worker in workers:
+        worker.start()
+    tournament = coordinator.collect_socket(timeout=10)
+    for worker in workers:
+        worker.join()
+    assert get_standings(tournament) == single
+
+    # Missing shards are reported when timing out
+    coordinator = ToucanShardCoordinator("Sharded", 2)
+    send_partial(run_shard(tournament_dir, 0, 2), coordinator.listen())
+    with pytest.raises(ToucanException, match="shards \\[1\\]"):
+        coordinator.collect_socket(timeout=0.5)
+
+
+def test_coordinator_socket_rejected(tournament_dir, single):
+    # Bad connections are rejected... while the valid partial results keep being collected
+    coordinator = ToucanShardCoordinator("Sharded", 2)
+    address = coordinator.listen()
+    with socket.create_connection(address) as connection:
+        connection.sendall(FRAME_HEADER.pack(5) + b"oops!")
+    with socket.create_connection(address) as connection:
+        connection.sendall(b"\0\0")
+    send_partial(run_shard(tournament_dir, 0, 3), address)
+    for shard in range(2):
+        send_partial(run_shard(tournament_dir, shard, 2), address)
+    tournament = coordinator.collect_socket(timeout=10)
+    assert get_standings(tournament) == single
+    assert len(coordinator.rejected) == 3
+    assert "Invalid partial result" in coordinator.rejected[0]
+    assert "connection was closed" in coordinator.rejected[1]
+    assert "does not belong to a tournament of 2 shards" in coordinator.rejected[2]
+
+    # Oversized frames are rejected before receiving them
+    coordinator = ToucanShardCoordinator("Sharded", 1)
+    address = coordinator.listen()
+    with socket.create_connection(address) as connection:
+        connection.sendall(FRAME_HEADER.pack(MAX_FRAME_BYTES + 1) + b"oops!")
+    send_partial(run_shard(tournament_dir, 0, 1), address)
+    assert get_standings(coordinator.collect_socket(timeout=10)) == single
+    assert len(coordinator.rejected) == 1
+    assert f"exceeds the limit of {MAX_FRAME_BYTES} bytes" in coordinator.rejected[0]
+
+    # Rejected connections are reported when timing out
+    coordinator = ToucanShardCoordinator("Sharded", 2)
+    send_partial(run_shard(tournament_dir, 0, 3), coordinator.listen())
+    with pytest.raises(ToucanException, match="shards \\[0, 1\\] \\(1 rejected connections\\)"):
+        coordinator.collect_socket(timeout=0.5)
+
+
+def test_cli_sharded(tournament_dir, tmp_path, capsys):
+    # Each shard is processed by its own command, then merged
+    paths = [str(Path(tmp_path, f"shard{shard}.json")) for shard in range(2)]
+    for shard, path in enumerate(paths):
+        assert main([str(tournament_dir), "--shard", f"{shard}/2", "--partial-output", path]) == 0
+    assert main([str(tournament_dir), "--format", "csv"]) == 0
+    expected = capsys.readouterr().out
+    assert main(paths + ["--merge", "--format", "csv"]) == 0
+    assert capsys.readouterr().out == expected
+
+    # Shards must be valid and delivered somewhere
+    assert main([str(tournament_dir), "--shard", "0/2"]) == 2
+    assert "--shard requires" in capsys.readouterr().err
+    with pytest.raises(SystemExit):
+        main([str(tournament_dir), "--shard", "2/2", "--partial-output", paths[0]])
+    with pytest.raises(SystemExit):
+        main([str(tournament_dir), "--shard", "0/2", "--coordinator", "localhost"])
+
+
+def test_send_partial_too_large(tournament_dir, monkeypatch):
+    # Partial results exceeding the frame limit are not even sent
+    monkeypatch.setattr("toucan.mvp.calculator.shard.MAX_FRAME_BYTES", 16)
+    with pytest.raises(ToucanException, match="exceeds the limit of 16 bytes"):
+        send_partial(run_shard(tournament_dir, 0, 1), ("127.0.0.1", 1))
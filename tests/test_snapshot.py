@@ -0,0 +1,136 @@
+from pathlib import Path
+
+import pytest
+
+from toucan.mvp.calculator import ToucanTournament
+from toucan.mvp.calculator.errors import ToucanException
+from toucan.mvp.calculator.snapshot import read_snapshot
+
+DATA_PATH = Path(Path(__file__).parent, "data", "tournament")
+
+
+def test_snapshot_roundtrip(tmp_path):
+    # Let's process the reference tournament and save it
+    tournament = ToucanTournament("ReferenceTournament")
+    tournament.process_tournament(DATA_PATH, incremental=True)
+    snapshot = Path(tmp_path, "tournament.snapshot")
+    tournament.save(snapshot)
+
+    # Load it back... it should be exactly the same
+    loaded = ToucanTournament.load(snapshot)
+    assert loaded.name == "ReferenceTournament"
+    assert loaded.mvp.nickname == "nick3"
+    assert loaded.mvp.total_points == 72
+    assert [player.nickname for player in loaded.players] == [
+        player.nickname for player in tournament.players
+    ]
+    for player in tournament.players:
+        assert loaded._players[player.nickname].points == player.points
+    assert [player.nickname for player in loaded.top(6)] == [
+        player.nickname for player in tournament.top(6)
+    ]
+
+    # The points are not copied, but memory-mapped (with the typecodes they were widened to)
+    assert all(isinstance(column, memoryview) for column in loaded._store.columns.values())
+    assert [column.format for column in loaded._store.columns.values()] == [
+        column.typecode for column in tournament._store.columns.values()
+    ]
+
+    # ...and so are the match results, which can be queried all the same
+    assert all(isinstance(column, memoryview) for column in loaded._results.columns.values())
+    for match_file in DATA_PATH.glob("*.txt"):
+        assert vars(loaded.match_result(match_file)) == vars(tournament.match_result(match_file))
+    assert [vars(record) for record in loaded.player_results("nick3")] == [
+        vars(record) for record in tournament.player_results("nick3")
+    ]
+    assert [vars(record) for record in loaded.team_results("Team A")] == [
+        vars(record) for record in tournament.team_results("Team A")
+    ]
+
+    # Loaded tournaments can keep on being processed incrementally... nothing changed!
+    loaded.process_tournament(DATA_PATH, incremental=True)
+    assert loaded.mvp.total_points == 72
+    assert all(isinstance(column, memoryview) for column in loaded._store.columns.values())
+
+    # ...or not, which modifies (and thus copies) the points
+    loaded.process_tournament(DATA_PATH)
+    assert loaded.mvp.total_points == 2 * 72
+    assert not any(isinstance(column, memoryview) for column in loaded._store.columns.values())
+    assert not any(isinstance(column, memoryview) for column in loaded._results.columns.values())
+    assert len(loaded.player_results("nick3")) == 2 * len(tournament.player_results("nick3"))
+
+
+def test_snapshot_empty_tournament(tmp_path):
+    # Empty tournaments can be saved and loaded as well
+    snapshot = Path(tmp_path, "empty.snapshot")
+    ToucanTournament("EmptyTournament").save(snapshot)
+    loaded = ToucanTournament.load(snapshot)
+    assert loaded.mvp is None
+    assert list(loaded.players) == []
+
+
+def test_invalid_snapshot(tmp_path):
+    # Let's try to load files which are not snapshots
+    empty = Path(tmp_path, "empty.snapshot")
+    empty.write_bytes(b"")
+    with pytest.raises(ToucanException, match="is not a valid tournament snapshot"):
+        read_snapshot(empty)
+
+    short = Path(tmp_path, "short.snapshot")
+    short.write_bytes(b"TOUCAN")
+    with pytest.raises(ToucanException, match="is not a valid tournament snapshot"):
+        read_snapshot(short)
+
+    with pytest.raises(ToucanException, match="is not a valid tournament snapshot"):
+        read_snapshot(Path(DATA_PATH, "match1.txt"))
+
+    # ...or snapshots of another version
+    snapshot = Path(tmp_path, "tournament.snapshot")
+    ToucanTournament("EmptyTournament").save(snapshot)
+    data = bytearray(snapshot.read_bytes())
+    data[8] = 42
+    snapshot.write_bytes(bytes(data))
+    with pytest.raises(ToucanException, match="The snapshot version 42 is not supported"):
+        read_snapshot(snapshot)
+
+
+def test_truncated_snapshot(tmp_path):
+    # Let's load snapshots cut short or with corrupt sizes
+    snapshot = Path(tmp_path, "tournament.snapshot")
+    tournament = ToucanTournament("ReferenceTournament")
+    tournament.process_tournament(DATA_PATH)
+    tournament.save(snapshot)
+    data = snapshot.read_bytes()
+
+    truncated = Path(tmp_path, "truncated.snapshot")
+    for size in [64, len(data) // 2, len(data) - 1]:
+        truncated.write_bytes(data[:size])
+        with pytest.raises(ToucanException, match="is not a valid tournament snapshot"):
+            read_snapshot(truncated)
+
+    # A number of rows larger than the file
+    corrupt = bytearray(data)
+    corrupt[24:32] = (1 << 40).to_bytes(8, "little")
+    truncated.write_bytes(bytes(corrupt))
+    with pytest.raises(ToucanException, match="is not a valid tournament snapshot"):
+        read_snapshot(truncated)
+
+    # An unknown column typecode
+    corrupt = bytearray(data)
+    corrupt[64] = ord("d")
+    truncated.write_bytes(bytes(corrupt))
+    with pytest.raises(ToucanException, match="is not a valid tournament snapshot"):
+        read_snapshot(truncated)
+
+
+def test_snapshot_overwrite(tmp_path):
+    # Let's save a loaded tournament over its own (memory-mapped) snapshot
+    snapshot = Path(tmp_path, "tournament.snapshot")
+    tournament = ToucanTournament("ReferenceTournament")
+    tournament.process_tournament(DATA_PATH)
+    tournament.save(snapshot)
+
+    loaded = ToucanTournament.load(snapshot)
+    loaded.save(snapshot)
+    assert loaded.mvp.total_points == 72
+    assert ToucanTournament.load(snapshot).mvp.total_points == 72
@@ -0,0 +1,173 @@
+import io
+from pathlib import Path
+import tarfile
+import zipfile
+
+import pytest
+
+from toucan.mvp.calculator import ToucanTournament
+from toucan.mvp.calculator.cache import ToucanMatchCache
+from toucan.mvp.calculator.errors import ToucanException, ToucanMatchError
+from toucan.mvp.calculator.sources import is_archive, iter_archive_members, iter_match_lines
+
+DATA_PATH = Path(Path(__file__).parent, "data", "tournament")
+ERROR_PATH = Path(Path(__file__).parent, "data", "tournament_error1")
+MATCH_FILES = sorted(path for path in DATA_PATH.iterdir() if path.is_file())
+
+
+def get_standings(tournament):
+    return [(player.nickname, player.total_points) for player in tournament.players]
+
+
+def get_reference_standings():
+    tournament = ToucanTournament("Reference")
+    tournament.process_tournament(DATA_PATH)
+    return get_standings(tournament), tournament.mvp.nickname
+
+
+def write_zip(path, match_files):
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("folder/", "")
+        archive.writestr("folder/.gitignore", "*")
+        for match_file in reversed(match_files):
+            archive.write(match_file, match_file.name)
+    return path
+
+
+def write_tar(path, match_files, mode="w:gz"):
+    with tarfile.open(path, mode) as archive:
+        for match_file in match_files:
+            archive.add(match_file, match_file.name)
+    return path
+
+
+@pytest.mark.parametrize("engine", ["python", "numpy"])
+@pytest.mark.parametrize("parser", ["text", "mmap"])
+@pytest.mark.parametrize("workers", [1, 2])
+@pytest.mark.parametrize("kind", ["zip", "tar.gz", "tar.xz"])
+def test_process_archive(tmp_path, engine, parser, workers, kind):
+    if engine == "numpy":
+        pytest.importorskip("numpy")
+
+    # Processing an archive is the same as processing the extracted directory
+    if kind == "zip":
+        archive = write_zip(tmp_path / "matches.zip", MATCH_FILES)
+    else:
+        archive = write_tar(tmp_path / f"matches.{kind}", MATCH_FILES, f"w:{kind[4:]}")
+    assert is_archive(archive)
+    tournament = ToucanTournament("Archive", engine, parser=parser)
+    assert tournament.process_tournament(archive, workers=workers) == []
+    assert (get_standings(tournament), tournament.mvp.nickname) == get_reference_standings()
+
+    # Each match is identified by the archive and the name of its member
+    record = tournament.match_result(archive / "match1.txt")
+    assert record.source == str(archive / "match1.txt")
+
+    # Archives cannot be processed incrementally
+    with pytest.raises(ToucanException, match="cannot be processed incrementally"):
+        ToucanTournament("Archive").process_tournament(archive, incremental=True)
+
+
+def test_hidden_files(tmp_path):
+    # Hidden files are skipped alike in directories and archives
+    directory = tmp_path / "matches"
+    directory.mkdir()
+    for match_file in MATCH_FILES:
+        (directory / match_file.name).write_bytes(match_file.read_bytes())
+    (directory / ".DS_Store").write_bytes(b"\0\1\2")
+    (directory / ".match0.txt.swp").write_text("not a match\n")
+    archive = tmp_path / "matches.tar"
+    with tarfile.open(archive, "w") as tar_file:
+        tar_file.add(directory, "matches")
+
+    for source in [directory, archive]:
+        tournament = ToucanTournament("Hidden")
+        assert tournament.process_tournament(source) == []
+        assert (get_standings(tournament), tournament.mvp.nickname) == get_reference_standings()
+
+
+def test_process_archive_stream(tmp_path):
+    # Tar archives are streamed, even from non-seekable file-like objects...
+    data = write_tar(tmp_path / "matches.tar.gz", MATCH_FILES).read_bytes()
+
+    class Socket(io.RawIOBase):
+        def __init__(self, data):
+            self._data = io.BytesIO(data)
+
+        def readable(self):
+            return True
+
+        def seekable(self):
+            return False
+
+        def readinto(self, buffer):
+            return self._data.readinto(buffer)
+
+    tournament = ToucanTournament("Stream")
+    tournament.process_archive(Socket(data))
+    assert (get_standings(tournament), tournament.mvp.nickname) == get_reference_standings()
+    assert tournament.match_result("match2.txt").source == "match2.txt"
+
+    # ...whereas zip archives are read in sorted name order from seekable ones
+    data = write_zip(tmp_path / "matches.zip", MATCH_FILES).read_bytes()
+    stream = io.BytesIO(data)
+    assert [name for name, _ in iter_archive_members(stream)] == ["match1.txt", "match2.txt"]
+    stream.seek(0)
+    tournament = ToucanTournament("Stream", cache=ToucanMatchCache())
+    tournament.process_archive(stream)
+    assert (get_standings(tournament), tournament.mvp.nickname) == get_reference_standings()
+
+
+def test_process_archive_errors(tmp_path, monkeypatch):
+    # Invalid match files of an archive can be collected...
+    archive = write_zip(tmp_path / "errors.zip", MATCH_FILES)
+    with zipfile.ZipFile(archive, "a") as zip_file:
+        zip_file.write(Path(ERROR_PATH, "match1.txt"), "match3.txt")
+    tournament = ToucanTournament("Errors")
+    monkeypatch.setattr("toucan.mvp.calculator.tournament.ARCHIVE_BATCH_FILES", 1)
+    with pytest.raises(ToucanException):
+        ToucanTournament("Errors").process_archive(archive)
+
+    errors = tournament.process_archive(archive, errors="collect")
+    assert [error.source for error in errors] == [str(archive / "match3.txt")]
+    assert isinstance(errors[0], ToucanMatchError)
+    with pytest.raises(ToucanException, match="Too many invalid match files"):
+        ToucanTournament("Errors").process_archive(archive, errors="collect", max_errors=0)
+
+    # ...and files which are not archives are rejected
+    not_archive = tmp_path / "matches.txt"
+    not_archive.write_bytes(MATCH_FILES[0].read_bytes())
+    assert not is_archive(not_archive)
+    with pytest.raises(ToucanException, match="is neither a zip nor a tar file"):
+        ToucanTournament("Errors").process_archive(not_archive)
+
+
+@pytest.mark.parametrize("engine", ["python", "numpy"])
+@pytest.mark.parametrize("parser", ["text", "mmap"])
+@pytest.mark.parametrize("kind", ["bytes", "binary", "text", "byte_lines", "str_lines"])
+def test_process_match_stream(engine, parser, kind):
+    if engine == "numpy":
+        pytest.importorskip("numpy")
+
+    # Matches can be processed from their contents, without any file
+    tournament = ToucanTournament("Streams", engine, parser=parser)
+    for match_file in MATCH_FILES:
+        data = match_file.read_bytes()
+        stream = {
+            "bytes": data,
+            "binary": io.BytesIO(data),
+            "text": io.StringIO(data.decode()),
+            "byte_lines": data.splitlines(keepends=True),
+            "str_lines": data.decode().splitlines(),
+        }[kind]
+        tournament.process_match(stream, match_file.name)
+    assert (get_standings(tournament), tournament.mvp.nickname) == get_reference_standings()
+    assert tournament.match_result("match1.txt").source == "match1.txt"
+
+
+def test_iter_match_lines():
+    # Lines are decoded one at a time, without their line breaks
+    assert list(iter_match_lines(io.BytesIO(b"a\r\nb\n"))) == ["a", "b"]
+    assert list(iter_match_lines([b"a\n", "b"])) == ["a", "b"]
+    assert list(iter_match_lines(b"a\r\nb")) == ["a", "b"]
+    assert list(iter_match_lines(io.StringIO("a\r\nb\n"))) == ["a", "b"]
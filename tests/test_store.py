@@ -0,0 +1,157 @@
+import pytest
+
+from toucan.mvp.calculator.errors import ToucanException
+from toucan.mvp.calculator.store import POINTS_RANGE, ToucanPointsStore
+
+
+def test_points_store():
+    # Let's register a couple of players and matches
+    store = ToucanPointsStore()
+    player_a, player_b = store.new_player(), store.new_player()
+    assert (player_a, player_b) == (0, 1)
+    assert store.n_players == 2
+
+    first_match = store.new_match()
+    store.append(player_a, 10)
+    store.append(player_b, 5)
+    store.add_to_last(player_a, 10)
+
+    second_match = store.new_match()
+    store.append(player_b, 7)
+    store.append(player_a, 3)
+    store.add_to_last(player_b, 10)
+
+    # Check the rows and running totals
+    assert store.n_rows == 4
+    assert store.points_of(player_a) == [20, 3]
+    assert store.points_of(player_b) == [5, 17]
+    assert store.total(player_a) == 23
+    assert store.total(player_b) == 22
+    assert store.row_count(player_a) == 2
+
+    # Now, drop the first match
+    assert store.drop_matches([first_match]) == {player_a, player_b}
+    assert store.n_rows == 2
+    assert store.points_of(player_a) == [3]
+    assert store.points_of(player_b) == [17]
+    assert store.total(player_a) == 3
+    assert store.total(player_b) == 17
+
+    # Bonus points should still go to the last row of each player
+    store.add_to_last(player_a, 10)
+    assert store.points_of(player_a) == [13]
+
+    # Dropping nothing does nothing... while dropping everything leaves no rows
+    assert store.drop_matches([]) == set()
+    assert store.n_rows == 2
+    store.drop_matches([second_match])
+    assert store.n_rows == 0
+    assert store.points_of(player_a) == []
+    assert store.total(player_a) == 0
+    assert store.row_count(player_a) == 0
+
+
+def test_points_store_extend():
+    # All the rows of a match can be added at once
+    store = ToucanPointsStore()
+    player_a, player_b = store.new_player(), store.new_player()
+    store.new_match()
+    store.extend([player_a, player_b], [20, 5])
+    store.new_match()
+    store.extend([player_b, player_a], [17, 3])
+
+    assert store.n_rows == 4
+    assert store.points_of(player_a) == [20, 3]
+    assert store.points_of(player_b) == [5, 17]
+    assert store.total(player_a) == 23
+    assert store.row_count(player_b) == 2
+    store.add_to_last(player_b, 10)
+    assert store.points_of(player_b) == [5, 27]
+
+    # The rows of each match are found by its identifier
+    assert [list(column) for column in store.match_rows(1)] == [[player_b, player_a], [27, 3]]
+    assert [list(column) for column in store.match_rows(2)] == [[], []]
+
+
+def test_points_store_overflow():
+    # Points which do not fit in the store are rejected before modifying it
+    store = ToucanPointsStore()
+    player_a, player_b = store.new_player(), store.new_player()
+    store.new_match()
+    store.extend([player_a, player_b], [POINTS_RANGE[1], 5])
+    store.new_match()
+    for player_ids, points in [
+        ([player_b, player_a], [5, 1]),
+        ([player_b], [POINTS_RANGE[0] - 1]),
+    ]:
+        with pytest.raises(ToucanException, match="does not fit in the store"):
+            store.extend(player_ids, points)
+    with pytest.raises(ToucanException, match="does not fit in the store"):
+        store.append(player_a, 1)
+    with pytest.raises(ToucanException, match="does not fit in the store"):
+        store.add_to_last(player_a, 1)
+
+    # ...so all of its columns are left untouched
+    assert store.n_rows == 2
+    assert {column: len(values) for column, values in store.columns.items()} == {
+        "player_ids": 2,
+        "points": 2,
+        "match_starts": 2,
+        "totals": 2,
+        "row_counts": 2,
+        "last_rows": 2,
+    }
+    assert store.points_of(player_b) == [5]
+    assert store.total(player_b) == 5
+    assert store.row_count(player_b) == 1
+
+    # The rows of a player are found after further rows are added too
+    store.extend([player_b, player_b], [1, 2])
+    assert store.points_of(player_b) == [5, 1, 2]
+    store.append(player_b, 3)
+    assert store.points_of(player_b) == [5, 1, 2, 3]
+
+
+def test_points_store_typecodes():
+    # The columns of the rows start narrow and are widened as needed
+    store = ToucanPointsStore()
+    player_ids = [store.new_player() for _ in range(200)]
+    store.new_match()
+    store.extend(player_ids[:2], [20, -5])
+    assert store.columns["player_ids"].typecode == "h"
+    assert store.columns["points"].typecode == "b"
+    store.extend(player_ids[2:4], [1 << 20, 3])
+    assert store.columns["points"].typecode == "i"
+    store.add_to_last(player_ids[1], -(1 << 40))
+    assert store.columns["points"].typecode == "q"
+    assert store.points_of(player_ids[0]) == [20]
+    assert store.points_of(player_ids[1]) == [-5 - (1 << 40)]
+    assert store.points_of(player_ids[2]) == [1 << 20]
+
+
+def test_points_store_dropped_rows():
+    # Dropping a few matches only marks their rows...
+    store = ToucanPointsStore()
+    player_a, player_b = store.new_player(), store.new_player()
+    for player_ids, points in [([player_a, player_b], [1, 2]), ([player_a, player_b], [3, 4])]:
+        store.new_match()
+        store.extend(player_ids, points)
+    last_match = store.new_match()
+    store.append(player_a, 5)
+    store.new_match()
+    store.append(player_b, 6)
+
+    assert store.drop_matches([last_match]) == {player_a}
+    assert store.n_rows == 5
+    assert len(store.columns["points"]) == 6
+    assert store.total(player_a) == 4
+
+    # ...the bonus points then go to the last row left
+    store.add_to_last(player_a, 10)
+    assert store.points_of(player_a) == [1, 13]
+
+    # Once most of the rows are dropped, they are compacted
+    assert store.drop_matches([0, 1]) == {player_a, player_b}
+    assert store.n_rows == len(store.columns["points"]) == 1
+    assert store.points_of(player_b) == [6]
+    assert (store.total(player_a), store.row_count(player_a)) == (0, 0)
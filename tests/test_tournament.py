@@ -1,9 +1,12 @@
+import asyncio
+import os
 from pathlib import Path
 
 import pytest
 
 from toucan.mvp.calculator import ToucanTournament
 from toucan.mvp.calculator.errors import ToucanException
+from toucan.mvp.calculator.tournament import _score_match_file
 
 
 def test_ref_tournament():
@@ -54,3 +57,350 @@ def test_invalid_match_files():
         ToucanException, match=f"Failed to process tournament... error on match file"
     ):
         tournament.process_tournament(DATA_PATH)
+
+
+def test_parallel_tournament(tmp_path):
+    # Let's build a bigger tournament by replicating the reference matches
+    REF_PATH = Path(Path(__file__).parent, "data", "tournament")
+    for idx in range(5):
+        for match_file in REF_PATH.glob("*.txt"):
+            Path(tmp_path, f"{idx}_{match_file.name}").write_text(match_file.read_text())
+
+    # Process the tournament both serially and in parallel
+    serial = ToucanTournament("SerialTournament")
+    serial.process_tournament(tmp_path)
+    parallel = ToucanTournament("ParallelTournament")
+    parallel.process_tournament(tmp_path, workers=2)
+
+    # Both of them should end up being exactly the same
+    assert parallel.mvp.nickname == serial.mvp.nickname == "nick3"
+    assert parallel.mvp.total_points == serial.mvp.total_points == 72 * 5
+    assert [player.nickname for player in parallel.players] == [
+        player.nickname for player in serial.players
+    ]
+    for player in serial.players:
+        assert parallel._players[player.nickname].points == player.points
+
+
+@pytest.mark.parametrize("engine", ["python", "numpy"])
+@pytest.mark.parametrize("parser", ["text", "mmap"])
+def test_score_match_file(engine, parser):
+    # The worker processes only send back the outcome of each player record
+    match_file = Path(Path(__file__).parent, "data", "tournament", "match1.txt")
+    discipline, teams, scores, rows = _score_match_file(match_file, engine, parser)
+    assert (discipline, teams) == ("BASKETBALL", ("Team A", "Team B"))
+    assert [row[:4] for row in rows] == [
+        (f"player {idx}", f"nick{idx}", position, idx // 4)
+        for idx, position in enumerate(["G", "F", "C", "G", "F", "C"], start=1)
+    ]
+
+    # ...which is enough for merging the match into a tournament
+    serial = ToucanTournament("SerialTournament")
+    serial.process_match(match_file)
+    assert [row[4] for row in rows] == [player.total_points for player in serial.players]
+    assert scores == serial.match_result(0).scores
+
+
+def test_parallel_invalid_match_files():
+    # Errors in the worker processes should be raised as well
+    DATA_PATH = Path(Path(__file__).parent, "data", "tournament_error1")
+    tournament = ToucanTournament("InvalidMatchDataTournament")
+    with pytest.raises(
+        ToucanException, match=f"Failed to process tournament... error on match file"
+    ):
+        tournament.process_tournament(DATA_PATH, workers=2)
+
+    # An invalid amount of workers should raise as well
+    with pytest.raises(ToucanException, match="The number of workers must be at least 1"):
+        tournament.process_tournament(DATA_PATH, workers=0)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_collect_invalid_match_files(tmp_path, workers):
+    # Let's mix the reference matches with several kinds of invalid ones
+    REF_PATH = Path(Path(__file__).parent, "data", "tournament")
+    for match_file in REF_PATH.glob("*.txt"):
+        Path(tmp_path, match_file.name).write_text(match_file.read_text())
+    valid_lines = (REF_PATH / "match1.txt").read_text().splitlines()
+    Path(tmp_path, "match0.txt").write_text("\n".join(valid_lines[:3] + ["oops"]))
+    Path(tmp_path, "match3.txt").write_text("CHESS\n")
+    Path(tmp_path, "match4.txt").write_text("\n".join(valid_lines[:4]))
+    Path(tmp_path, "match5.bin").write_bytes(b"\xff\xfe")
+
+    # The invalid matches are reported... without leaving points behind
+    tournament = ToucanTournament("CollectTournament")
+    errors = tournament.process_tournament(tmp_path, workers=workers, errors="collect")
+    assert tournament.mvp.nickname == "nick3"
+    assert tournament.mvp.total_points == 72
+    assert [(Path(error.source).name, error.line) for error in errors] == [
+        ("match0.txt", 4),
+        ("match3.txt", 1),
+        ("match4.txt", None),
+        ("match5.bin", None),
+    ]
+    assert "does not match the BASKETBALL format" in errors[0].reason
+    assert "'CHESS' is not implemented" in errors[1].reason
+    assert "two teams, not 1" in errors[2].reason
+
+    # Giving up once too many errors are found
+    tournament = ToucanTournament("CappedTournament")
+    with pytest.raises(ToucanException, match="Too many invalid match files \\(2\\)"):
+        tournament.process_tournament(tmp_path, workers=workers, errors="collect", max_errors=1)
+    with pytest.raises(ToucanException, match="The error mode 'ignore' is not one of"):
+        tournament.process_tournament(tmp_path, errors="ignore")
+    with pytest.raises(ToucanException, match="cannot be negative"):
+        tournament.process_tournament(tmp_path, errors="collect", max_errors=-1)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+@pytest.mark.parametrize("parser", ["text", "mmap"])
+def test_collect_empty_marks(tmp_path, workers, parser):
+    # An empty mark is an invalid line, not a crash of the whole run
+    REF_PATH = Path(Path(__file__).parent, "data", "tournament")
+    for match_file in REF_PATH.glob("*.txt"):
+        Path(tmp_path, match_file.name).write_text(match_file.read_text())
+    valid_lines = (REF_PATH / "match1.txt").read_text().splitlines()
+    Path(tmp_path, "match0.txt").write_text(
+        "\n".join(valid_lines[:2] + ["player 1;nick1;4;Team A;G;;2;7"] + valid_lines[3:])
+    )
+
+    tournament = ToucanTournament("EmptyMarksTournament", parser=parser)
+    errors = tournament.process_tournament(tmp_path, workers=workers, errors="collect")
+    assert tournament.mvp.nickname == "nick3"
+    assert [(Path(error.source).name, error.line) for error in errors] == [("match0.txt", 3)]
+    assert "does not match the BASKETBALL format" in errors[0].reason
+
+
+@pytest.mark.parametrize("engine", ["python", "numpy"])
+@pytest.mark.parametrize("workers", [1, 2])
+@pytest.mark.parametrize("mark", [99999999999999999999, 5000000000000000000])
+def test_large_marks(tmp_path, engine, workers, mark):
+    # Points which do not fit in the store make the match invalid as a whole
+    REF_PATH = Path(Path(__file__).parent, "data", "tournament")
+    for match_file in REF_PATH.glob("*.txt"):
+        Path(tmp_path, match_file.name).write_text(match_file.read_text())
+    valid_lines = (REF_PATH / "match1.txt").read_text().splitlines()
+    Path(tmp_path, "match0.txt").write_text(
+        "\n".join(valid_lines[:1] + [f"player 0;nick0;4;Team A;G;{mark};2;7"] + valid_lines[2:])
+    )
+
+    tournament = ToucanTournament("LargeMarksTournament", engine)
+    with pytest.raises(ToucanException, match="does not fit in the store"):
+        tournament.process_tournament(tmp_path, workers=workers)
+    assert list(tournament.players) == []
+
+    tournament = ToucanTournament("LargeMarksTournament", engine)
+    errors = tournament.process_tournament(tmp_path, workers=workers, errors="collect")
+    assert [(Path(error.source).name, error.line) for error in errors] == [("match0.txt", None)]
+    assert "does not fit in the store" in errors[0].reason
+    assert "nick0" not in [player.nickname for player in tournament.players]
+    assert (tournament.mvp.nickname, tournament.mvp.total_points) == ("nick3", 72)
+
+
+@pytest.mark.parametrize("engine", ["python", "numpy"])
+@pytest.mark.parametrize("parser", ["text", "mmap"])
+@pytest.mark.parametrize("workers", [1, 2])
+def test_large_team_scores(tmp_path, engine, parser, workers):
+    # Team scores which do not fit in the store make the match invalid as well,
+    # even if the points of each player do fit
+    if engine == "numpy":
+        pytest.importorskip("numpy")
+    REF_PATH = Path(Path(__file__).parent, "data", "tournament")
+    for match_file in REF_PATH.glob("*.txt"):
+        Path(tmp_path, match_file.name).write_text(match_file.read_text())
+    mark = 1 << 62
+    Path(tmp_path, "match0.txt").write_text(
+        "\n".join(
+            ["HANDBALL"]
+            + [f"player {idx};nick{idx}0;{idx};Team A;F;{mark};0" for idx in range(3)]
+            + ["player 3;nick30;3;Team B;F;1;0"]
+        )
+    )
+
+    tournament = ToucanTournament("LargeScoresTournament", engine, parser=parser)
+    with pytest.raises(ToucanException, match="does not fit in the store"):
+        tournament.process_tournament(tmp_path, workers=workers)
+    assert list(tournament.players) == []
+
+    tournament = ToucanTournament("LargeScoresTournament", engine, parser=parser)
+    errors = tournament.process_tournament(tmp_path, workers=workers, errors="collect")
+    assert [(Path(error.source).name, error.line) for error in errors] == [("match0.txt", None)]
+    assert "does not fit in the store" in errors[0].reason
+    assert "nick00" not in [player.nickname for player in tournament.players]
+    assert len(tournament.team_results("Team A")) == 2
+    assert (tournament.mvp.nickname, tournament.mvp.total_points) == ("nick3", 72)
+
+
+def test_incremental_collect_invalid_match_files(tmp_path):
+    REF_PATH = Path(Path(__file__).parent, "data", "tournament")
+    for match_file in REF_PATH.glob("*.txt"):
+        Path(tmp_path, match_file.name).write_text(match_file.read_text())
+    Path(tmp_path, "match3.txt").write_text("CHESS\n")
+
+    # The invalid match file is retried until it gets fixed
+    tournament = ToucanTournament("IncrementalCollectTournament")
+    errors = tournament.process_tournament(tmp_path, incremental=True, errors="collect")
+    assert len(errors) == 1
+    errors = tournament.process_tournament(tmp_path, incremental=True, errors="collect")
+    assert len(errors) == 1
+    Path(tmp_path, "match3.txt").write_text((REF_PATH / "match2.txt").read_text())
+    assert tournament.process_tournament(tmp_path, incremental=True, errors="collect") == []
+    reference = ToucanTournament("ReferenceTournament")
+    reference.process_tournament(tmp_path)
+    assert tournament.mvp.total_points == reference.mvp.total_points
+
+
+@pytest.mark.parametrize("engine", ["python", "numpy"])
+@pytest.mark.parametrize("workers", [1, 2])
+def test_mmap_parser_tournament(tmp_path, engine, workers):
+    if engine == "numpy":
+        pytest.importorskip("numpy")
+
+    # Let's build a tournament with some unicode nicknames and Windows line breaks
+    REF_PATH = Path(Path(__file__).parent, "data", "tournament")
+    for idx in range(3):
+        for match_file in REF_PATH.glob("*.txt"):
+            content = match_file.read_text().replace("nick2", "ñick2").replace("\n", "\r\n")
+            Path(tmp_path, f"{idx}_{match_file.name}").write_bytes(content.encode())
+
+    # Both parsers should end up with exactly the same tournament
+    text = ToucanTournament("TextTournament", engine)
+    text.process_tournament(tmp_path, workers=workers)
+    mmap = ToucanTournament("MmapTournament", engine, parser="mmap")
+    mmap.process_tournament(tmp_path, workers=workers)
+    assert mmap.parser == "mmap"
+    assert [(player.name, player.nickname, player.points) for player in mmap.players] == [
+        (player.name, player.nickname, player.points) for player in text.players
+    ]
+    assert "ñick2" in mmap._players
+
+    with pytest.raises(ToucanException, match="The parser 'csv' is not one of"):
+        ToucanTournament("InvalidParserTournament", parser="csv")
+
+
+def test_incremental_tournament(tmp_path):
+    # Let's start from the reference matches
+    REF_PATH = Path(Path(__file__).parent, "data", "tournament")
+    for match_file in REF_PATH.glob("*.txt"):
+        Path(tmp_path, match_file.name).write_text(match_file.read_text())
+
+    # Process the tournament incrementally... twice! Points should not be double-counted
+    tournament = ToucanTournament("IncrementalTournament")
+    tournament.process_tournament(tmp_path, incremental=True)
+    assert tournament.mvp.nickname == "nick3"
+    assert tournament.mvp.total_points == 72
+    tournament.process_tournament(tmp_path, incremental=True)
+    assert tournament.mvp.nickname == "nick3"
+    assert tournament.mvp.total_points == 72
+
+    # Touching a file without changing its contents should not change anything either
+    touched_file = Path(tmp_path, "match1.txt")
+    os.utime(touched_file, ns=(0, touched_file.stat().st_mtime_ns + 10**9))
+    tournament.process_tournament(tmp_path, incremental=True)
+    assert tournament.mvp.total_points == 72
+
+    # Now, add a new match... only a new player would take part in it
+    new_match = Path(tmp_path, "match3.txt")
+    new_match.write_text(
+        "BASKETBALL\nplayer 7;nick7;4;Team A;G;50;2;7\nplayer 1;nick1;4;Team B;G;1;0;0"
+    )
+    tournament.process_tournament(tmp_path, incremental=True)
+    assert tournament.mvp.nickname == "nick7"
+    assert tournament.mvp.total_points == 50 * 2 + 2 * 3 + 7 + 10
+
+    # Edit that match... so that the previous MVP is back
+    new_match.write_text(
+        "BASKETBALL\nplayer 7;nick7;4;Team A;G;1;0;0\nplayer 1;nick1;4;Team B;G;2;0;0"
+    )
+    tournament.process_tournament(tmp_path, incremental=True)
+    assert tournament.mvp.nickname == "nick3"
+    assert tournament._players["nick7"].points == [2]
+
+    # And finally, remove it... the new player should be gone
+    new_match.unlink()
+    tournament.process_tournament(tmp_path, incremental=True, workers=2)
+    assert "nick7" not in tournament._players
+    assert tournament.mvp.nickname == "nick3"
+    assert tournament.mvp.total_points == 72
+
+    # The result should be the same as the one of a brand new tournament
+    reference = ToucanTournament("ReferenceTournament")
+    reference.process_tournament(tmp_path)
+    for player in reference.players:
+        assert sorted(tournament._players[player.nickname].points) == sorted(player.points)
+
+
+def test_tournament_ranking():
+    # Let's check the ranking of the reference tournament
+    DATA_PATH = Path(Path(__file__).parent, "data", "tournament")
+    tournament = ToucanTournament("ReferenceTournament")
+    assert tournament.mvp is None
+    assert tournament.top(3) == []
+
+    tournament.process_tournament(DATA_PATH)
+    top = tournament.top(3)
+    assert [player.nickname for player in top][0] == "nick3"
+    assert [player.total_points for player in top] == sorted(
+        [player.total_points for player in tournament.players], reverse=True
+    )[:3]
+    for rank, player in enumerate(tournament.top(6), start=1):
+        assert tournament.rank(player.nickname) == rank
+
+    with pytest.raises(ToucanException, match="The player 'nick42' does not take part"):
+        tournament.rank("nick42")
+
+
+def test_async_tournament(tmp_path):
+    # Let's build a bigger tournament by replicating the reference matches
+    REF_PATH = Path(Path(__file__).parent, "data", "tournament")
+    for idx in range(5):
+        for match_file in REF_PATH.glob("*.txt"):
+            Path(tmp_path, f"{idx}_{match_file.name}").write_text(match_file.read_text())
+
+    # Process the tournament both synchronously and asynchronously
+    serial = ToucanTournament("SyncTournament")
+    serial.process_tournament(tmp_path)
+    tournament = ToucanTournament("AsyncTournament")
+    asyncio.run(tournament.aprocess_tournament(tmp_path, concurrency=3))
+
+    # Both of them should end up being exactly the same
+    assert tournament.mvp.nickname == serial.mvp.nickname == "nick3"
+    for player in serial.players:
+        assert tournament._players[player.nickname].points == player.points
+
+    # An invalid concurrency should raise
+    with pytest.raises(ToucanException, match="The concurrency must be at least 1"):
+        asyncio.run(tournament.aprocess_tournament(tmp_path, concurrency=0))
+
+
+def test_async_matches():
+    REF_PATH = Path(Path(__file__).parent, "data", "tournament")
+    match1, match2 = Path(REF_PATH, "match1.txt"), Path(REF_PATH, "match2.txt")
+
+    async def stream_lines(filepath):
+        for line in filepath.read_text().splitlines():
+            await asyncio.sleep(0)
+            yield line
+
+    async def process_matches(tournament):
+        # Receive both matches concurrently... one as a stream, one as a path
+        await asyncio.gather(
+            tournament.aprocess_match(stream_lines(match1), "match1"),
+            tournament.aprocess_match(match2),
+        )
+        # ...and a regular iterable of lines
+        await tournament.aprocess_match(match1.read_text().splitlines())
+
+    tournament = ToucanTournament("AsyncTournament")
+    asyncio.run(process_matches(tournament))
+    assert tournament.mvp.nickname == "nick3"
+    assert len(tournament._players["nick3"].points) == 3
+
+    # Errors should be raised with the provided source
+    async def invalid_match():
+        await tournament.aprocess_match(
+            stream_lines(Path(match1.parent.parent, "tournament_error1", "match1.txt")), "my_stream"
+        )
+
+    with pytest.raises(ToucanException, match="error on match file 'my_stream'"):
+        asyncio.run(invalid_match())
@@ -0,0 +1,119 @@
+from pathlib import Path
+import random
+
+import pytest
+
+from toucan.mvp.calculator import ToucanTournament
+from toucan.mvp.calculator.discipline import ToucanDiscipline
+from toucan.mvp.calculator.errors import ToucanException
+from toucan.mvp.calculator.players import ToucanPlayer
+
+pytest.importorskip("numpy")
+
+from toucan.mvp.calculator.vectorized import score_matches  # noqa : E402
+
+
+def random_match(discipline, rng, n_rows):
+    # Build the records of a random match without draws
+    positions = list(discipline.get_eval_params())
+    n_marks = len(discipline.get_eval_params()[positions[0]])
+    while True:
+        rows = [
+            (
+                f"player {idx}",
+                f"nick{idx}",
+                str(idx),
+                "Team A" if row % 2 else "Team B",
+                rng.choice(positions),
+                [rng.randint(0, 30) for _ in range(n_marks)],
+            )
+            for row, idx in enumerate(rng.sample(range(100), n_rows))
+        ]
+        scores = {"Team A": 0, "Team B": 0}
+        for *_, team, _, marks in rows:
+            scores[team] += ToucanPlayer("", "").get_team_score_contribution(marks, discipline)
+        if scores["Team A"] != scores["Team B"]:
+            return rows
+
+
+def test_score_matches():
+    # Let's score a batch of random matches of both disciplines...
+    rng = random.Random(42)
+    matches = [
+        (discipline, random_match(discipline, rng, rng.randint(2, 20)))
+        for discipline in rng.choices(list(ToucanDiscipline), k=50)
+    ]
+    results, team_scores = score_matches(matches, return_team_scores=True)
+    assert score_matches(matches) == results
+
+    # ...and compare them against the pure Python scoring
+    for (discipline, rows), points, match_scores in zip(matches, results, team_scores):
+        players, scores = [], {}
+        for name, nickname, _, team, position, marks in rows:
+            player = ToucanPlayer(name, nickname)
+            player.add_match_points(marks, discipline, position)
+            scores[team] = scores.get(team, 0) + player.get_team_score_contribution(
+                marks, discipline
+            )
+            players.append((team, player))
+
+        assert match_scores == tuple(scores.values())
+        winner = max(scores, key=scores.get)
+        for team, player in players:
+            if team == winner:
+                player.add_bonus_points()
+
+        assert points == [player.points[0] for _, player in players]
+
+
+def test_score_matches_errors():
+    # Unknown positions are not allowed...
+    rows = [("p1", "n1", "1", "Team A", "C", [1, 2]), ("p2", "n2", "2", "Team B", "G", [1, 2])]
+    with pytest.raises(ToucanException, match="Problems retrieving evaluation parameters"):
+        score_matches([(ToucanDiscipline.HANDBALL, rows)])
+
+    # ...neither unexpected marks...
+    rows = [("p1", "n1", "1", "Team A", "G", [1]), ("p2", "n2", "2", "Team B", "G", [1, 2])]
+    with pytest.raises(ToucanException, match="do not match the marks given"):
+        score_matches([(ToucanDiscipline.HANDBALL, rows)])
+
+    # ...nor a single team
+    rows = [("p1", "n1", "1", "Team A", "G", [1, 2]), ("p2", "n2", "2", "Team A", "G", [1, 2])]
+    with pytest.raises(ToucanException, match="Matches must be played by two teams"):
+        score_matches([(ToucanDiscipline.HANDBALL, rows)])
+
+
+def test_numpy_engine_tournament(tmp_path, monkeypatch):
+    # Let's write a random tournament
+    rng = random.Random(7)
+    for idx in range(30):
+        discipline = rng.choice(list(ToucanDiscipline))
+        rows = random_match(discipline, rng, rng.randint(2, 12))
+        lines = [discipline.name] + [";".join([*row[:5], *map(str, row[5])]) for row in rows]
+        Path(tmp_path, f"match{idx}.txt").write_text("\n".join(lines))
+
+    # Both engines should give exactly the same results
+    python = ToucanTournament("PythonTournament")
+    python.process_tournament(tmp_path)
+    numpy = ToucanTournament("NumpyTournament", engine="numpy")
+    assert numpy.engine == "numpy"
+    monkeypatch.setattr("toucan.mvp.calculator.tournament.NUMPY_BATCH_ROWS", 20)
+    numpy.process_tournament(tmp_path)
+
+    assert numpy.mvp.nickname == python.mvp.nickname
+    assert [player.nickname for player in numpy.players] == [
+        player.nickname for player in python.players
+    ]
+    for player in python.players:
+        assert numpy._players[player.nickname].points == player.points
+
+    # Also when processing the matches one by one in worker processes
+    parallel = ToucanTournament("ParallelNumpyTournament", engine="numpy")
+    parallel.process_tournament(tmp_path, workers=2)
+    for player in python.players:
+        assert parallel._players[player.nickname].points == player.points
+
+
+def test_invalid_engine():
+    with pytest.raises(ToucanException, match="The scoring engine 'fortran' is not one of"):
+        ToucanTournament("InvalidEngineTournament", engine="fortran")
@@ -0,0 +1,118 @@
+from pathlib import Path
+import shutil
+import threading
+
+import pytest
+
+from toucan.mvp.calculator import ToucanTournament
+from toucan.mvp.calculator.errors import ToucanException
+from toucan.mvp.calculator.watch import ToucanWatcher, _InotifyBackend
+
+DATA_PATH = Path(Path(__file__).parent, "data", "tournament")
+
+BACKENDS = [
+    "poll",
+    pytest.param(
+        "inotify",
+        marks=pytest.mark.skipif(
+            not _InotifyBackend.is_available(), reason="inotify is not available"
+        ),
+    ),
+]
+
+STAR_MATCH = "HANDBALL\nplayer 7;nick7;4;Team C;G;10;0\nplayer 8;nick8;8;Team D;G;0;20\n"
+
+
+def _events(events, kind):
+    return [
+        (event.nickname, event.previous, event.current) for event in events if event.kind == kind
+    ]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_watch_tournament(tmp_path, backend):
+    shutil.copytree(DATA_PATH, tmp_path, dirs_exist_ok=True)
+    tournament = ToucanTournament("Live")
+    watcher = tournament.watch(tmp_path, backend=backend, interval=0.1)
+    assert watcher.backend == backend
+    received = []
+    watcher.subscribe(received.append)
+
+    # The first poll catches up with the directory
+    events = watcher.poll()
+    assert events == received
+    assert _events(events, "mvp") == [("nick3", None, None)]
+    assert ("nick3", None, 1) in _events(events, "rank")
+    assert watcher.poll() == []
+
+    # A new match file makes a new MVP
+    (tmp_path / "match3.txt").write_text(STAR_MATCH)
+    events = watcher.poll(5)
+    assert _events(events, "mvp") == [("nick7", "nick3", None)]
+    assert ("nick7", None, 1) in _events(events, "rank")
+    assert ("nick3", 1, 2) not in _events(events, "rank")  # its points did not change
+
+    # Changing it changes the points...
+    points = {player.nickname: player.total_points for player in tournament.players}
+    (tmp_path / "match3.txt").write_text(STAR_MATCH.replace(";10;0", ";1;0"))
+    events = watcher.poll(5)
+    assert _events(events, "mvp") == [("nick3", "nick7", None)]
+    assert ("nick7", 1, tournament.rank("nick7")) in _events(events, "rank")
+    assert points["nick7"] - tournament.top(7)[tournament.rank("nick7") - 1].total_points == 45
+
+    # ...and removing it makes its players leave
+    (tmp_path / "match3.txt").unlink()
+    events = watcher.poll(5)
+    assert _events(events, "mvp") == []
+    assert [(nickname, current) for nickname, _, current in _events(events, "rank")] == [
+        ("nick7", None),
+        ("nick8", None),
+    ]
+    assert "nick7" not in [player.nickname for player in tournament.players]
+
+    # Invalid match files are reported
+    (tmp_path / "match4.txt").write_text("CURLING\n")
+    events = watcher.poll(5)
+    assert [event.kind for event in events] == ["error"]
+    assert "match4.txt" in str(events[0].error)
+    assert repr(events[0]).startswith("ToucanWatchEvent(error, ")
+    watcher.stop()
+
+    # The result is the same as processing the directory from scratch
+    (tmp_path / "match4.txt").unlink()
+    reference = ToucanTournament("Reference")
+    reference.process_tournament(tmp_path)
+    assert [(player.nickname, player.total_points) for player in tournament.top(10)] == [
+        (player.nickname, player.total_points) for player in reference.top(10)
+    ]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_watch_thread(tmp_path, backend):
+    shutil.copytree(DATA_PATH, tmp_path, dirs_exist_ok=True)
+    new_mvp = threading.Event()
+
+    def on_event(event):
+        if event.kind == "mvp" and event.nickname == "nick7":
+            new_mvp.set()
+
+    tournament = ToucanTournament("Live")
+    with ToucanWatcher(tournament, tmp_path, backend=backend, interval=0.05) as watcher:
+        watcher.subscribe(on_event)
+        with pytest.raises(ToucanException, match="The watcher is already running."):
+            watcher.start()
+        (tmp_path / "match3.txt").write_text(STAR_MATCH)
+        assert new_mvp.wait(10)
+        with watcher.lock:
+            assert tournament.mvp.nickname == "nick7"
+        watcher.unsubscribe(on_event)
+
+
+def test_watch_errors(tmp_path):
+    tournament = ToucanTournament("Live")
+    with pytest.raises(ToucanException, match="The watch backend 'kqueue' is not one of"):
+        tournament.watch(tmp_path, backend="kqueue")
+    with pytest.raises(ToucanException, match="The poll interval must be positive, not 0."):
+        tournament.watch(tmp_path, interval=0)
+    with pytest.raises(ToucanException, match="is not a directory."):
+        tournament.watch(tmp_path / "missing")